@@ -4,14 +4,25 @@
  */
 package oracle.weblogic.deploy.encrypt;
 
+import java.nio.ByteBuffer;
+import java.nio.CharBuffer;
 import java.security.InvalidAlgorithmParameterException;
 import java.security.InvalidKeyException;
+import java.security.MessageDigest;
 import java.security.NoSuchAlgorithmException;
 import java.security.SecureRandom;
 import java.security.spec.InvalidKeySpecException;
 import java.security.spec.KeySpec;
 import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.LinkedHashMap;
 import java.util.List;
+import java.util.Map;
+import java.util.concurrent.Callable;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
 
 import javax.crypto.BadPaddingException;
 import javax.crypto.Cipher;
@@ -33,11 +44,23 @@ import static java.nio.charset.StandardCharsets.UTF_8;
 
 /**
  * This class provides basic encryption/decryption capabilities.
+ *
+ * Deriving the AES key from the passphrase is by far the most expensive part of encrypting or decrypting a
+ * value, so the derived keys are cached by passphrase digest and salt.  By default, every encrypted value gets
+ * its own random salt, and so its own key.  Setting the WLSDEPLOY_KEY_DERIVATION environment variable to per-run
+ * encrypts all of the values of a run with the same random salt, so the key is derived once per run and once
+ * again when the values are decrypted.  The values still use their own random nonce, and the encrypted format is
+ * the same in both modes.
  */
 public final class EncryptionUtils {
     private static final String CLASS = EncryptionUtils.class.getName();
     private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.encrypt");
 
+    public static final String KEY_DERIVATION_ENV_VARIABLE = "WLSDEPLOY_KEY_DERIVATION";
+    public static final String PER_VALUE_KEY_DERIVATION = "per-value";
+    public static final String PER_RUN_KEY_DERIVATION = "per-run";
+    public static final String ENCRYPT_THREADS_ENV_VARIABLE = "WLSDEPLOY_ENCRYPT_THREADS";
+
     private static final String SECRET_KEY_FACTORY_ALGORITHM = "PBKDF2WithHmacSHA256";
     private static final String SECRET_KEY_SPEC_ALGORITHM = "AES";
     private static final String CIPHER_ALGORITHM = "AES/GCM/NoPadding";
@@ -55,7 +78,15 @@ public final class EncryptionUtils {
     private static final int NONCE_POS = 1;
     private static final int SALT_POS = 2;
 
+    private static final String PASSPHRASE_DIGEST_ALGORITHM = "SHA-256";
+    private static final int KEY_CACHE_SIZE = 512;
+
     private static final SecureRandom RANDOM = new SecureRandom();
+    private static final KeyCache KEY_CACHE = new KeyCache(KEY_CACHE_SIZE);
+    private static final boolean PER_RUN_SALT = isPerRunKeyDerivation();
+
+    // the salt shared by the values encrypted by this process in per-run key derivation mode
+    private static byte[] runSalt;
 
     private EncryptionUtils() {
         // hide the constructor for this utility class
@@ -133,8 +164,7 @@ public final class EncryptionUtils {
 
         String result = clearText;
         if (!StringUtils.isEmpty(clearText)) {
-            final byte[] salt = new byte[SALT_SIZE];
-            RANDOM.nextBytes(salt);
+            final byte[] salt = getEncryptionSalt();
             SecretKey key = getKey(userPassphrase, salt);
             Cipher cipher = getCipher();
             try {
@@ -155,8 +185,130 @@ public final class EncryptionUtils {
         return  result;
     }
 
+    /**
+     * Get the encrypted strings for the specified list of characters.  The strings are encrypted concurrently
+     * by the number of threads specified by the WLSDEPLOY_ENCRYPT_THREADS environment variable, which defaults
+     * to the number of processors.
+     *
+     * @param clearTexts the list of characters to encrypt
+     * @param userPassphrase the passphrase to use for encryption/decryption
+     * @return the list of encrypted strings, in the same order
+     * @throws EncryptionException if an error occurs while encrypting the characters
+     */
+    public static List<String> encryptStrings(List<String> clearTexts, final char[] userPassphrase)
+        throws EncryptionException {
+        final String METHOD = "encryptStrings";
+
+        if (userPassphrase == null || userPassphrase.length == 0) {
+            EncryptionException ee = new EncryptionException("WLSDPLY-04000");
+            LOGGER.throwing(CLASS, METHOD, ee);
+            throw ee;
+        }
+
+        List<String> result = new ArrayList<>(clearTexts.size());
+        int poolSize = Math.min(getEncryptThreadCount(), clearTexts.size());
+        if (poolSize <= 1) {
+            for (String clearText : clearTexts) {
+                result.add(encryptString(clearText, userPassphrase));
+            }
+            return result;
+        }
+
+        LOGGER.fine("WLSDPLY-04009", clearTexts.size(), poolSize);
+        ExecutorService executor = Executors.newFixedThreadPool(poolSize);
+        try {
+            List<Future<String>> futures = new ArrayList<>(clearTexts.size());
+            for (final String clearText : clearTexts) {
+                futures.add(executor.submit(new Callable<String>() {
+                    @Override
+                    public String call() throws EncryptionException {
+                        return encryptString(clearText, userPassphrase);
+                    }
+                }));
+            }
+            for (Future<String> future : futures) {
+                result.add(future.get());
+            }
+        } catch (ExecutionException ee) {
+            Throwable cause = ee.getCause();
+            if (cause instanceof EncryptionException) {
+                LOGGER.throwing(CLASS, METHOD, cause);
+                throw (EncryptionException) cause;
+            }
+            EncryptionException ex = new EncryptionException("WLSDPLY-04002", cause, cause.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        } catch (InterruptedException ie) {
+            Thread.currentThread().interrupt();
+            EncryptionException ex = new EncryptionException("WLSDPLY-04002", ie, ie.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        } finally {
+            executor.shutdownNow();
+        }
+        return result;
+    }
+
+    private static byte[] getEncryptionSalt() {
+        if (PER_RUN_SALT) {
+            synchronized (EncryptionUtils.class) {
+                if (runSalt == null) {
+                    runSalt = new byte[SALT_SIZE];
+                    RANDOM.nextBytes(runSalt);
+                }
+                return runSalt;
+            }
+        }
+        final byte[] salt = new byte[SALT_SIZE];
+        RANDOM.nextBytes(salt);
+        return salt;
+    }
+
     private static SecretKey getKey(final char[] userPassphrase, byte[] saltBytes) throws EncryptionException {
-        final String METHOD = "getKey";
+        String cacheKey = getKeyCacheKey(userPassphrase, saltBytes);
+        synchronized (KEY_CACHE) {
+            SecretKey cached = KEY_CACHE.get(cacheKey);
+            if (cached != null) {
+                return cached;
+            }
+        }
+
+        // derive the key outside the lock so that other threads can derive other keys at the same time
+        SecretKey result = deriveKey(userPassphrase, saltBytes);
+        synchronized (KEY_CACHE) {
+            KEY_CACHE.put(cacheKey, result);
+        }
+        return result;
+    }
+
+    private static String getKeyCacheKey(final char[] userPassphrase, byte[] saltBytes) throws EncryptionException {
+        final String METHOD = "getKeyCacheKey";
+
+        MessageDigest digest;
+        try {
+            digest = MessageDigest.getInstance(PASSPHRASE_DIGEST_ALGORITHM);
+        } catch (NoSuchAlgorithmException nsae) {
+            EncryptionException ee = new EncryptionException("WLSDPLY-04007", nsae, PASSPHRASE_DIGEST_ALGORITHM,
+                nsae.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ee);
+            throw ee;
+        }
+
+        // digest the passphrase without copying it into an immutable string
+        ByteBuffer passphraseBytes = UTF_8.encode(CharBuffer.wrap(userPassphrase));
+        byte[] passphraseArray = new byte[passphraseBytes.remaining()];
+        passphraseBytes.get(passphraseArray);
+        digest.update(passphraseArray);
+        Arrays.fill(passphraseArray, (byte) 0);
+        if (passphraseBytes.hasArray()) {
+            Arrays.fill(passphraseBytes.array(), (byte) 0);
+        }
+        return DatatypeConverter.printBase64Binary(digest.digest()) + SEP
+            + DatatypeConverter.printBase64Binary(saltBytes);
+    }
+
+    private static SecretKey deriveKey(final char[] userPassphrase, byte[] saltBytes) throws EncryptionException {
+        final String METHOD = "deriveKey";
 
         SecretKeyFactory factory;
         try {
@@ -180,6 +332,31 @@ public final class EncryptionUtils {
         return result;
     }
 
+    private static boolean isPerRunKeyDerivation() {
+        String value = System.getenv(KEY_DERIVATION_ENV_VARIABLE);
+        if (StringUtils.isEmpty(value) || PER_VALUE_KEY_DERIVATION.equalsIgnoreCase(value.trim())) {
+            return false;
+        }
+        if (PER_RUN_KEY_DERIVATION.equalsIgnoreCase(value.trim())) {
+            return true;
+        }
+        LOGGER.warning("WLSDPLY-04008", value, KEY_DERIVATION_ENV_VARIABLE, PER_VALUE_KEY_DERIVATION);
+        return false;
+    }
+
+    private static int getEncryptThreadCount() {
+        int result = Runtime.getRuntime().availableProcessors();
+        String value = System.getenv(ENCRYPT_THREADS_ENV_VARIABLE);
+        if (!StringUtils.isEmpty(value)) {
+            try {
+                result = Integer.parseInt(value.trim());
+            } catch (NumberFormatException nfe) {
+                LOGGER.warning("WLSDPLY-04010", value, ENCRYPT_THREADS_ENV_VARIABLE, result);
+            }
+        }
+        return Math.max(1, result);
+    }
+
     private static Cipher getCipher() throws EncryptionException {
         final String METHOD = "getCipher";
 
@@ -222,4 +399,23 @@ public final class EncryptionUtils {
         }
         return result;
     }
+
+    /**
+     * The most recently used derived keys, keyed by passphrase digest and salt.
+     */
+    static final class KeyCache extends LinkedHashMap<String, SecretKey> {
+        private static final long serialVersionUID = 1L;
+
+        private final int maxSize;
+
+        KeyCache(int maxSize) {
+            super(16, 0.75f, true);
+            this.maxSize = maxSize;
+        }
+
+        @Override
+        protected boolean removeEldestEntry(Map.Entry<String, SecretKey> eldest) {
+            return size() > maxSize;
+        }
+    }
 }
@@ -16,6 +16,7 @@ import oracle.weblogic.deploy.util.StringUtils;
 import org.antlr.v4.runtime.CharStream;
 import org.antlr.v4.runtime.CharStreams;
 import org.antlr.v4.runtime.CommonTokenStream;
+import org.antlr.v4.runtime.ParserRuleContext;
 import org.antlr.v4.runtime.atn.PredictionMode;
 import org.antlr.v4.runtime.tree.ParseTree;
 import org.antlr.v4.runtime.tree.ParseTreeWalker;
@@ -29,6 +30,8 @@ import org.python.core.PyString;
 
 /**
  * This class does the heavy-lifting of walking the parse tree and performing the conversion into a Python dictionary.
+ * In streaming mode, the dictionary is built by a parse listener while the parser consumes the token stream, so the
+ * parse tree for the whole file is never held in memory.
  */
 public abstract class AbstractJsonTranslator extends JSONBaseListener {
 
@@ -40,6 +43,8 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
     private PyObject currentScalarValue;
     @SuppressWarnings("WeakerAccess")
     protected boolean useOrderedDict;
+    @SuppressWarnings("WeakerAccess")
+    protected boolean useStreaming;
 
     /**
      * This method triggers parsing of the JSON and conversion into the Python dictionary.
@@ -295,9 +300,15 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
                 parser.addErrorListener(errorListener);
                 parser.getInterpreter().setPredictionMode(PredictionMode.LL_EXACT_AMBIG_DETECTION);
 
-                ParseTree tree = parser.json();
-                ParseTreeWalker walker = new ParseTreeWalker();
-                walker.walk(this, tree);
+                if (useStreaming) {
+                    parser.setBuildParseTree(false);
+                    parser.addParseListener(new StreamingListener(errorListener));
+                    parser.json();
+                } else {
+                    ParseTree tree = parser.json();
+                    ParseTreeWalker walker = new ParseTreeWalker();
+                    walker.walk(this, tree);
+                }
             } catch (IOException ioe) {
                 JsonException ex =
                     new JsonException("WLSDPLY-18007", ioe, "JSON", jsonFileName, ioe.getLocalizedMessage());
@@ -355,6 +366,116 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
         return result;
     }
 
+    /**
+     * The parse listener used in streaming mode.
+     *
+     * A parse listener is called while the rules are being parsed. Since the parse tree is not built, a rule context
+     * only holds the tokens of the rule itself and not its sub-rules, and the enter events for labeled alternatives
+     * are never called.  The listener therefore starts objects and arrays from their own rules, takes the pair name
+     * from the pair when its value is entered, and converts scalar values when they exit, once their token is known.
+     */
+    private final class StreamingListener extends JSONBaseListener {
+        private final JsonErrorListener errorListener;
+
+        StreamingListener(JsonErrorListener errorListener) {
+            this.errorListener = errorListener;
+        }
+
+        @Override
+        public void enterJson(JSONParser.JsonContext ctx) {
+            AbstractJsonTranslator.this.enterJson(ctx);
+        }
+
+        @Override
+        public void enterEveryRule(ParserRuleContext ctx) {
+            // the pair name has been parsed before its value
+            if (isBuilding() && ctx instanceof JSONParser.ValueContext
+                && ctx.getParent() instanceof JSONParser.PairContext) {
+                enterPair((JSONParser.PairContext) ctx.getParent());
+            }
+        }
+
+        @Override
+        public void exitPair(JSONParser.PairContext ctx) {
+            if (isBuilding()) {
+                AbstractJsonTranslator.this.exitPair(ctx);
+            }
+        }
+
+        @Override
+        public void enterObj(JSONParser.ObjContext ctx) {
+            if (isBuilding()) {
+                enterJsonObject(null);
+            }
+        }
+
+        @Override
+        public void exitJsonObject(JSONParser.JsonObjectContext ctx) {
+            if (isBuilding()) {
+                AbstractJsonTranslator.this.exitJsonObject(ctx);
+            }
+        }
+
+        @Override
+        public void enterArray(JSONParser.ArrayContext ctx) {
+            if (isBuilding()) {
+                enterJsonArray(null);
+            }
+        }
+
+        @Override
+        public void exitJsonArray(JSONParser.JsonArrayContext ctx) {
+            if (isBuilding()) {
+                AbstractJsonTranslator.this.exitJsonArray(ctx);
+            }
+        }
+
+        @Override
+        public void exitJsonString(JSONParser.JsonStringContext ctx) {
+            if (isBuilding()) {
+                enterJsonString(ctx);
+                AbstractJsonTranslator.this.exitJsonString(ctx);
+            }
+        }
+
+        @Override
+        public void exitJsonNumber(JSONParser.JsonNumberContext ctx) {
+            if (isBuilding()) {
+                enterJsonNumber(ctx);
+                AbstractJsonTranslator.this.exitJsonNumber(ctx);
+            }
+        }
+
+        @Override
+        public void exitJsonTrue(JSONParser.JsonTrueContext ctx) {
+            if (isBuilding()) {
+                enterJsonTrue(ctx);
+                AbstractJsonTranslator.this.exitJsonTrue(ctx);
+            }
+        }
+
+        @Override
+        public void exitJsonFalse(JSONParser.JsonFalseContext ctx) {
+            if (isBuilding()) {
+                enterJsonFalse(ctx);
+                AbstractJsonTranslator.this.exitJsonFalse(ctx);
+            }
+        }
+
+        @Override
+        public void exitJsonNull(JSONParser.JsonNullContext ctx) {
+            if (isBuilding()) {
+                enterJsonNull(ctx);
+                AbstractJsonTranslator.this.exitJsonNull(ctx);
+            }
+        }
+
+        // Once a syntax error is reported, the contexts may be incomplete and the result is discarded anyway.
+        private boolean isBuilding() {
+            return errorListener.getErrorCount() == 0;
+        }
+    }
+
     /**
      * Internal enum used to keep track of the types being processed.
      */
@@ -41,8 +41,21 @@ public class JsonTranslator extends AbstractJsonTranslator {
      * @throws IllegalArgumentException if the file name is null or does not point to a valid, existing file.
      */
     public JsonTranslator(String fileName, boolean useOrdering) {
+        this(fileName, useOrdering, false);
+    }
+
+    /**
+     * Constructor for parsing JSON file into a Python dictionary and controlling ordering and streaming.
+     *
+     * @param fileName - the name of the existing JSON file to parse
+     * @param useOrdering - whether or not to use an ordered dictionary
+     * @param useStreaming - whether or not to build the dictionary while parsing, without keeping the parse tree
+     * @throws IllegalArgumentException if the file name is null or does not point to a valid, existing file.
+     */
+    public JsonTranslator(String fileName, boolean useOrdering, boolean useStreaming) {
         this.jsonFile = FileUtils.validateExistingFile(fileName);
         this.useOrderedDict = useOrdering;
+        this.useStreaming = useStreaming;
     }
 
     /**
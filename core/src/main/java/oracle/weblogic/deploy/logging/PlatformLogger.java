@@ -285,8 +285,10 @@ public class PlatformLogger {
      * @param msg the message
      */
     public void info(String msg) {
-        CallerDetails details = inferCaller();
-        logger.logp(Level.INFO, details.clazz, details.method, msg);
+        if (isInfoEnabled()) {
+            CallerDetails details = inferCaller();
+            logger.logp(Level.INFO, details.clazz, details.method, msg);
+        }
     }
 
     /**
@@ -296,8 +298,10 @@ public class PlatformLogger {
      * @param params the objects to use to fill in the message details
      */
     public void info(String msg, Object... params) {
-        CallerDetails details = inferCaller();
-        logger.logp(Level.INFO, details.clazz, details.method, msg, params);
+        if (isInfoEnabled()) {
+            CallerDetails details = inferCaller();
+            logger.logp(Level.INFO, details.clazz, details.method, msg, params);
+        }
     }
 
     /**
@@ -425,8 +429,10 @@ public class PlatformLogger {
      * @param msg    the message to log
      */
     public void severe(String msg) {
-        CallerDetails details = inferCaller();
-        logger.logp(Level.SEVERE, details.clazz, details.method, msg);
+        if (isSevereEnabled()) {
+            CallerDetails details = inferCaller();
+            logger.logp(Level.SEVERE, details.clazz, details.method, msg);
+        }
     }
 
     /**
@@ -436,8 +442,10 @@ public class PlatformLogger {
      * @param params the objects to use to fill in the message details
      */
     public void severe(String msg, Object... params) {
-        CallerDetails details = inferCaller();
-        logger.logp(Level.SEVERE, details.clazz, details.method, msg, params);
+        if (isSevereEnabled()) {
+            CallerDetails details = inferCaller();
+            logger.logp(Level.SEVERE, details.clazz, details.method, msg, params);
+        }
     }
 
     /**
@@ -448,8 +456,10 @@ public class PlatformLogger {
      * @param params the objects to use to fill in the message details
      */
     public void severe(String msg, Throwable error, Object... params) {
-        CallerDetails details = inferCaller();
-        logger.log(getLogRecord(Level.SEVERE, details, msg, error, params));
+        if (isSevereEnabled()) {
+            CallerDetails details = inferCaller();
+            logger.log(getLogRecord(Level.SEVERE, details, msg, error, params));
+        }
     }
 
     /**
@@ -459,8 +469,10 @@ public class PlatformLogger {
      * @param thrown the exception to log
      */
     public void severe(String msg, Throwable thrown) {
-        CallerDetails details = inferCaller();
-        logger.logp(Level.SEVERE, details.clazz, details.method, msg, thrown);
+        if (isSevereEnabled()) {
+            CallerDetails details = inferCaller();
+            logger.logp(Level.SEVERE, details.clazz, details.method, msg, thrown);
+        }
     }
 
     /**
@@ -492,8 +504,10 @@ public class PlatformLogger {
      * @param msg    the message to log
      */
     public void warning(String msg) {
-        CallerDetails details = inferCaller();
-        logger.logp(Level.WARNING, details.clazz, details.method, msg);
+        if (isWarningEnabled()) {
+            CallerDetails details = inferCaller();
+            logger.logp(Level.WARNING, details.clazz, details.method, msg);
+        }
     }
 
     /**
@@ -503,8 +517,10 @@ public class PlatformLogger {
      * @param params the objects to use to fill in the message details
      */
     public void warning(String msg, Object... params) {
-        CallerDetails details = inferCaller();
-        logger.logp(Level.WARNING, details.clazz, details.method, msg, params);
+        if (isWarningEnabled()) {
+            CallerDetails details = inferCaller();
+            logger.logp(Level.WARNING, details.clazz, details.method, msg, params);
+        }
     }
 
     /**
@@ -515,8 +531,10 @@ public class PlatformLogger {
      * @param params the objects to use to fill in the message details
      */
     public void warning(String msg, Throwable error, Object... params) {
-        CallerDetails details = inferCaller();
-        logger.log(getLogRecord(Level.WARNING, details, msg, error, params));
+        if (isWarningEnabled()) {
+            CallerDetails details = inferCaller();
+            logger.log(getLogRecord(Level.WARNING, details, msg, error, params));
+        }
     }
 
     /**
@@ -526,8 +544,10 @@ public class PlatformLogger {
      * @param thrown the exception to log
      */
     public void warning(String msg, Throwable thrown) {
-        CallerDetails details = inferCaller();
-        logger.logp(Level.WARNING, details.clazz, details.method, msg, thrown);
+        if (isWarningEnabled()) {
+            CallerDetails details = inferCaller();
+            logger.logp(Level.WARNING, details.clazz, details.method, msg, thrown);
+        }
     }
 
     /**
@@ -0,0 +1,211 @@
+/*
+ * Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+ * The Universal Permissive License (UPL), Version 1.0
+ */
+package oracle.weblogic.deploy.util;
+
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.OutputStream;
+import java.nio.file.Files;
+import java.nio.file.StandardCopyOption;
+import java.util.HashSet;
+import java.util.Iterator;
+import java.util.Properties;
+import java.util.Set;
+
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+
+/**
+ * A persistent cache of the hashes of files on disk, keyed by the path, size and last modified time of the
+ * file, so that a file that has not changed since it was last hashed does not need to be read again.
+ *
+ * Trusting the size and last modified time of a file is only acceptable when binaries are compared by
+ * checksum, so the cache is only used when the WLSDEPLOY_HASH_MODE environment variable is set to checksum.
+ * The cache is stored in the directory named by the WLSDEPLOY_HASH_CACHE_DIR environment variable, if set,
+ * or in the lib/hash_cache directory of the WLSDEPLOY_HOME installation.  If neither is set, the hashes are
+ * only cached for the life of the process.
+ *
+ * Changes are written once, when the process exits.  Entries for files that no longer exist are removed
+ * when the cache is written, and if more than MAX_ENTRIES remain, only the entries used by this process
+ * are kept.
+ */
+final class FileHashCache {
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.util");
+
+    static final String HASH_MODE_ENV_VARIABLE = "WLSDEPLOY_HASH_MODE";
+    static final String CHECKSUM_HASH_MODE = "checksum";
+    static final String CACHE_DIR_ENV_VARIABLE = "WLSDEPLOY_HASH_CACHE_DIR";
+    static final int MAX_ENTRIES = 10000;
+
+    private static final String WLSDEPLOY_HOME_ENV_VARIABLE = "WLSDEPLOY_HOME";
+    private static final String CACHE_FILE_NAME = "file_hashes.properties";
+    private static final String SEP = "|";
+
+    private static FileHashCache instance;
+
+    private final File cacheFile;
+    private final Properties hashes = new Properties();
+    private final Set<String> usedKeys = new HashSet<>();
+    private boolean changed;
+
+    /**
+     * Create a cache backed by the specified file.
+     *
+     * @param cacheFile the file used to persist the cache, or null to only cache in memory
+     */
+    FileHashCache(File cacheFile) {
+        this.cacheFile = cacheFile;
+        load();
+    }
+
+    /**
+     * Whether or not the cache should be used, based on the hash mode.
+     *
+     * @return true if the cache should be used, false otherwise
+     */
+    static boolean isEnabled() {
+        return CHECKSUM_HASH_MODE.equals(System.getenv(HASH_MODE_ENV_VARIABLE));
+    }
+
+    /**
+     * Get the cache for this process, creating it on first use.  A persistent cache is written when
+     * the process exits.
+     *
+     * @return the cache
+     */
+    static synchronized FileHashCache getInstance() {
+        if (instance == null) {
+            instance = new FileHashCache(getDefaultCacheFile());
+            if (instance.cacheFile != null) {
+                final FileHashCache cache = instance;
+                Runtime.getRuntime().addShutdownHook(new Thread(new Runnable() {
+                    @Override
+                    public void run() {
+                        cache.store();
+                    }
+                }));
+            }
+        }
+        return instance;
+    }
+
+    /**
+     * Get the cached hash of the file, if the file still has the size and last modified time it had when
+     * the hash was computed.
+     *
+     * @param algorithm the name of the hash algorithm
+     * @param path the canonical path of the file
+     * @param size the current size of the file
+     * @param lastModified the current last modified time of the file
+     * @return the cached hash, or null if there is no usable hash
+     */
+    synchronized String get(String algorithm, String path, long size, long lastModified) {
+        String key = getKey(algorithm, path);
+        String value = hashes.getProperty(key);
+        String prefix = size + SEP + lastModified + SEP;
+        if (value == null || !value.startsWith(prefix)) {
+            return null;
+        }
+        usedKeys.add(key);
+        return value.substring(prefix.length());
+    }
+
+    /**
+     * Add the hash of the file to the cache.  The cache file is not written until store() is called.
+     *
+     * @param algorithm the name of the hash algorithm
+     * @param path the canonical path of the file
+     * @param size the size of the file that was hashed
+     * @param lastModified the last modified time of the file that was hashed
+     * @param hash the hash
+     */
+    synchronized void put(String algorithm, String path, long size, long lastModified, String hash) {
+        String key = getKey(algorithm, path);
+        hashes.setProperty(key, size + SEP + lastModified + SEP + hash);
+        usedKeys.add(key);
+        changed = true;
+    }
+
+    /**
+     * Write the cache file if the cache changed, after removing the entries for files that no longer exist.
+     * Failing to write the cache file is logged and otherwise ignored.
+     */
+    synchronized void store() {
+        if (cacheFile == null || !changed) {
+            return;
+        }
+        prune();
+
+        File cacheDir = cacheFile.getAbsoluteFile().getParentFile();
+        File tempFile = null;
+        try {
+            if (!cacheDir.isDirectory() && !cacheDir.mkdirs()) {
+                throw new IOException(cacheDir.getPath());
+            }
+            tempFile = File.createTempFile("file_hashes", ".tmp", cacheDir);
+            try (OutputStream output = new FileOutputStream(tempFile)) {
+                hashes.store(output, null);
+            }
+            Files.move(tempFile.toPath(), cacheFile.toPath(), StandardCopyOption.REPLACE_EXISTING);
+            changed = false;
+        } catch (IOException ioe) {
+            LOGGER.fine("WLSDPLY-01152", ioe, cacheFile.getPath(), ioe.getLocalizedMessage());
+            if (tempFile != null && tempFile.exists() && !tempFile.delete()) {
+                tempFile.deleteOnExit();
+            }
+        }
+    }
+
+    private void prune() {
+        int initialSize = hashes.size();
+        Iterator<Object> keys = hashes.keySet().iterator();
+        while (keys.hasNext()) {
+            String key = (String) keys.next();
+            String path = key.substring(key.indexOf(SEP) + SEP.length());
+            if (!new File(path).isFile()) {
+                keys.remove();
+            }
+        }
+
+        if (hashes.size() > MAX_ENTRIES) {
+            hashes.keySet().retainAll(usedKeys);
+        }
+        if (hashes.size() < initialSize) {
+            LOGGER.fine("WLSDPLY-01153", cacheFile.getPath(), initialSize - hashes.size());
+        }
+    }
+
+    private static String getKey(String algorithm, String path) {
+        return algorithm + SEP + path;
+    }
+
+    private static File getDefaultCacheFile() {
+        String cacheDir = System.getenv(CACHE_DIR_ENV_VARIABLE);
+        if (StringUtils.isEmpty(cacheDir)) {
+            String wlsdeployHome = System.getenv(WLSDEPLOY_HOME_ENV_VARIABLE);
+            if (StringUtils.isEmpty(wlsdeployHome)) {
+                return null;
+            }
+            cacheDir = wlsdeployHome + File.separator + "lib" + File.separator + "hash_cache";
+        }
+        return new File(cacheDir, CACHE_FILE_NAME);
+    }
+
+    private void load() {
+        if (cacheFile == null || !cacheFile.isFile()) {
+            return;
+        }
+        try (InputStream input = new FileInputStream(cacheFile)) {
+            hashes.load(input);
+            LOGGER.fine("WLSDPLY-01150", cacheFile.getPath(), hashes.size());
+        } catch (IOException | IllegalArgumentException e) {
+            hashes.clear();
+            LOGGER.fine("WLSDPLY-01151", e, cacheFile.getPath(), e.getLocalizedMessage());
+        }
+    }
+}
@@ -18,6 +18,7 @@ import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.List;
 import java.util.Locale;
+import java.util.zip.CRC32;
 
 import javax.xml.bind.DatatypeConverter;
 
@@ -37,6 +38,9 @@ public final class FileUtils {
     private static final int FILE_NAME_POS = 0;
     private static final int FILE_EXT_POS = 1;
     private static final int READ_BUFFER_SIZE = 4096;
+    private static final int HASH_BUFFER_SIZE = 64 * 1024;
+    private static final String HASH_ALGORITHM = "MD5";
+    private static final String CHECKSUM_ALGORITHM = "CRC32";
 
     private FileUtils() {
         // hide the constructor for this utility class
@@ -535,12 +539,120 @@ public final class FileUtils {
         LOGGER.entering(CLASS, METHOD, file);
         validateExistingFile(file);
 
-        byte[] fileBytes = readFileToByteArray(file);
-        String result = computeHash(fileBytes);
+        String result = computeCachedDigest(file, HASH_ALGORITHM);
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
     }
 
+    /**
+     * Compute the Base64-encoded hash of the contents of the specified input stream.  The stream is read
+     * with a fixed size buffer so the memory used does not depend on the size of the contents.  The caller
+     * is responsible for closing the stream.
+     *
+     * @param input the input stream
+     * @return the Base64-encoded hash
+     * @throws IOException if an error occurs reading the input stream
+     * @throws NoSuchAlgorithmException if an error occurs obtaining the hashing algorithm
+     */
+    public static String computeHash(InputStream input) throws IOException, NoSuchAlgorithmException {
+        MessageDigest messageDigest = MessageDigest.getInstance(HASH_ALGORITHM);
+        byte[] readBuffer = new byte[HASH_BUFFER_SIZE];
+
+        int bytesRead;
+        while (true) {
+            bytesRead = input.read(readBuffer);
+            if (bytesRead < 0) {
+                break;
+            }
+            messageDigest.update(readBuffer, 0, bytesRead);
+        }
+        return DatatypeConverter.printBase64Binary(messageDigest.digest());
+    }
+
+    /**
+     * Compute the CRC-32 checksum and size of the specified file, formatted by formatChecksum().  This is
+     * much cheaper to compute than the hash, and can be compared with the CRC-32 and size stored in the
+     * archive for an entry without reading the entry.
+     *
+     * @param fileName the file name
+     * @return the formatted checksum
+     * @throws IOException if an error occurs reading the file
+     * @throws IllegalArgumentException if the file is not a valid, existing file
+     */
+    public static String computeChecksum(String fileName) throws IOException {
+        final String METHOD = "computeChecksum";
+
+        LOGGER.entering(CLASS, METHOD, fileName);
+        validateFileName(fileName);
+
+        String result = computeChecksum(getCanonicalFile(new File(fileName)));
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Compute the CRC-32 checksum and size of the specified file, formatted by formatChecksum().
+     *
+     * @param file the file
+     * @return the formatted checksum
+     * @throws IOException if an error occurs reading the file
+     * @throws IllegalArgumentException if the file is not a valid, existing file
+     */
+    public static String computeChecksum(File file) throws IOException {
+        final String METHOD = "computeChecksum";
+
+        LOGGER.entering(CLASS, METHOD, file);
+        validateExistingFile(file);
+
+        String result;
+        try {
+            result = computeCachedDigest(file, CHECKSUM_ALGORITHM);
+        } catch (NoSuchAlgorithmException nsae) {
+            // not thrown for CRC-32, which does not use a MessageDigest
+            IOException ioe = new IOException(nsae.getLocalizedMessage(), nsae);
+            LOGGER.throwing(CLASS, METHOD, ioe);
+            throw ioe;
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Compute the CRC-32 checksum and size of the contents of the specified input stream, formatted by
+     * formatChecksum().  The caller is responsible for closing the stream.
+     *
+     * @param input the input stream
+     * @return the formatted checksum
+     * @throws IOException if an error occurs reading the input stream
+     */
+    public static String computeChecksum(InputStream input) throws IOException {
+        CRC32 crc = new CRC32();
+        byte[] readBuffer = new byte[HASH_BUFFER_SIZE];
+        long size = 0;
+
+        int bytesRead;
+        while (true) {
+            bytesRead = input.read(readBuffer);
+            if (bytesRead < 0) {
+                break;
+            }
+            crc.update(readBuffer, 0, bytesRead);
+            size += bytesRead;
+        }
+        return formatChecksum(crc.getValue(), size);
+    }
+
+    /**
+     * Format a CRC-32 checksum and size so that checksums from different sources can be compared as strings.
+     *
+     * @param crc the CRC-32 value
+     * @param size the size of the contents
+     * @return the formatted checksum
+     */
+    public static String formatChecksum(long crc, long size) {
+        return String.format("%08x:%d", crc, size);
+    }
+
     /**
      * Compute the Base64-encoded hash for the specified bytes.
      *
@@ -549,7 +661,7 @@ public final class FileUtils {
      * @throws NoSuchAlgorithmException if an error occurs obtaining the hashing algorithm
      */
     public static String computeHash(byte[] bytes) throws NoSuchAlgorithmException {
-        MessageDigest messageDigest = MessageDigest.getInstance("MD5");
+        MessageDigest messageDigest = MessageDigest.getInstance(HASH_ALGORITHM);
         byte[] hash = messageDigest.digest(bytes);
         return DatatypeConverter.printBase64Binary(hash);
     }
@@ -616,6 +728,41 @@ public final class FileUtils {
     // Private helper methods                                                //
     ///////////////////////////////////////////////////////////////////////////
 
+    // If the hash cache is enabled, use the cached value if the file has not changed since it was computed.
+    // The size and modification time are read before the file so that a change made while reading is not cached.
+    //
+    private static String computeCachedDigest(File file, String algorithm)
+        throws IOException, NoSuchAlgorithmException {
+
+        if (!FileHashCache.isEnabled()) {
+            return computeDigest(file, algorithm);
+        }
+
+        String path = getCanonicalPath(file);
+        long size = file.length();
+        long lastModified = file.lastModified();
+        FileHashCache cache = FileHashCache.getInstance();
+        String result = cache.get(algorithm, path, size, lastModified);
+        if (result != null) {
+            return result;
+        }
+
+        result = computeDigest(file, algorithm);
+        if (file.length() == size && file.lastModified() == lastModified) {
+            cache.put(algorithm, path, size, lastModified, result);
+        }
+        return result;
+    }
+
+    private static String computeDigest(File file, String algorithm) throws IOException, NoSuchAlgorithmException {
+        try (InputStream input = new FileInputStream(file)) {
+            if (CHECKSUM_ALGORITHM.equals(algorithm)) {
+                return computeChecksum(input);
+            }
+            return computeHash(input);
+        }
+    }
+
     private static File getModelFileFromArray(File[] files, File modelDirectory) {
         File modelFile = null;
         if (files != null && files.length > 0) {
@@ -12,8 +12,12 @@ import java.io.InputStream;
 import java.net.HttpURLConnection;
 import java.net.URL;
 import java.security.NoSuchAlgorithmException;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.LinkedHashMap;
 import java.util.List;
 import java.util.Map;
+import java.util.zip.ZipEntry;
 
 import oracle.weblogic.deploy.exception.ExceptionHelper;
 import oracle.weblogic.deploy.logging.PlatformLogger;
@@ -79,6 +83,12 @@ public class WLSDeployArchive {
      */
     public static final String ARCHIVE_SCRIPTS_DIR = WLSDPLY_ARCHIVE_BINARY_DIR + "/scripts";
 
+    /**
+     * The environment variable that sets the number of threads used to extract files from the archive.
+     * The default is the number of available processors.
+     */
+    public static final String EXTRACT_THREADS_ENV_VARIABLE = "WLSDEPLOY_EXTRACT_THREADS";
+
     // Used by the unit tests so it requires package level scoping...
     //
     /* package */
@@ -270,8 +280,7 @@ public class WLSDeployArchive {
         boolean result = false;
         // Verify that the path is into the binary root directory so that we do not allow random content.
         if (isPathIntoArchive(path)) {
-            List<String> entries = getZipFile().listZipEntries();
-            result = entries.contains(path);
+            result = getZipFile().containsZipEntry(path);
         }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
@@ -294,8 +303,7 @@ public class WLSDeployArchive {
         boolean result = false;
         // Verify that the path is into the binary root directory so that we do not allow random content.
         if (isPathIntoArchive(path)) {
-            List<String> entries = getZipFile().listZipEntries();
-            result = !entries.contains(path) && zipListContainsPath(entries, path);
+            result = !getZipFile().containsZipEntry(path) && getZipFile().containsZipEntries(path);
         }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
@@ -319,8 +327,7 @@ public class WLSDeployArchive {
         boolean result = false;
         // Verify that the path is into the binary root directory so that we do not allow random content.
         if (isPathIntoArchive(path)) {
-            List<String> entries = getZipFile().listZipEntries();
-            result = entries.contains(path) || zipListContainsPath(entries, path);
+            result = getZipFile().containsZipEntry(path) || getZipFile().containsZipEntries(path);
         }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
@@ -403,6 +410,60 @@ public class WLSDeployArchive {
         return result;
     }
 
+    /**
+     * Extract the specified files and directories to the specified location (which is typically the domain
+     * home), in the same way as extractFile(path, extractToLocation).  All of the entries are extracted in
+     * parallel using one open handle on the archive, so callers should request everything they need at once.
+     *
+     * @param paths the paths into the archive file to extract
+     * @param extractToLocation the base directory to which to write the extracted files and directories
+     * @return the canonical extracted file name for each path, or null for a path that is not into the archive
+     * @throws WLSDeployArchiveIOException if an error occurs reading the archive or writing the files
+     * @throws IllegalArgumentException if a path is null or empty or the extractToLocation
+     *                                  was not a valid, existing directory
+     */
+    public List<String> extractFiles(List<String> paths, File extractToLocation) throws WLSDeployArchiveIOException {
+        final String METHOD = "extractFiles";
+
+        LOGGER.entering(CLASS, METHOD, paths, extractToLocation);
+        validateExistingDirectory(extractToLocation, "extractToLocation", getArchiveFileName(), METHOD);
+
+        List<String> result = new ArrayList<>(paths.size());
+        Map<String, File> targets = new LinkedHashMap<>();
+        for (String path : paths) {
+            validateNonEmptyString(path, "path", METHOD);
+            if (!isPathIntoArchive(path)) {
+                LOGGER.warning("WLSDPLY-01404", path);
+                result.add(null);
+                continue;
+            }
+
+            List<String> entryNames;
+            if (path.endsWith(ZIP_SEP)) {
+                entryNames = getZipFile().listZipEntries(path);
+            } else if (getZipFile().containsZipEntry(path)) {
+                entryNames = Collections.singletonList(path);
+            } else {
+                entryNames = Collections.emptyList();
+            }
+            if (entryNames.isEmpty()) {
+                WLSDeployArchiveIOException aioe =
+                    new WLSDeployArchiveIOException("WLSDPLY-01403", path, getArchiveFileName());
+                LOGGER.throwing(CLASS, METHOD, aioe);
+                throw aioe;
+            }
+            for (String entryName : entryNames) {
+                targets.put(entryName, new File(extractToLocation, entryName));
+            }
+            result.add(FileUtils.getCanonicalFile(new File(extractToLocation, path)).getAbsolutePath());
+        }
+
+        LOGGER.fine("WLSDPLY-01426", targets.size(), getArchiveFileName(), extractToLocation);
+        getZipFile().extractZipEntries(targets, getExtractThreadCount());
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
     /**
      * Get the Base64-encoded hash for the specified archive file entry.
      *
@@ -415,47 +476,73 @@ public class WLSDeployArchive {
 
         LOGGER.entering(CLASS, METHOD, path);
         validateNonEmptyString(path, "path", METHOD);
+        validateArchiveFilePath(path, METHOD);
 
-        if (path.endsWith(ZIP_SEP)) {
+        String result;
+        InputStream input = getZipFile().getZipEntry(path);
+        try {
+            if (input == null) {
+                WLSDeployArchiveIOException aioe =
+                    new WLSDeployArchiveIOException("WLSDPLY-01406", getArchiveFileName(), path);
+                LOGGER.throwing(CLASS, METHOD, aioe);
+                throw aioe;
+            }
+            result = FileUtils.computeHash(input);
+        } catch (IOException | NoSuchAlgorithmException e) {
             WLSDeployArchiveIOException aioe =
-                new WLSDeployArchiveIOException("WLSDPLY-01405", getArchiveFileName(), path);
+                new WLSDeployArchiveIOException("WLSDPLY-01407", e, getArchiveFileName(),
+                                                path, e.getLocalizedMessage());
             LOGGER.throwing(CLASS, METHOD, aioe);
             throw aioe;
-        }
-
-        Map<String, InputStream> zipEntries = getZipFile().getZipEntries(path);
-        if (zipEntries.isEmpty() || !zipEntries.containsKey(path)) {
-            WLSDeployArchiveIOException aioe =
-                new WLSDeployArchiveIOException("WLSDPLY-01406", getArchiveFileName(), path);
-            LOGGER.throwing(CLASS, METHOD, aioe);
-            closeMapInputStreams(zipEntries);
+        } finally {
+            closeInputStream(path, input);
             getZipFile().close();
-            throw aioe;
         }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
 
-        byte[] fileBytes;
-        try {
-            fileBytes = FileUtils.readInputStreamToByteArray(zipEntries.get(path));
-        } catch (IOException ioe) {
+    /**
+     * Get the CRC-32 checksum and size for the specified archive file entry, formatted the same way as
+     * FileUtils.computeChecksum().  The values stored in the archive are used so that the entry content
+     * does not need to be read.
+     *
+     * @param path the path into the archive file
+     * @return the formatted checksum for the entry
+     * @throws WLSDeployArchiveIOException if an error occurs
+     */
+    public String getFileChecksum(String path) throws WLSDeployArchiveIOException {
+        final String METHOD = "getFileChecksum";
+
+        LOGGER.entering(CLASS, METHOD, path);
+        validateNonEmptyString(path, "path", METHOD);
+        validateArchiveFilePath(path, METHOD);
+
+        ZipEntry entry = getZipFile().getZipEntryMetadata(path);
+        if (entry == null) {
             WLSDeployArchiveIOException aioe =
-                new WLSDeployArchiveIOException("WLSDPLY-01407", ioe, getArchiveFileName(),
-                                                path, ioe.getLocalizedMessage());
+                new WLSDeployArchiveIOException("WLSDPLY-01406", getArchiveFileName(), path);
             LOGGER.throwing(CLASS, METHOD, aioe);
             throw aioe;
-        } finally {
-            closeMapInputStreams(zipEntries);
-            getZipFile().close();
         }
 
         String result;
-        try {
-            result = FileUtils.computeHash(fileBytes);
-        } catch (NoSuchAlgorithmException e) {
-            WLSDeployArchiveIOException aioe =
-                new WLSDeployArchiveIOException("WLSDPLY-01407", e, getArchiveFileName(),
-                                                path, e.getLocalizedMessage());
-            LOGGER.throwing(CLASS, METHOD, aioe);
-            throw aioe;
+        if (entry.getCrc() != -1 && entry.getSize() != -1) {
+            result = FileUtils.formatChecksum(entry.getCrc(), entry.getSize());
+        } else {
+            InputStream input = getZipFile().getZipEntry(path);
+            try {
+                result = FileUtils.computeChecksum(input);
+            } catch (IOException ioe) {
+                WLSDeployArchiveIOException aioe =
+                    new WLSDeployArchiveIOException("WLSDPLY-01407", ioe, getArchiveFileName(),
+                                                    path, ioe.getLocalizedMessage());
+                LOGGER.throwing(CLASS, METHOD, aioe);
+                throw aioe;
+            } finally {
+                closeInputStream(path, input);
+                getZipFile().close();
+            }
         }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
@@ -879,10 +966,40 @@ public class WLSDeployArchive {
     }
 
     /**
-     * Closes the underlying zip file and any open streams.
+     * Start a transaction on the archive.  The changes made to the archive until the transaction is
+     * committed are written to the archive file in a single pass, instead of rewriting the archive
+     * file for every change.  Reading from the archive during the transaction commits the changes
+     * made so far.
+     *
+     * @throws WLSDeployArchiveIOException if an error occurs while starting the transaction
+     */
+    public void beginTransaction() throws WLSDeployArchiveIOException {
+        getZipFile().beginBatch();
+    }
+
+    /**
+     * Write the changes made since the transaction was started to the archive file.  The existing
+     * entries of the archive are copied without being recompressed.
+     *
+     * @throws WLSDeployArchiveIOException if an error occurs while writing the archive file
+     */
+    public void commitTransaction() throws WLSDeployArchiveIOException {
+        getZipFile().commitBatch();
+    }
+
+    /**
+     * Discard the changes made since the transaction was started.
+     */
+    public void rollbackTransaction() {
+        getZipFile().rollbackBatch();
+    }
+
+    /**
+     * Closes the underlying zip file and any open streams.  Any uncommitted transaction is discarded.
      */
     public void close() {
         if (getZipFile() != null) {
+            getZipFile().rollbackBatch();
             getZipFile().close();
         }
     }
@@ -1045,48 +1162,13 @@ public class WLSDeployArchive {
         if (!dirName.endsWith(ZIP_SEP)) {
             dirName += ZIP_SEP;
         }
-        Map<String, InputStream> zipEntries = getZipFile().getZipEntries(dirName);
-        FileOutputStream outputStream;
-        File targetFile = null;
-        try {
-            if (zipEntries != null && !zipEntries.isEmpty()) {
-                for (Map.Entry<String, InputStream> zipEntry : zipEntries.entrySet()) {
-                    String entryName = zipEntry.getKey();
-                    String targetFileName = entryName.replace(fromDirectoryName + ZIP_SEP, toDirectoryName + SEP);
-                    targetFile = new File(extractToLocation, targetFileName);
-                    File targetDirectory;
-                    if (entryName.endsWith(ZIP_SEP)) {
-                        targetDirectory = targetFile;
-                    } else {
-                        targetDirectory = targetFile.getParentFile();
-                    }
-                    if (!targetDirectory.exists() && !targetDirectory.mkdirs()) {
-                        WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01414",
-                            getArchiveFileName(), targetDirectory.getAbsolutePath());
-                        LOGGER.throwing(CLASS, METHOD, wdaioe);
-                        throw wdaioe;
-                    }
-
-                    // no need to copy a directory entry
-                    //
-                    if (!entryName.endsWith(ZIP_SEP)) {
-                        InputStream inputStream = zipEntry.getValue();
-                        // overwrite any existing file
-                        outputStream = new FileOutputStream(targetFile, false);
-                        copyFile(inputStream, outputStream);
-                        outputStream.close();
-                    }
-                }
-            }
-        } catch (IOException ioe) {
-            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01415", ioe,
-                getArchiveFileName(), targetFile.getAbsolutePath(), ioe.getLocalizedMessage());
-            LOGGER.throwing(CLASS, METHOD, wdaioe);
-            throw wdaioe;
-        } finally {
-            closeMapInputStreams(zipEntries);
-            getZipFile().close();
+        Map<String, File> targets = new LinkedHashMap<>();
+        for (String entryName : getZipFile().listZipEntries(dirName)) {
+            String targetFileName = entryName.replace(fromDirectoryName + ZIP_SEP, toDirectoryName + SEP);
+            targets.put(entryName, new File(extractToLocation, targetFileName));
         }
+        LOGGER.fine("WLSDPLY-01426", targets.size(), getArchiveFileName(), extractToLocation);
+        getZipFile().extractZipEntries(targets, getExtractThreadCount());
         LOGGER.exiting(CLASS, METHOD);
     }
 
@@ -1140,19 +1222,6 @@ public class WLSDeployArchive {
     // Private Helper methods used by the protected methods above...         //
     ///////////////////////////////////////////////////////////////////////////
 
-    private static boolean zipListContainsPath(List<String> entries, String path) {
-        boolean foundInList = false;
-        if (path != null && entries != null) {
-            for (String entry : entries) {
-                if (entry.startsWith(path)) {
-                    foundInList = true;
-                    break;
-                }
-            }
-        }
-        return foundInList;
-    }
-
     private static void copyFile(InputStream input, FileOutputStream output) throws IOException {
         byte[] readBuffer = new byte[READ_BUFFER_SIZE];
 
@@ -1166,19 +1235,23 @@ public class WLSDeployArchive {
         }
     }
 
-    private static void closeMapInputStreams(Map<String, InputStream> map) {
-        if (map != null) {
-            for (Map.Entry<String, InputStream> entry : map.entrySet()) {
-                InputStream stream = entry.getValue();
-                try {
-                    if (stream != null) {
-                        stream.close();
-                    }
-                } catch (IOException ignore) {
-                    // we are just trying to cleanup so ignore this error
-                    LOGGER.warning("WLSDPLY-01417", ignore, entry.getKey(), ignore.getLocalizedMessage());
-                }
+    private static void closeInputStream(String name, InputStream stream) {
+        try {
+            if (stream != null) {
+                stream.close();
             }
+        } catch (IOException ignore) {
+            // we are just trying to cleanup so ignore this error
+            LOGGER.warning("WLSDPLY-01417", ignore, name, ignore.getLocalizedMessage());
+        }
+    }
+
+    private void validateArchiveFilePath(String path, String callingMethod) throws WLSDeployArchiveIOException {
+        if (path.endsWith(ZIP_SEP)) {
+            WLSDeployArchiveIOException aioe =
+                new WLSDeployArchiveIOException("WLSDPLY-01405", getArchiveFileName(), path);
+            LOGGER.throwing(CLASS, callingMethod, aioe);
+            throw aioe;
         }
     }
 
@@ -1208,6 +1281,19 @@ public class WLSDeployArchive {
     // Private Static Helper Methods                                         //
     ///////////////////////////////////////////////////////////////////////////
 
+    private static int getExtractThreadCount() {
+        int result = Runtime.getRuntime().availableProcessors();
+        String value = System.getenv(EXTRACT_THREADS_ENV_VARIABLE);
+        if (!StringUtils.isEmpty(value)) {
+            try {
+                result = Integer.parseInt(value.trim());
+            } catch (NumberFormatException nfe) {
+                LOGGER.warning("WLSDPLY-01427", value, EXTRACT_THREADS_ENV_VARIABLE, result);
+            }
+        }
+        return Math.max(1, result);
+    }
+
     private static void validateExistingFile(File file, String argName, String fileName, String callingMethod) {
         validateExistingFile(file, argName, fileName, callingMethod, false);
     }
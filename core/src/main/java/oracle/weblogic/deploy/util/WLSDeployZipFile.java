@@ -4,19 +4,32 @@
  */
 package oracle.weblogic.deploy.util;
 
+import java.io.BufferedOutputStream;
 import java.io.File;
 import java.io.FileInputStream;
+import java.io.FilterInputStream;
 import java.io.FileOutputStream;
 import java.io.IOException;
 import java.io.InputStream;
+import java.io.InterruptedIOException;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.util.ArrayList;
+import java.util.Collection;
+import java.util.Collections;
+import java.util.Comparator;
 import java.util.Enumeration;
 import java.util.Iterator;
 import java.util.LinkedHashMap;
+import java.util.LinkedHashSet;
 import java.util.List;
 import java.util.Map;
+import java.util.concurrent.Callable;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.concurrent.TimeUnit;
 import java.util.regex.Pattern;
 import java.util.zip.ZipEntry;
 import java.util.zip.ZipFile;
@@ -28,6 +41,12 @@ import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
 
 /**
  * The internal class that does the heavy-lifting with zip files for the WLSDeployArchive class.
+ * The methods that access the zip file are synchronized so that a single archive can be shared
+ * by multiple discover threads.  The input streams returned for the entries are read from a zip file
+ * opened for each caller, so that a call from another thread does not close the zip file under them.
+ *
+ * Each change rewrites the whole zip file unless it is made inside a batch started with beginBatch(),
+ * in which case the zip file is written once when the batch is committed.
  */
 public class WLSDeployZipFile {
     private static final String CLASS = WLSDeployZipFile.class.getName();
@@ -40,6 +59,7 @@ public class WLSDeployZipFile {
     private static final char ZIP_SEP_CHAR = '/';
     private static final String ZIP_SEP = "/";
     private static final int READ_BUFFER_SIZE = 4096;
+    private static final int EXTRACT_BUFFER_SIZE = 64 * 1024;
 
     private static final int MAX_DIGITS = Integer.toString(Integer.MAX_VALUE).length() - 1;
     private static final String ARCHIVE_RENAME_PATTERN_REGEX = ".+\\([0-9]{1," + MAX_DIGITS + "}\\)/?$";
@@ -51,6 +71,14 @@ public class WLSDeployZipFile {
     private File file;
     private ZipFile openZipFile;
     private boolean newFile;
+    private ZipEntryIndex entryIndex;
+
+    private File batchFile;
+    private ZipOutputStream batchOutputStream;
+    private LinkedHashMap<String, ZipEntry> batchSavedEntries;
+    private LinkedHashSet<String> batchNewEntries;
+    private boolean batchChanged;
+    private Exception batchFailure;
 
     //////////////////////////////////////////////////////////////////////////////////////////////////
     // Public APIs                                                                                  //
@@ -90,46 +118,146 @@ public class WLSDeployZipFile {
 
 
     /**
-     * Get an entry from the zip file.  Because this code returns an input stream from the ZipFile,
-     * the caller must call close() when they are finished with the input stream.
+     * Get an entry from the zip file.  Because this code returns an input stream from a ZipFile opened
+     * for the caller, the caller must call close() when they are finished with the input stream.
      *
      * @param key entry name
      * @return an InputStream for the entry content, or null if the entry does not exist
      * @throws WLSDeployArchiveIOException if an IOException occurred while reading or writing changes
      */
-    public InputStream getZipEntry(String key) throws WLSDeployArchiveIOException {
+    public synchronized InputStream getZipEntry(String key) throws WLSDeployArchiveIOException {
         final String METHOD = "getZipEntry";
 
         LOGGER.entering(CLASS, METHOD, key);
         closeOpenZipFile();
+        flushBatch();
 
-        LinkedHashMap<String, ZipEntry> map = getZipFileEntries(getFile());
+        ZipEntryIndex index = getEntryIndex();
         InputStream stream = null;
-        boolean leaveOpen = false;
-        try {
-            if (map.containsKey(key)) {
-                LOGGER.finer("WLSDPLY-01500", getFileName(), key);
-                openZipFile = new ZipFile(getFile(), ZIP_FILE_OPEN_MODE);
-                ZipEntry ze = new ZipEntry(key);
-                sanitizeZipEntry(ze);
-                stream = openZipFile.getInputStream(ze);
-                leaveOpen = true;
-                LOGGER.finer("WLSDPLY-01501", getFileName(), ze.getName(), stream.toString());
-            } else {
-                LOGGER.finer("WLSDPLY-01502", getFileName(), key);
+        if (index.containsEntry(key)) {
+            LOGGER.finer("WLSDPLY-01500", getFileName(), key);
+            ZipEntry ze = new ZipEntry(key);
+            sanitizeZipEntry(ze);
+            Map<String, InputStream> streams = openEntryStreams(Collections.singletonList(ze), METHOD);
+            stream = streams.get(key);
+            LOGGER.finer("WLSDPLY-01501", getFileName(), ze.getName(), stream.toString());
+        } else {
+            LOGGER.finer("WLSDPLY-01502", getFileName(), key);
+        }
+        LOGGER.exiting(CLASS, METHOD, stream);
+        return stream;
+    }
+
+    /**
+     * Get the central directory information for an entry in the zip file, which includes the size, the
+     * compressed size and the CRC-32 of the entry.  The entry content is not read.
+     *
+     * @param key entry name
+     * @return a copy of the entry, or null if the entry does not exist
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
+     */
+    public synchronized ZipEntry getZipEntryMetadata(String key) throws WLSDeployArchiveIOException {
+        final String METHOD = "getZipEntryMetadata";
+
+        LOGGER.entering(CLASS, METHOD, key);
+        closeOpenZipFile();
+        flushBatch();
+
+        ZipEntry result = getEntryIndex().getEntry(key);
+        if (result != null) {
+            result = new ZipEntry(result);
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Extract the specified entries to files using a pool of threads that share one open zip file.  An entry
+     * whose name ends with a slash is a directory entry, for which only the target directory is created.  The
+     * largest entries are started first so that a single large entry does not leave the other threads idle.
+     *
+     * @param targets the target file for each entry name
+     * @param threadCount the maximum number of threads to use
+     * @throws WLSDeployArchiveIOException if an entry does not exist or an error occurs extracting an entry
+     */
+    public synchronized void extractZipEntries(Map<String, File> targets, int threadCount)
+        throws WLSDeployArchiveIOException {
+        final String METHOD = "extractZipEntries";
+
+        LOGGER.entering(CLASS, METHOD, targets.keySet(), threadCount);
+        closeOpenZipFile();
+        flushBatch();
+
+        ZipEntryIndex index = getEntryIndex();
+        List<ZipEntry> entries = new ArrayList<>(targets.size());
+        for (String name : targets.keySet()) {
+            ZipEntry entry = index.getEntry(name);
+            if (entry == null) {
+                WLSDeployArchiveIOException wdaioe =
+                    new WLSDeployArchiveIOException("WLSDPLY-01550", getFileName(), name);
+                LOGGER.throwing(CLASS, METHOD, wdaioe);
+                throw wdaioe;
+            }
+            entries.add(entry);
+        }
+        if (entries.isEmpty()) {
+            LOGGER.exiting(CLASS, METHOD);
+            return;
+        }
+        Collections.sort(entries, new Comparator<ZipEntry>() {
+            @Override
+            public int compare(ZipEntry first, ZipEntry second) {
+                return Long.compare(second.getCompressedSize(), first.getCompressedSize());
+            }
+        });
+
+        int poolSize = Math.max(1, Math.min(threadCount, entries.size()));
+        LOGGER.fine("WLSDPLY-01551", getFileName(), entries.size(), poolSize);
+        try (final ZipFile zipFile = new ZipFile(getFile(), ZIP_FILE_OPEN_MODE)) {
+            ExecutorService executor = Executors.newFixedThreadPool(poolSize);
+            try {
+                List<Future<Void>> results = new ArrayList<>(entries.size());
+                for (final ZipEntry entry : entries) {
+                    final File target = targets.get(entry.getName());
+                    results.add(executor.submit(new Callable<Void>() {
+                        @Override
+                        public Void call() throws WLSDeployArchiveIOException {
+                            extractZipEntry(zipFile, entry, target);
+                            return null;
+                        }
+                    }));
+                }
+                for (Future<Void> result : results) {
+                    result.get();
+                }
+            } finally {
+                // stop the remaining entries after a failure, and wait so the zip file is not closed under them
+                executor.shutdownNow();
+                awaitTermination(executor);
             }
+        } catch (ExecutionException ee) {
+            Throwable cause = ee.getCause();
+            if (cause instanceof WLSDeployArchiveIOException) {
+                LOGGER.throwing(CLASS, METHOD, cause);
+                throw (WLSDeployArchiveIOException) cause;
+            }
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01503", cause,
+                getFileName(), cause.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        } catch (InterruptedException ie) {
+            Thread.currentThread().interrupt();
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01503", ie,
+                getFileName(), ie.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
         } catch (IOException ioe) {
             WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01503", ioe,
                 getFileName(), ioe.getLocalizedMessage());
             LOGGER.throwing(CLASS, METHOD, wdaioe);
             throw wdaioe;
-        } finally {
-            if (!leaveOpen && openZipFile != null) {
-                closeOpenZipFile();
-            }
         }
-        LOGGER.exiting(CLASS, METHOD, stream);
-        return stream;
+        LOGGER.exiting(CLASS, METHOD);
     }
 
     /**
@@ -138,14 +266,18 @@ public class WLSDeployZipFile {
      * @return the list of zip file entries
      * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
      */
-    public List<String> listZipEntries() throws WLSDeployArchiveIOException {
+    public synchronized List<String> listZipEntries() throws WLSDeployArchiveIOException {
         final String METHOD = "listZipEntries";
 
         LOGGER.entering(CLASS, METHOD);
         closeOpenZipFile();
 
-        Map<String, ZipEntry> zipEntries = getZipFileEntries(file);
-        List<String> result = new ArrayList<>(zipEntries.keySet());
+        List<String> result;
+        if (isBatchOpen()) {
+            result = new ArrayList<>(getCurrentEntries().keySet());
+        } else {
+            result = getEntryIndex().getNames();
+        }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
     }
@@ -157,57 +289,88 @@ public class WLSDeployZipFile {
      * @return the list of zip file entries that match the prefix
      * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
      */
-    public List<String> listZipEntries(String prefix) throws WLSDeployArchiveIOException {
+    public synchronized List<String> listZipEntries(String prefix) throws WLSDeployArchiveIOException {
         final String METHOD = "listZipEntries";
 
         LOGGER.entering(CLASS, METHOD, prefix);
         closeOpenZipFile();
 
-        Map<String, ZipEntry> zipEntries = getZipFileEntries(file);
-        List<String> result = new ArrayList<>();
-        for (String name : zipEntries.keySet()) {
-            if (name.startsWith(prefix)) {
-                result.add(name);
+        List<String> result;
+        if (isBatchOpen()) {
+            result = new ArrayList<>();
+            for (String name : getCurrentEntries().keySet()) {
+                if (name.startsWith(prefix)) {
+                    result.add(name);
+                }
             }
+        } else {
+            result = getEntryIndex().getNames(prefix);
         }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
     }
 
     /**
-     * Get the entries in the zip file.  Because this code returns input streams from the ZipFile,
-     * the caller must call close() when they are finished with the input streams.
+     * Determines whether or not the zip file has an entry with the specified name.
+     *
+     * @param key the entry name
+     * @return true if the entry exists, false otherwise
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
+     */
+    public synchronized boolean containsZipEntry(String key) throws WLSDeployArchiveIOException {
+        final String METHOD = "containsZipEntry";
+
+        LOGGER.entering(CLASS, METHOD, key);
+        boolean result = hasEntry(key);
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Determines whether or not the zip file has any entry whose name starts with the specified prefix.
+     *
+     * @param prefix the prefix to match
+     * @return true if at least one entry matches, false otherwise
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
+     */
+    public synchronized boolean containsZipEntries(String prefix) throws WLSDeployArchiveIOException {
+        final String METHOD = "containsZipEntries";
+
+        LOGGER.entering(CLASS, METHOD, prefix);
+        boolean result = false;
+        if (isBatchOpen()) {
+            for (String name : getCurrentEntries().keySet()) {
+                if (name.startsWith(prefix)) {
+                    result = true;
+                    break;
+                }
+            }
+        } else {
+            result = getEntryIndex().containsPrefix(prefix);
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Get the entries in the zip file.  Because this code returns input streams from a ZipFile opened
+     * for the caller, the caller must call close() when they are finished with the input streams.
      *
      * @return a map of InputStreams keyed by the entry name
      * @throws WLSDeployArchiveIOException if an IOException occurred while reading or writing changes
      */
-    public Map<String, InputStream> getZipEntries() throws WLSDeployArchiveIOException {
+    public synchronized Map<String, InputStream> getZipEntries() throws WLSDeployArchiveIOException {
         final String METHOD = "getZipEntries";
 
         LOGGER.entering(CLASS, METHOD);
         closeOpenZipFile();
+        flushBatch();
 
-        LinkedHashMap<String, ZipEntry> map = getZipFileEntries(getFile());
-        LinkedHashMap<String, InputStream> zipEntries = new LinkedHashMap<>();
-        boolean leaveOpen = false;
-        try {
-            if (!map.isEmpty()) {
-                LOGGER.finer("WLSDPLY-01504", getFileName(), map.size());
-                openZipFile = new ZipFile(getFile(), ZIP_FILE_OPEN_MODE);
-                for (String key : map.keySet()) {
-                    addEntryToMap(map, zipEntries, key);
-                }
-                leaveOpen = true;
-            }
-        } catch (IOException ioe) {
-            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01503", ioe,
-                getFileName(), ioe.getLocalizedMessage());
-            LOGGER.throwing(CLASS, METHOD, wdaioe);
-            throw wdaioe;
-        } finally {
-            if (!leaveOpen && openZipFile != null) {
-                closeOpenZipFile();
-            }
+        LinkedHashMap<String, ZipEntry> map = getZipFileEntries();
+        Map<String, InputStream> zipEntries = new LinkedHashMap<>();
+        if (!map.isEmpty()) {
+            LOGGER.finer("WLSDPLY-01504", getFileName(), map.size());
+            zipEntries = openEntryStreams(map.values(), METHOD);
         }
         LOGGER.exiting(CLASS, METHOD, zipEntries);
         return zipEntries;
@@ -215,44 +378,30 @@ public class WLSDeployZipFile {
 
     /**
      * Get the entries in the zip file whose names start with the specified value.  Because this code
-     * returns input streams from the ZipFile, the caller must call close() when they are finished
-     * with the input streams.
+     * returns input streams from a ZipFile opened for the caller, the caller must call close() when
+     * they are finished with the input streams.
      *
      * @param key the beginning part of the entry names to match
      * @return a map of InputStreams keyed by the entry name
      * @throws WLSDeployArchiveIOException if an IOException occured while rading or writing changes
      */
-    public Map<String, InputStream> getZipEntries(String key) throws WLSDeployArchiveIOException {
+    public synchronized Map<String, InputStream> getZipEntries(String key) throws WLSDeployArchiveIOException {
         final String METHOD = "getZipEntries";
 
         LOGGER.entering(CLASS, METHOD, key);
         closeOpenZipFile();
-
-        LinkedHashMap<String, ZipEntry> map = getZipFileEntries(getFile());
-        LinkedHashMap<String, InputStream> zipEntries = new LinkedHashMap<>();
-        boolean leaveOpen = false;
-        try {
-            if (!map.isEmpty()) {
-                LOGGER.finer("WLSDPLY-01504", getFileName(), map.size());
-                openZipFile = new ZipFile(getFile(), ZIP_FILE_OPEN_MODE);
-                Iterator<String> savedKeys = map.keySet().iterator();
-                while (savedKeys.hasNext()) {
-                    String savedKey = savedKeys.next();
-                    if (savedKey.startsWith(key)) {
-                        addEntryToMap(map, zipEntries, savedKey);
-                    }
-                }
-                leaveOpen = true;
-            }
-        } catch (IOException ioe) {
-            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01503", ioe,
-                getFileName(), ioe.getLocalizedMessage());
-            LOGGER.throwing(CLASS, METHOD, wdaioe);
-            throw wdaioe;
-        } finally {
-            if (!leaveOpen && openZipFile != null) {
-                closeOpenZipFile();
+        flushBatch();
+
+        ZipEntryIndex index = getEntryIndex();
+        Map<String, InputStream> zipEntries = new LinkedHashMap<>();
+        List<String> matchingKeys = index.getNames(key);
+        if (!matchingKeys.isEmpty()) {
+            LOGGER.finer("WLSDPLY-01505", getFileName(), key, matchingKeys.size());
+            List<ZipEntry> entries = new ArrayList<>(matchingKeys.size());
+            for (String matchingKey : matchingKeys) {
+                entries.add(new ZipEntry(index.getEntry(matchingKey)));
             }
+            zipEntries = openEntryStreams(entries, METHOD);
         }
         LOGGER.exiting(CLASS, METHOD, zipEntries);
         return zipEntries;
@@ -265,18 +414,18 @@ public class WLSDeployZipFile {
      * @return true if the entry was found and removed, false otherwise
      * @throws WLSDeployArchiveIOException if an IOException occurred while reading or writing changes
      */
-    public boolean removeZipEntry(String key) throws WLSDeployArchiveIOException {
+    public synchronized boolean removeZipEntry(String key) throws WLSDeployArchiveIOException {
         final String METHOD = "removeZipEntry";
 
         LOGGER.entering(CLASS, METHOD, key);
         closeOpenZipFile();
 
         boolean removedEntry = false;
-        LinkedHashMap<String, ZipEntry> map = getZipFileEntries(getFile());
+        LinkedHashMap<String, ZipEntry> map = getCurrentEntries();
         if (map.containsKey(key)) {
             LOGGER.finer("WLSDPLY-01500", getFileName(), key);
             map.remove(key);
-            saveChangesToZip(map, null);
+            writeChanges(map, null);
             removedEntry = true;
         } else {
             LOGGER.finer("WLSDPLY-01502", getFileName(), key);
@@ -294,14 +443,14 @@ public class WLSDeployZipFile {
      * @return whether ot not any entries were deleted from the zip
      * @throws WLSDeployArchiveIOException if an error occurs reading or writing the zip file
      */
-    public boolean removeZipEntries(String key) throws WLSDeployArchiveIOException {
+    public synchronized boolean removeZipEntries(String key) throws WLSDeployArchiveIOException {
         final String METHOD = "removeZipEntries";
 
         LOGGER.entering(CLASS, METHOD, key);
         closeOpenZipFile();
 
         boolean removedEntry = false;
-        LinkedHashMap<String, ZipEntry> entriesMap = getZipFileEntries(getFile());
+        LinkedHashMap<String, ZipEntry> entriesMap = getCurrentEntries();
         if (!entriesMap.isEmpty()) {
             ArrayList<String> matchingKeys = getMatchingKeysFromMap(entriesMap, key);
             if (!matchingKeys.isEmpty()) {
@@ -310,7 +459,7 @@ public class WLSDeployZipFile {
                 for (String matchingKey : matchingKeys) {
                     entriesMap.remove(matchingKey);
                 }
-                saveChangesToZip(entriesMap, null);
+                writeChanges(entriesMap, null);
                 removedEntry = true;
             } else {
                 LOGGER.finer("WLSDPLY-01506", getFileName(), key);
@@ -329,7 +478,7 @@ public class WLSDeployZipFile {
      * @return the entry name used to store the entry or null if the add failed due to an entry name conflict
      * @throws WLSDeployArchiveIOException if an IOException occurred while adding the entry
      */
-    public String addZipEntry(String entryName, InputStream inputStream, boolean rename)
+    public synchronized String addZipEntry(String entryName, InputStream inputStream, boolean rename)
         throws WLSDeployArchiveIOException {
         final String METHOD = "addZipEntry";
 
@@ -359,14 +508,14 @@ public class WLSDeployZipFile {
      * @return true if the entry was added, false if the zip file already has an entry with that name
      * @throws WLSDeployArchiveIOException if an IOException occurred while adding the entry
      */
-    public boolean addZipEntry(String key, InputStream inputStream) throws WLSDeployArchiveIOException {
+    public synchronized boolean addZipEntry(String key, InputStream inputStream) throws WLSDeployArchiveIOException {
         final String METHOD = "addZipEntry";
 
         LOGGER.entering(CLASS, METHOD, key, inputStream);
         closeOpenZipFile();
 
         boolean addedEntry = true;
-        LinkedHashMap<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
+        LinkedHashMap<String, ZipEntry> zipEntriesMap = getCurrentEntries();
         if (zipEntriesMap.containsKey(key)) {
             LOGGER.finer("WLSDPLY-01509", getFileName(), key);
             addedEntry = false;
@@ -376,7 +525,7 @@ public class WLSDeployZipFile {
             LOGGER.finer("WLSDPLY-01510", getFileName(), key);
             LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
             newEntries.put(key, inputStream);
-            saveChangesToZip(zipEntriesMap, newEntries);
+            writeChanges(zipEntriesMap, newEntries);
             LOGGER.finer("WLSDPLY-01511", getFileName(), key);
         }
         LOGGER.exiting(CLASS, METHOD, addedEntry);
@@ -391,7 +540,8 @@ public class WLSDeployZipFile {
      * @return the name of the added entry
      * @throws WLSDeployArchiveIOException if an IOException occurred while adding the entry
      */
-    public String addZipDirectoryEntry(String entryName, boolean rename) throws WLSDeployArchiveIOException {
+    public synchronized String addZipDirectoryEntry(String entryName, boolean rename)
+        throws WLSDeployArchiveIOException {
         final String METHOD = "addZipDirectoryEntry";
 
         LOGGER.entering(CLASS, METHOD, entryName, rename);
@@ -426,14 +576,14 @@ public class WLSDeployZipFile {
      * @return whether or not the entry was added
      * @throws WLSDeployArchiveIOException if an IOException occurred while adding the entry
      */
-    public boolean addZipDirectoryEntry(String key) throws WLSDeployArchiveIOException {
+    public synchronized boolean addZipDirectoryEntry(String key) throws WLSDeployArchiveIOException {
         final String METHOD = "addZipDirectoryEntry";
 
         LOGGER.entering(CLASS, METHOD, key);
         closeOpenZipFile();
 
         boolean addedEntry = true;
-        LinkedHashMap<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
+        LinkedHashMap<String, ZipEntry> zipEntriesMap = getCurrentEntries();
         if (zipEntriesMap.containsKey(key)) {
             LOGGER.finer("WLSDPLY-01509", getFileName(), key);
             addedEntry = false;
@@ -443,7 +593,7 @@ public class WLSDeployZipFile {
             LOGGER.finer("WLSDPLY-01510", getFileName(), key);
             LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
             newEntries.put(key, null);
-            saveChangesToZip(zipEntriesMap, newEntries);
+            writeChanges(zipEntriesMap, newEntries);
             LOGGER.finer("WLSDPLY-01511", getFileName(), key);
         }
         LOGGER.exiting(CLASS, METHOD, addedEntry);
@@ -460,7 +610,8 @@ public class WLSDeployZipFile {
      * @throws WLSDeployArchiveIOException if an IOException occurred while adding the entry
      * @throws IllegalArgumentException if the file provided is not a valid directory
      */
-    public String addDirectoryZipEntries(String entryName, File directory) throws WLSDeployArchiveIOException {
+    public synchronized String addDirectoryZipEntries(String entryName, File directory)
+        throws WLSDeployArchiveIOException {
         final String METHOD = "addDirectoryZipEntries";
 
         LOGGER.entering(CLASS, METHOD, entryName, directory);
@@ -495,11 +646,11 @@ public class WLSDeployZipFile {
         if (!rootEntryName.endsWith(ZIP_SEP)) {
             rootEntryName += ZIP_SEP;
         }
-        LinkedHashMap<String, ZipEntry> existingEntries = getZipFileEntries(getFile());
+        LinkedHashMap<String, ZipEntry> existingEntries = getCurrentEntries();
         LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
         try {
             addDirectoryToUnsavedMap(newEntries, directory, rootEntryName);
-            saveChangesToZip(existingEntries, newEntries);
+            writeChanges(existingEntries, newEntries);
         } finally {
             cleanupUnsavedEntries(newEntries);
         }
@@ -514,13 +665,13 @@ public class WLSDeployZipFile {
      * @param inputStream the InputStream to use to read the contents
      * @throws WLSDeployArchiveIOException if an error occurs while reading or writing the zip file.
      */
-    public void putZipEntry(String key, InputStream inputStream) throws WLSDeployArchiveIOException {
+    public synchronized void putZipEntry(String key, InputStream inputStream) throws WLSDeployArchiveIOException {
         final String METHOD = "putZipEntry";
 
         LOGGER.entering(CLASS, METHOD, key, inputStream);
         closeOpenZipFile();
 
-        LinkedHashMap<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
+        LinkedHashMap<String, ZipEntry> zipEntriesMap = getCurrentEntries();
         if (zipEntriesMap.containsKey(key)) {
             zipEntriesMap.remove(key);
         }
@@ -529,7 +680,7 @@ public class WLSDeployZipFile {
         entryToPut.put(key, inputStream);
         try {
             LOGGER.finer("WLSDPLY-01510", getFileName(), key);
-            saveChangesToZip(zipEntriesMap, entryToPut);
+            writeChanges(zipEntriesMap, entryToPut);
             LOGGER.finer("WLSDPLY-01511", getFileName(), key);
         } finally {
             cleanupUnsavedEntries(entryToPut);
@@ -537,10 +688,119 @@ public class WLSDeployZipFile {
         LOGGER.exiting(CLASS, METHOD);
     }
 
+    /**
+     * Start a batch of changes to the zip file.  Until the batch is committed, added entries are compressed
+     * into a temporary file and removed or replaced saved entries are only recorded, so that adding many
+     * entries does not rewrite the zip file for each one.  Reading entries while a batch is open commits
+     * the changes made so far.  If an entry cannot be written, only that entry is left out of the batch.
+     * If the batch cannot be recovered from that failure, later changes and commitBatch() throw an exception.
+     *
+     * @throws WLSDeployArchiveIOException if the zip file cannot be read or the temporary file cannot be created
+     * @throws IllegalStateException if a batch is already open
+     */
+    public synchronized void beginBatch() throws WLSDeployArchiveIOException {
+        final String METHOD = "beginBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        closeOpenZipFile();
+        if (isBatchOpen()) {
+            String message = ExceptionHelper.getMessage("WLSDPLY-01547", getFileName());
+            IllegalStateException ise = new IllegalStateException(message);
+            LOGGER.throwing(CLASS, METHOD, ise);
+            throw ise;
+        }
+
+        LinkedHashMap<String, ZipEntry> savedEntries = getZipFileEntries();
+        String[] nameComponents = FileUtils.parseFileName(getFileName());
+        File tempFile = null;
+        try {
+            tempFile = File.createTempFile(nameComponents[0], DOT + nameComponents[1], getFile().getParentFile());
+            batchOutputStream =
+                new ZipOutputStream(new BufferedOutputStream(new FileOutputStream(tempFile, false)));
+        } catch (IOException ioe) {
+            deleteBatchFile(tempFile);
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01548", ioe,
+                getFileName(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        }
+        batchFile = tempFile;
+        batchSavedEntries = savedEntries;
+        batchNewEntries = new LinkedHashSet<>();
+        batchChanged = false;
+        batchFailure = null;
+        LOGGER.fine("WLSDPLY-01542", getFileName(), batchFile.getAbsolutePath());
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Commit the open batch of changes by writing the zip file once.  The saved entries that were not removed
+     * or replaced are copied without being decompressed and recompressed.  Does nothing if no batch is open.
+     *
+     * @throws WLSDeployArchiveIOException if an error occurs while writing the zip file, or if the batch
+     *                                     could not be recovered from an earlier failure, in which case
+     *                                     the batch is discarded
+     */
+    public synchronized void commitBatch() throws WLSDeployArchiveIOException {
+        final String METHOD = "commitBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        closeOpenZipFile();
+        if (isBatchOpen()) {
+            try {
+                checkBatchNotFailed();
+                try {
+                    batchOutputStream.close();
+                } catch (IOException ioe) {
+                    WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01522", ioe,
+                        getFileName(), ioe.getLocalizedMessage());
+                    LOGGER.throwing(CLASS, METHOD, wdaioe);
+                    throw wdaioe;
+                }
+                if (batchChanged) {
+                    LOGGER.fine("WLSDPLY-01543", getFileName(), batchNewEntries.size(), batchSavedEntries.size());
+                    saveBatchToZip();
+                }
+            } finally {
+                endBatch();
+            }
+        }
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Discard the open batch of changes, leaving the zip file as it was when the batch was started.
+     * Does nothing if no batch is open.
+     */
+    public synchronized void rollbackBatch() {
+        final String METHOD = "rollbackBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        if (isBatchOpen()) {
+            try {
+                batchOutputStream.close();
+            } catch (IOException ignore) {
+                LOGGER.finest("WLSDPLY-01539", ignore, batchFile.getAbsolutePath(), ignore.getLocalizedMessage());
+            }
+            endBatch();
+            LOGGER.fine("WLSDPLY-01545", getFileName());
+        }
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Whether or not a batch of changes is open.
+     *
+     * @return true if a batch is open, false otherwise
+     */
+    public synchronized boolean isBatchOpen() {
+        return batchOutputStream != null;
+    }
+
     /**
      * Closes the open zip file from the last call, if any, which in turn closes all open input streams into the zip.
      */
-    public void close() {
+    public synchronized void close() {
         final String METHOD = "close";
 
         LOGGER.entering(CLASS, METHOD);
@@ -595,6 +855,55 @@ public class WLSDeployZipFile {
         }
     }
 
+    // Called concurrently by the extractZipEntries() threads, so only the zip file is shared.
+    //
+    private void extractZipEntry(ZipFile zipFile, ZipEntry entry, File target) throws WLSDeployArchiveIOException {
+        final String METHOD = "extractZipEntry";
+
+        File targetDirectory = entry.isDirectory() ? target : target.getParentFile();
+        // another thread may create the directory between the checks
+        if (!targetDirectory.isDirectory() && !targetDirectory.mkdirs() && !targetDirectory.isDirectory()) {
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01554",
+                getFileName(), entry.getName(), targetDirectory.getAbsolutePath());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        }
+        if (entry.isDirectory()) {
+            return;
+        }
+
+        LOGGER.finer("WLSDPLY-01553", getFileName(), entry.getName(), target);
+        // overwrite any existing file
+        try (InputStream input = zipFile.getInputStream(entry);
+             FileOutputStream output = new FileOutputStream(target, false)) {
+            byte[] readBuffer = new byte[EXTRACT_BUFFER_SIZE];
+            int bytesRead;
+            while (true) {
+                if (Thread.currentThread().isInterrupted()) {
+                    throw new InterruptedIOException(entry.getName());
+                }
+                bytesRead = input.read(readBuffer);
+                if (bytesRead < 0) {
+                    break;
+                }
+                output.write(readBuffer, 0, bytesRead);
+            }
+        } catch (IOException ioe) {
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01552", ioe,
+                getFileName(), entry.getName(), target.getAbsolutePath(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        }
+    }
+
+    private static void awaitTermination(ExecutorService executor) {
+        try {
+            executor.awaitTermination(Long.MAX_VALUE, TimeUnit.MILLISECONDS);
+        } catch (InterruptedException ie) {
+            Thread.currentThread().interrupt();
+        }
+    }
+
     private void closeOpenZipFile() {
         final String METHOD = "closeOpenZipFile";
 
@@ -631,7 +940,42 @@ public class WLSDeployZipFile {
         return value;
     }
 
-    private LinkedHashMap<String, ZipEntry> getZipFileEntries(File zipFile) throws WLSDeployArchiveIOException {
+    // The entries of the zip file, including any changes in the open batch.
+    //
+    private LinkedHashMap<String, ZipEntry> getCurrentEntries() throws WLSDeployArchiveIOException {
+        if (!isBatchOpen()) {
+            return getZipFileEntries();
+        }
+
+        LinkedHashMap<String, ZipEntry> entries = new LinkedHashMap<>(batchSavedEntries);
+        for (String name : batchNewEntries) {
+            entries.put(name, new ZipEntry(name));
+        }
+        return entries;
+    }
+
+    private boolean hasEntry(String key) throws WLSDeployArchiveIOException {
+        if (isBatchOpen()) {
+            return batchSavedEntries.containsKey(key) || batchNewEntries.contains(key);
+        }
+        return getEntryIndex().containsEntry(key);
+    }
+
+    // The central directory is only read again after this object changes the zip file,
+    // or if the size or timestamp of the zip file changes underneath it.
+    //
+    private ZipEntryIndex getEntryIndex() throws WLSDeployArchiveIOException {
+        if (entryIndex == null || !entryIndex.isCurrent(getFile())) {
+            entryIndex = new ZipEntryIndex(readZipFileEntries(getFile()), getFile());
+        }
+        return entryIndex;
+    }
+
+    private LinkedHashMap<String, ZipEntry> getZipFileEntries() throws WLSDeployArchiveIOException {
+        return getEntryIndex().getEntries();
+    }
+
+    private LinkedHashMap<String, ZipEntry> readZipFileEntries(File zipFile) throws WLSDeployArchiveIOException {
         final String METHOD = "getZipEntries";
 
         LinkedHashMap<String, ZipEntry> savedZipEntries = new LinkedHashMap<>();
@@ -654,11 +998,236 @@ public class WLSDeployZipFile {
         return savedZipEntries;
     }
 
+    private void writeChanges(Map<String, ZipEntry> updatedZipEntries, Map<String, InputStream> newEntries)
+        throws WLSDeployArchiveIOException {
+        final String METHOD = "writeChanges";
+
+        if (!isBatchOpen()) {
+            saveChangesToZip(updatedZipEntries, newEntries);
+            return;
+        }
+
+        LOGGER.entering(CLASS, METHOD, updatedZipEntries, newEntries);
+        checkBatchNotFailed();
+
+        // A zip file cannot hold the same entry twice, so removing or replacing an entry that was
+        // added earlier in the batch requires committing the batch first.
+        //
+        for (String name : batchNewEntries) {
+            if (!updatedZipEntries.containsKey(name) || (newEntries != null && newEntries.containsKey(name))) {
+                LOGGER.fine("WLSDPLY-01549", getFileName());
+                commitBatch();
+                beginBatch();
+                break;
+            }
+        }
+
+        Map<String, ZipEntry> replacedEntries = new LinkedHashMap<>();
+        Iterator<Map.Entry<String, ZipEntry>> savedEntries = batchSavedEntries.entrySet().iterator();
+        while (savedEntries.hasNext()) {
+            Map.Entry<String, ZipEntry> savedEntry = savedEntries.next();
+            String savedKey = savedEntry.getKey();
+            if (newEntries != null && newEntries.containsKey(savedKey)) {
+                LOGGER.finest("WLSDPLY-01517", getFileName(), savedKey);
+                replacedEntries.put(savedKey, savedEntry.getValue());
+                savedEntries.remove();
+                batchChanged = true;
+            } else if (!updatedZipEntries.containsKey(savedKey)) {
+                savedEntries.remove();
+                batchChanged = true;
+            }
+        }
+
+        if (newEntries != null) {
+            for (Map.Entry<String, InputStream> entry : newEntries.entrySet()) {
+                String key = entry.getKey();
+                try {
+                    writeBatchEntry(key, entry.getValue());
+                } catch (WLSDeployArchiveIOException wdaioe) {
+                    // keep the saved entry that the failed entry was meant to replace
+                    if (replacedEntries.containsKey(key)) {
+                        batchSavedEntries.put(key, replacedEntries.get(key));
+                    }
+                    throw wdaioe;
+                }
+            }
+        }
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    private void writeBatchEntry(String key, InputStream inputStream) throws WLSDeployArchiveIOException {
+        final String METHOD = "writeBatchEntry";
+
+        boolean written = false;
+        try {
+            batchOutputStream.putNextEntry(new ZipEntry(key));
+            if (!key.endsWith(ZIP_SEP)) {
+                readWriteBytes(key, inputStream, batchOutputStream);
+            }
+            batchOutputStream.closeEntry();
+            written = true;
+        } catch (IOException ioe) {
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01522", ioe,
+                getFileName(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        } finally {
+            if (inputStream != null) {
+                closeFileInputStream(inputStream, key);
+            }
+            if (!written) {
+                // the batch file is left with a partial entry, so copy the other entries to a new batch file
+                restartBatch(key);
+            }
+        }
+        batchNewEntries.add(key);
+        batchChanged = true;
+        LOGGER.finer("WLSDPLY-01520", key, getFileName(), batchFile.getAbsolutePath());
+    }
+
+    // Replace the batch file with a new one holding the entries written so far, leaving out the partial entry
+    // that failed.  If that fails too, the batch is marked as failed so that it cannot be committed.
+    //
+    private void restartBatch(String failedKey) {
+        final String METHOD = "restartBatch";
+
+        LOGGER.entering(CLASS, METHOD, failedKey);
+        File failedFile = batchFile;
+        File tempFile = null;
+        ZipOutputStream restartedStream = null;
+        try {
+            batchOutputStream.close();
+
+            String[] nameComponents = FileUtils.parseFileName(getFileName());
+            tempFile = File.createTempFile(nameComponents[0], DOT + nameComponents[1], getFile().getParentFile());
+            restartedStream = new ZipOutputStream(new BufferedOutputStream(new FileOutputStream(tempFile, false)));
+            try (ZipFile failedZip = new ZipFile(failedFile, ZIP_FILE_OPEN_MODE)) {
+                for (String name : batchNewEntries) {
+                    restartedStream.putNextEntry(new ZipEntry(name));
+                    if (!name.endsWith(ZIP_SEP)) {
+                        try (InputStream inputStream = failedZip.getInputStream(failedZip.getEntry(name))) {
+                            readWriteBytes(name, inputStream, restartedStream);
+                        }
+                    }
+                    restartedStream.closeEntry();
+                }
+            }
+        } catch (IOException | WLSDeployArchiveIOException e) {
+            if (restartedStream != null) {
+                try {
+                    restartedStream.close();
+                } catch (IOException ignore) {
+                    LOGGER.finest("WLSDPLY-01539", ignore, tempFile.getAbsolutePath(), ignore.getLocalizedMessage());
+                }
+            }
+            deleteBatchFile(tempFile);
+            batchFailure = e;
+            LOGGER.warning("WLSDPLY-01556", e, getFileName(), failedKey, e.getLocalizedMessage());
+            LOGGER.exiting(CLASS, METHOD);
+            return;
+        }
+
+        deleteBatchFile(failedFile);
+        batchFile = tempFile;
+        batchOutputStream = restartedStream;
+        LOGGER.fine("WLSDPLY-01555", getFileName(), failedKey, batchFile.getAbsolutePath());
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    private void checkBatchNotFailed() throws WLSDeployArchiveIOException {
+        final String METHOD = "checkBatchNotFailed";
+
+        if (batchFailure != null) {
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01557", batchFailure,
+                getFileName(), batchFailure.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        }
+    }
+
+    private void saveBatchToZip() throws WLSDeployArchiveIOException {
+        final String METHOD = "saveBatchToZip";
+
+        LOGGER.entering(CLASS, METHOD);
+        entryIndex = null;
+        File savedZip = batchSavedEntries.isEmpty() ? null : getFile();
+        File newOutputFile = getNewOutputFile();
+        boolean copied;
+        try {
+            copied = ZipEntryCopier.mergeZipFiles(newOutputFile, savedZip, batchSavedEntries.keySet(), batchFile);
+        } catch (IOException ioe) {
+            if (!isNewFile()) {
+                deleteBatchFile(newOutputFile);
+            }
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01522", ioe,
+                getFileName(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        }
+
+        if (copied) {
+            LOGGER.fine("WLSDPLY-01521", newOutputFile.getAbsolutePath(), getFileName());
+            if (isNewFile()) {
+                setNewFile(false);
+            } else {
+                swapFiles(getFile(), newOutputFile);
+            }
+        } else {
+            LOGGER.fine("WLSDPLY-01544", getFileName());
+            if (!isNewFile()) {
+                deleteBatchFile(newOutputFile);
+            }
+            LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
+            try (ZipFile batchZip = new ZipFile(batchFile, ZIP_FILE_OPEN_MODE)) {
+                Enumeration<?> entries = batchZip.entries();
+                while (entries.hasMoreElements()) {
+                    ZipEntry entry = (ZipEntry) entries.nextElement();
+                    newEntries.put(entry.getName(), entry.isDirectory() ? null : batchZip.getInputStream(entry));
+                }
+                saveChangesToZip(batchSavedEntries, newEntries);
+            } catch (IOException ioe) {
+                WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01522", ioe,
+                    getFileName(), ioe.getLocalizedMessage());
+                LOGGER.throwing(CLASS, METHOD, wdaioe);
+                throw wdaioe;
+            } finally {
+                cleanupUnsavedEntries(newEntries);
+            }
+        }
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    // Commit the changes made so far so that the zip file can be read, and keep batching later changes.
+    //
+    private void flushBatch() throws WLSDeployArchiveIOException {
+        if (isBatchOpen()) {
+            commitBatch();
+            beginBatch();
+        }
+    }
+
+    private void endBatch() {
+        deleteBatchFile(batchFile);
+        batchFile = null;
+        batchOutputStream = null;
+        batchSavedEntries = null;
+        batchNewEntries = null;
+        batchChanged = false;
+        batchFailure = null;
+    }
+
+    private void deleteBatchFile(File tempFile) {
+        if (tempFile != null && tempFile.exists() && !tempFile.delete()) {
+            LOGGER.warning("WLSDPLY-01546", getFileName(), tempFile.getAbsolutePath());
+        }
+    }
+
     private void saveChangesToZip(Map<String, ZipEntry> updatedZipEntries, Map<String, InputStream> newEntries)
         throws WLSDeployArchiveIOException {
         final String METHOD = "saveChangesToZip";
 
         LOGGER.entering(CLASS, METHOD, updatedZipEntries, newEntries);
+        entryIndex = null;
 
         File newOutputFile = getNewOutputFile();
         if ((updatedZipEntries != null && !updatedZipEntries.isEmpty()) ||
@@ -869,8 +1438,7 @@ public class WLSDeployZipFile {
         LOGGER.entering(entryName);
 
         boolean renameNeeded = false;
-        Map<String, ZipEntry> zipEntryMap = getZipFileEntries(getFile());
-        if (zipEntryMap.containsKey(entryName)) {
+        if (hasEntry(entryName)) {
             LOGGER.finest("WLSDPLY-01534", entryName);
             renameNeeded = true;
         }
@@ -896,7 +1464,7 @@ public class WLSDeployZipFile {
         }
         LOGGER.finer("WLSDPLY-01535", entryName, entryNameBase, entryNameExtension);
         ArrayList<String> matchingSavedEntries = new ArrayList<>();
-        Map<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
+        Map<String, ZipEntry> zipEntriesMap = getCurrentEntries();
 
         for (String zipEntryKey : zipEntriesMap.keySet()) {
             if (zipEntryKey.startsWith(entryNameBase) && entryReallyMatches(zipEntryKey, entryNameBase,
@@ -1056,15 +1624,36 @@ public class WLSDeployZipFile {
         }
     }
 
-    private void addEntryToMap(LinkedHashMap<String, ZipEntry> zipMap, LinkedHashMap<String, InputStream> map,
-        String key) throws IOException {
-
-        LOGGER.finer("WLSDPLY-01500", getFileName(), key);
-        ZipEntry entry = zipMap.get(key);
-        sanitizeZipEntry(entry);
-        InputStream stream = openZipFile.getInputStream(entry);
-        LOGGER.finer("WLSDPLY-01501", getFileName(), key, stream);
-        map.put(key, stream);
+    // Open the input streams of the entries from a zip file opened for the caller, which is closed once
+    // all of the streams are closed.  The zip file is not shared, so that another thread closing or
+    // replacing the zip file does not affect the streams.
+    //
+    private Map<String, InputStream> openEntryStreams(Collection<ZipEntry> entries, String method)
+        throws WLSDeployArchiveIOException {
+        LinkedHashMap<String, InputStream> map = new LinkedHashMap<>();
+        CallerZipFile zipFile = null;
+        try {
+            zipFile = new CallerZipFile(new ZipFile(getFile(), ZIP_FILE_OPEN_MODE));
+            for (ZipEntry entry : entries) {
+                LOGGER.finer("WLSDPLY-01500", getFileName(), entry.getName());
+                sanitizeZipEntry(entry);
+                InputStream stream = zipFile.getInputStream(entry);
+                LOGGER.finer("WLSDPLY-01501", getFileName(), entry.getName(), stream);
+                map.put(entry.getName(), stream);
+            }
+        } catch (IOException ioe) {
+            for (InputStream stream : map.values()) {
+                closeFileInputStream(stream, getFileName());
+            }
+            if (zipFile != null && map.isEmpty()) {
+                zipFile.closeUnused(getFileName());
+            }
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01503", ioe,
+                getFileName(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, method, wdaioe);
+            throw wdaioe;
+        }
+        return map;
     }
 
     private static InputStream closeZipInputStream(InputStream inputStream, String fileName, ZipEntry ze) {
@@ -1086,4 +1675,63 @@ public class WLSDeployZipFile {
         }
         return null;
     }
+
+    // A zip file opened for the caller of getZipEntry() or getZipEntries(), closed with its last open stream.
+    //
+    private static final class CallerZipFile {
+        private final ZipFile zipFile;
+        private int openStreams;
+
+        CallerZipFile(ZipFile zipFile) {
+            this.zipFile = zipFile;
+        }
+
+        synchronized InputStream getInputStream(ZipEntry entry) throws IOException {
+            InputStream stream = new CallerEntryInputStream(zipFile.getInputStream(entry), this);
+            openStreams++;
+            return stream;
+        }
+
+        synchronized void release() throws IOException {
+            openStreams--;
+            if (openStreams == 0) {
+                zipFile.close();
+            }
+        }
+
+        synchronized void closeUnused(String fileName) {
+            if (openStreams == 0) {
+                try {
+                    zipFile.close();
+                } catch (IOException ioe) {
+                    LOGGER.warning("WLSDPLY-01514", ioe, fileName, ioe.getLocalizedMessage());
+                }
+            }
+        }
+    }
+
+    // The input stream of an entry of a CallerZipFile, which releases the zip file when it is closed.
+    //
+    private static final class CallerEntryInputStream extends FilterInputStream {
+        private final CallerZipFile zipFile;
+        private boolean closed;
+
+        CallerEntryInputStream(InputStream input, CallerZipFile zipFile) {
+            super(input);
+            this.zipFile = zipFile;
+        }
+
+        @Override
+        public void close() throws IOException {
+            if (closed) {
+                return;
+            }
+            closed = true;
+            try {
+                super.close();
+            } finally {
+                zipFile.release();
+            }
+        }
+    }
 }
@@ -0,0 +1,270 @@
+/*
+ * Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+ * The Universal Permissive License (UPL), Version 1.0
+ */
+package oracle.weblogic.deploy.util;
+
+import java.io.BufferedOutputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.File;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.RandomAccessFile;
+import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.Comparator;
+import java.util.List;
+import java.util.Set;
+import java.util.zip.ZipException;
+
+/**
+ * Merges the entries of two zip files into a new zip file by copying the raw local header and
+ * compressed data of each entry, so that no entry is decompressed or recompressed.  Only the
+ * central directory is rewritten.
+ *
+ * Zip64 archives are not handled; the copy methods return false for them so that the caller can
+ * fall back to rewriting the entries.
+ */
+final class ZipEntryCopier {
+    private static final int LOCAL_HEADER_SIGNATURE = 0x04034b50;
+    private static final int CENTRAL_HEADER_SIGNATURE = 0x02014b50;
+    private static final int END_HEADER_SIGNATURE = 0x06054b50;
+    private static final int ZIP64_LOCATOR_SIGNATURE = 0x07064b50;
+
+    private static final int CENTRAL_HEADER_SIZE = 46;
+    private static final int END_HEADER_SIZE = 22;
+    private static final int ZIP64_LOCATOR_SIZE = 20;
+    private static final int MAX_COMMENT_SIZE = 0xFFFF;
+    private static final int MAX_ENTRIES = 0xFFFF;
+    private static final long MAX_SIZE = 0xFFFFFFFFL;
+
+    private static final int CENTRAL_FLAGS_OFFSET = 8;
+    private static final int CENTRAL_COMPRESSED_SIZE_OFFSET = 20;
+    private static final int CENTRAL_SIZE_OFFSET = 24;
+    private static final int CENTRAL_NAME_LENGTH_OFFSET = 28;
+    private static final int CENTRAL_EXTRA_LENGTH_OFFSET = 30;
+    private static final int CENTRAL_COMMENT_LENGTH_OFFSET = 32;
+    private static final int CENTRAL_LOCAL_OFFSET_OFFSET = 42;
+    private static final int ENCRYPTED_FLAG = 0x1;
+
+    private static final int COPY_BUFFER_SIZE = 64 * 1024;
+
+    private ZipEntryCopier() {
+        // hide the constructor
+    }
+
+    /**
+     * Write a new zip file containing the named entries of the saved zip file followed by all of
+     * the entries of the new entries zip file.  Both input files must be distinct from the output file.
+     *
+     * @param outputFile the zip file to write
+     * @param savedZip the zip file holding the existing entries, or null if there are none to keep
+     * @param savedNames the names of the entries in the saved zip file to keep
+     * @param newEntriesZip the zip file holding the new entries
+     * @return true if the output file was written, false if either input cannot be copied raw
+     * @throws IOException if an error occurs reading the inputs or writing the output
+     */
+    static boolean mergeZipFiles(File outputFile, File savedZip, Set<String> savedNames, File newEntriesZip)
+        throws IOException {
+
+        try (RandomAccessFile savedInput = savedZip != null ? new RandomAccessFile(savedZip, "r") : null;
+             RandomAccessFile newInput = new RandomAccessFile(newEntriesZip, "r")) {
+
+            List<EntryRecord> savedRecords = new ArrayList<>();
+            if (savedInput != null) {
+                List<EntryRecord> allSavedRecords = readCentralDirectory(savedInput);
+                if (allSavedRecords == null) {
+                    return false;
+                }
+                for (EntryRecord record : allSavedRecords) {
+                    if (savedNames.contains(record.name)) {
+                        savedRecords.add(record);
+                    }
+                }
+            }
+            List<EntryRecord> newRecords = readCentralDirectory(newInput);
+            if (newRecords == null) {
+                return false;
+            }
+            if (savedRecords.size() + newRecords.size() >= MAX_ENTRIES
+                || getOutputSize(savedRecords) + getOutputSize(newRecords) + END_HEADER_SIZE > MAX_SIZE) {
+                return false;
+            }
+
+            try (OutputStream output = new BufferedOutputStream(new FileOutputStream(outputFile, false))) {
+                ByteArrayOutputStream centralDirectory = new ByteArrayOutputStream();
+                byte[] buffer = new byte[COPY_BUFFER_SIZE];
+                long offset = copyEntries(savedInput, savedRecords, output, centralDirectory, 0, buffer);
+                offset = copyEntries(newInput, newRecords, output, centralDirectory, offset, buffer);
+
+                int entryCount = savedRecords.size() + newRecords.size();
+                byte[] endHeader = new byte[END_HEADER_SIZE];
+                putInt(endHeader, 0, END_HEADER_SIGNATURE);
+                putShort(endHeader, 8, entryCount);
+                putShort(endHeader, 10, entryCount);
+                putInt(endHeader, 12, centralDirectory.size());
+                putInt(endHeader, 16, offset);
+                centralDirectory.writeTo(output);
+                output.write(endHeader);
+            }
+        }
+        return true;
+    }
+
+    private static long copyEntries(RandomAccessFile input, List<EntryRecord> records, OutputStream output,
+        ByteArrayOutputStream centralDirectory, long startOffset, byte[] buffer) throws IOException {
+
+        long offset = startOffset;
+        for (EntryRecord record : records) {
+            input.seek(record.localOffset);
+            if (Integer.reverseBytes(input.readInt()) != LOCAL_HEADER_SIGNATURE) {
+                throw new ZipException("invalid local header for entry " + record.name);
+            }
+            input.seek(record.localOffset);
+            long remaining = record.localLength;
+            while (remaining > 0) {
+                int count = input.read(buffer, 0, (int) Math.min(buffer.length, remaining));
+                if (count < 0) {
+                    throw new ZipException("unexpected end of data for entry " + record.name);
+                }
+                output.write(buffer, 0, count);
+                remaining -= count;
+            }
+
+            byte[] header = record.centralHeader.clone();
+            putInt(header, CENTRAL_LOCAL_OFFSET_OFFSET, offset);
+            centralDirectory.write(header);
+            offset += record.localLength;
+        }
+        return offset;
+    }
+
+    private static long getOutputSize(List<EntryRecord> records) {
+        long size = 0;
+        for (EntryRecord record : records) {
+            size += record.localLength + record.centralHeader.length;
+        }
+        return size;
+    }
+
+    // Returns null if the file is a zip64 or encrypted archive, or otherwise cannot be copied raw.
+    //
+    private static List<EntryRecord> readCentralDirectory(RandomAccessFile input) throws IOException {
+        long fileLength = input.length();
+        if (fileLength < END_HEADER_SIZE) {
+            return null;
+        }
+
+        int tailLength = (int) Math.min(fileLength, END_HEADER_SIZE + MAX_COMMENT_SIZE + ZIP64_LOCATOR_SIZE);
+        byte[] tail = new byte[tailLength];
+        input.seek(fileLength - tailLength);
+        input.readFully(tail);
+
+        int endIndex = -1;
+        for (int i = tailLength - END_HEADER_SIZE; i >= 0; i--) {
+            if (getInt(tail, i) == END_HEADER_SIGNATURE
+                && i + END_HEADER_SIZE + getShort(tail, i + 20) == tailLength) {
+                endIndex = i;
+                break;
+            }
+        }
+        if (endIndex < 0 || (endIndex >= ZIP64_LOCATOR_SIZE
+            && getInt(tail, endIndex - ZIP64_LOCATOR_SIZE) == ZIP64_LOCATOR_SIGNATURE)) {
+            return null;
+        }
+
+        int diskNumber = getShort(tail, endIndex + 4);
+        int centralDiskNumber = getShort(tail, endIndex + 6);
+        int entryCount = getShort(tail, endIndex + 10);
+        long centralSize = getInt(tail, endIndex + 12) & MAX_SIZE;
+        long centralOffset = getInt(tail, endIndex + 16) & MAX_SIZE;
+        if (diskNumber != 0 || centralDiskNumber != 0 || entryCount == MAX_ENTRIES
+            || centralOffset + centralSize > fileLength) {
+            return null;
+        }
+
+        byte[] central = new byte[(int) centralSize];
+        input.seek(centralOffset);
+        input.readFully(central);
+
+        List<EntryRecord> records = new ArrayList<>(entryCount);
+        int position = 0;
+        for (int i = 0; i < entryCount; i++) {
+            if (position + CENTRAL_HEADER_SIZE > central.length
+                || getInt(central, position) != CENTRAL_HEADER_SIGNATURE) {
+                throw new ZipException("invalid central directory header");
+            }
+            int flags = getShort(central, position + CENTRAL_FLAGS_OFFSET);
+            long compressedSize = getInt(central, position + CENTRAL_COMPRESSED_SIZE_OFFSET) & MAX_SIZE;
+            long size = getInt(central, position + CENTRAL_SIZE_OFFSET) & MAX_SIZE;
+            long localOffset = getInt(central, position + CENTRAL_LOCAL_OFFSET_OFFSET) & MAX_SIZE;
+            if ((flags & ENCRYPTED_FLAG) != 0 || compressedSize == MAX_SIZE || size == MAX_SIZE
+                || localOffset == MAX_SIZE) {
+                return null;
+            }
+
+            int nameLength = getShort(central, position + CENTRAL_NAME_LENGTH_OFFSET);
+            int headerLength = CENTRAL_HEADER_SIZE + nameLength
+                + getShort(central, position + CENTRAL_EXTRA_LENGTH_OFFSET)
+                + getShort(central, position + CENTRAL_COMMENT_LENGTH_OFFSET);
+            if (position + headerLength > central.length) {
+                throw new ZipException("invalid central directory header");
+            }
+
+            EntryRecord record = new EntryRecord();
+            record.name = new String(central, position + CENTRAL_HEADER_SIZE, nameLength, StandardCharsets.UTF_8);
+            record.centralHeader = new byte[headerLength];
+            System.arraycopy(central, position, record.centralHeader, 0, headerLength);
+            record.localOffset = localOffset;
+            records.add(record);
+            position += headerLength;
+        }
+
+        // The local data of an entry runs up to the start of the next entry, or the central directory,
+        // which also picks up the data descriptor that follows streamed entries.
+        //
+        List<EntryRecord> byOffset = new ArrayList<>(records);
+        Collections.sort(byOffset, new Comparator<EntryRecord>() {
+            @Override
+            public int compare(EntryRecord first, EntryRecord second) {
+                return Long.compare(first.localOffset, second.localOffset);
+            }
+        });
+        for (int i = 0; i < byOffset.size(); i++) {
+            long end = i + 1 < byOffset.size() ? byOffset.get(i + 1).localOffset : centralOffset;
+            EntryRecord record = byOffset.get(i);
+            record.localLength = end - record.localOffset;
+            if (record.localLength <= 0) {
+                throw new ZipException("invalid local header offset for entry " + record.name);
+            }
+        }
+        return records;
+    }
+
+    private static int getShort(byte[] bytes, int offset) {
+        return (bytes[offset] & 0xFF) | ((bytes[offset + 1] & 0xFF) << 8);
+    }
+
+    private static int getInt(byte[] bytes, int offset) {
+        return getShort(bytes, offset) | (getShort(bytes, offset + 2) << 16);
+    }
+
+    private static void putShort(byte[] bytes, int offset, int value) {
+        bytes[offset] = (byte) value;
+        bytes[offset + 1] = (byte) (value >>> 8);
+    }
+
+    private static void putInt(byte[] bytes, int offset, long value) {
+        putShort(bytes, offset, (int) value);
+        putShort(bytes, offset + 2, (int) (value >>> 16));
+    }
+
+    private static final class EntryRecord {
+        private String name;
+        private byte[] centralHeader;
+        private long localOffset;
+        private long localLength;
+    }
+}
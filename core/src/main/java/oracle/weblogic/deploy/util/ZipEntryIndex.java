@@ -0,0 +1,130 @@
+/*
+ * Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+ * The Universal Permissive License (UPL), Version 1.0
+ */
+package oracle.weblogic.deploy.util;
+
+import java.io.File;
+import java.util.ArrayList;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.TreeMap;
+import java.util.zip.ZipEntry;
+
+/**
+ * An in-memory index of the central directory of a zip file.  The entries are kept both in the order
+ * they appear in the zip file and sorted by name, so that lookups by name or name prefix do not need
+ * to scan the entries.  The index records the length and modification time of the zip file so that
+ * it can tell when the file was changed by someone else.
+ */
+final class ZipEntryIndex {
+    private final LinkedHashMap<String, ZipEntry> entries;
+    private final TreeMap<String, ZipEntry> sortedEntries;
+    private final long fileLength;
+    private final long fileLastModified;
+
+    /**
+     * Create the index.
+     *
+     * @param entries the entries of the zip file, in zip file order
+     * @param zipFile the zip file, used to detect later changes to it
+     */
+    ZipEntryIndex(Map<String, ZipEntry> entries, File zipFile) {
+        this.entries = new LinkedHashMap<>(entries);
+        this.sortedEntries = new TreeMap<>(entries);
+        this.fileLength = zipFile.length();
+        this.fileLastModified = zipFile.lastModified();
+    }
+
+    /**
+     * Whether or not the zip file is unchanged since the index was created.
+     *
+     * @param zipFile the zip file
+     * @return true if the index still describes the zip file
+     */
+    boolean isCurrent(File zipFile) {
+        return zipFile.length() == fileLength && zipFile.lastModified() == fileLastModified;
+    }
+
+    /**
+     * Get a copy of the entries, in zip file order.  The entries are copied as well so that the caller
+     * can modify them.
+     *
+     * @return the entries keyed by name
+     */
+    LinkedHashMap<String, ZipEntry> getEntries() {
+        LinkedHashMap<String, ZipEntry> result = new LinkedHashMap<>();
+        for (Map.Entry<String, ZipEntry> entry : entries.entrySet()) {
+            result.put(entry.getKey(), new ZipEntry(entry.getValue()));
+        }
+        return result;
+    }
+
+    /**
+     * Get the names of all entries, in zip file order.
+     *
+     * @return the entry names
+     */
+    List<String> getNames() {
+        return new ArrayList<>(entries.keySet());
+    }
+
+    /**
+     * Get the entry with the specified name, which holds the size, compressed size and CRC of the entry.
+     * The caller must not modify the returned entry.
+     *
+     * @param name the entry name
+     * @return the entry, or null if the zip file has no entry with that name
+     */
+    ZipEntry getEntry(String name) {
+        return sortedEntries.get(name);
+    }
+
+    /**
+     * Whether or not the zip file has an entry with the specified name.
+     *
+     * @param name the entry name
+     * @return true if the entry exists
+     */
+    boolean containsEntry(String name) {
+        return sortedEntries.containsKey(name);
+    }
+
+    /**
+     * Whether or not the zip file has any entry whose name starts with the specified prefix.
+     *
+     * @param prefix the name prefix
+     * @return true if a matching entry exists
+     */
+    boolean containsPrefix(String prefix) {
+        String firstMatch = sortedEntries.ceilingKey(prefix);
+        return firstMatch != null && firstMatch.startsWith(prefix);
+    }
+
+    /**
+     * Get the names of the entries that start with the specified prefix, sorted by name.
+     *
+     * @param prefix the name prefix
+     * @return the matching entry names
+     */
+    List<String> getNames(String prefix) {
+        List<String> result = new ArrayList<>();
+        for (String name : sortedEntries.tailMap(prefix, true).keySet()) {
+            if (!name.startsWith(prefix)) {
+                break;
+            }
+            result.add(name);
+        }
+        return result;
+    }
+
+    /**
+     * Get the number of entries.
+     *
+     * @return the number of entries
+     */
+    int size() {
+        return entries.size();
+    }
+}
@@ -17,6 +17,8 @@ import oracle.weblogic.deploy.util.StringUtils;
 import org.antlr.v4.runtime.CharStream;
 import org.antlr.v4.runtime.CharStreams;
 import org.antlr.v4.runtime.CommonTokenStream;
+import org.antlr.v4.runtime.ParserRuleContext;
+import org.antlr.v4.runtime.RuleContext;
 import org.antlr.v4.runtime.atn.PredictionMode;
 import org.antlr.v4.runtime.tree.ParseTree;
 import org.antlr.v4.runtime.tree.ParseTreeWalker;
@@ -30,6 +32,8 @@ import org.python.core.PyString;
 
 /**
  * This class does the heavy-lifting of walking the parse tree and performing the conversion into a Python dictionary.
+ * In streaming mode, the dictionary is built by a parse listener while the parser consumes the token stream, so the
+ * parse tree for the whole file is never held in memory.
  */
 public abstract class AbstractYamlTranslator extends YamlBaseListener {
 
@@ -40,6 +44,8 @@ public abstract class AbstractYamlTranslator extends YamlBaseListener {
     private PyList openObjectList;
     @SuppressWarnings("WeakerAccess")
     protected boolean useOrderedDict;
+    @SuppressWarnings("WeakerAccess")
+    protected boolean useStreaming;
 
     /**
      * This method triggers parsing of the YAML and conversion into the Python dictionary.
@@ -115,7 +121,10 @@ public abstract class AbstractYamlTranslator extends YamlBaseListener {
      */
     @Override
     public void enterObject(YamlParser.ObjectContext ctx) {
-        String name = getQuotedStringText(ctx.name().getText());
+        enterObject(getQuotedStringText(ctx.name().getText()));
+    }
+
+    private void enterObject(String name) {
         PyDictionary objDict;
         if (useOrderedDict) {
             objDict = new PyOrderedDict();
@@ -178,9 +187,15 @@ public abstract class AbstractYamlTranslator extends YamlBaseListener {
                 parser.addErrorListener(errorListener);
                 parser.getInterpreter().setPredictionMode(PredictionMode.LL_EXACT_AMBIG_DETECTION);
 
-                ParseTree tree = parser.file();
-                ParseTreeWalker walker = new ParseTreeWalker();
-                walker.walk(this, tree);
+                if (useStreaming) {
+                    parser.setBuildParseTree(false);
+                    parser.addParseListener(new StreamingListener(errorListener));
+                    parser.file();
+                } else {
+                    ParseTree tree = parser.file();
+                    ParseTreeWalker walker = new ParseTreeWalker();
+                    walker.walk(this, tree);
+                }
             } catch (IOException ioe) {
                 YamlException ex =
                     new YamlException("WLSDPLY-18007", ioe, "YAML", yamlFileName, ioe.getLocalizedMessage());
@@ -376,4 +391,116 @@ public abstract class AbstractYamlTranslator extends YamlBaseListener {
         }
         return result;
     }
+
+    /**
+     * The parse listener used in streaming mode.
+     *
+     * A parse listener is called while the rules are being parsed. Since the parse tree is not built, a rule context
+     * only holds the tokens of the rule itself and not its sub-rules, and the enter events for labeled alternatives
+     * are never called.  The listener therefore builds the dictionary from the exit events of the rules that hold the
+     * names and values, and keeps the pending name and value until the enclosing assignment is complete.
+     */
+    private final class StreamingListener extends YamlBaseListener {
+        private final YamlErrorListener errorListener;
+        private String pendingName;
+        private PyObject pendingValue;
+        private PyList inlineList;
+
+        StreamingListener(YamlErrorListener errorListener) {
+            this.errorListener = errorListener;
+        }
+
+        @Override
+        public void enterFile(YamlParser.FileContext ctx) {
+            AbstractYamlTranslator.this.enterFile(ctx);
+        }
+
+        @Override
+        public void exitName(YamlParser.NameContext ctx) {
+            if (isBuilding()) {
+                pendingName = getQuotedStringText(ctx.getText());
+            }
+        }
+
+        @Override
+        public void enterObj_block(YamlParser.Obj_blockContext ctx) {
+            // the object name has been parsed before its block
+            if (isBuilding()) {
+                enterObject(pendingName);
+                pendingName = null;
+            }
+        }
+
+        @Override
+        public void exitObj_block(YamlParser.Obj_blockContext ctx) {
+            if (isBuilding()) {
+                AbstractYamlTranslator.this.exitObj_block(ctx);
+            }
+        }
+
+        @Override
+        public void exitAssign(YamlParser.AssignContext ctx) {
+            if (isBuilding()) {
+                PyDictionary container = currentDict.peek();
+                container.__setitem__(new PyString(pendingName), pendingValue);
+                pendingName = null;
+                pendingValue = null;
+            }
+        }
+
+        @Override
+        public void enterInline_list(YamlParser.Inline_listContext ctx) {
+            inlineList = new PyList();
+        }
+
+        @Override
+        public void exitEveryRule(ParserRuleContext ctx) {
+            if (!isBuilding()) {
+                return;
+            }
+
+            if (ctx instanceof YamlParser.YamlInlineListValueContext) {
+                exitInlineListValue(ctx);
+            } else if (ctx instanceof YamlParser.ValueContext) {
+                exitScalarValue((YamlParser.ValueContext) ctx);
+            }
+        }
+
+        @Override
+        public void exitFile(YamlParser.FileContext ctx) {
+            if (isBuilding()) {
+                AbstractYamlTranslator.this.exitFile(ctx);
+            }
+        }
+
+        private void exitInlineListValue(ParserRuleContext ctx) {
+            if (ctx.getParent() instanceof YamlParser.AssignContext) {
+                pendingValue = inlineList;
+            } else {
+                // inline lists are only supported as the value of an assignment
+                getLogger().severe("WLSDPLY-18006", lastObjectName, ctx.getClass().getName());
+                getOpenObjectList().add(Py.None);
+            }
+            inlineList = null;
+        }
+
+        private void exitScalarValue(YamlParser.ValueContext ctx) {
+            RuleContext parent = ctx.getParent();
+            if (parent instanceof YamlParser.Inline_list_itemContext) {
+                String madeUpName = MessageFormat.format("{0}[{1}]", pendingName, inlineList.size());
+                inlineList.pyadd(getScalarValue(madeUpName, ctx));
+            } else if (parent instanceof YamlParser.YamlListItemValueContext) {
+                PyList myList = getOpenObjectList();
+                String madeUpName = MessageFormat.format("{0}[{1}]", lastObjectName, myList.size());
+                myList.add(getScalarValue(madeUpName, ctx));
+            } else {
+                pendingValue = getScalarValue(pendingName, ctx);
+            }
+        }
+
+        // Once a syntax error is reported, the contexts may be incomplete and the result is discarded anyway.
+        private boolean isBuilding() {
+            return errorListener.getErrorCount() == 0;
+        }
+    }
 }
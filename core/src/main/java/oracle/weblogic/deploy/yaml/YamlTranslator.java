@@ -41,9 +41,23 @@ public class YamlTranslator extends AbstractYamlTranslator {
      * @throws IllegalArgumentException if the file name is null or does not point to a valid, existing file.
      */
     public YamlTranslator(String fileName, boolean useOrderedDict) {
+        this(fileName, useOrderedDict, false);
+    }
+
+    /**
+     * Constructor for parsing YAML file into a Python dictionary and controlling ordering and streaming.
+     *
+     * @param fileName the name of the existing YAML file to parse
+     * @param useOrderedDict whether or not to use an ordered dictionary to maintain the order
+     * @param useStreaming whether or not to build the dictionary while parsing, without keeping the parse tree
+     * @throws IllegalArgumentException if the file name is null or does not point to a valid, existing file.
+     */
+    public YamlTranslator(String fileName, boolean useOrderedDict, boolean useStreaming) {
         this.yamlFile = FileUtils.validateExistingFile(fileName);
         this.useOrderedDict = useOrderedDict;
+        this.useStreaming = useStreaming;
     }
+
     /**
      * This method triggers parsing of the file and conversion into the Python dictionary.
      *
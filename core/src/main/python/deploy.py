@@ -33,6 +33,7 @@ from wlsdeploy.exception.expection_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.deploy import deployer_utils
 from wlsdeploy.tool.deploy import model_deployer
+from wlsdeploy.tool.deploy import model_differ
 from wlsdeploy.tool.validate.validator import Validator
 from wlsdeploy.tool.util import filter_helper
 from wlsdeploy.tool.util.wlst_helper import WlstHelper
@@ -289,7 +290,7 @@ def __deploy_online(model, model_context, aliases):
     __logger.info("WLSDPLY-09007", admin_url, method_name=_method_name, class_name=_class_name)
 
     try:
-        model_deployer.deploy_resources(model, model_context, aliases, wlst_mode=__wlst_mode)
+        skipped_count = model_deployer.deploy_resources(model, model_context, aliases, wlst_mode=__wlst_mode)
     except DeployException, de:
         __release_edit_session_and_disconnect()
         raise de
@@ -301,7 +302,8 @@ def __deploy_online(model, model_context, aliases):
         __release_edit_session_and_disconnect()
         raise ex
 
-    model_deployer.deploy_applications(model, model_context, aliases, wlst_mode=__wlst_mode)
+    skipped_count += model_deployer.deploy_applications(model, model_context, aliases, wlst_mode=__wlst_mode)
+    deployer_utils.log_skipped_attribute_count(skipped_count)
 
     try:
         __wlst_helper.disconnect()
@@ -328,7 +330,8 @@ def __deploy_offline(model, model_context, aliases):
 
     __wlst_helper.read_domain(domain_home)
 
-    model_deployer.deploy_model_offline(model, model_context, aliases, wlst_mode=__wlst_mode)
+    skipped_count = model_deployer.deploy_model_offline(model, model_context, aliases, wlst_mode=__wlst_mode)
+    deployer_utils.log_skipped_attribute_count(skipped_count)
 
     try:
         __wlst_helper.update_domain()
@@ -421,7 +424,7 @@ def main(args):
 
     __logger.entering(args[0], class_name=_class_name, method_name=_method_name)
     for index, arg in enumerate(args):
-        __logger.finer('sys.argv[{0}] = {1}', str(index), str(arg), class_name=_class_name, method_name=_method_name)
+        __logger.finer('sys.argv[{0}] = {1}', index, arg, class_name=_class_name, method_name=_method_name)
 
     __wlst_helper.silence()
 
@@ -462,6 +465,15 @@ def main(args):
         # if any filters were applied, re-validate the model
         validate_model(model_dictionary, model_context, aliases)
 
+    try:
+        model_dictionary = model_differ.get_model_changes(model_dictionary, model_context, aliases, "deploy",
+                                                          __logger)
+    except TranslateException, ex:
+        __logger.severe('WLSDPLY-09016', _program_name, model_context.get_previous_model_file(),
+                        ex.getLocalizedMessage(), error=ex, class_name=_class_name, method_name=_method_name)
+        __clean_up_temp_files()
+        tool_exit.end(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
+
     try:
         model = Model(model_dictionary)
         __deploy(model, model_context, aliases)
@@ -38,6 +38,7 @@ from wlsdeploy.tool.discover import discoverer
 from wlsdeploy.tool.discover.deployments_discoverer import DeploymentsDiscoverer
 from wlsdeploy.tool.discover.domain_info_discoverer import DomainInfoDiscoverer
 from wlsdeploy.tool.discover.multi_tenant_discoverer import MultiTenantDiscoverer
+from wlsdeploy.tool.discover.parallel_discoverer import ParallelDiscoverer
 from wlsdeploy.tool.discover.resources_discoverer import ResourcesDiscoverer
 from wlsdeploy.tool.discover.topology_discoverer import TopologyDiscoverer
 from wlsdeploy.tool.util import filter_helper
@@ -51,12 +52,16 @@ from wlsdeploy.util.cla_utils import CommandLineArgUtil
 from wlsdeploy.util.model import Model
 from wlsdeploy.util.model_context import ModelContext
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
+from wlsdeploy.util.wlst_session import WlstSession
 
 _program_name = 'discoverDomain'
 _class_name = 'discover'
 __logger = PlatformLogger(discoverer.get_discover_logger_name())
 __wlst_mode = WlstModes.OFFLINE
 
+# Set to a value greater than 1 to discover the independent model sections concurrently in online mode
+_discover_threads_env_variable = 'WLSDEPLOY_DISCOVER_THREADS'
+
 __required_arguments = [
     CommandLineArgUtil.ORACLE_HOME_SWITCH,
     CommandLineArgUtil.DOMAIN_HOME_SWITCH,
@@ -203,14 +208,18 @@ def __discover(model_context, aliases):
     __connect_to_domain(model_context)
     try:
         _add_domain_name(base_location, aliases)
-        DomainInfoDiscoverer(model_context, model.get_model_domain_info(), base_location, wlst_mode=__wlst_mode,
-                             aliases=aliases).discover()
-        TopologyDiscoverer(model_context, model.get_model_topology(), base_location, wlst_mode=__wlst_mode,
-                           aliases=aliases).discover()
-        ResourcesDiscoverer(model_context, model.get_model_resources(), base_location, wlst_mode=__wlst_mode,
-                            aliases=aliases).discover()
-        DeploymentsDiscoverer(model_context, model.get_model_app_deployments(), base_location, wlst_mode=__wlst_mode,
-                              aliases=aliases).discover()
+        worker_count = __get_discover_worker_count()
+        if __wlst_mode == WlstModes.ONLINE and worker_count > 1:
+            __discover_sections_in_parallel(model, model_context, base_location, aliases, worker_count)
+        else:
+            DomainInfoDiscoverer(model_context, model.get_model_domain_info(), base_location, wlst_mode=__wlst_mode,
+                                 aliases=aliases).discover()
+            TopologyDiscoverer(model_context, model.get_model_topology(), base_location, wlst_mode=__wlst_mode,
+                               aliases=aliases).discover()
+            ResourcesDiscoverer(model_context, model.get_model_resources(), base_location, wlst_mode=__wlst_mode,
+                                aliases=aliases).discover()
+            DeploymentsDiscoverer(model_context, model.get_model_app_deployments(), base_location,
+                                  wlst_mode=__wlst_mode, aliases=aliases).discover()
         __discover_multi_tenant(model, model_context, base_location, aliases)
     except AliasException, ae:
         wls_version = WebLogicHelper(__logger).get_actual_weblogic_version()
@@ -225,6 +234,63 @@ def __discover(model_context, aliases):
     return model
 
 
+def __get_discover_worker_count():
+    """
+    Get the number of worker threads to use for online discovery from the environment.
+    :return: the number of worker threads, 1 if parallel discovery is not enabled
+    """
+    _method_name = '__get_discover_worker_count'
+
+    worker_count = 1
+    value = os.environ.get(_discover_threads_env_variable)
+    if value is not None and len(value) > 0:
+        try:
+            worker_count = int(value)
+        except ValueError:
+            __logger.warning('WLSDPLY-06025', value, _discover_threads_env_variable,
+                             class_name=_class_name, method_name=_method_name)
+            worker_count = 1
+    return worker_count
+
+
+def __discover_sections_in_parallel(model, model_context, base_location, aliases, worker_count):
+    """
+    Discover the domainInfo, topology, resources and appDeployments sections of the model concurrently.
+    Each worker uses its own WLST session connected to the Admin Server.
+    :param model: the model object to populate
+    :param model_context: the model context
+    :param base_location: the location of the domain
+    :param aliases: the aliases object shared by the workers
+    :param worker_count: the maximum number of sections to discover concurrently
+    :raises DiscoverException: if an error occurs during discovery
+    """
+    _method_name = '__discover_sections_in_parallel'
+
+    def open_session():
+        return WlstSession(model_context.get_admin_user(), model_context.get_admin_password(),
+                           model_context.get_admin_url())
+
+    def section_function(discoverer_class):
+        def discover_section(dictionary):
+            discoverer_class(model_context, dictionary, LocationContext(base_location), wlst_mode=__wlst_mode,
+                             aliases=aliases).discover()
+        return discover_section
+
+    parallel_discoverer = ParallelDiscoverer(worker_count, open_session)
+    parallel_discoverer.add_section(model_constants.DOMAIN_INFO, model.get_model_domain_info(),
+                                    section_function(DomainInfoDiscoverer))
+    parallel_discoverer.add_section(model_constants.TOPOLOGY, model.get_model_topology(),
+                                    section_function(TopologyDiscoverer))
+    parallel_discoverer.add_section(model_constants.RESOURCES, model.get_model_resources(),
+                                    section_function(ResourcesDiscoverer))
+    parallel_discoverer.add_section(model_constants.APP_DEPLOYMENTS, model.get_model_app_deployments(),
+                                    section_function(DeploymentsDiscoverer))
+    __logger.info('WLSDPLY-06024', parallel_discoverer.get_section_names(), worker_count,
+                  class_name=_class_name, method_name=_method_name)
+    parallel_discoverer.discover()
+    return
+
+
 def _add_domain_name(location, aliases):
     _method_name = '_get_domain_name'
     try:
@@ -288,7 +354,8 @@ def __connect_to_domain(model_context):
 
 def __clear_archive_file(model_context):
     """
-    Remove any binaries already in the archive file.
+    Start the archive transaction that collects the discovered files and remove any binaries already in the
+    archive file, so that the archive file is only written once when the archive is closed.
     :param model_context: the model context
     :raises DiscoverException: if an error occurs while removing the binaries
     """
@@ -303,6 +370,7 @@ def __clear_archive_file(model_context):
         raise de
 
     try:
+        archive_file.beginTransaction()
         archive_file.removeAllBinaries()
     except WLSDeployArchiveIOException, wioe:
         de = exception_helper.create_discover_exception('WLSDPLY-06005', wioe.getLocalizedMessage())
@@ -314,13 +382,23 @@ def __clear_archive_file(model_context):
 
 def __close_archive(model_context):
     """
-    Close the archive object
+    Write the changes to the archive file and close the archive object
     :param model_context: the model context
+    :raises DiscoverException: if an error occurs while writing the archive file
     """
     _method_name = '__close_archive'
 
     __logger.entering(_class_name=_class_name, method_name=_method_name)
     archive_file = model_context.get_archive_file()
+    try:
+        archive_file.commitTransaction()
+    except WLSDeployArchiveIOException, wioe:
+        archive_file.close()
+        de = exception_helper.create_discover_exception('WLSDPLY-06026', model_context.get_archive_file_name(),
+                                                        wioe.getLocalizedMessage(), error=wioe)
+        __logger.throwing(class_name=_class_name, method_name=_method_name, error=de)
+        raise de
+
     archive_file.close()
     __logger.exiting(class_name=_class_name, method_name=_method_name)
     return
@@ -462,7 +540,7 @@ def main(args):
 
     __logger.entering(class_name=_class_name, method_name=_method_name)
     for index, arg in enumerate(args):
-        __logger.finer('sys.argv[{0}] = {1}', str(index), str(arg), class_name=_class_name, method_name=_method_name)
+        __logger.finer('sys.argv[{0}] = {1}', index, arg, class_name=_class_name, method_name=_method_name)
 
     wlst_helper.silence()
 
@@ -505,7 +583,12 @@ def main(args):
                         error=ex, class_name=_class_name, method_name=_method_name)
         __log_and_exit(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE, _class_name, _method_name)
 
-    __close_archive(model_context)
+    try:
+        __close_archive(model_context)
+    except DiscoverException, ex:
+        __logger.severe('WLSDPLY-06027', _program_name, model_context.get_archive_file_name(),
+                        ex.getLocalizedMessage(), error=ex, class_name=_class_name, method_name=_method_name)
+        __log_and_exit(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE, _class_name, _method_name)
 
     __log_and_exit(model_context, exit_code, _class_name, _method_name)
 
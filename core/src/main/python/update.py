@@ -35,6 +35,7 @@ from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.create.domain_typedef import DomainTypedef
 from wlsdeploy.tool.deploy import deployer_utils
 from wlsdeploy.tool.deploy import model_deployer
+from wlsdeploy.tool.deploy import model_differ
 from wlsdeploy.tool.deploy.topology_updater import TopologyUpdater
 from wlsdeploy.tool.validate.validator import Validator
 from wlsdeploy.tool.util import filter_helper
@@ -303,8 +304,9 @@ def __update_online(model, model_context, aliases):
     try:
         topology_updater = TopologyUpdater(model, model_context, aliases, wlst_mode=WlstModes.ONLINE)
         topology_updater.update()
+        skipped_count = topology_updater.get_skipped_attribute_count()
 
-        model_deployer.deploy_resources(model, model_context, aliases, wlst_mode=__wlst_mode)
+        skipped_count += model_deployer.deploy_resources(model, model_context, aliases, wlst_mode=__wlst_mode)
     except DeployException, de:
         __release_edit_session_and_disconnect()
         raise de
@@ -316,7 +318,8 @@ def __update_online(model, model_context, aliases):
         __release_edit_session_and_disconnect()
         raise ex
 
-    model_deployer.deploy_applications(model, model_context, aliases, wlst_mode=__wlst_mode)
+    skipped_count += model_deployer.deploy_applications(model, model_context, aliases, wlst_mode=__wlst_mode)
+    deployer_utils.log_skipped_attribute_count(skipped_count)
 
     try:
         __wlst_helper.disconnect()
@@ -345,8 +348,10 @@ def __update_offline(model, model_context, aliases):
 
     topology_updater = TopologyUpdater(model, model_context, aliases, wlst_mode=WlstModes.OFFLINE)
     topology_updater.update()
+    skipped_count = topology_updater.get_skipped_attribute_count()
 
-    model_deployer.deploy_model_offline(model, model_context, aliases, wlst_mode=__wlst_mode)
+    skipped_count += model_deployer.deploy_model_offline(model, model_context, aliases, wlst_mode=__wlst_mode)
+    deployer_utils.log_skipped_attribute_count(skipped_count)
 
     try:
         __wlst_helper.update_domain()
@@ -439,7 +444,7 @@ def main(args):
 
     __logger.entering(args[0], class_name=_class_name, method_name=_method_name)
     for index, arg in enumerate(args):
-        __logger.finer('sys.argv[{0}] = {1}', str(index), str(arg), class_name=_class_name, method_name=_method_name)
+        __logger.finer('sys.argv[{0}] = {1}', index, arg, class_name=_class_name, method_name=_method_name)
 
     __wlst_helper.silence()
 
@@ -480,6 +485,15 @@ def main(args):
         # if any filters were applied, re-validate the model
         validate_model(model_dictionary, model_context, aliases)
 
+    try:
+        model_dictionary = model_differ.get_model_changes(model_dictionary, model_context, aliases, "update",
+                                                          __logger)
+    except TranslateException, ex:
+        __logger.severe('WLSDPLY-09016', _program_name, model_context.get_previous_model_file(),
+                        ex.getLocalizedMessage(), error=ex, class_name=_class_name, method_name=_method_name)
+        __clean_up_temp_files()
+        tool_exit.end(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
+
     try:
         model = Model(model_dictionary)
         __update(model, model_context, aliases)
@@ -0,0 +1,195 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Persistent cache of the compiled alias knowledge base.
+
+Loading the alias category files requires parsing each JSON file, expanding the contains references and
+resolving every folder and attribute against the WLS version and WLST mode in use.  The result of that work
+depends only on the category files, the WLS version and the WLST mode so it is written to a serialized
+artifact, one per WLS version and WLST mode pair, the first time it is computed.  Subsequent runs load the
+artifact directly as long as the checksum of the category files recorded in the artifact still matches.
+
+The cache directory is taken from the WLSDEPLOY_ALIAS_CACHE_DIR environment variable, if set, or defaults
+to the lib/alias_cache directory of the WLSDEPLOY_HOME installation.  If neither is set, caching is disabled.
+"""
+import cPickle
+import os
+
+from java.io import File
+from java.lang import Exception as JException
+from java.lang import String
+from java.security import MessageDigest
+from javax.xml.bind import DatatypeConverter
+
+from oracle.weblogic.deploy.util import FileUtils
+
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+_class_name = 'alias_cache'
+_logger = PlatformLogger('wlsdeploy.aliases')
+
+# Bump this value whenever the structure of the compiled alias dictionaries changes
+# so that artifacts written by an older version of the tooling are ignored.
+CACHE_FORMAT_VERSION = 2
+
+CACHE_DIR_ENV_VARIABLE = 'WLSDEPLOY_ALIAS_CACHE_DIR'
+
+_cache_file_name_template = 'aliases_%s_%s.cache'
+
+
+def get_cache_directory():
+    """
+    Get the directory used to store the compiled alias artifacts.
+    :return: the directory name, or None if caching is disabled
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VARIABLE)
+    if cache_dir is None or len(cache_dir) == 0:
+        wlsdeploy_home = os.environ.get('WLSDEPLOY_HOME')
+        if wlsdeploy_home is not None and len(wlsdeploy_home) > 0:
+            cache_dir = os.path.join(wlsdeploy_home, 'lib', 'alias_cache')
+        else:
+            cache_dir = None
+    return cache_dir
+
+
+def get_cache_file(cache_dir, wls_version, wlst_mode):
+    """
+    Get the artifact file for the specified WLS version and WLST mode.
+    :param cache_dir: the cache directory
+    :param wls_version: the WLS version
+    :param wlst_mode: the WLST mode
+    :return: the java.io.File for the artifact
+    """
+    file_name = _cache_file_name_template % (wls_version, WlstModes.from_value(wlst_mode).lower())
+    return File(cache_dir, file_name)
+
+
+def is_writable(cache_dir):
+    """
+    Determine whether an artifact can be written to the cache directory, which is created if it does not exist.
+    :param cache_dir: the cache directory
+    :return: True if the directory, or its nearest existing parent directory, is writable, False otherwise
+    """
+    _method_name = 'is_writable'
+
+    directory = File(cache_dir).getAbsoluteFile()
+    while directory is not None and not directory.exists():
+        directory = directory.getParentFile()
+
+    result = directory is not None and directory.isDirectory() and directory.canWrite()
+    if not result:
+        _logger.fine('WLSDPLY-08608', cache_dir, class_name=_class_name, method_name=_method_name)
+    return result
+
+
+def compute_checksum(category_file_paths):
+    """
+    Compute the checksum of the category files used to build the alias knowledge base.
+    :param category_file_paths: the list of category file resource paths
+    :return: the checksum string, or None if one of the category files could not be read
+    """
+    _method_name = 'compute_checksum'
+
+    paths = list(category_file_paths)
+    paths.sort()
+    digest = MessageDigest.getInstance('MD5')
+    digest.update(String(str(CACHE_FORMAT_VERSION)).getBytes('UTF-8'))
+    for path in paths:
+        input_stream = FileUtils.getResourceAsStream(path)
+        if input_stream is None:
+            _logger.fine('WLSDPLY-08600', path, class_name=_class_name, method_name=_method_name)
+            return None
+        try:
+            digest.update(String(path).getBytes('UTF-8'))
+            digest.update(FileUtils.readInputStreamToByteArray(input_stream))
+        finally:
+            input_stream.close()
+    return DatatypeConverter.printHexBinary(digest.digest())
+
+
+def load(cache_dir, wls_version, wlst_mode, checksum):
+    """
+    Load the compiled category dictionaries for the specified WLS version and WLST mode.
+    :param cache_dir: the cache directory
+    :param wls_version: the WLS version
+    :param wlst_mode: the WLST mode
+    :param checksum: the current checksum of the category files
+    :return: the category dictionaries, or None if there is no usable artifact
+    """
+    _method_name = 'load'
+
+    cache_file = get_cache_file(cache_dir, wls_version, wlst_mode)
+    if not cache_file.isFile():
+        _logger.fine('WLSDPLY-08601', cache_file.getPath(), class_name=_class_name, method_name=_method_name)
+        return None
+
+    result = None
+    try:
+        cache_stream = open(cache_file.getPath(), 'rb')
+        try:
+            artifact = cPickle.load(cache_stream)
+        finally:
+            cache_stream.close()
+
+        if type(artifact) is dict and artifact.get('format') == CACHE_FORMAT_VERSION and \
+                artifact.get('checksum') == checksum:
+            result = artifact['categories']
+            _logger.fine('WLSDPLY-08602', cache_file.getPath(), class_name=_class_name, method_name=_method_name)
+        else:
+            _logger.fine('WLSDPLY-08603', cache_file.getPath(), class_name=_class_name, method_name=_method_name)
+    except (IOError, EOFError, cPickle.UnpicklingError, JException), e:
+        _logger.fine('WLSDPLY-08604', cache_file.getPath(), e, class_name=_class_name, method_name=_method_name)
+    return result
+
+
+def store(cache_dir, wls_version, wlst_mode, checksum, category_dict):
+    """
+    Write the compiled category dictionaries for the specified WLS version and WLST mode.  Failures
+    are logged and otherwise ignored since the cache is only an optimization.
+    :param cache_dir: the cache directory
+    :param wls_version: the WLS version
+    :param wlst_mode: the WLST mode
+    :param checksum: the checksum of the category files used to compile the dictionaries
+    :param category_dict: the fully resolved category dictionaries
+    :return: True if the artifact was written, False otherwise
+    """
+    _method_name = 'store'
+
+    cache_file = get_cache_file(cache_dir, wls_version, wlst_mode)
+    artifact = {
+        'format': CACHE_FORMAT_VERSION,
+        'checksum': checksum,
+        'wls_version': wls_version,
+        'wlst_mode': WlstModes.from_value(wlst_mode),
+        'categories': category_dict
+    }
+
+    result = False
+    try:
+        directory = cache_file.getParentFile()
+        if not directory.isDirectory() and not directory.mkdirs():
+            _logger.fine('WLSDPLY-08605', directory.getPath(), class_name=_class_name, method_name=_method_name)
+            return result
+
+        # Write to a temporary file and rename it so that concurrent tool runs never read a partial artifact.
+        temp_file = File.createTempFile(cache_file.getName(), '.tmp', directory)
+        try:
+            cache_stream = open(temp_file.getPath(), 'wb')
+            try:
+                cPickle.dump(artifact, cache_stream, 1)
+            finally:
+                cache_stream.close()
+
+            if cache_file.exists():
+                cache_file.delete()
+            if temp_file.renameTo(cache_file):
+                result = True
+                _logger.fine('WLSDPLY-08606', cache_file.getPath(), class_name=_class_name, method_name=_method_name)
+        finally:
+            if temp_file.exists():
+                temp_file.delete()
+    except (IOError, TypeError, cPickle.PicklingError, JException), e:
+        _logger.fine('WLSDPLY-08607', cache_file.getPath(), e, class_name=_class_name, method_name=_method_name)
+    return result
@@ -36,6 +36,7 @@ WLST_CREATE_PATH = 'wlst_create_path'
 WLST_LIST_PATH = 'wlst_list_path'
 WLST_MODE = 'wlst_mode'
 WLST_NAME = 'wlst_name'
+WLST_NAMES_INDEX = '__wlst_names_index__'
 WLST_NAMES_MAP = '__wlst_names__'
 WLST_PATH = 'wlst_path'
 WLST_PATHS = 'wlst_paths'
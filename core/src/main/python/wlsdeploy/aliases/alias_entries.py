@@ -3,7 +3,9 @@ Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
 import copy
+import threading
 
+from oracle.weblogic.deploy.aliases import AliasException
 from oracle.weblogic.deploy.aliases import VersionException
 from oracle.weblogic.deploy.aliases import VersionUtils
 from oracle.weblogic.deploy.json import JsonException
@@ -11,6 +13,7 @@ from oracle.weblogic.deploy.json import JsonStreamTranslator
 from oracle.weblogic.deploy.util import FileUtils
 
 import wlsdeploy.aliases.alias_utils as alias_utils
+from wlsdeploy.aliases import alias_cache
 from wlsdeploy.aliases import password_utils
 from wlsdeploy.aliases.alias_constants import ChildFoldersTypes
 from wlsdeploy.aliases.location_context import LocationContext
@@ -18,7 +21,6 @@ from wlsdeploy.aliases.validation_codes import ValidationCodes
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
-from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
 
 from wlsdeploy.aliases.alias_constants import ATTRIBUTES
@@ -45,6 +47,7 @@ from wlsdeploy.aliases.alias_constants import WLST_CREATE_PATH
 from wlsdeploy.aliases.alias_constants import WLST_LIST_PATH
 from wlsdeploy.aliases.alias_constants import WLST_MODE
 from wlsdeploy.aliases.alias_constants import WLST_NAME
+from wlsdeploy.aliases.alias_constants import WLST_NAMES_INDEX
 from wlsdeploy.aliases.alias_constants import WLST_NAMES_MAP
 from wlsdeploy.aliases.alias_constants import WLST_PATH
 from wlsdeploy.aliases.alias_constants import WLST_PATHS
@@ -179,7 +182,12 @@ class AliasEntries(object):
         :param wlst_mode: the WLST mode being used, the default is OFFLINE
         :param wls_version: the WLS version to use, the default is the version of WLST being used to run the program.
         """
+        # The workers of a parallel discovery share the aliases, so the caches are only changed under the lock
+        self._cache_lock = threading.RLock()
         self._category_dict = {}
+        self._location_dict_cache = {}
+        self._location_cache_hits = 0
+        self._location_cache_misses = 0
         self._wlst_mode = wlst_mode
         if wls_version is None:
             self._wls_helper = WebLogicHelper(_logger)
@@ -193,6 +201,8 @@ class AliasEntries(object):
                 self._wls_helper.requires_security_provider_rename_in_offline_mode()
         else:
             self._requires_security_provider_rename = False
+
+        self.__load_alias_cache()
         return
 
     def get_dictionary_for_location(self, location, resolve=True):
@@ -207,11 +217,18 @@ class AliasEntries(object):
         """
         _method_name = 'get_dictionary_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = self.__get_dictionary_for_location(location, resolve)
         _logger.exiting(class_name=_class_name, method_name=_method_name)
         return result
 
+    def get_location_cache_statistics(self):
+        """
+        Get the hit and miss counts of the cache of alias dictionaries keyed by location folders.
+        :return: a tuple of the hit count and the miss count
+        """
+        return self._location_cache_hits, self._location_cache_misses
+
     def get_model_domain_subfolder_names(self):
         """
         Get the list of top-level model folder names corresponding to top-level WLST folder names.
@@ -280,7 +297,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_model_subfolder_names_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and FOLDERS in folder_dict:
             subfolders_dict = folder_dict[FOLDERS]
@@ -300,7 +317,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_model_folder_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
 
         # Initialize return variable
         model_folder_path = ''
@@ -362,7 +379,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_attribute_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_ATTRIBUTES_PATH)
         result = alias_utils.replace_tokens_in_path(location, tokenized_path)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
@@ -378,7 +395,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_subfolders_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_SUBFOLDERS_PATH)
         result = alias_utils.replace_tokens_in_path(location, tokenized_path)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
@@ -394,7 +411,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_list_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_LIST_PATH)
         result = alias_utils.replace_tokens_in_path(location, tokenized_path)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
@@ -410,7 +427,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_list_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_CREATE_PATH)
         result = alias_utils.replace_tokens_in_path(location, tokenized_path)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
@@ -427,7 +444,7 @@ class AliasEntries(object):
         """
         _method_name = 'is_location_child_folder_type'
 
-        _logger.entering(str(location), ChildFoldersTypes.from_value(child_folders_type),
+        _logger.entering(location, ChildFoldersTypes.from_value(child_folders_type),
                          class_name=_class_name, method_name=_method_name)
         result = False
         folder_dict = self.__get_dictionary_for_location(location, False)
@@ -456,7 +473,7 @@ class AliasEntries(object):
         """
         _method_name = 'location_contains_flattened_folder'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = False
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and FLATTENED_FOLDER_DATA in folder_dict:
@@ -472,7 +489,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_flattened_type_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = None
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and FLATTENED_FOLDER_DATA in folder_dict and \
@@ -489,7 +506,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_flattened_name_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = None
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and FLATTENED_FOLDER_DATA in folder_dict and \
@@ -508,7 +525,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_flattened_folder_list_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_CREATE_PATH)
         tokenized_child_path = alias_utils.strip_trailing_folders_in_path(tokenized_path, 1)
         result = alias_utils.replace_tokens_in_path(location, tokenized_child_path)
@@ -525,7 +542,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_flattened_folder_create_path_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         tokenized_path = self.__get_path_for_location(location, WLST_CREATE_PATH)
         tokenized_child_path = alias_utils.strip_trailing_folders_in_path(tokenized_path, 2)
         result = alias_utils.replace_tokens_in_path(location, tokenized_child_path)
@@ -541,7 +558,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_name_token_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
 
         result = None
 
@@ -605,7 +622,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_mbean_name_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
 
         mbean_name = None
@@ -645,7 +662,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_wlst_mbean_type_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is None:
             wlst_type = None
@@ -672,7 +689,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_alias_attribute_entries_by_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
         model_attr_dict = dict()
         if folder_dict is not None and ATTRIBUTES in folder_dict:
@@ -702,7 +719,7 @@ class AliasEntries(object):
         """
         _method_name = 'get_alias_attribute_entry_by_model_name'
 
-        _logger.entering(str(location), model_attribute_name, class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, model_attribute_name, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and ATTRIBUTES in folder_dict:
             if model_attribute_name in folder_dict[ATTRIBUTES]:
@@ -732,17 +749,14 @@ class AliasEntries(object):
         """
         _method_name = 'get_alias_attribute_entry_by_wlst_name'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
-        if self._is_wlst_attribute_skipped(folder_dict, wlst_attribute_name):
-            result = None
-        elif folder_dict is not None and WLST_NAMES_MAP in folder_dict:
-            if wlst_attribute_name in folder_dict[WLST_NAMES_MAP]:
-                result = copy.deepcopy(folder_dict[WLST_NAMES_MAP][wlst_attribute_name])
-                if WLST_PATH in result:
-                    del result[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08110', wlst_attribute_name, location.get_folder_path(), WLST_PATH)
+        if folder_dict is not None and WLST_NAMES_INDEX in folder_dict:
+            wlst_names_index = folder_dict[WLST_NAMES_INDEX]
+            if wlst_attribute_name in wlst_names_index:
+                # skipped WLST names are indexed with a None entry.  The entry is copied
+                # so that callers cannot change the nested values held by the index.
+                result = copy.deepcopy(wlst_names_index[wlst_attribute_name])
             else:
                 if wlst_attribute_name not in IGNORE_FOR_MODEL_LIST:
                     ex = exception_helper.create_alias_exception('WLSDPLY-08111', location.get_folder_path(),
@@ -753,7 +767,7 @@ class AliasEntries(object):
                     result = None
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08112', location.get_folder_path(),
-                                                         wlst_attribute_name, WLST_NAMES_MAP)
+                                                         wlst_attribute_name, WLST_NAMES_INDEX)
             _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
             raise ex
 
@@ -771,7 +785,7 @@ class AliasEntries(object):
         """
         _method_name = 'is_valid_model_folder_name_for_location'
 
-        _logger.entering(str(location), model_folder_name, class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, model_folder_name, class_name=_class_name, method_name=_method_name)
         valid_version_range = None
         if len(location.get_model_folders()) == 0 and model_folder_name in self.get_model_domain_subfolder_names():
             sub_location = LocationContext(location).append_location(model_folder_name)
@@ -825,7 +839,7 @@ class AliasEntries(object):
         """
         _method_name = 'is_version_valid_location'
 
-        _logger.entering(str(location),class_name=_class_name, method_name=_method_name)
+        _logger.entering(location,class_name=_class_name, method_name=_method_name)
 
         code = ValidationCodes.VALID
         message = ''
@@ -850,7 +864,7 @@ class AliasEntries(object):
         """
         _method_name = 'is_valid_model_attribute_name_for_location'
 
-        _logger.entering(str(location), model_attribute_name, class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, model_attribute_name, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, True)
         valid_version_range = None
         if folder_dict is None:
@@ -880,6 +894,13 @@ class AliasEntries(object):
         DO NOT USE!
         :return: blob of stuff
         """
+        return self.__get_category_file_paths()
+
+    def __get_category_file_paths(self):
+        """
+        Get the resource paths of the category files, keyed by model category name.
+        :return: the dictionary of category file paths
+        """
         result = {}
         for key, value in self.__model_categories_map.iteritems():
             category_file_name = '%s.json' % value
@@ -887,6 +908,39 @@ class AliasEntries(object):
             result[key] = category_file_path
         return result
 
+    def __load_alias_cache(self):
+        """
+        Load the compiled category dictionaries for the current WLS version and WLST mode from the alias cache.
+        If the cache does not hold a current artifact and the cache directory is writable, compile all categories
+        and write a new artifact so that subsequent runs can skip parsing and resolving the category files.
+        Otherwise, or on any failure, the categories are loaded on demand from the category files.
+        """
+        _method_name = '__load_alias_cache'
+
+        cache_dir = alias_cache.get_cache_directory()
+        if cache_dir is None:
+            return
+
+        _logger.entering(cache_dir, class_name=_class_name, method_name=_method_name)
+        checksum = alias_cache.compute_checksum(self.__get_category_file_paths().values())
+        if checksum is not None:
+            category_dict = alias_cache.load(cache_dir, self._wls_version, self._wlst_mode, checksum)
+            if category_dict is not None:
+                self._category_dict = category_dict
+            elif alias_cache.is_writable(cache_dir):
+                # Only compile every category up front when the artifact can be written, otherwise each
+                # run would pay for compiling categories that it never uses.
+                try:
+                    for model_category_name in self.__model_categories_map:
+                        self.__get_category_dictionary(model_category_name)
+                    alias_cache.store(cache_dir, self._wls_version, self._wlst_mode, checksum, self._category_dict)
+                except AliasException, ae:
+                    _logger.fine('WLSDPLY-08145', ae.getLocalizedMessage(),
+                                 class_name=_class_name, method_name=_method_name)
+                    self._category_dict = {}
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return
+
     def __get_dictionary_for_location(self, location, resolve_path_tokens=True):
         """
         Get the dictionary for a location with or without path tokens resolved
@@ -897,13 +951,44 @@ class AliasEntries(object):
         """
         _method_name = '__get_dictionary_for_location'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         if location is None:
             ex = exception_helper.create_alias_exception('WLSDPLY-08115')
             _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
             raise ex
 
         location_folders = location.get_model_folders()
+        cache_key = tuple(location_folders)
+        self._cache_lock.acquire()
+        try:
+            if cache_key in self._location_dict_cache:
+                self._location_cache_hits += 1
+                folder_dict, path_name = self._location_dict_cache[cache_key]
+            else:
+                self._location_cache_misses += 1
+                folder_dict, path_name = self.__find_dictionary_for_folders(location_folders)
+                self._location_dict_cache[cache_key] = (folder_dict, path_name)
+        finally:
+            self._cache_lock.release()
+
+        if resolve_path_tokens and path_name is not None:
+            resolved_dict = alias_utils.resolve_path_tokens(location, path_name, folder_dict)
+        else:
+            resolved_dict = folder_dict
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return resolved_dict
+
+    def __find_dictionary_for_folders(self, location_folders):
+        """
+        Walk the category dictionary to find the unresolved dictionary for the specified model folders.
+        :param location_folders: the list of model folder names
+        :return: the unresolved dictionary and the model path name used to resolve its path tokens.  The path
+                 name is None if the dictionary is a category dictionary that does not require path resolution.
+        :raises: AliasException: if the model folders do not exist in the alias data
+        """
+        _method_name = '__find_dictionary_for_folders'
+
         if len(location_folders) == 0:
             model_category_name = self.__domain_category
         else:
@@ -914,30 +999,23 @@ class AliasEntries(object):
                 raise ex
 
         category_dict = self.__get_category_dictionary(model_category_name)
-        if category_dict is not None and len(location_folders) > 0:
-            path_name = '/' + location_folders[0]
-            location_subfolders = list(location_folders[1:])
-            child_dict = category_dict
-            for location_subfolder in location_subfolders:
-                if FOLDERS in child_dict and location_subfolder in child_dict[FOLDERS]:
-                    child_dict = child_dict[FOLDERS][location_subfolder]
-                else:
-                    ex = exception_helper.create_alias_exception('WLSDPLY-08117', location_subfolder, path_name)
-                    _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
-                    raise ex
-                if child_dict is None:
-                    break
-                path_name += '/' + location_subfolder
-
-            if resolve_path_tokens:
-                resolved_dict = alias_utils.resolve_path_tokens(location, path_name, child_dict)
+        if category_dict is None or len(location_folders) == 0:
+            return category_dict, None
+
+        path_name = '/' + location_folders[0]
+        location_subfolders = list(location_folders[1:])
+        child_dict = category_dict
+        for location_subfolder in location_subfolders:
+            if FOLDERS in child_dict and location_subfolder in child_dict[FOLDERS]:
+                child_dict = child_dict[FOLDERS][location_subfolder]
             else:
-                resolved_dict = child_dict
-        else:
-            resolved_dict = category_dict
-
-        _logger.exiting(class_name=_class_name, method_name=_method_name)
-        return resolved_dict
+                ex = exception_helper.create_alias_exception('WLSDPLY-08117', location_subfolder, path_name)
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+            if child_dict is None:
+                break
+            path_name += '/' + location_subfolder
+        return child_dict, path_name
 
     def __get_category_dictionary(self, model_category_name):
         """
@@ -947,9 +1025,13 @@ class AliasEntries(object):
         :return: the category dictionary, or None if the category is not relevant to the current WLS version
         :raises: AliasException: if an error occurs while loading the category dictionary
         """
-        if model_category_name not in self._category_dict:
-            self.__load_category(model_category_name)
-        return self._category_dict[model_category_name]
+        self._cache_lock.acquire()
+        try:
+            if model_category_name not in self._category_dict:
+                self.__load_category(model_category_name)
+            return self._category_dict[model_category_name]
+        finally:
+            self._cache_lock.release()
 
     def __load_category(self, model_category_name):
         """
@@ -1200,7 +1282,34 @@ class AliasEntries(object):
             result[WLST_NAMES_MAP] = result_wlst_attrs
             result[UNRESOLVED_ATTRIBUTES_MAP] = unresolved_attrs
             result[WLST_SKIP_NAMES] = wlst_skip_attrs
+            result[WLST_NAMES_INDEX] = self.__build_wlst_names_index(path_name, result_wlst_attrs, wlst_skip_attrs)
+
+        return result
+
+    def __build_wlst_names_index(self, path_name, wlst_attrs, wlst_skip_attrs):
+        """
+        Build the index used to look up the model attribute entry for a WLST attribute name.  The entries
+        are built once when the category is loaded so that discovery does not copy and filter the alias
+        attribute entry each time it converts a WLST attribute.
+        :param path_name: the model folder path name for the attributes
+        :param wlst_attrs: the resolved attribute entries keyed by WLST name
+        :param wlst_skip_attrs: the WLST names that should not be mapped to a model attribute
+        :return: the index of attribute entries, without the WLST path, keyed by WLST name
+        """
+        _method_name = '__build_wlst_names_index'
 
+        result = dict()
+        for wlst_name, attr_dict in wlst_attrs.iteritems():
+            index_entry = copy.deepcopy(attr_dict)
+            if WLST_PATH in index_entry:
+                del index_entry[WLST_PATH]
+            else:
+                _logger.warning('WLSDPLY-08110', wlst_name, path_name, WLST_PATH,
+                                class_name=_class_name, method_name=_method_name)
+            result[wlst_name] = index_entry
+
+        for skip_name in wlst_skip_attrs:
+            result[skip_name] = None
         return result
 
     def __resolve_attribute_by_wlst_context(self, path_name, attr_name, attrs_dict):
@@ -1352,7 +1461,7 @@ class AliasEntries(object):
         """
         _method_name = '__get_valid_version_range_for_folder'
 
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         version_range = None
         parent_dict = self._category_dict
         path_name = ''
@@ -1377,12 +1486,6 @@ class AliasEntries(object):
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=version_range)
         return version_range
 
-    def _is_wlst_attribute_skipped(self, folder_dict, wlst_attribute_name):
-        skip_names = dictionary_utils.get_element(folder_dict, WLST_SKIP_NAMES)  # type: list
-        if skip_names is not None:
-            return wlst_attribute_name in skip_names
-        return False
-
     def __get_path_for_location(self, location, path_type=WLST_ATTRIBUTES_PATH):
         """
         Get the tokenized path of the specified type for the location.  This method is used by all path-related methods.
@@ -1393,7 +1496,7 @@ class AliasEntries(object):
         """
         _method_name = '__get_path_for_location'
 
-        _logger.entering(str(location), path_type, class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, path_type, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and path_type in folder_dict:
             paths_index = folder_dict[path_type]
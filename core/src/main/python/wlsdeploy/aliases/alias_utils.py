@@ -408,7 +408,7 @@ def resolve_path_index(folder_dict, paths_index, path_attribute_name_used, locat
     _method_name = 'resolve_path_index'
 
     # Don't log folder dictionary because it is likely very large
-    _logger.entering(paths_index, path_attribute_name_used, str(location),
+    _logger.entering(paths_index, path_attribute_name_used, location,
                      class_name=_class_name, method_name=_method_name)
     if WLST_PATHS in folder_dict:
         if paths_index in folder_dict[WLST_PATHS]:
@@ -436,7 +436,7 @@ def replace_tokens_in_path(location, path):
     """
     _method_name = 'replace_tokens_in_path'
 
-    _logger.entering(str(location), path, class_name=_class_name, method_name=_method_name)
+    _logger.entering(location, path, class_name=_class_name, method_name=_method_name)
     name_tokens = location.get_name_tokens()
     new_path = path
     if name_tokens:
@@ -2,6 +2,9 @@
 Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
+import copy
+import threading
+
 from java.lang import String
 
 from oracle.weblogic.deploy.aliases import TypeUtils
@@ -15,6 +18,7 @@ from wlsdeploy.aliases.validation_codes import ValidationCodes
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.aliases import alias_constants
 from wlsdeploy.aliases import alias_utils
 from wlsdeploy.aliases import password_utils
 from wlsdeploy.util import string_utils
@@ -44,9 +48,20 @@ from wlsdeploy.aliases.alias_constants import SET_METHOD
 from wlsdeploy.aliases.alias_constants import USES_PATH_TOKENS
 from wlsdeploy.aliases.alias_constants import VALUE
 from wlsdeploy.aliases.alias_constants import WLST_NAME
+from wlsdeploy.aliases.alias_constants import WLST_READ_TYPE
 from wlsdeploy.aliases.alias_constants import WLST_TYPE
 from wlsdeploy.aliases.model_constants import MODEL_LIST_DELIMITER
 
+# data types whose model and WLST values can be compared after converting both to the data type
+_comparable_data_types = [
+    alias_constants.BOOLEAN,
+    alias_constants.DOUBLE,
+    alias_constants.INTEGER,
+    alias_constants.JAVA_LANG_BOOLEAN,
+    alias_constants.LONG,
+    alias_constants.STRING
+]
+
 
 class Aliases(object):
     """
@@ -71,6 +86,14 @@ class Aliases(object):
             self._wls_version = wls_version
 
         self._alias_entries = AliasEntries(wlst_mode, self._wls_version)
+
+        # Attribute name lists derived from the alias dictionaries only depend on the location folders,
+        # so they are computed once per folder and shared by every MBean instance of that folder.
+        # The workers of a parallel discovery share the aliases, so the caches are only changed under the lock
+        self._cache_lock = threading.RLock()
+        self._attribute_names_cache = dict()
+        self._attribute_names_cache_hits = 0
+        self._attribute_names_cache_misses = 0
         return
 
     ###########################################################################
@@ -416,7 +439,7 @@ class Aliases(object):
         """
         _method_name = 'get_wlst_attribute_name'
 
-        self._logger.entering(str(location), model_attribute_name,
+        self._logger.entering(location, model_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         wlst_attribute_name = None
         alias_attr_dict = self._alias_entries.get_alias_attribute_entry_by_model_name(location, model_attribute_name)
@@ -439,9 +462,14 @@ class Aliases(object):
         """
         _method_name = 'get_wlst_get_required_attribute_names'
 
+        cache_key = _get_attribute_names_cache_key(location, 'wlst_get_required')
+        cached_names = self.__get_cached_attribute_names(cache_key)
+        if cached_names is not None:
+            return list(cached_names)
+
         wlst_attribute_names = []
 
-        module_folder = self._alias_entries.get_dictionary_for_location(location)
+        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
 
         if ATTRIBUTES not in module_folder:
             ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
@@ -452,7 +480,8 @@ class Aliases(object):
             if GET_METHOD in value and value[GET_METHOD] == GET:
                 wlst_attribute_names.append(value[WLST_NAME])
 
-        return wlst_attribute_names
+        self.__set_cached_attribute_names(cache_key, wlst_attribute_names)
+        return list(wlst_attribute_names)
 
     def get_wlst_lsa_required_attribute_names(self, location):
         """
@@ -463,9 +492,14 @@ class Aliases(object):
         """
         _method_name = 'get_wlst_lsa_required_attribute_names'
 
+        cache_key = _get_attribute_names_cache_key(location, 'wlst_lsa_required')
+        cached_names = self.__get_cached_attribute_names(cache_key)
+        if cached_names is not None:
+            return list(cached_names)
+
         wlst_attribute_names = []
 
-        module_folder = self._alias_entries.get_dictionary_for_location(location)
+        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
 
         if ATTRIBUTES not in module_folder:
             ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
@@ -476,7 +510,8 @@ class Aliases(object):
             if GET_METHOD in value and value[GET_METHOD] == LSA:
                 wlst_attribute_names.append(value[WLST_NAME])
 
-        return wlst_attribute_names
+        self.__set_cached_attribute_names(cache_key, wlst_attribute_names)
+        return list(wlst_attribute_names)
 
     def get_wlst_get_returns_mbean_attribute_names_and_types(self, location):
         """
@@ -487,9 +522,14 @@ class Aliases(object):
         """
         _method_name = 'get_wlst_get_required_attribute_names'
 
+        cache_key = _get_attribute_names_cache_key(location, 'wlst_get_returns_mbean')
+        cached_names = self.__get_cached_attribute_names(cache_key)
+        if cached_names is not None:
+            return dict(cached_names)
+
         wlst_attribute_names = dict()
 
-        module_folder = self._alias_entries.get_dictionary_for_location(location)
+        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
 
         if ATTRIBUTES not in module_folder:
             ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
@@ -502,7 +542,8 @@ class Aliases(object):
             else:
                 wlst_attribute_names[value[WLST_NAME]] = None
 
-        return wlst_attribute_names
+        self.__set_cached_attribute_names(cache_key, wlst_attribute_names)
+        return dict(wlst_attribute_names)
 
     ###########################################################################
     #                    Model folder-related methods                         #
@@ -564,7 +605,7 @@ class Aliases(object):
         """
         _method_name = 'is_valid_model_folder_name'
 
-        self._logger.entering(str(location), model_folder_name,
+        self._logger.entering(location, model_folder_name,
                               class_name=self._class_name, method_name=_method_name)
         result, valid_version_range = \
             self._alias_entries.is_valid_model_folder_name_for_location(location, model_folder_name)
@@ -603,6 +644,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_password_type_attribute_names'
 
+        cache_key = _get_attribute_names_cache_key(location, 'password_type')
+        cached_names = self.__get_cached_attribute_names(cache_key)
+        if cached_names is not None:
+            return list(cached_names)
+
         password_attribute_names = []
         module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
         if ATTRIBUTES not in module_folder:
@@ -613,7 +659,8 @@ class Aliases(object):
         for key, value in module_folder[ATTRIBUTES].iteritems():
             if WLST_TYPE in value and value[WLST_TYPE] == 'password':
                 password_attribute_names.append(key)
-        return password_attribute_names
+        self.__set_cached_attribute_names(cache_key, password_attribute_names)
+        return list(password_attribute_names)
 
     def get_model_restart_required_attribute_names(self, location):
         """
@@ -623,6 +670,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_restart_required_attribute_names'
 
+        cache_key = _get_attribute_names_cache_key(location, 'restart_required')
+        cached_names = self.__get_cached_attribute_names(cache_key)
+        if cached_names is not None:
+            return list(cached_names)
+
         restart_attribute_names = []
 
         module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
@@ -638,7 +690,8 @@ class Aliases(object):
                 if "true" == restart_required_value.lower():
                     restart_attribute_names.append(key)
 
-        return restart_attribute_names
+        self.__set_cached_attribute_names(cache_key, restart_attribute_names)
+        return list(restart_attribute_names)
 
     def get_model_get_required_attribute_names(self, location):
         """
@@ -649,6 +702,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_get_required_attribute_names'
 
+        cache_key = _get_attribute_names_cache_key(location, 'get_required')
+        cached_names = self.__get_cached_attribute_names(cache_key)
+        if cached_names is not None:
+            return list(cached_names)
+
         wlst_attribute_names = []
 
         module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
@@ -661,7 +719,8 @@ class Aliases(object):
             if GET_METHOD in value and value[GET_METHOD] == GET:
                 wlst_attribute_names.append(key)
 
-        return wlst_attribute_names
+        self.__set_cached_attribute_names(cache_key, wlst_attribute_names)
+        return list(wlst_attribute_names)
 
     def get_model_lsa_required_attribute_names(self, location):
         """
@@ -672,6 +731,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_lsa_required_attribute_names'
 
+        cache_key = _get_attribute_names_cache_key(location, 'lsa_required')
+        cached_names = self.__get_cached_attribute_names(cache_key)
+        if cached_names is not None:
+            return list(cached_names)
+
         lsa_required_attribute_names = []
 
         module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
@@ -684,7 +748,8 @@ class Aliases(object):
             if GET_METHOD in value and LSA in value[GET_METHOD]:
                 lsa_required_attribute_names.append(key)
 
-        return lsa_required_attribute_names
+        self.__set_cached_attribute_names(cache_key, lsa_required_attribute_names)
+        return list(lsa_required_attribute_names)
 
     def get_model_get_returns_mbean_attribute_names_and_types(self, location):
         """
@@ -695,6 +760,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_get_returns_mbean_attribute_names_and_types'
 
+        cache_key = _get_attribute_names_cache_key(location, 'get_returns_mbean')
+        cached_names = self.__get_cached_attribute_names(cache_key)
+        if cached_names is not None:
+            return dict(cached_names)
+
         model_attribute_names = dict()
 
         module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
@@ -709,7 +779,8 @@ class Aliases(object):
             else:
                 model_attribute_names[key] = None
 
-        return model_attribute_names
+        self.__set_cached_attribute_names(cache_key, model_attribute_names)
+        return dict(model_attribute_names)
 
     def get_model_mbean_set_method_attribute_names_and_types(self, location):
         """
@@ -720,6 +791,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_mbean_set_method_attribute_names_and_types'
 
+        cache_key = _get_attribute_names_cache_key(location, 'mbean_set_method')
+        cached_names = self.__get_cached_attribute_names(cache_key)
+        if cached_names is not None:
+            return copy.deepcopy(cached_names)
+
         model_attributes_dict = dict()
 
         module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
@@ -745,7 +821,8 @@ class Aliases(object):
 
                 model_attributes_dict[key] = attr_dict
 
-        return model_attributes_dict
+        self.__set_cached_attribute_names(cache_key, model_attributes_dict)
+        return copy.deepcopy(model_attributes_dict)
 
     def get_model_merge_required_attribute_names(self, location):
         """
@@ -756,6 +833,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_merge_required_attribute_names'
 
+        cache_key = _get_attribute_names_cache_key(location, 'merge_required')
+        cached_names = self.__get_cached_attribute_names(cache_key)
+        if cached_names is not None:
+            return list(cached_names)
+
         model_attribute_names = list()
 
         module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
@@ -772,7 +854,8 @@ class Aliases(object):
                 if merge:
                     model_attribute_names.append(key)
 
-        return model_attribute_names
+        self.__set_cached_attribute_names(cache_key, model_attribute_names)
+        return list(model_attribute_names)
 
     def get_model_uses_path_tokens_attribute_names(self, location):
         """
@@ -783,6 +866,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_uses_path_tokens_attribute_names'
 
+        cache_key = _get_attribute_names_cache_key(location, 'uses_path_tokens')
+        cached_names = self.__get_cached_attribute_names(cache_key)
+        if cached_names is not None:
+            return list(cached_names)
+
         model_attribute_names = list()
         module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
 
@@ -795,7 +883,8 @@ class Aliases(object):
             if USES_PATH_TOKENS in value and alias_utils.convert_boolean(value[USES_PATH_TOKENS]):
                 model_attribute_names.append(key)
 
-        return model_attribute_names
+        self.__set_cached_attribute_names(cache_key, model_attribute_names)
+        return list(model_attribute_names)
 
     def get_model_attribute_name_and_value(self, location, wlst_attribute_name, wlst_attribute_value):
         """
@@ -811,7 +900,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_attribute_name_and_value'
 
-        self._logger.entering(str(location), wlst_attribute_name, wlst_attribute_value,
+        self._logger.entering(location, wlst_attribute_name, wlst_attribute_value,
                               class_name=self._class_name, method_name=_method_name)
         model_attribute_name = None
         # Assume wlst_attribute_value is the same as default value of model_attribute_name
@@ -879,7 +968,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_attribute_name'
 
-        self._logger.entering(str(location), wlst_attribute_name,
+        self._logger.entering(location, wlst_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         model_attribute_name = None
 
@@ -900,9 +989,14 @@ class Aliases(object):
         """
         _method_name = 'get_model_attribute_names'
 
-        self._logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
-        attributes_dict = self._alias_entries.get_alias_attribute_entries_by_location(location)
-        result = list(attributes_dict.keys())
+        self._logger.entering(location, class_name=self._class_name, method_name=_method_name)
+        cache_key = _get_attribute_names_cache_key(location, 'model_attribute_names')
+        result = self.__get_cached_attribute_names(cache_key)
+        if result is None:
+            attributes_dict = self._alias_entries.get_alias_attribute_entries_by_location(location)
+            result = list(attributes_dict.keys())
+            self.__set_cached_attribute_names(cache_key, result)
+        result = list(result)
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
         return result
 
@@ -915,16 +1009,21 @@ class Aliases(object):
         """
         _method_name = 'get_model_attribute_names_and_types'
 
-        self._logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
-        result = {}
-        attributes_dict = self._alias_entries.get_alias_attribute_entries_by_location(location)
-        for key, value in attributes_dict.iteritems():
-            if PREFERRED_MODEL_TYPE in value:
-                result[key] = value[PREFERRED_MODEL_TYPE]
-            elif WLST_TYPE in value:
-                result[key] = value[WLST_TYPE]
-            else:
-                result[key] = None
+        self._logger.entering(location, class_name=self._class_name, method_name=_method_name)
+        cache_key = _get_attribute_names_cache_key(location, 'model_attribute_names_and_types')
+        result = self.__get_cached_attribute_names(cache_key)
+        if result is None:
+            result = {}
+            attributes_dict = self._alias_entries.get_alias_attribute_entries_by_location(location)
+            for key, value in attributes_dict.iteritems():
+                if PREFERRED_MODEL_TYPE in value:
+                    result[key] = value[PREFERRED_MODEL_TYPE]
+                elif WLST_TYPE in value:
+                    result[key] = value[WLST_TYPE]
+                else:
+                    result[key] = None
+            self.__set_cached_attribute_names(cache_key, result)
+        result = dict(result)
 
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
         return result
@@ -953,7 +1052,7 @@ class Aliases(object):
 
         result = False
 
-        module_folder = self._alias_entries.get_dictionary_for_location(location)
+        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
 
         if ATTRIBUTES not in module_folder:
             ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
@@ -969,6 +1068,48 @@ class Aliases(object):
 
         return result
 
+    def is_unchanged_attribute_value(self, location, model_attribute_name, model_attribute_value, wlst_attribute_value):
+        """
+        Returns whether or not the model value for a given model attribute is equal to the existing WLST value,
+        so that setting the attribute would not change anything.
+
+        Only attributes with simple data types that are read and written as the same type are compared.
+        For all other attributes, such as passwords, lists and MBean references, the values are never
+        considered equal so that the caller always sets them.
+        :param location: the location of the attribute
+        :param model_attribute_name: the model name of the attribute
+        :param model_attribute_value: the model value of the attribute
+        :param wlst_attribute_value: the existing WLST value, from lsa() or get()
+        :return: True if the values are equal, False otherwise
+        :raises: AliasException: if an error occurs
+        """
+        _method_name = 'is_unchanged_attribute_value'
+
+        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
+
+        if ATTRIBUTES not in module_folder:
+            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
+            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
+            raise ex
+
+        if model_attribute_name not in module_folder[ATTRIBUTES]:
+            return False
+
+        attribute_info = module_folder[ATTRIBUTES][model_attribute_name]
+        if not attribute_info or WLST_READ_TYPE in attribute_info or PREFERRED_MODEL_TYPE in attribute_info:
+            return False
+
+        data_type = attribute_info[WLST_TYPE]
+        if data_type not in _comparable_data_types or model_attribute_value is None or wlst_attribute_value is None:
+            return False
+
+        if USES_PATH_TOKENS in attribute_info and string_utils.to_boolean(attribute_info[USES_PATH_TOKENS]):
+            model_attribute_value = self._model_context.replace_token_string(model_attribute_value)
+
+        model_value = alias_utils.convert_to_type(data_type, model_attribute_value)
+        wlst_value = alias_utils.convert_to_type(data_type, wlst_attribute_value)
+        return model_value == wlst_value
+
     def is_valid_model_attribute_name(self, location, model_attribute_name):
         """
         Return whether or not location's model folders list has an attribute
@@ -987,7 +1128,7 @@ class Aliases(object):
         """
         _method_name = 'is_wlst_version_model_attribute_name'
 
-        self._logger.entering(str(location), model_attribute_name,
+        self._logger.entering(location, model_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         result, valid_version_range = \
             self._alias_entries.is_valid_model_attribute_name_for_location(location, model_attribute_name)
@@ -1021,7 +1162,7 @@ class Aliases(object):
         """
         _method_name = 'get_model_attribute_default_value'
 
-        self._logger.entering(str(location), model_attribute_name,
+        self._logger.entering(location, model_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         default_value = None
         attribute_info = self._alias_entries.get_alias_attribute_entry_by_model_name(location, model_attribute_name)
@@ -1037,12 +1178,54 @@ class Aliases(object):
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=default_value)
         return default_value
 
+    def get_cache_statistics(self):
+        """
+        Get the hit and miss counts of the alias lookup caches, used to confirm their effectiveness on large models.
+        :return: a dictionary of the hit and miss counts keyed by cache name
+        """
+        location_hits, location_misses = self._alias_entries.get_location_cache_statistics()
+        return {
+            'location_hits': location_hits,
+            'location_misses': location_misses,
+            'attribute_names_hits': self._attribute_names_cache_hits,
+            'attribute_names_misses': self._attribute_names_cache_misses
+        }
+
     ####################################################################################
     #
     # Private methods, private inner classes and static methods only, beyond here please
     #
     ####################################################################################
 
+    def __get_cached_attribute_names(self, cache_key):
+        """
+        Get the derived attribute names for the cache key, updating the hit and miss counts.
+        The caller must copy the returned value before handing it out since it is shared.
+        :param cache_key: the cache key returned by _get_attribute_names_cache_key()
+        :return: the cached value, or None if it has not been computed yet
+        """
+        self._cache_lock.acquire()
+        try:
+            if cache_key in self._attribute_names_cache:
+                self._attribute_names_cache_hits += 1
+                return self._attribute_names_cache[cache_key]
+            self._attribute_names_cache_misses += 1
+            return None
+        finally:
+            self._cache_lock.release()
+
+    def __set_cached_attribute_names(self, cache_key, value):
+        """
+        Cache the derived attribute names for the cache key.
+        :param cache_key: the cache key returned by _get_attribute_names_cache_key()
+        :param value: the value to cache, which must not be changed afterwards
+        """
+        self._cache_lock.acquire()
+        try:
+            self._attribute_names_cache[cache_key] = value
+        finally:
+            self._cache_lock.release()
+
     def __decrypt_password(self, text):
         """
         Internal method to determine if the provided password text needs to be decrypted
@@ -1079,6 +1262,17 @@ class Aliases(object):
         return rtnval
 
 
+def _get_attribute_names_cache_key(location, names_type):
+    """
+    Get the key used to cache derived attribute names for the location.  Only the model folders
+    are used since the alias dictionary for a location does not depend on its name tokens.
+    :param location: the location
+    :param names_type: the type of attribute names being cached
+    :return: the cache key
+    """
+    return (names_type,) + tuple(location.get_model_folders())
+
+
 def _strings_are_empty(converted_value, default_value):
     """
     Test converted and default values to see if they are both either None or an empty string
@@ -10,6 +10,8 @@ import java.io.IOException as JIOException
 import java.io.PrintWriter as JPrintWriter
 import java.lang.Boolean as JBoolean
 import java.lang.IllegalArgumentException as JIllegalArgumentException
+import java.lang.StringBuilder as JStringBuilder
+import java.lang.System as JSystem
 
 import oracle.weblogic.deploy.util.FileUtils as JFileUtils
 import oracle.weblogic.deploy.json.JsonStreamTranslator as JJsonStreamTranslator
@@ -18,6 +20,9 @@ import oracle.weblogic.deploy.json.JsonTranslator as JJsonTranslator
 from wlsdeploy.logging.platform_logger import PlatformLogger
 import wlsdeploy.exception.exception_helper as exception_helper
 
+# the line separator used by java.io.PrintWriter.println()
+_line_separator = JSystem.getProperty('line.separator')
+
 
 class JsonToPython(object):
     """
@@ -25,13 +30,18 @@ class JsonToPython(object):
     """
     _class_name = 'JsonToPython'
 
-    def __init__(self, file_name, use_ordering=False):
+    def __init__(self, file_name, use_ordering=False, use_streaming=False):
+        """
+        :param file_name: the name of the JSON file
+        :param use_ordering: whether or not to maintain the order of the keys in the dictionaries
+        :param use_streaming: whether or not to build the dictionary while parsing, without keeping the parse tree
+        """
         _method_name = '__init__'
 
         self._file_name = file_name
         self._logger = PlatformLogger('wlsdeploy.json')
         try:
-            self._translator = JJsonTranslator(file_name, use_ordering)
+            self._translator = JJsonTranslator(file_name, use_ordering, use_streaming)
         except JIllegalArgumentException, iae:
             json_ex = \
                 exception_helper.create_json_exception('WLSDPLY-18014', file_name, iae.getLocalizedMessage(), error=iae)
@@ -124,7 +134,8 @@ class PythonToJson(object):
         writer = None
         try:
             fos = JFileOutputStream(json_file, False)
-            writer = JPrintWriter(fos, True)
+            # the print writer buffers the output, so do not flush it after every line
+            writer = JPrintWriter(fos, False)
             self._write_dictionary_to_json_file(self._dictionary, writer)
 
         except JFileNotFoundException, fnfe:
@@ -161,17 +172,17 @@ class PythonToJson(object):
         writer.write(_start_dict)
         end_indent = indent
 
+        # write each entry with a single call, ending the previous line the way println() would
         indent += self._indent_unit
         for key, value in dictionary.iteritems():
-            writer.println(end_line)
+            entry = end_line + _line_separator + indent + '"' + _quote_embedded_quotes(key) + '" : '
             end_line = ','
-            writer.write(indent + '"' + _quote_embedded_quotes(key) + '" : ')
             if isinstance(value, dict):
+                writer.write(entry)
                 self._write_dictionary_to_json_file(value, writer, indent)
             else:
-                writer.write(_format_json_value(value))
-        writer.println()
-        writer.write(end_indent + _end_dict)
+                writer.write(entry + _format_json_value(value))
+        writer.write(_line_separator + end_indent + _end_dict)
 
         return
 
@@ -200,15 +211,14 @@ def _format_json_value(value):
     :param value: the value
     :return: the JSON snippet
     """
-    import java.lang.StringBuilder as StringBuilder
-    builder = StringBuilder()
     if type(value) == bool or (type(value) == str and (value == 'true' or value == 'false')):
-        builder.append(JBoolean.toString(value))
+        result = JBoolean.toString(value)
     elif type(value) == str:
-        builder.append('"').append(_quote_embedded_quotes(value)).append('"')
+        result = '"' + _quote_embedded_quotes(value) + '"'
     else:
-        builder.append(value)
-    return builder.toString()
+        # other values are formatted the way Java formats them
+        result = JStringBuilder().append(value).toString()
+    return result
 
 def _quote_embedded_quotes(text):
     """
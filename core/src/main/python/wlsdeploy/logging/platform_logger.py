@@ -2,6 +2,7 @@
 Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
+import java.lang.Object as JObject
 import java.lang.System as JSystem
 import java.lang.Thread as JThread
 import java.lang.Throwable as Throwable
@@ -116,8 +117,9 @@ class PlatformLogger(object):
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
-        record = self.__get_log_record(JLevel.CONFIG, clazz, method, message, error, *args)
-        self.logger.log(record)
+        if self.logger.isLoggable(JLevel.CONFIG):
+            record = self.__get_log_record(JLevel.CONFIG, clazz, method, message, error, *args)
+            self.logger.log(record)
         return
 
     def log(self, level, message, *args, **kwargs):
@@ -131,8 +133,9 @@ class PlatformLogger(object):
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
-        record = self.__get_log_record(level, clazz, method, message, error, *args)
-        self.logger.log(record)
+        if self.logger.isLoggable(level):
+            record = self.__get_log_record(level, clazz, method, message, error, *args)
+            self.logger.log(record)
         return
 
     def entering(self, *args, **kwargs):
@@ -143,7 +146,8 @@ class PlatformLogger(object):
         """
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
-        self.logger.entering(clazz, method, args)
+        if self.logger.isLoggable(JLevel.FINER):
+            self.logger.entering(clazz, method, _get_args_as_deferred_java_array(*args))
         return
 
     def exiting(self, class_name, method_name, result=None):
@@ -153,10 +157,11 @@ class PlatformLogger(object):
         :param method_name: the name of the method
         :param result: the method result, if any
         """
-        if result is not None:
-            self.logger.exiting(class_name, method_name, result)
-        else:
-            self.logger.exiting(class_name, method_name)
+        if self.logger.isLoggable(JLevel.FINER):
+            if result is not None:
+                self.logger.exiting(class_name, method_name, _DeferredArgument(result))
+            else:
+                self.logger.exiting(class_name, method_name)
         return
 
     def fine(self, message, *args, **kwargs):
@@ -169,8 +174,9 @@ class PlatformLogger(object):
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
-        record = self.__get_log_record(JLevel.FINE, clazz, method, message, error, *args)
-        self.logger.log(record)
+        if self.logger.isLoggable(JLevel.FINE):
+            record = self.__get_log_record(JLevel.FINE, clazz, method, message, error, *args)
+            self.logger.log(record)
         return
 
     def finer(self, message, *args, **kwargs):
@@ -183,8 +189,9 @@ class PlatformLogger(object):
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
-        record = self.__get_log_record(JLevel.FINER, clazz, method, message, error, *args)
-        self.logger.log(record)
+        if self.logger.isLoggable(JLevel.FINER):
+            record = self.__get_log_record(JLevel.FINER, clazz, method, message, error, *args)
+            self.logger.log(record)
         return
 
     def finest(self, message, *args, **kwargs):
@@ -197,8 +204,9 @@ class PlatformLogger(object):
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
-        record = self.__get_log_record(JLevel.FINEST, clazz, method, message, error, *args)
-        self.logger.log(record)
+        if self.logger.isLoggable(JLevel.FINEST):
+            record = self.__get_log_record(JLevel.FINEST, clazz, method, message, error, *args)
+            self.logger.log(record)
         return
 
     def info(self, message, *args, **kwargs):
@@ -211,8 +219,9 @@ class PlatformLogger(object):
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
-        record = self.__get_log_record(JLevel.INFO, clazz, method, message, error, *args)
-        self.logger.log(record)
+        if self.logger.isLoggable(JLevel.INFO):
+            record = self.__get_log_record(JLevel.INFO, clazz, method, message, error, *args)
+            self.logger.log(record)
         return
 
     def warning(self, message, *args, **kwargs):
@@ -225,8 +234,9 @@ class PlatformLogger(object):
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
-        record = self.__get_log_record(JLevel.WARNING, clazz, method, message, error, *args)
-        self.logger.log(record)
+        if self.logger.isLoggable(JLevel.WARNING):
+            record = self.__get_log_record(JLevel.WARNING, clazz, method, message, error, *args)
+            self.logger.log(record)
         return
 
     def severe(self, message, *args, **kwargs):
@@ -239,8 +249,9 @@ class PlatformLogger(object):
         method = kwargs.pop('method_name', None)
         clazz = kwargs.pop('class_name', None)
         error = kwargs.pop('error', None)
-        record = self.__get_log_record(JLevel.SEVERE, clazz, method, message, error, *args)
-        self.logger.log(record)
+        if self.logger.isLoggable(JLevel.SEVERE):
+            record = self.__get_log_record(JLevel.SEVERE, clazz, method, message, error, *args)
+            self.logger.log(record)
         return
 
     def throwing(self, error, method_name=None, class_name=None):
@@ -260,7 +271,12 @@ class PlatformLogger(object):
         record = JLogRecord(level, message)
         record.setLoggerName(self.name)
         record.setMillis(JSystem.currentTimeMillis())
-        record.setParameters(_get_args_as_java_array(*args))
+        if level.intValue() < JLevel.WARNING.intValue():
+            record.setParameters(_get_args_as_deferred_java_array(*args))
+        else:
+            # the summary handler keeps warning and severe records until the end of the tool,
+            # so format their arguments before the objects they refer to can change
+            record.setParameters(_get_args_as_java_array(*args))
         if self.resource_bundle_name is not None:
             record.setResourceBundle(self.logger.getResourceBundle())
         if clazz is not None:
@@ -289,3 +305,36 @@ def _get_args_as_java_array(*args):
             result.add(str(arg))
     return result.toArray()
 
+
+def _get_args_as_deferred_java_array(*args):
+    """
+    Convert the Python args list into a Java array of objects that are only converted to strings
+    if the log record is formatted.
+    :param args: the args list
+    :return: the Java array of deferred arguments
+    """
+    result = JArrayList()
+    if args is not None and len(args) > 0:
+        for arg in args:
+            result.add(_DeferredArgument(arg))
+    return result.toArray()
+
+
+class _DeferredArgument(JObject):
+    """
+    A log message argument whose string value is computed the first time the record is formatted,
+    so that arguments of records that no handler publishes are never converted to strings.
+    """
+    def __init__(self, arg):
+        JObject.__init__(self)
+        self.__arg = arg
+        self.__string = None
+
+    def toString(self):
+        """
+        Get the string value of the argument.
+        :return: the string value
+        """
+        if self.__string is None:
+            self.__string = str(self.__arg)
+        return self.__string
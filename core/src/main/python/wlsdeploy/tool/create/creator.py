@@ -52,7 +52,7 @@ class Creator(object):
         """
         _method_name = '_create_named_mbeans'
 
-        self.logger.entering(type_name, str(base_location), log_created,
+        self.logger.entering(type_name, base_location, log_created,
                              class_name=self.__class_name, method_name=_method_name)
         if model_nodes is None or len(model_nodes) == 0 or not self._is_type_valid(base_location, type_name):
             return
@@ -110,7 +110,7 @@ class Creator(object):
         """
         _method_name = '_create_mbean'
 
-        self.logger.entering(type_name, str(base_location), log_created,
+        self.logger.entering(type_name, base_location, log_created,
                              class_name=self.__class_name, method_name=_method_name)
         if model_nodes is None or len(model_nodes) == 0 or not self._is_type_valid(base_location, type_name):
             return
@@ -167,7 +167,7 @@ class Creator(object):
         """
         _method_name = '_create_security_provider_mbeans'
 
-        self.logger.entering(type_name, str(base_location), log_created,
+        self.logger.entering(type_name, base_location, log_created,
                              class_name=self.__class_name, method_name=_method_name)
         if model_nodes is None or len(model_nodes) == 0 or not self._is_type_valid(base_location, type_name):
             return
@@ -360,7 +360,7 @@ class Creator(object):
         """
         _method_name = '_create_subfolders'
 
-        self.logger.entering(str(location), class_name=self.__class_name, method_name=_method_name)
+        self.logger.entering(location, class_name=self.__class_name, method_name=_method_name)
         model_subfolder_names = self.alias_helper.get_model_subfolder_names(location)
 
         for key in model_nodes:
@@ -369,11 +369,11 @@ class Creator(object):
                 if len(subfolder_nodes) != 0:
                     sub_location = LocationContext(location).append_location(key)
                     if self.alias_helper.supports_multiple_mbean_instances(sub_location):
-                        self.logger.finest('WLSDPLY-12109', key, str(sub_location), subfolder_nodes,
+                        self.logger.finest('WLSDPLY-12109', key, sub_location, subfolder_nodes,
                                            class_name=self.__class_name, method_name=_method_name)
                         self._create_named_mbeans(key, subfolder_nodes, location)
                     elif self.alias_helper.requires_artificial_type_subfolder_handling(sub_location):
-                        self.logger.finest('WLSDPLY-12116', key, str(sub_location), subfolder_nodes,
+                        self.logger.finest('WLSDPLY-12116', key, sub_location, subfolder_nodes,
                                            class_name=self.__class_name, method_name=_method_name)
                         self._create_security_provider_mbeans(key, subfolder_nodes, location)
                     elif self.alias_helper.is_artificial_type_folder(sub_location):
@@ -382,7 +382,7 @@ class Creator(object):
                         self.logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
                         raise ex
                     else:
-                        self.logger.finest('WLSDPLY-12110', key, str(sub_location), subfolder_nodes,
+                        self.logger.finest('WLSDPLY-12110', key, sub_location, subfolder_nodes,
                                            class_name=self.__class_name, method_name=_method_name)
                         self._create_mbean(key, subfolder_nodes, location)
         self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
@@ -231,8 +231,7 @@ class DomainCreator(Creator):
             self.__extend_domain(self._domain_home)
 
         if len(self.files_to_extract_from_archive) > 0:
-            for file_to_extract in self.files_to_extract_from_archive:
-                self.archive_helper.extract_file(file_to_extract)
+            self.archive_helper.extract_files(self.files_to_extract_from_archive)
 
         self.library_helper.install_domain_libraries()
         self.library_helper.extract_classpath_libraries()
@@ -431,7 +430,7 @@ class DomainCreator(Creator):
         """
         _method_name = '__create_security_folder'
 
-        self.logger.entering(str(location), class_name=self.__class_name, method_name=_method_name)
+        self.logger.entering(location, class_name=self.__class_name, method_name=_method_name)
         security_nodes = dictionary_utils.get_dictionary_element(self._topology, SECURITY)
         if len(security_nodes) > 0:
             self._create_mbean(SECURITY, security_nodes, location)
@@ -446,7 +445,7 @@ class DomainCreator(Creator):
         """
         _method_name = '__create_machines'
 
-        self.logger.entering(str(location), class_name=self.__class_name, method_name=_method_name)
+        self.logger.entering(location, class_name=self.__class_name, method_name=_method_name)
         machine_nodes = dictionary_utils.get_dictionary_element(self._topology, MACHINE)
         unix_machine_nodes = dictionary_utils.get_dictionary_element(self._topology, UNIX_MACHINE)
 
@@ -465,7 +464,7 @@ class DomainCreator(Creator):
         """
         _method_name = '__create_clusters_and_servers'
 
-        self.logger.entering(str(location), class_name=self.__class_name, method_name=_method_name)
+        self.logger.entering(location, class_name=self.__class_name, method_name=_method_name)
         #
         # In order for source domain provisioning to work with dynamic clusters, we have to provision
         # the ServerTemplates.  There is a cyclical dependency between Server Template and Clusters so we
@@ -517,7 +516,7 @@ class DomainCreator(Creator):
         """
         _method_name = '__create_migratable_targets'
 
-        self.logger.entering(str(location), class_name=self.__class_name, method_name=_method_name)
+        self.logger.entering(location, class_name=self.__class_name, method_name=_method_name)
         migratable_target_nodes = dictionary_utils.get_dictionary_element(self._topology, MIGRATABLE_TARGET)
 
         if len(migratable_target_nodes) > 0:
@@ -534,7 +533,7 @@ class DomainCreator(Creator):
         """
         _method_name = '__create_other_domain_artifacts'
 
-        self.logger.entering(str(location), mbean_type_list, class_name=self.__class_name, method_name=_method_name)
+        self.logger.entering(location, mbean_type_list, class_name=self.__class_name, method_name=_method_name)
         for mbean_type in mbean_type_list:
             mbean_nodes = dictionary_utils.get_dictionary_element(self._topology, mbean_type)
 
@@ -76,7 +76,7 @@ class SecurityProviderCreator(Creator):
         """
         _method_name = '__create_security_configuration'
 
-        self.logger.entering(str(location), class_name=self.__class_name, method_name=_method_name)
+        self.logger.entering(location, class_name=self.__class_name, method_name=_method_name)
         security_configuration_nodes = dictionary_utils.get_dictionary_element(self._topology, SECURITY_CONFIGURATION)
 
         self.__handle_default_security_providers(location, security_configuration_nodes)
@@ -88,7 +88,7 @@ class SecurityProviderCreator(Creator):
     def __handle_default_security_providers(self, base_location, security_configuration_dict):
         _method_name = '__handle_default_security_providers'
 
-        self.logger.entering(str(base_location), class_name=self.__class_name, method_name=_method_name)
+        self.logger.entering(base_location, class_name=self.__class_name, method_name=_method_name)
         location = self.__get_default_realm_location()
         if security_configuration_dict is None or len(security_configuration_dict) == 0:
             if self.__fix_default_authentication_provider_names:
@@ -198,7 +198,7 @@ class SecurityProviderCreator(Creator):
     def __handle_default_authentication_providers(self, base_location, atn_providers=None):
         _method_name = '__handle_default_authentication_providers'
 
-        self.logger.entering(str(base_location), class_name=self.__class_name, method_name=_method_name)
+        self.logger.entering(base_location, class_name=self.__class_name, method_name=_method_name)
         if atn_providers is None or len(atn_providers) == 0 or \
                 (DEFAULT_AUTHENTICATOR_NAME is None and DEFAULT_IDENTITY_ASSERTER_NAME is None):
             if self.__fix_default_authentication_provider_names:
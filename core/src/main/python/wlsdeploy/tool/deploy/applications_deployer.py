@@ -23,7 +23,11 @@ from wlsdeploy.aliases.location_context import LocationContext
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.tool.deploy import deployer_utils
+from wlsdeploy.tool.deploy import deployment_manifest
+from wlsdeploy.tool.deploy import deployment_scheduler
+from wlsdeploy.tool.deploy.deployment_scheduler import DeploymentScheduler
 from wlsdeploy.tool.deploy.deployer import Deployer
+from wlsdeploy.tool.deploy.deployment_manifest import DeploymentManifest
 from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util import string_utils
 
@@ -57,6 +61,7 @@ class ApplicationsDeployer(Deployer):
         self._class_name = 'ApplicationDeployer'
         self._base_location = base_location
         self._parent_dict, self._parent_name, self._parent_type = self.__get_parent_by_location(self._base_location)
+        self._manifest = None
 
     def deploy(self):
         """
@@ -91,6 +96,15 @@ class ApplicationsDeployer(Deployer):
         shared_library_token = self.alias_helper.get_name_token(shared_library_location)
         existing_shared_libraries = deployer_utils.get_existing_object_list(shared_library_location, self.alias_helper)
 
+        archive_source_paths = []
+        for shared_library_name in shared_libraries:
+            shlib_source_path = dictionary_utils.get_element(shared_libraries[shared_library_name], SOURCE_PATH)
+            if not string_utils.is_empty(shlib_source_path) and \
+                    deployer_utils.is_path_into_archive(shlib_source_path) and self.archive_helper is not None:
+                archive_source_paths.append(shlib_source_path)
+        if len(archive_source_paths) > 0:
+            self.archive_helper.extract_files(archive_source_paths)
+
         for shared_library_name in shared_libraries:
             self.logger.info('WLSDPLY-09608', LIBRARY, shared_library_name, self._parent_type, self._parent_name,
                              class_name=self._class_name, method_name=_method_name)
@@ -110,9 +124,7 @@ class ApplicationsDeployer(Deployer):
                 raise ex
 
             if deployer_utils.is_path_into_archive(shlib_source_path):
-                if self.archive_helper is not None:
-                    self.archive_helper.extract_file(shlib_source_path)
-                else:
+                if self.archive_helper is None:
                     ex = exception_helper.create_deploy_exception('WLSDPLY-09303', shared_library_name)
                     self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
                     raise ex
@@ -193,6 +205,11 @@ class ApplicationsDeployer(Deployer):
             # Nothing to do...
             return
 
+        # The manifest avoids hashing the archive entries, the files extracted from them, and the other
+        # hashed files that did not change since the last run
+        self._manifest = DeploymentManifest(
+            deployment_manifest.get_manifest_directory(self.model_context.get_domain_home()))
+
         existing_app_refs = self.__get_existing_apps(self._base_location)
         existing_lib_refs = self.__get_library_references(self._base_location)
         existing_libs = existing_lib_refs.keys()
@@ -218,30 +235,42 @@ class ApplicationsDeployer(Deployer):
         deployed_app_list = []
         redeploy_app_list = []
 
-        # shared library updated, app referenced must be stopped, redeployed, and started so stop the app first
+        # shared library updated, app referenced must be stopped, redeployed, and started
         for app in stop_app_list:
-            self.__stop_app(app)
-            # add the referenced app to the redeploy list
-            redeploy_app_list.append(app)
-            # add the referenced app to the start list
-            deployed_app_list.append(app)
+            if app not in redeploy_app_list:
+                # add the referenced app to the redeploy list and the start list
+                redeploy_app_list.append(app)
+                deployed_app_list.append(app)
+
+        # Independent tasks run concurrently, in waves by DeploymentOrder. The apps are stopped and
+        # undeployed in the reverse of the order in which they are started.
+        scheduler = DeploymentScheduler()
+        stop_list = list(redeploy_app_list)
+        for app in stop_and_undeploy_app_list:
+            if app not in stop_list:
+                stop_list.append(app)
+        existing_orders = self.__get_deployment_orders(stop_list, base_location)
 
         # app is updated, it must be stopped and undeployed first
-        for app in stop_and_undeploy_app_list:
-            self.__stop_app(app)
-            self.__undeploy_app(app)
+        self.__run_deployment_waves(scheduler, 'stop', existing_orders, self.__stop_app, reverse=True)
+        self.__run_deployment_waves(scheduler, 'undeploy', _select_orders(existing_orders, stop_and_undeploy_app_list),
+                                    self.__undeploy_app, reverse=True)
 
         # library is updated, it must be undeployed first
+        undeploy_lib_tasks = []
         for lib in update_library_list:
-            self.__undeploy_app(lib, library_module='true')
+            undeploy_lib_tasks.append((lib, self.__undeploy_task(lib, library_module='true')))
+        scheduler.run_wave('undeploy', None, undeploy_lib_tasks)
 
-        self.__deploy_model_libraries(model_shared_libraries, lib_location)
-        self.__deploy_model_applications(model_applications, app_location, deployed_app_list)
+        self.__extract_files_from_archive(model_shared_libraries, lib_location, model_applications, app_location)
+        self._manifest.store()
+        self.__deploy_model_libraries(scheduler, model_shared_libraries, lib_location)
+        self.__deploy_model_applications(scheduler, model_applications, app_location, deployed_app_list)
 
-        for app in redeploy_app_list:
-            self.__redeploy_app(app)
+        self.__run_deployment_waves(scheduler, 'redeploy', _select_orders(existing_orders, redeploy_app_list),
+                                    self.__redeploy_app)
 
-        self.__start_all_apps(deployed_app_list, base_location)
+        self.__start_all_apps(scheduler, deployed_app_list, base_location)
         self.logger.exiting(class_name=self._class_name, method_name=_method_name)
         return
 
@@ -253,7 +282,7 @@ class ApplicationsDeployer(Deployer):
     def __get_parent_by_location(self, location):
         _method_name = '_get_parent_by_location'
 
-        self.logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(location, class_name=self._class_name, method_name=_method_name)
         location_folders = location.get_model_folders()
         if len(location_folders) == 0:
             parent_dict = self.model.get_model_app_deployments()
@@ -325,7 +354,7 @@ class ApplicationsDeployer(Deployer):
     def __get_parent_dict_and_name_for_resource_group(self, location, parent_dict, parent_path):
         _method_name = '__get_parent_dict_and_name_for_resource_group'
 
-        self.logger.entering(str(location), parent_path, class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(location, parent_path, class_name=self._class_name, method_name=_method_name)
         if RESOURCE_GROUP not in parent_dict:
             ex = exception_helper.create_deploy_exception('WLSDPLY-09305', RESOURCE_GROUP, parent_path)
             self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
@@ -346,7 +375,7 @@ class ApplicationsDeployer(Deployer):
     def __get_existing_apps(self, base_location):
         _method_name = '__get_existing_apps'
 
-        self.logger.entering(str(base_location), class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(base_location, class_name=self._class_name, method_name=_method_name)
         ref_dictionary = OrderedDict()
 
         location = LocationContext(base_location).append_location(APPLICATION)
@@ -386,59 +415,106 @@ class ApplicationsDeployer(Deployer):
     def __get_library_references(self, base_location):
         _method_name = '__get_library_references'
 
-        self.logger.entering(str(base_location), class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(base_location, class_name=self._class_name, method_name=_method_name)
+
+        # Gather the referencing apps of each library from all of the server runtimes first, so that the
+        # configuration of each library is read, and its file hashed, once rather than once per server.
+        runtime_references = self.__get_library_runtime_references()
 
         location = LocationContext(base_location).append_location(LIBRARY)
         token_name = self.alias_helper.get_name_token(location)
 
         existing_libraries = OrderedDict()
+        self.wlst_helper.server_config()
+        for lib, app_ids in runtime_references.iteritems():
+            lib_location = LocationContext(location).add_name_token(token_name, lib)
+            wlst_attributes_path = self.alias_helper.get_wlst_attributes_path(lib_location)
+            self.wlst_helper.cd(wlst_attributes_path)
+            config_attributes = self.wlst_helper.lsa()
+            config_targets = self.__get_config_targets()
+
+            # TODO(jshum) - Why does the deployment plan not get considered?
+            absolute_source_path = config_attributes[ABSOLUTE_SOURCE_PATH]
+            deployment_order = config_attributes[DEPLOYMENT_ORDER]
+            lib_hash = self.__get_file_hash(absolute_source_path)
+
+            _update_ref_dictionary(existing_libraries, lib, absolute_source_path, lib_hash, config_targets)
+            for app_id in app_ids:
+                _update_ref_dictionary(existing_libraries, lib, absolute_source_path, lib_hash, config_targets,
+                                       deploy_order=deployment_order, app_name=app_id)
+        return existing_libraries
+
+    def __get_library_runtime_references(self):
+        """
+        Get the apps referencing each library deployed to any of the running servers.
+        :return: dictionary of the list of referencing app names of each library name
+        """
+        references = OrderedDict()
         self.wlst_helper.domain_runtime()
         server_runtime_path = '/ServerRuntimes/'
         server_runtimes = self.wlst_helper.get_existing_object_list(server_runtime_path)
 
         for server_runtime in server_runtimes:
             library_runtime_path = server_runtime_path + server_runtime + '/LibraryRuntimes/'
-
-            self.wlst_helper.domain_runtime()
             libs = self.wlst_helper.get_existing_object_list(library_runtime_path)
 
             for lib in libs:
-                self.wlst_helper.domain_runtime()
-                self.wlst_helper.cd(library_runtime_path + lib)
-                runtime_attributes = self.wlst_helper.lsa()
-
-                lib_location = LocationContext(location).add_name_token(token_name, lib)
-                wlst_attributes_path = self.alias_helper.get_wlst_attributes_path(lib_location)
-                self.wlst_helper.server_config()
-                self.wlst_helper.cd(wlst_attributes_path)
-                config_attributes = self.wlst_helper.lsa()
-                config_targets = self.__get_config_targets()
-
-                # TODO(jshum) - Why does the deployment plan not get considered?
-                absolute_source_path = config_attributes[ABSOLUTE_SOURCE_PATH]
-                deployment_order = config_attributes[DEPLOYMENT_ORDER]
-                lib_hash = self.__get_file_hash(absolute_source_path)
+                if references.has_key(lib) is False:
+                    references[lib] = []
+                app_ids = references[lib]
 
+                runtime_attributes = self.__get_runtime_attributes(['Referenced'], library_runtime_path + lib)
                 if string_utils.to_boolean(runtime_attributes['Referenced']) is True:
                     referenced_path = library_runtime_path + lib + '/ReferencingRuntimes/'
-                    self.wlst_helper.domain_runtime()
                     referenced_by = self.wlst_helper.get_existing_object_list(referenced_path)
-                    self.wlst_helper.cd(referenced_path)
                     for app_ref in referenced_by:
                         # TODO(rpatrick) - what if it is partitioned?
-                        ref_attrs = self.wlst_helper.lsa(app_ref)
-                        app_type = ref_attrs['Type']
-                        app_id = None
-                        if app_type == 'ApplicationRuntime':
-                            app_id = ref_attrs['ApplicationName']
-                        if app_type == 'WebAppComponentRuntime':
-                            app_id = ref_attrs['ApplicationIdentifier']
-
-                        _update_ref_dictionary(existing_libraries, lib, absolute_source_path, lib_hash, config_targets,
-                                               deploy_order=deployment_order, app_name=app_id)
-                else:
-                    _update_ref_dictionary(existing_libraries, lib, absolute_source_path, lib_hash, config_targets)
-        return existing_libraries
+                        app_id = self.__get_referencing_app_id(referenced_path + app_ref)
+                        if app_id is not None and app_id not in app_ids:
+                            app_ids.append(app_id)
+        return references
+
+    def __get_referencing_app_id(self, path):
+        """
+        Get the name of the application of a runtime MBean referencing a library.  The MBean server omits the
+        attributes that the MBean does not have, so only the name attribute that matches the Type is required.
+        :param path: the WLST path of the referencing runtime MBean
+        :return: the application name, or None if the MBean is not an application or web application runtime
+        """
+        attributes = self.wlst_helper.get_attributes(['Type', 'ApplicationName', 'ApplicationIdentifier'], path)
+        if attributes is None or 'Type' not in attributes:
+            attributes = self.wlst_helper.lsa(path)
+
+        app_type = attributes['Type']
+        name_attribute = None
+        if app_type == 'ApplicationRuntime':
+            name_attribute = 'ApplicationName'
+        elif app_type == 'WebAppComponentRuntime':
+            name_attribute = 'ApplicationIdentifier'
+        if name_attribute is None:
+            return None
+
+        if name_attribute not in attributes:
+            attributes = self.wlst_helper.lsa(path)
+        return attributes[name_attribute]
+
+    def __get_runtime_attributes(self, attribute_names, path):
+        """
+        Get the values of the runtime MBean attributes with a single request to the MBean server,
+        falling back to listing all of the attributes if any of them could not be read that way.
+        :param attribute_names: the list of WLST attribute names
+        :param path: the WLST path of the runtime MBean
+        :return: dictionary of attribute name to value
+        """
+        attributes = self.wlst_helper.get_attributes(attribute_names, path)
+        if attributes is not None:
+            for attribute_name in attribute_names:
+                if attribute_name not in attributes:
+                    attributes = None
+                    break
+        if attributes is None:
+            attributes = self.wlst_helper.lsa(path)
+        return attributes
 
     def __build_library_deploy_strategy(self, location, model_libs, existing_libs, existing_lib_refs,
                                         stop_app_list, update_library_list):
@@ -544,10 +620,18 @@ class ApplicationsDeployer(Deployer):
         return self.alias_helper.get_model_uses_path_tokens_attribute_names(location)
 
     def __get_file_hash(self, filename):
-        _method_name = '__get_file_hash'
+        if self._manifest is None:
+            return self.__compute_file_hash(filename)
+        return self._manifest.get_file_hash(filename, self.__compute_file_hash)
+
+    def __compute_file_hash(self, filename):
+        _method_name = '__compute_file_hash'
 
         try:
-            hash_value = FileUtils.computeHash(filename)
+            if deployer_utils.use_checksums():
+                hash_value = FileUtils.computeChecksum(filename)
+            else:
+                hash_value = FileUtils.computeHash(filename)
         except (IOException, NoSuchAlgorithmException), e:
             ex = exception_helper.create_deploy_exception('WLSDPLY-09309', filename, e.getLocalizedMessage(), error=e)
             self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
@@ -562,7 +646,10 @@ class ApplicationsDeployer(Deployer):
         elif os.path.isabs(path):
             hash_value = self.__get_file_hash(path)
         elif deployer_utils.is_path_into_archive(path):
-            hash_value = self.archive_helper.get_file_hash(path)
+            if self._manifest is None:
+                hash_value = deployer_utils.get_archive_file_hash(self.archive_helper, path)
+            else:
+                hash_value = self._manifest.get_archive_file_hash(self.archive_helper, path)
         else:
             ex = exception_helper.create_deploy_exception('WLSDPLY-09310', path)
             self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
@@ -604,87 +691,143 @@ class ApplicationsDeployer(Deployer):
         return
 
     def __stop_app(self, application_name, partition_name=None, timeout=None):
+        """
+        Stop the application without waiting for it to stop.
+        :return: the WLST progress object
+        """
         _method_name = '__stop_app'
 
         self.logger.info('WLSDPLY-09312', application_name, class_name=self._class_name, method_name=_method_name)
-        progress = self.wlst_helper.stop_application(application_name, partition=partition_name, timeout=timeout)
-        while progress.isRunning():
-            continue
-        return
+        return self.wlst_helper.stop_application(application_name, partition=partition_name, timeout=timeout,
+                                                 block='false')
 
     def __start_app(self, application_name, partition_name=None):
+        """
+        Start the application without waiting for it to start.
+        :return: the WLST progress object
+        """
         _method_name = '__start_app'
 
         self.logger.info('WLSDPLY-09313', application_name, class_name=self._class_name, method_name=_method_name)
-        self.wlst_helper.start_application(application_name, partition=partition_name)
-        return
+        return self.wlst_helper.start_application(application_name, partition=partition_name, block='false')
 
     def __undeploy_app(self, application_name, library_module='false', partition_name=None,
                        resource_group_template=None, timeout=None):
+        """
+        Undeploy the application without waiting for the undeployment to complete.
+        :return: the WLST progress object
+        """
         _method_name = '__undeploy_app'
 
         self.logger.info('WLSDPLY-09314', application_name, class_name=self._class_name, method_name=_method_name)
-        self.wlst_helper.undeploy_application(application_name, libraryModule=library_module, partition=partition_name,
-                                              resourceGroupTemplate=resource_group_template, timeout=timeout)
-        return
+        return self.wlst_helper.undeploy_application(application_name, libraryModule=library_module,
+                                                     partition=partition_name,
+                                                     resourceGroupTemplate=resource_group_template, timeout=timeout,
+                                                     block='false')
 
     def __redeploy_app(self, application_name):
+        """
+        Redeploy the application without waiting for the redeployment to complete.
+        :return: the WLST progress object
+        """
         _method_name = '__redeploy_app'
 
         self.logger.info('WLSDPLY-09315', application_name, class_name=self._class_name, method_name=_method_name)
-        self.wlst_helper.redeploy_application(application_name)
+        return self.wlst_helper.redeploy_application(application_name, block='false')
+
+    def __undeploy_task(self, application_name, library_module='false'):
+        """
+        Get the scheduler task function that undeploys the application or library.
+        """
+        def undeploy_task():
+            return self.__undeploy_app(application_name, library_module=library_module)
+        return undeploy_task
+
+    def __name_task(self, task_function, application_name):
+        """
+        Get the scheduler task function that calls the task function with the application name.
+        """
+        def name_task():
+            return task_function(application_name)
+        return name_task
+
+    def __deploy_task(self, application_name, kwargs):
+        """
+        Get the scheduler task function that deploys the application with the deploy arguments.
+        """
+        def deploy_task():
+            return self.__deploy_app_online(application_name, kwargs)
+        return deploy_task
+
+    def __run_deployment_waves(self, scheduler, operation, deployment_orders, task_function, reverse=False):
+        """
+        Run the task function for each application, in waves by DeploymentOrder.
+        :param scheduler: the deployment scheduler
+        :param operation: the name of the operation, used for logging
+        :param deployment_orders: dictionary of the DeploymentOrder of each application name
+        :param task_function: function that starts the task for an application name and returns its progress
+        :param reverse: whether to run the waves in descending DeploymentOrder
+        :raises: DeployException: if an error occurs
+        """
+        waves = deployment_scheduler.get_deployment_waves(deployment_orders)
+        if reverse:
+            waves.reverse()
+        for deployment_order, names in waves:
+            tasks = []
+            for name in names:
+                tasks.append((name, self.__name_task(task_function, name)))
+            scheduler.run_wave(operation, deployment_order, tasks)
         return
 
-    def __deploy_model_libraries(self, model_libs, lib_location):
+    def __deploy_model_libraries(self, scheduler, model_libs, lib_location):
         if model_libs is not None and len(model_libs) > 0:
-            uses_path_tokens_attribute_names = self.__get_uses_path_tokens_attribute_names(lib_location)
-            deploy_ordered_keys = self.__get_deployment_ordering(model_libs)
             location = LocationContext(lib_location)
             token_name = self.alias_helper.get_name_token(location)
-            for lib_name in deploy_ordered_keys:
-                lib_dict = model_libs[lib_name]
-                src_path = dictionary_utils.get_element(lib_dict, SOURCE_PATH)
-                plan_file = dictionary_utils.get_element(lib_dict, PLAN_PATH)
-                targets = dictionary_utils.get_element(lib_dict, TARGET)
-                options = _get_deploy_options(model_libs, lib_name, library_module='true')
-                for uses_path_tokens_attribute_name in uses_path_tokens_attribute_names:
-                    if uses_path_tokens_attribute_name in lib_dict:
-                        self.__extract_file_from_archive(lib_dict[uses_path_tokens_attribute_name])
-
-                location.add_name_token(token_name, lib_name)
-                resource_group_template_name, resource_group_name, partition_name = \
-                    self.__get_mt_names_from_location(location)
-                self.__deploy_app_online(lib_name, src_path, targets, plan=plan_file,
-                                         partition=partition_name, resource_group=resource_group_name,
-                                         resource_group_template=resource_group_template_name, options=options)
-                location.remove_name_token(token_name)
+            for deployment_order, lib_names in deployment_scheduler.get_deployment_waves(_get_orders(model_libs)):
+                tasks = []
+                for lib_name in lib_names:
+                    lib_dict = model_libs[lib_name]
+                    src_path = dictionary_utils.get_element(lib_dict, SOURCE_PATH)
+                    plan_file = dictionary_utils.get_element(lib_dict, PLAN_PATH)
+                    targets = dictionary_utils.get_element(lib_dict, TARGET)
+                    options = _get_deploy_options(model_libs, lib_name, library_module='true')
+                    location.add_name_token(token_name, lib_name)
+                    resource_group_template_name, resource_group_name, partition_name = \
+                        self.__get_mt_names_from_location(location)
+                    deploy_name, kwargs = \
+                        self.__get_deploy_arguments(lib_name, src_path, targets, plan=plan_file,
+                                                    partition=partition_name, resource_group=resource_group_name,
+                                                    resource_group_template=resource_group_template_name,
+                                                    options=options)
+                    location.remove_name_token(token_name)
+                    tasks.append((lib_name, self.__deploy_task(deploy_name, kwargs)))
+                scheduler.run_wave('deploy', deployment_order, tasks)
         return
 
-    def __deploy_model_applications(self, model_apps, app_location, deployed_applist):
+    def __deploy_model_applications(self, scheduler, model_apps, app_location, deployed_applist):
         if model_apps is not None:
-            uses_path_tokens_attribute_names = self.__get_uses_path_tokens_attribute_names(app_location)
-            deploy_ordered_keys = self.__get_deployment_ordering(model_apps)
             location = LocationContext(app_location)
             token_name = self.alias_helper.get_name_token(location)
-            for app_name in deploy_ordered_keys:
-                app_dict = model_apps[app_name]
-                src_path = dictionary_utils.get_element(app_dict, SOURCE_PATH)
-                plan_file = dictionary_utils.get_element(app_dict, PLAN_PATH)
-                targets = dictionary_utils.get_element(app_dict, TARGET)
-                options = _get_deploy_options(model_apps, app_name, library_module='false')
-                for uses_path_tokens_attribute_name in uses_path_tokens_attribute_names:
-                    if uses_path_tokens_attribute_name in app_dict:
-                        self.__extract_file_from_archive(app_dict[uses_path_tokens_attribute_name])
-
-                location.add_name_token(token_name, app_name)
-                resource_group_template_name, resource_group_name, partition_name = \
-                    self.__get_mt_names_from_location(location)
-
-                self.__deploy_app_online(app_name, src_path, targets, plan=plan_file,
-                                         partition=partition_name, resource_group=resource_group_name,
-                                         resource_group_template=resource_group_template_name, options=options)
-                location.remove_name_token(token_name)
-                deployed_applist.append(app_name)
+            for deployment_order, app_names in deployment_scheduler.get_deployment_waves(_get_orders(model_apps)):
+                tasks = []
+                for app_name in app_names:
+                    app_dict = model_apps[app_name]
+                    src_path = dictionary_utils.get_element(app_dict, SOURCE_PATH)
+                    plan_file = dictionary_utils.get_element(app_dict, PLAN_PATH)
+                    targets = dictionary_utils.get_element(app_dict, TARGET)
+                    options = _get_deploy_options(model_apps, app_name, library_module='false')
+                    location.add_name_token(token_name, app_name)
+                    resource_group_template_name, resource_group_name, partition_name = \
+                        self.__get_mt_names_from_location(location)
+                    deploy_name, kwargs = \
+                        self.__get_deploy_arguments(app_name, src_path, targets, plan=plan_file,
+                                                    partition=partition_name, resource_group=resource_group_name,
+                                                    resource_group_template=resource_group_template_name,
+                                                    options=options)
+                    location.remove_name_token(token_name)
+                    tasks.append((app_name, self.__deploy_task(deploy_name, kwargs)))
+                scheduler.run_wave('deploy', deployment_order, tasks)
+                deployed_applist.extend(app_names)
         return
 
     def __get_mt_names_from_location(self, app_location):
@@ -708,11 +851,14 @@ class ApplicationsDeployer(Deployer):
         dummy_location.pop_location()
         return resource_group_template_name, resource_group_name, partition_name
 
-    def __deploy_app_online(self, application_name, source_path, targets, plan=None, partition=None,
-                            resource_group=None, resource_group_template=None, options=None):
-        _method_name = '__deploy_app_online'
-
-        self.logger.info('WLSDPLY-09316', application_name, class_name=self._class_name, method_name=_method_name)
+    def __get_deploy_arguments(self, application_name, source_path, targets, plan=None, partition=None,
+                               resource_group=None, resource_group_template=None, options=None):
+        """
+        Check the source and plan paths of the application and build the arguments to deploy it.
+        :return: the name with which to deploy the application, the dictionary of named deploy arguments
+        :raises: DeployException: if the source or plan path is invalid
+        """
+        _method_name = '__get_deploy_arguments'
 
         if string_utils.is_empty(source_path):
             ex = exception_helper.create_deploy_exception('WLSDPLY-09317', application_name, SOURCE_PATH)
@@ -732,7 +878,6 @@ class ApplicationsDeployer(Deployer):
             application_name = computed_name
 
         # build the dictionary of named arguments to pass to the deploy_application method
-        args = list()
         kwargs = {'path': str(source_path), 'targets': str(targets)}
         if plan is not None:
             if not os.path.isabs(plan):
@@ -752,15 +897,51 @@ class ApplicationsDeployer(Deployer):
         if options is not None:
             for key, value in options.iteritems():
                 kwargs[key] = value
+        return application_name, kwargs
+
+    def __deploy_app_online(self, application_name, kwargs):
+        """
+        Deploy the application without waiting for the deployment to complete.
+        :param application_name: the name with which to deploy the application
+        :param kwargs: the named deploy arguments
+        :return: the WLST progress object
+        """
+        _method_name = '__deploy_app_online'
 
+        self.logger.info('WLSDPLY-09316', application_name, class_name=self._class_name, method_name=_method_name)
         self.logger.fine('WLSDPLY-09320', application_name, kwargs,
                          class_name=self._class_name, method_name=_method_name)
-        self.wlst_helper.deploy_application(application_name, *args, **kwargs)
-        return
+        deploy_kwargs = dict(kwargs)
+        deploy_kwargs['block'] = 'false'
+        return self.wlst_helper.deploy_application(application_name, **deploy_kwargs)
 
-    def __extract_file_from_archive(self, path):
-        if path is not None and deployer_utils.is_path_into_archive(path):
-            self.archive_helper.extract_file(path)
+    def __extract_files_from_archive(self, model_libs, lib_location, model_apps, app_location):
+        """
+        Extract the archive files used by the libraries and applications to be deployed, all at once so that
+        the archive can extract them in parallel.
+        :param model_libs: the libraries to be deployed
+        :param lib_location: the location of the libraries
+        :param model_apps: the applications to be deployed
+        :param app_location: the location of the applications
+        """
+        archive_paths = []
+        for model_dict, location in [(model_libs, lib_location), (model_apps, app_location)]:
+            if model_dict is None or len(model_dict) == 0:
+                continue
+            uses_path_tokens_attribute_names = self.__get_uses_path_tokens_attribute_names(location)
+            for name in model_dict:
+                item_dict = model_dict[name]
+                for uses_path_tokens_attribute_name in uses_path_tokens_attribute_names:
+                    if uses_path_tokens_attribute_name in item_dict:
+                        path = item_dict[uses_path_tokens_attribute_name]
+                        if path is not None and deployer_utils.is_path_into_archive(path):
+                            archive_paths.append(path)
+
+        if len(archive_paths) > 0:
+            extracted_paths = self.archive_helper.extract_files(archive_paths)
+            if self._manifest is not None:
+                for index in range(len(archive_paths)):
+                    self._manifest.add_extracted_file(archive_paths[index], extracted_paths[index])
         return
 
     def __get_deployable_library_versioned_name(self, source_path, model_name):
@@ -830,66 +1011,56 @@ class ApplicationsDeployer(Deployer):
         self.logger.exiting(class_name=self._class_name, method_name=_method_name, result=versioned_name)
         return versioned_name
 
-    def __get_deployment_ordering(self, apps):
-        _method_name = '__get_deployment_ordering'
-        name_sorted_keys = apps.keys()
-        name_sorted_keys.sort()
-
-        has_deploy_order_apps = []
-        pop_keys = []
-        for key in name_sorted_keys:
-            if apps[key].has_key(DEPLOYMENT_ORDER):
-                has_deploy_order_apps.append(key)
-                pop_keys.append(key)
-
-        for key in pop_keys:
-            name_sorted_keys.remove(key)
-
-        # now sort the has_deploy_order_apps
-        deploy_order_list = []
-        for app in has_deploy_order_apps:
-            deploy_order = apps[app][DEPLOYMENT_ORDER]
-            if deploy_order not in deploy_order_list:
-                deploy_order_list.append(deploy_order)
-        deploy_order_list.sort()
-
-        ordered_list = []
-        for order in deploy_order_list:
-            this_list = _find_deployorder_list(apps, has_deploy_order_apps, order)
-            ordered_list.extend(this_list)
-
-        result_deploy_order = []
-        if ordered_list is not None:
-            result_deploy_order.extend(ordered_list)
-        if name_sorted_keys is not None:
-            result_deploy_order.extend(name_sorted_keys)
-
-        self.logger.fine('WLSDPLY-09326', str(result_deploy_order),
-                         class_name=self._class_name, method_name=_method_name)
-        return result_deploy_order
-
-    def __start_all_apps(self, deployed_app_list, base_location):
+    def __get_deployment_orders(self, app_list, base_location):
+        """
+        Get the DeploymentOrder of the deployed applications from the domain.
+        :param app_list: the list of application names
+        :param base_location: the base location of the applications
+        :return: dictionary of the DeploymentOrder of each application name
+        """
+        orders = OrderedDict()
+        if len(app_list) == 0:
+            return orders
 
-        temp_app_dict = OrderedDict()
         location = LocationContext(base_location).append_location(APPLICATION)
         token_name = self.alias_helper.get_name_token(location)
 
         self.wlst_helper.server_config()
-        for app in deployed_app_list:
+        for app in app_list:
             location.add_name_token(token_name, app)
             wlst_attribute_path = self.alias_helper.get_wlst_attributes_path(location)
             self.wlst_helper.cd(wlst_attribute_path)
-            deployment_order = self.wlst_helper.get(DEPLOYMENT_ORDER)
-
-            if temp_app_dict.has_key(app) is False:
-                temp_app_dict[app] = OrderedDict()
-            temp_app_dict[app][DEPLOYMENT_ORDER] = deployment_order
+            orders[app] = self.wlst_helper.get(DEPLOYMENT_ORDER)
+        return orders
 
-        start_order = self.__get_deployment_ordering(temp_app_dict)
-        for app in start_order:
-            self.__start_app(app)
+    def __start_all_apps(self, scheduler, deployed_app_list, base_location):
+        start_orders = self.__get_deployment_orders(deployed_app_list, base_location)
+        self.__run_deployment_waves(scheduler, 'start', start_orders, self.__start_app)
         return
 
+def _get_orders(model_apps):
+    """
+    Get the DeploymentOrder of the apps or libraries in the model.
+    :param model_apps: the apps dictionary
+    :return: dictionary of the DeploymentOrder of each app name, or None if not set
+    """
+    result = OrderedDict()
+    for app_name in model_apps:
+        result[app_name] = dictionary_utils.get_element(model_apps[app_name], DEPLOYMENT_ORDER)
+    return result
+
+def _select_orders(deployment_orders, app_list):
+    """
+    Get the DeploymentOrder of the listed apps.
+    :param deployment_orders: dictionary of the DeploymentOrder of each app name
+    :param app_list: the list of app names
+    :return: dictionary of the DeploymentOrder of each listed app name
+    """
+    result = OrderedDict()
+    for app_name in app_list:
+        result[app_name] = deployment_orders[app_name]
+    return result
+
 def _get_deploy_options(model_apps, app_name, library_module):
     """
     Get the deploy command options.
@@ -922,20 +1093,6 @@ def _get_deploy_options(model_apps, app_name, library_module):
         deploy_options = None
     return deploy_options
 
-def _find_deployorder_list(apps_dict, ordered_list, order):
-    """
-    Get the deployment order for the apps
-    :param apps_dict: the apps dict
-    :param ordered_list: the ordered list
-    :param order: the order
-    :return: list of ordered app name in deployment order
-    """
-    result = []
-    for app_name in ordered_list:
-        if order == apps_dict[app_name][DEPLOYMENT_ORDER]:
-            result.append(app_name)
-    return result
-
 def _add_ref_apps_to_stoplist(stop_applist, lib_refs, lib_name):
     """
     Add the referencing apps for the specified shared library to the stop list.
@@ -6,6 +6,8 @@ import javaos as os
 
 from array import array
 from java.lang import Class
+from oracle.weblogic.deploy.aliases import AliasException
+from oracle.weblogic.deploy.exception import BundleAwareException
 from oracle.weblogic.deploy.util import PyWLSTException
 
 from wlsdeploy.aliases.wlst_modes import WlstModes
@@ -46,6 +48,8 @@ class Deployer(object):
         self.wls_helper = WebLogicHelper(self.logger)
         self.wlst_helper = WlstHelper(self.logger, ExceptionType.DEPLOY)
         self.attribute_setter = AttributeSetter(self.aliases, self.logger, ExceptionType.DEPLOY, wlst_mode=wlst_mode)
+        self._skip_unchanged_attributes = deployer_utils.skip_unchanged_attributes()
+        self._skipped_attribute_count = 0
 
         self.archive_helper = None
         archive_file_name = self.model_context.get_archive_file_name()
@@ -165,6 +169,7 @@ class Deployer(object):
         merge_attribute_names = self.alias_helper.get_model_merge_required_attribute_names(location)
         lsa_required_attribute_names = self.aliases.get_model_lsa_required_attribute_names(location)
         set_method_map = self.alias_helper.get_model_mbean_set_method_attribute_names_and_types(location)
+        existing_values = None
 
         for key in model_nodes:
             key_excluded = (excludes is not None) and (key in excludes)
@@ -176,9 +181,14 @@ class Deployer(object):
                 wlst_merge_value = None
                 if key in merge_attribute_names:
                     wlst_merge_value = self._get_existing_wlst_value(location, key, lsa_required_attribute_names)
-
-                if not self._skip_setting_attribute(key, value, wlst_merge_value, restart_attribute_names) and \
-                        (not self.set_special_attribute(location, key, value, wlst_merge_value, set_method_map)):
+                elif self._skip_unchanged_attributes and key not in set_method_map:
+                    if existing_values is None:
+                        existing_values = self._get_existing_wlst_values(location)
+                    if self._skip_setting_attribute(location, key, value, existing_values,
+                                                    restart_attribute_names):
+                        continue
+
+                if not self.set_special_attribute(location, key, value, wlst_merge_value, set_method_map):
                     try:
                         self.attribute_setter.set_attribute(location, key, value, wlst_merge_value)
                     except PyWLSTException, pwe:
@@ -189,25 +199,66 @@ class Deployer(object):
                         raise ex
         return
 
-    def _skip_setting_attribute(self, key, value, wlst_merge_value, restart_attribute_names):
+    def _skip_setting_attribute(self, location, key, value, existing_values, restart_attribute_names):
         """
-        For the case where a change to an attribute will require restart, verify that the new value is different
-        from the current value in WLST.
+        Determine if the attribute can be skipped because WLST already holds the model value.
+        This is only called if the WLSDEPLOY_SET_MODE environment variable selects skipping unchanged attributes.
+        Skipping these writes keeps the edit session small and avoids restarts for restart-required
+        attributes that did not actually change.
+        :param location: the location of the attribute
         :param key: the attribute key
         :param value: the attribute value from the model
-        :param wlst_merge_value: the WLST value to check for merge
+        :param existing_values: the existing WLST attribute values at the location, keyed by WLST name
         :param restart_attribute_names: a list of attribute names that require system restart
         :return: True if the attribute does not need to be set
         """
         _method_name = '_skip_setting_attribute'
-        self.logger.entering(str(key), str(value), str(wlst_merge_value), str(restart_attribute_names),
-                             class_name=self._class_name, method_name=_method_name)
 
-        # Needs implementation. Return true if model key in restart attribute_names,
-        # and WLST helper determines that set is required,
-        # based on model key, model value, and the WLST merge value
+        wlst_key = self.alias_helper.get_wlst_attribute_name(location, key)
+        if wlst_key is None or wlst_key not in existing_values:
+            return False
 
-        return False
+        try:
+            skip = self.aliases.is_unchanged_attribute_value(location, key, value, existing_values[wlst_key])
+        except AliasException, ae:
+            self.logger.finer('WLSDPLY-09206', key, ae.getLocalizedMessage(), class_name=self._class_name,
+                              method_name=_method_name)
+            skip = False
+
+        if skip:
+            self._skipped_attribute_count += 1
+            loc_type, loc_name = self.get_location_type_and_name(location)
+            if key in restart_attribute_names:
+                self.logger.fine('WLSDPLY-09207', key, loc_type, loc_name, class_name=self._class_name,
+                                 method_name=_method_name)
+            else:
+                self.logger.finer('WLSDPLY-09205', key, loc_type, loc_name, class_name=self._class_name,
+                                  method_name=_method_name)
+        return skip
+
+    def _get_existing_wlst_values(self, location):
+        """
+        Read the existing attribute values at the current WLST location with a single lsa() call.
+        Attributes that must be read with get() are left out, since lsa() does not report their values reliably.
+        :param location: the location of the attributes, which must be the current WLST location
+        :return: dictionary of WLST attribute names and values, empty if the values could not be read
+        """
+        _method_name = '_get_existing_wlst_values'
+
+        result = dict()
+        try:
+            attribute_map = self.wlst_helper.lsa(log_throwing=False)
+        except BundleAwareException, ex:
+            self.logger.finer('WLSDPLY-09208', self.alias_helper.get_model_folder_path(location),
+                              ex.getLocalizedMessage(), class_name=self._class_name, method_name=_method_name)
+            return result
+
+        if attribute_map:
+            get_required_names = self.aliases.get_wlst_get_required_attribute_names(location)
+            for wlst_name in attribute_map.keys():
+                if wlst_name not in get_required_names:
+                    result[wlst_name] = attribute_map[wlst_name]
+        return result
 
     def _get_existing_wlst_value(self, location, key, lsa_required_attribute_names):
         """
@@ -277,7 +328,7 @@ class Deployer(object):
         :return: the type of the last element in the location
         """
         _method_name = 'get_location_type'
-        self.logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(location, class_name=self._class_name, method_name=_method_name)
 
         folders = location.get_model_folders()
         if len(folders) == 0:
@@ -329,7 +380,7 @@ class Deployer(object):
         """
         _method_name = '_extract_from_archive_if_needed'
 
-        self.logger.entering(str(location), key, value, class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(location, key, value, class_name=self._class_name, method_name=_method_name)
         result = False
         if deployer_utils.is_path_into_archive(value):
             if self.archive_helper is not None:
@@ -353,7 +404,7 @@ class Deployer(object):
         """
         _method_name = '__process_archive_entry'
 
-        self.logger.entering(str(location), key, value, class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(location, key, value, class_name=self._class_name, method_name=_method_name)
         result = False
         fullpath = os.path.join(self.model_context.get_domain_home(), value)
         if self.archive_helper.contains_file(value):
@@ -372,7 +423,7 @@ class Deployer(object):
                         # If the file already exists in the file system,
                         # compare the hash values to determine if it needs
                         # to be extracted.
-                        archive_hash = self.archive_helper.get_file_hash(value)
+                        archive_hash = deployer_utils.get_archive_file_hash(self.archive_helper, value)
                         file_hash = deployer_utils.get_file_hash(fullpath)
                         if archive_hash != file_hash:
                             self.archive_helper.extract_file(value)
@@ -401,7 +452,7 @@ class Deployer(object):
         :return: True, if the directory was created, False otherwise
         """
         _method_name = '__process_directory_entry'
-        self.logger.entering(str(path), class_name=self._class_name, method_name=_method_name)
+        self.logger.entering(path, class_name=self._class_name, method_name=_method_name)
 
         result = False
         if not os.path.isdir(path):
@@ -409,3 +460,19 @@ class Deployer(object):
             os.makedirs(path)
             result = True
         return result
+
+    def get_skipped_attribute_count(self):
+        """
+        Get the number of attribute writes skipped by this deployer, and the deployers it ran,
+        because WLST already held the model value.
+        :return: the number of skipped attribute writes
+        """
+        return self._skipped_attribute_count
+
+    def _add_skipped_attribute_count(self, other_deployer):
+        """
+        Add the number of attribute writes skipped by a deployer run by this deployer.
+        :param other_deployer: the other deployer
+        """
+        self._skipped_attribute_count += other_deployer.get_skipped_attribute_count()
+        return
@@ -2,6 +2,7 @@
 Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
+import os
 from sets import Set
 
 from java.io import IOException
@@ -26,6 +27,17 @@ _class_name = "deployer_utils"
 _logger = platform_logger.PlatformLogger('wlsdeploy.deploy.utils')
 _wlst_helper = WlstHelper(_logger, ExceptionType.DEPLOY)
 
+# Set this environment variable to 'checksum' to compare binaries using the CRC-32 and size of the file,
+# which for archive entries can be taken from the archive without reading the entry.  In this mode, the
+# checksums of files on disk are also cached by their size and last modified time.
+HASH_MODE_ENV_VARIABLE = 'WLSDEPLOY_HASH_MODE'
+CHECKSUM_HASH_MODE = 'checksum'
+
+# Set this environment variable to 'changed' to only set the attributes whose existing WLST value differs
+# from the model value. By default, every attribute in the model is set.
+SET_MODE_ENV_VARIABLE = 'WLSDEPLOY_SET_MODE'
+CHANGED_SET_MODE = 'changed'
+
 
 def set_attribute(location, model_key, model_value, alias_helper, use_raw_value=False):
     """
@@ -77,7 +89,7 @@ def create_and_cd(location, existing_names, alias_helper):
     :param alias_helper: the alias helper used to determine path names
     """
     method_name = 'create_and_cd'
-    _logger.entering(str(location), existing_names, _class_name, method_name)
+    _logger.entering(location, existing_names, _class_name, method_name)
 
     mbean_name = get_mbean_name(location, existing_names, alias_helper)
     create_path = alias_helper.get_wlst_create_path(location)
@@ -301,21 +313,64 @@ def get_library_name_components(name, wlst_mode=WlstModes.OFFLINE):
     return name_tuple
 
 
+def use_checksums():
+    """
+    Determine whether binaries should be compared using their CRC-32 checksum and size instead of their hash.
+    :return: True if checksums should be used, False otherwise
+    """
+    return os.environ.get(HASH_MODE_ENV_VARIABLE) == CHECKSUM_HASH_MODE
+
+
+def skip_unchanged_attributes():
+    """
+    Determine whether attributes whose existing WLST value equals the model value should be skipped.
+    :return: True if unchanged attributes should be skipped, False otherwise
+    """
+    return os.environ.get(SET_MODE_ENV_VARIABLE) == CHANGED_SET_MODE
+
+
+def log_skipped_attribute_count(skipped_count):
+    """
+    Log the number of attribute writes skipped by the deployers of a tool, if unchanged attributes are skipped.
+    :param skipped_count: the total number of skipped attribute writes
+    """
+    _method_name = 'log_skipped_attribute_count'
+    if skip_unchanged_attributes():
+        _logger.info('WLSDPLY-09017', skipped_count, class_name=_class_name, method_name=_method_name)
+    return
+
+
 def get_file_hash(file_name):
     """
-    Compute the Base64-encoded hash value for the specified file.
+    Compute the hash value for the specified file, or the checksum if use_checksums() is True.
     :param file_name: the file name
-    :return: the Base64-encoded hash value
+    :return: the hash value
     :raise: DeployException: if an error occurs
     """
     _method_name = 'get_file_hash'
 
     _logger.entering(file_name, class_name=_class_name, method_name=_method_name)
     try:
-        result = FileUtils.computeHash(file_name)
+        if use_checksums():
+            result = FileUtils.computeChecksum(file_name)
+        else:
+            result = FileUtils.computeHash(file_name)
     except (IOException, NoSuchAlgorithmException), e:
         ex = exception_helper.create_deploy_exception('WLSDPLY-09108', file_name, e.getLocalizedMessage(), error=e)
         _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
         raise ex
     _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
     return result
+
+
+def get_archive_file_hash(archive_helper, path):
+    """
+    Get the hash value for the specified archive entry, or the checksum if use_checksums() is True.
+    :param archive_helper: the archive helper to use
+    :param path: the path of the entry in the archive
+    :return: the hash value, comparable with the result of get_file_hash()
+    :raises: BundleAwareException of the appropriate type: if an error occurs
+    """
+    if use_checksums():
+        return archive_helper.get_file_checksum(path)
+    return archive_helper.get_file_hash(path)
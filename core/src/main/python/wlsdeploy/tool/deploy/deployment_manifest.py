@@ -0,0 +1,250 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Persistent manifest of the hashes of deployed binaries.
+
+Deciding whether an online application or library changed requires the hash of the deployed binary and of the
+binary in the model, which is often an archive entry.  The manifest records the CRC-32 checksum and size of
+each archive entry along with its hash, so that later runs only hash the entries whose checksum changed.  The
+files extracted from those entries into the domain are recorded with the size, modification time and hash of
+their entry, so the next run does not hash the deployed copy either.  When binaries are compared by hash,
+every other file that is hashed, such as a binary at an absolute path in the model, is recorded with its size,
+modification time and hash as well.  When binaries are compared by checksum, FileUtils caches the checksums of
+those files itself.
+
+The manifest is written to the directory named by the WLSDEPLOY_STATE_DIR environment variable, if set, or to
+the wlsdeploy directory of the domain home.
+"""
+import cPickle
+import os
+
+from java.io import File
+from java.lang import Exception as JException
+
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.deploy import deployer_utils
+
+_class_name = 'DeploymentManifest'
+_logger = PlatformLogger('wlsdeploy.deploy')
+
+# Bump this value whenever the structure of the manifest changes
+# so that files written by an older version of the tooling are ignored.
+MANIFEST_FORMAT_VERSION = 3
+
+STATE_DIR_ENV_VARIABLE = 'WLSDEPLOY_STATE_DIR'
+
+_manifest_file_name = 'deploy_manifest.cache'
+
+
+def get_manifest_directory(domain_home):
+    """
+    Get the directory used to store the deployment manifest.
+    :param domain_home: the domain home directory
+    :return: the directory name, or None if the manifest is only kept in memory
+    """
+    state_dir = os.environ.get(STATE_DIR_ENV_VARIABLE)
+    if state_dir is None or len(state_dir) == 0:
+        if domain_home is not None and len(domain_home) > 0:
+            state_dir = os.path.join(domain_home, 'wlsdeploy')
+        else:
+            state_dir = None
+    return state_dir
+
+
+class DeploymentManifest(object):
+    """
+    The recorded hashes of the deployed binaries and archive entries, loaded from the manifest directory.
+    """
+
+    def __init__(self, manifest_dir):
+        """
+        :param manifest_dir: the manifest directory, or None to only keep the manifest in memory
+        """
+        self._manifest_file = None
+        if manifest_dir is not None:
+            self._manifest_file = File(manifest_dir, _manifest_file_name)
+        self._hash_mode = _get_hash_mode()
+        # file path -> (size, last modified time, hash), for the extracted files and the hashed files
+        self._files = {}
+        # archive entry path -> (archive checksum, hash)
+        self._archive_entries = {}
+        # hashes of the archive entries whose checksum was checked during this run
+        self._checked_entries = {}
+        self._changed = False
+        self._load()
+        return
+
+    def get_file_hash(self, file_name, hash_function):
+        """
+        Get the hash of the file, using the recorded hash if the size and modification time of the file have
+        not changed since it was extracted or hashed.  The hash of an extracted file is the hash of its archive
+        entry.  Other files are only recorded when binaries are compared by hash.
+        :param file_name: the file name
+        :param hash_function: function that computes the hash of the file name
+        :return: the hash value
+        :raises: DeployException: if an error occurs computing the hash
+        """
+        _method_name = 'get_file_hash'
+
+        if file_name is None:
+            return hash_function(file_name)
+
+        binary_file = File(file_name)
+        if not binary_file.isFile():
+            return hash_function(file_name)
+
+        key = binary_file.getAbsolutePath()
+        size = binary_file.length()
+        last_modified = binary_file.lastModified()
+        if key in self._files:
+            recorded_size, recorded_last_modified, recorded_hash = self._files[key]
+            if recorded_size == size and recorded_last_modified == last_modified:
+                _logger.finest('WLSDPLY-09337', file_name, class_name=_class_name, method_name=_method_name)
+                return recorded_hash
+
+            # the file changed since it was extracted or hashed
+            del self._files[key]
+            self._changed = True
+
+        hash_value = hash_function(file_name)
+        if self._hash_mode != deployer_utils.CHECKSUM_HASH_MODE:
+            self._files[key] = (size, last_modified, hash_value)
+            self._changed = True
+        return hash_value
+
+    def get_archive_file_hash(self, archive_helper, path):
+        """
+        Get the hash of the archive entry, using the recorded hash if the CRC-32 checksum and size stored
+        in the archive for the entry have not changed since it was recorded.
+        :param archive_helper: the archive helper to use
+        :param path: the path of the entry in the archive
+        :return: the hash value, comparable with the result of get_file_hash()
+        :raises: BundleAwareException of the appropriate type: if an error occurs
+        """
+        _method_name = 'get_archive_file_hash'
+
+        checksum = archive_helper.get_file_checksum(path)
+        if deployer_utils.use_checksums():
+            hash_value = checksum
+        elif path in self._archive_entries and self._archive_entries[path][0] == checksum:
+            _logger.finest('WLSDPLY-09337', path, class_name=_class_name, method_name=_method_name)
+            hash_value = self._archive_entries[path][1]
+        else:
+            hash_value = archive_helper.get_file_hash(path)
+            self._archive_entries[path] = (checksum, hash_value)
+            self._changed = True
+
+        self._checked_entries[path] = hash_value
+        return hash_value
+
+    def add_extracted_file(self, path, file_name):
+        """
+        Record the hash of the file extracted from the archive entry, if the hash of the entry is known.
+        :param path: the path of the entry in the archive
+        :param file_name: the name of the extracted file
+        """
+        if file_name is not None and path in self._checked_entries:
+            extracted_file = File(file_name)
+            if extracted_file.isFile():
+                self._files[extracted_file.getAbsolutePath()] = \
+                    (extracted_file.length(), extracted_file.lastModified(), self._checked_entries[path])
+                self._changed = True
+        return
+
+    def store(self):
+        """
+        Write the manifest if it changed.  Failures are logged and otherwise ignored
+        since the manifest is only an optimization.
+        :return: True if the manifest was written, False otherwise
+        """
+        _method_name = 'store'
+
+        if self._manifest_file is None or not self._changed:
+            return False
+
+        # forget the files that no longer exist
+        for key in self._files.keys():
+            if not File(key).isFile():
+                del self._files[key]
+
+        artifact = {
+            'format': MANIFEST_FORMAT_VERSION,
+            'version': WebLogicDeployToolingVersion.getFullVersion(),
+            'hashMode': self._hash_mode,
+            'files': self._files,
+            'archiveEntries': self._archive_entries
+        }
+
+        result = False
+        try:
+            directory = self._manifest_file.getParentFile()
+            if not directory.isDirectory() and not directory.mkdirs():
+                _logger.fine('WLSDPLY-09338', directory.getPath(), class_name=_class_name, method_name=_method_name)
+                return result
+
+            # Write to a temporary file and rename it so that concurrent tool runs never read a partial file.
+            temp_file = File.createTempFile(_manifest_file_name, '.tmp', directory)
+            try:
+                manifest_stream = open(temp_file.getPath(), 'wb')
+                try:
+                    cPickle.dump(artifact, manifest_stream, 1)
+                finally:
+                    manifest_stream.close()
+
+                if self._manifest_file.exists():
+                    self._manifest_file.delete()
+                if temp_file.renameTo(self._manifest_file):
+                    result = True
+                    self._changed = False
+                    _logger.fine('WLSDPLY-09335', self._manifest_file.getPath(),
+                                 class_name=_class_name, method_name=_method_name)
+            finally:
+                if temp_file.exists():
+                    temp_file.delete()
+        except (IOError, TypeError, cPickle.PicklingError, JException), e:
+            _logger.fine('WLSDPLY-09336', self._manifest_file.getPath(), e,
+                         class_name=_class_name, method_name=_method_name)
+        return result
+
+    def _load(self):
+        """
+        Load the manifest file, if it exists and was written by this version of the tooling
+        using the same hash mode.
+        """
+        _method_name = '_load'
+
+        if self._manifest_file is None or not self._manifest_file.isFile():
+            return
+
+        try:
+            manifest_stream = open(self._manifest_file.getPath(), 'rb')
+            try:
+                artifact = cPickle.load(manifest_stream)
+            finally:
+                manifest_stream.close()
+
+            if type(artifact) is dict and artifact.get('format') == MANIFEST_FORMAT_VERSION and \
+                    artifact.get('version') == WebLogicDeployToolingVersion.getFullVersion() and \
+                    artifact.get('hashMode') == self._hash_mode:
+                self._files = artifact['files']
+                self._archive_entries = artifact['archiveEntries']
+                _logger.fine('WLSDPLY-09332', self._manifest_file.getPath(),
+                             class_name=_class_name, method_name=_method_name)
+            else:
+                _logger.fine('WLSDPLY-09333', self._manifest_file.getPath(),
+                             class_name=_class_name, method_name=_method_name)
+        except (IOError, EOFError, KeyError, cPickle.UnpicklingError, JException), e:
+            _logger.fine('WLSDPLY-09334', self._manifest_file.getPath(), e,
+                         class_name=_class_name, method_name=_method_name)
+            self._files = {}
+            self._archive_entries = {}
+        return
+
+
+def _get_hash_mode():
+    if deployer_utils.use_checksums():
+        return deployer_utils.CHECKSUM_HASH_MODE
+    return 'hash'
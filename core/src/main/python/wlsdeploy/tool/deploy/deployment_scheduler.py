@@ -0,0 +1,197 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import os
+import time
+
+from oracle.weblogic.deploy.deploy import DeployException
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+_class_name = 'DeploymentScheduler'
+_logger = PlatformLogger('wlsdeploy.deploy')
+
+# The maximum number of deployment tasks running at the same time. Concurrent tasks contend for the edit lock
+# of the domain, so the tasks run one at a time unless it is set to a larger number.
+MAX_TASKS_ENV_VARIABLE = 'WLSDEPLOY_DEPLOY_TASKS'
+DEFAULT_MAX_TASKS = 1
+
+# The number of seconds to wait between checks of the running deployment tasks
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+def get_max_tasks():
+    """
+    Get the maximum number of concurrent deployment tasks from the environment.
+    :return: the maximum number of tasks
+    """
+    _method_name = 'get_max_tasks'
+
+    max_tasks = DEFAULT_MAX_TASKS
+    value = os.environ.get(MAX_TASKS_ENV_VARIABLE)
+    if value is not None and len(value) > 0:
+        try:
+            max_tasks = max(int(value), 1)
+        except ValueError:
+            _logger.warning('WLSDPLY-09330', value, MAX_TASKS_ENV_VARIABLE, DEFAULT_MAX_TASKS,
+                            class_name=_class_name, method_name=_method_name)
+    return max_tasks
+
+
+def get_deployment_waves(deployment_orders):
+    """
+    Group applications into waves by DeploymentOrder. The waves are sorted by ascending DeploymentOrder,
+    followed by a wave of the applications without a DeploymentOrder, and the names in each wave are sorted.
+    This is the order in which the applications were deployed one at a time.
+    :param deployment_orders: dictionary of the DeploymentOrder of each application name, or None if not set
+    :return: the list of (DeploymentOrder, list of names) waves
+    """
+    _method_name = 'get_deployment_waves'
+
+    waves = {}
+    unordered_names = []
+    for name in deployment_orders:
+        order = _get_order_value(deployment_orders[name])
+        if order is None:
+            unordered_names.append(name)
+        elif order in waves:
+            waves[order].append(name)
+        else:
+            waves[order] = [name]
+
+    orders = waves.keys()
+    orders.sort()
+    result = []
+    for order in orders:
+        names = waves[order]
+        names.sort()
+        result.append((order, names))
+    if len(unordered_names) > 0:
+        unordered_names.sort()
+        result.append((None, unordered_names))
+
+    _logger.fine('WLSDPLY-09326', result, class_name=_class_name, method_name=_method_name)
+    return result
+
+
+class DeploymentScheduler(object):
+    """
+    Run the WLST deployment tasks of one wave concurrently.
+
+    Each task is started without blocking, using block='false', and the scheduler polls the progress objects
+    until the whole wave is complete, keeping at most max_tasks tasks running at a time. A failed task does not
+    stop the other tasks of its wave. Once the wave is complete, each failure is logged and a DeployException
+    naming all of the failed applications is raised, so the next wave never starts after a failure.
+    """
+
+    def __init__(self, max_tasks=None, poll_interval=DEFAULT_POLL_INTERVAL):
+        """
+        :param max_tasks: the maximum number of tasks running at the same time, by default from the environment
+        :param poll_interval: the number of seconds to wait between checks of the running tasks
+        """
+        if max_tasks is None:
+            max_tasks = get_max_tasks()
+        self._max_tasks = max(max_tasks, 1)
+        self._poll_interval = poll_interval
+
+    def get_max_tasks(self):
+        """
+        Get the maximum number of tasks running at the same time.
+        :return: the maximum number of tasks
+        """
+        return self._max_tasks
+
+    def run_wave(self, operation, deployment_order, tasks):
+        """
+        Run the tasks of a wave and wait for all of them to complete.
+        :param operation: the name of the operation, such as deploy or start, used for logging
+        :param deployment_order: the DeploymentOrder of the wave, or None, used for logging
+        :param tasks: the list of (application name, start function) tasks, where the start function starts
+                      the task without blocking and returns its WLST progress object
+        :raises: DeployException: if any of the tasks failed
+        """
+        _method_name = 'run_wave'
+
+        if len(tasks) == 0:
+            return
+
+        names = []
+        for name, start_function in tasks:
+            names.append(name)
+        _logger.info('WLSDPLY-09327', operation, names, _get_order_text(deployment_order),
+                     min(self._max_tasks, len(tasks)), class_name=_class_name, method_name=_method_name)
+
+        pending = list(tasks)
+        running = []
+        failures = []
+        while len(pending) > 0 or len(running) > 0:
+            while len(pending) > 0 and len(running) < self._max_tasks:
+                name, start_function = pending.pop(0)
+                try:
+                    progress = start_function()
+                except DeployException, de:
+                    failures.append((name, de.getLocalizedMessage()))
+                    continue
+                if progress is not None:
+                    running.append((name, progress))
+
+            still_running = []
+            for name, progress in running:
+                if progress.isRunning():
+                    still_running.append((name, progress))
+                elif progress.isFailed():
+                    failures.append((name, _get_progress_message(progress)))
+                else:
+                    _logger.fine('WLSDPLY-09331', operation, name, progress.getState(),
+                                 class_name=_class_name, method_name=_method_name)
+            running = still_running
+
+            # only wait if no more tasks can be started until a running task completes
+            if len(running) > 0 and (len(pending) == 0 or len(running) >= self._max_tasks):
+                time.sleep(self._poll_interval)
+
+        if len(failures) > 0:
+            failed_names = []
+            for name, message in failures:
+                _logger.severe('WLSDPLY-09328', operation, name, message,
+                               class_name=_class_name, method_name=_method_name)
+                failed_names.append(name)
+            ex = exception_helper.create_deploy_exception('WLSDPLY-09329', operation, len(failures), len(tasks),
+                                                          _get_order_text(deployment_order), failed_names)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+        return
+
+
+def _get_order_value(order):
+    """
+    Get the numeric value of a DeploymentOrder.
+    :param order: the DeploymentOrder from the model or from WLST
+    :return: the integer value, or None if the order is not set or not a number
+    """
+    if order is None:
+        return None
+    try:
+        return int(str(order).strip())
+    except ValueError:
+        return None
+
+
+def _get_order_text(order):
+    if order is None:
+        return 'default'
+    return str(order)
+
+
+def _get_progress_message(progress):
+    """
+    Get the failure message of a WLST progress object.
+    :param progress: the progress object
+    :return: the message, or the state of the task if there is no message
+    """
+    message = progress.getMessage()
+    if message is None or len(str(message)) == 0:
+        message = progress.getState()
+    return str(message)
@@ -8,6 +8,7 @@ from wlsdeploy.aliases.location_context import LocationContext
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.deploy import deployer_utils
 from wlsdeploy.tool.deploy.applications_deployer import ApplicationsDeployer
 from wlsdeploy.tool.deploy.resources_deployer import ResourcesDeployer
 
@@ -23,6 +24,7 @@ def deploy_resources(model, model_context, aliases, wlst_mode=WlstModes.OFFLINE)
     :param model_context: the model context
     :param aliases: the aliases object
     :param wlst_mode: the WLST mode to use
+    :return: the number of attribute writes skipped because the domain already had the model values
     :raises DeployException: if an error occurs
     """
     _method_name = 'deploy_resources'
@@ -35,7 +37,7 @@ def deploy_resources(model, model_context, aliases, wlst_mode=WlstModes.OFFLINE)
         ex = exception_helper.create_deploy_exception('WLSDPLY-09111', pwe.getLocalizedMessage(), error=pwe)
         _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
         raise ex
-    return
+    return resources_deployer.get_skipped_attribute_count()
 
 
 def deploy_applications(model, model_context, aliases, wlst_mode=WlstModes.OFFLINE):
@@ -45,10 +47,12 @@ def deploy_applications(model, model_context, aliases, wlst_mode=WlstModes.OFFLI
     :param model_context: the model context
     :param aliases: the aliases object
     :param wlst_mode: the WLST mode to use
+    :return: the number of attribute writes skipped because the domain already had the model values
     :raises DeployException: if an error occurs
     """
     applications_deployer = ApplicationsDeployer(model, model_context, aliases, wlst_mode=wlst_mode)
     applications_deployer.deploy()
+    return applications_deployer.get_skipped_attribute_count()
 
 
 def deploy_model_offline(model, model_context, aliases, wlst_mode=WlstModes.OFFLINE):
@@ -59,18 +63,19 @@ def deploy_model_offline(model, model_context, aliases, wlst_mode=WlstModes.OFFL
     :param model_context: the model context
     :param aliases: the aliases object
     :param wlst_mode: the WLST mode to use
+    :return: the number of attribute writes skipped because the domain already had the model values
     :raises DeployException: if an error occurs
     """
     _method_name = 'deploy_model_offline'
 
     try:
-        deploy_resources(model, model_context, aliases, wlst_mode=wlst_mode)
-        deploy_applications(model, model_context, aliases, wlst_mode=wlst_mode)
+        skipped_count = deploy_resources(model, model_context, aliases, wlst_mode=wlst_mode)
+        skipped_count += deploy_applications(model, model_context, aliases, wlst_mode=wlst_mode)
     except PyWLSTException, pwe:
         ex = exception_helper.create_deploy_exception('WLSDPLY-09650', pwe.getLocalizedMessage(), error=pwe)
         _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
         raise ex
-    return
+    return skipped_count
 
 
 def deploy_resources_and_apps_for_create(model, model_context, aliases):
@@ -81,5 +86,6 @@ def deploy_resources_and_apps_for_create(model, model_context, aliases):
     :param aliases: the aliases
     :raises DeployException: if an error occurs
     """
-    deploy_model_offline(model, model_context, aliases)
+    skipped_count = deploy_model_offline(model, model_context, aliases)
+    deployer_utils.log_skipped_attribute_count(skipped_count)
     return
@@ -0,0 +1,230 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.model_constants import RESOURCES
+from wlsdeploy.aliases.model_constants import SECURITY_CONFIGURATION
+from wlsdeploy.aliases.model_constants import SUB_DEPLOYMENT_NAME
+from wlsdeploy.aliases.model_constants import TARGET
+from wlsdeploy.aliases.model_constants import TEMPLATE
+from wlsdeploy.aliases.model_constants import TOPOLOGY
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.tool.util import filter_helper
+from wlsdeploy.tool.util.alias_helper import AliasHelper
+from wlsdeploy.util.model_translator import FileToPython
+
+# Folders that are always sent in full when anything inside them changes, since the
+# order and combination of their contents is significant when they are applied.
+_replace_when_changed_folders = [SECURITY_CONFIGURATION]
+
+# Attributes that are kept, even when unchanged, in a folder that has other changes, since the
+# deployers read them to target or place the folder contents.
+_context_attributes = [TARGET, SUB_DEPLOYMENT_NAME, TEMPLATE]
+
+
+class ModelDiffer(object):
+    """
+    Compute the changes between the previous model applied to a domain and the current model.
+
+    The topology and resources sections are reduced to the folders and attributes that were added or
+    changed since the previous model, so that only those are applied to the domain. The other sections
+    are returned as is, because their deployers do their own change detection (for example, the archive
+    hashes of applications and libraries). The context attributes of a changed folder, such as Target, are kept
+    with its changes. Like the full update, the changes never delete anything from
+    the domain: entries removed from the model are only logged.
+
+    The previous model is compared without substituting its variables, since the values of its @@PROP and
+    @@FILE tokens may have changed since it was applied. Any previous value that references a variable is
+    treated as changed, so the current value is always applied.
+    """
+    _class_name = 'ModelDiffer'
+
+    def __init__(self, current_dict, previous_dict, aliases, logger):
+        """
+        :param current_dict: the current model dictionary
+        :param previous_dict: the model dictionary previously applied to the domain, without substitution
+        :param aliases: the aliases object
+        :param logger: the logger to use
+        """
+        self._current_dict = current_dict
+        self._previous_dict = previous_dict
+        self._logger = logger
+        self._alias_helper = AliasHelper(aliases, logger, ExceptionType.DEPLOY)
+        self._unchanged_count = 0
+
+    def get_changed_model(self):
+        """
+        Get the model containing only the changes since the previous model.
+        :return: the reduced model dictionary
+        """
+        _method_name = 'get_changed_model'
+        self._logger.entering(class_name=self._class_name, method_name=_method_name)
+
+        result = OrderedDict()
+        for section_name in self._current_dict:
+            section = self._current_dict[section_name]
+            if section_name == TOPOLOGY:
+                folder_names = self._alias_helper.get_model_topology_top_level_folder_names()
+            elif section_name == RESOURCES:
+                folder_names = self._alias_helper.get_model_resources_top_level_folder_names()
+            else:
+                result[section_name] = section
+                continue
+
+            previous_section = self._get_dictionary(self._previous_dict, section_name)
+            changes = self._get_folder_changes(section, previous_section, LocationContext(), folder_names)
+            self._logger.info('WLSDPLY-09700', section_name, len(changes), self._unchanged_count,
+                              class_name=self._class_name, method_name=_method_name)
+            self._unchanged_count = 0
+            result[section_name] = changes
+
+        self._logger.exiting(class_name=self._class_name, method_name=_method_name)
+        return result
+
+    def _get_folder_changes(self, current, previous, location, subfolder_names):
+        """
+        Get the added and changed attributes and subfolders of a model folder.
+        :param current: the current folder dictionary
+        :param previous: the previous folder dictionary
+        :param location: the location of the folder
+        :param subfolder_names: the model subfolder names valid at the location
+        :return: dictionary of the changed entries and their context attributes, empty if nothing changed
+        """
+        changes = OrderedDict()
+        unchanged_context_keys = []
+        for key in current:
+            value = current[key]
+            if key not in previous:
+                changes[key] = value
+                continue
+
+            previous_value = previous[key]
+            if key in subfolder_names and isinstance(value, dict) and isinstance(previous_value, dict):
+                sub_location = LocationContext(location).append_location(key)
+                subfolder_changes = self._get_subfolder_changes(key, value, previous_value, sub_location)
+                if len(subfolder_changes) > 0:
+                    changes[key] = subfolder_changes
+            elif value != previous_value or _has_variables(previous_value):
+                changes[key] = value
+            elif key in _context_attributes:
+                unchanged_context_keys.append(key)
+            else:
+                self._unchanged_count += 1
+
+        self._log_removed_entries(current, previous, location)
+        if len(changes) == 0:
+            self._unchanged_count += len(unchanged_context_keys)
+            return changes
+
+        # keep the model order of the entries
+        result = OrderedDict()
+        for key in current:
+            if key in changes:
+                result[key] = changes[key]
+            elif key in unchanged_context_keys:
+                result[key] = current[key]
+        return result
+
+    def _get_subfolder_changes(self, folder_name, current, previous, location):
+        """
+        Get the changes for a model subfolder, taking into account whether it contains named MBeans.
+        :param folder_name: the model name of the subfolder
+        :param current: the current subfolder dictionary
+        :param previous: the previous subfolder dictionary
+        :param location: the location of the subfolder
+        :return: dictionary of the changed entries, empty if nothing changed
+        """
+        if folder_name in _replace_when_changed_folders or \
+                self._alias_helper.requires_artificial_type_subfolder_handling(location):
+            if current == previous and not _has_variables(previous):
+                self._unchanged_count += 1
+                return OrderedDict()
+            return current
+
+        if not self._alias_helper.supports_multiple_mbean_instances(location):
+            subfolder_names = self._alias_helper.get_model_subfolder_names(location)
+            return self._get_folder_changes(current, previous, location, subfolder_names)
+
+        result = OrderedDict()
+        token = self._alias_helper.get_name_token(location)
+        for name in current:
+            value = current[name]
+            if name not in previous:
+                result[name] = value
+                continue
+
+            previous_value = previous[name]
+            if not isinstance(value, dict) or not isinstance(previous_value, dict):
+                if value != previous_value or _has_variables(previous_value):
+                    result[name] = value
+                else:
+                    self._unchanged_count += 1
+                continue
+
+            name_location = LocationContext(location)
+            if token is not None:
+                name_location.add_name_token(token, name)
+            subfolder_names = self._alias_helper.get_model_subfolder_names(name_location)
+            changes = self._get_folder_changes(value, previous_value, name_location, subfolder_names)
+            if len(changes) > 0:
+                result[name] = changes
+
+        self._log_removed_entries(current, previous, location)
+        return result
+
+    def _log_removed_entries(self, current, previous, location):
+        _method_name = '_log_removed_entries'
+        for key in previous:
+            # names that reference variables cannot be matched, so their entries are sent as added instead
+            if key not in current and not _has_variables(key):
+                self._logger.info('WLSDPLY-09701', key, self._alias_helper.get_model_folder_path(location),
+                                  class_name=self._class_name, method_name=_method_name)
+
+    def _get_dictionary(self, dictionary, key):
+        if key in dictionary and isinstance(dictionary[key], dict):
+            return dictionary[key]
+        return OrderedDict()
+
+
+def get_model_changes(model_dictionary, model_context, aliases, tool_type, logger):
+    """
+    Reduce the model to the changes since the previous model file, if one was specified.
+    The filters of the tool type are applied to the previous model, as they were to the current model.
+    :param model_dictionary: the current model dictionary, with variables substituted and filters applied
+    :param model_context: the model context
+    :param aliases: the aliases object
+    :param tool_type: the tool type used to select the filters, such as "deploy" or "update"
+    :param logger: the logger to use
+    :return: the reduced model dictionary, or the original model if there is no previous model file
+    :raises TranslateException: if the previous model file cannot be read
+    """
+    previous_model_file = model_context.get_previous_model_file()
+    if previous_model_file is None:
+        return model_dictionary
+
+    logger.info('WLSDPLY-09702', previous_model_file, class_name='model_differ', method_name='get_model_changes')
+    previous_dictionary = FileToPython(previous_model_file, True).parse()
+    filter_helper.apply_filters(previous_dictionary, tool_type)
+    return ModelDiffer(model_dictionary, previous_dictionary, aliases, logger).get_changed_model()
+
+
+def _has_variables(value):
+    """
+    Determine if the model value or name references a variable or file token.
+    :param value: the value to check, which may be a dictionary or list
+    :return: True if the value contains a token, False otherwise
+    """
+    if isinstance(value, dict):
+        for key in value:
+            if _has_variables(key) or _has_variables(value[key]):
+                return True
+    elif isinstance(value, list):
+        for item in value:
+            if _has_variables(item):
+                return True
+    elif type(value) is str or type(value) is unicode:
+        return '@@PROP:' in value or '@@FILE:' in value or '${' in value
+    return False
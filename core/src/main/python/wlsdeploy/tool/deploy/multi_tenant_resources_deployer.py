@@ -41,6 +41,7 @@ class MultiTenantResourcesDeployer(Deployer):
         self._add_resource_groups(self._resources, location)
         self._add_partition_work_managers(self._resources, location)
         self._add_partitions(location)
+        self._add_skipped_attribute_count(self.common_deployer)
         return
 
     # Override
@@ -128,6 +129,12 @@ class MultiTenantResourcesDeployer(Deployer):
         applications_deployer = \
             ApplicationsDeployer(self.model, self.model_context, self.aliases, self.wlst_mode, location)
         applications_deployer.deploy()
+
+        self._add_skipped_attribute_count(data_source_deployer)
+        self._add_skipped_attribute_count(common_deployer)
+        self._add_skipped_attribute_count(jms_deployer)
+        self._add_skipped_attribute_count(wldf_deployer)
+        self._add_skipped_attribute_count(applications_deployer)
         return
 
     def _add_partition_work_managers(self, parent_dict, location):
@@ -38,6 +38,7 @@ class ResourcesDeployer(Deployer):
         multi_tenant_deployer = \
             MultiTenantResourcesDeployer(self.model, self.model_context, self.aliases, self.wlst_mode)
         multi_tenant_deployer.add_multi_tenant_objects(location)
+        self._add_skipped_attribute_count(multi_tenant_deployer)
 
     def _add_resources(self, location):
         """
@@ -71,6 +72,11 @@ class ResourcesDeployer(Deployer):
         wldf_deployer.add_wldf_modules(self._resources, location)
 
         common_deployer.add_coherence_clusters(self._resources, location)
+
+        self._add_skipped_attribute_count(data_source_deployer)
+        self._add_skipped_attribute_count(common_deployer)
+        self._add_skipped_attribute_count(jms_deployer)
+        self._add_skipped_attribute_count(wldf_deployer)
         return
 
     def _add_startup_classes(self, location):
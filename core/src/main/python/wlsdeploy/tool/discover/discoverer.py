@@ -72,12 +72,19 @@ class Discoverer(object):
         _logger.finest('WLSDPLY-06102', self._wlst_helper.get_pwd(), wlst_params, class_name=_class_name,
                        method_name=_method_name)
         wlst_get_params = self._get_required_attributes(location)
-        _logger.finest('WLSDPLY-06103', str(location), wlst_get_params,
+        _logger.finest('WLSDPLY-06103', location, wlst_get_params,
                        class_name=_class_name, method_name=_method_name)
         attr_dict = OrderedDict()
         if wlst_params:
+            get_names = []
             for wlst_param in wlst_params:
                 if wlst_param in wlst_get_params:
+                    get_names.append(wlst_param)
+            get_values = self._get_attribute_values(get_names)
+            for wlst_param in wlst_params:
+                if wlst_param in get_values:
+                    wlst_value = get_values[wlst_param]
+                elif wlst_param in wlst_get_params:
                     _logger.finest('WLSDPLY-06104', wlst_param, class_name=_class_name, method_name=_method_name)
                     try:
                         wlst_value = wlst_helper.get(wlst_param)
@@ -132,7 +139,7 @@ class Discoverer(object):
             attributes = wlst_helper.lsa(path)
         except PyWLSTException, pe:
             name = location.get_model_folders()[-1]
-            _logger.fine('WLSDPLY-06109', name, str(location), pe.getLocalizedMessage(), class_name=_class_name,
+            _logger.fine('WLSDPLY-06109', name, location, pe.getLocalizedMessage(), class_name=_class_name,
                          method_name=_method_name)
         return attributes
 
@@ -146,17 +153,39 @@ class Discoverer(object):
             mbean_attributes = wlst_helper.get_mbi().getAttributes()
             if mbean_attributes:
                 alias_attributes = self._get_wlst_attributes(location)
+                missing_names = []
                 for mbean_attribute in mbean_attributes:
                     name = mbean_attribute.getName()
                     if name not in attributes and name in alias_attributes:
+                        missing_names.append(name)
+                missing_values = self._get_attribute_values(missing_names)
+                for name in missing_names:
+                    if name in missing_values:
+                        attributes[name] = missing_values[name]
+                    else:
                         attributes[name] = wlst_helper.get(name)
-                        added = True
+                    added = True
         except PyWLSTException, pe:
             name = location.get_model_folders()[-1]
-            _logger.fine('WLSDPLY-06109', name, str(location), pe.getLocalizedMessage(), class_name=_class_name,
+            _logger.fine('WLSDPLY-06109', name, location, pe.getLocalizedMessage(), class_name=_class_name,
                          method_name=_method_name)
         return attributes
 
+    def _get_attribute_values(self, wlst_names):
+        """
+        Get the values of the attributes of the MBean at the current location with a single request to the
+        MBean server. Attribute names that could not be retrieved this way are missing from the result, and
+        the caller must get them individually.
+        :param wlst_names: the list of WLST attribute names
+        :return: dictionary of WLST attribute name to value
+        """
+        result = None
+        if self._wlst_mode == WlstModes.ONLINE and len(wlst_names) > 0:
+            result = wlst_helper.get_attributes(wlst_names)
+        if result is None:
+            result = dict()
+        return result
+
     def _is_defined_attribute(self, location, wlst_name):
         attribute = False
         try:
@@ -287,7 +316,7 @@ class Discoverer(object):
         :return: model subfolder name: subfolder result dictionary:
         """
         _method_name = '_discover_subfolder_singleton'
-        _logger.entering(model_subfolder_name, str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(model_subfolder_name, location, class_name=_class_name, method_name=_method_name)
         subfolder_result = OrderedDict()
         # For all server subfolder names there should only be one path
         if self._mbean_names_exist(location):
@@ -295,7 +324,7 @@ class Discoverer(object):
             if self.wlst_cd(subfolder_path, location):
                 self._populate_model_parameters(subfolder_result, location)
                 self._discover_subfolders(subfolder_result, location)
-        _logger.finest('WLSDPLY-06111', str(location), class_name=_class_name, method_name=_method_name)
+        _logger.finest('WLSDPLY-06111', location, class_name=_class_name, method_name=_method_name)
         _logger.exiting(class_name=_class_name, method_name=_method_name)
         return subfolder_result
 
@@ -330,7 +359,7 @@ class Discoverer(object):
         :return: dictionary containing the discovered folder attributes
         """
         _method_name = '_discover_artifical_folder'
-        _logger.entering(model_subfolder_name, str(location), name_token, class_name=_class_name,
+        _logger.entering(model_subfolder_name, location, name_token, class_name=_class_name,
                          method_name=_method_name)
         subfolder_result = OrderedDict()
         names = self._find_names_in_folder(location)
@@ -364,7 +393,7 @@ class Discoverer(object):
         :return: model subfolder name: dictionary results:
         """
         _method_name = '_discover_subfolder_with_names'
-        _logger.entering(model_subfolder_name, str(location), name_token, class_name=_class_name,
+        _logger.entering(model_subfolder_name, location, name_token, class_name=_class_name,
                          method_name=_method_name)
         subfolder_result = OrderedDict()
         names = self._find_names_in_folder(location)
@@ -379,7 +408,7 @@ class Discoverer(object):
                     self._populate_model_parameters(subfolder_result[name], location)
                     self._discover_subfolders(subfolder_result[name], location)
                 location.remove_name_token(name_token)
-        _logger.finest('WLSDPLY-06114', str(location), class_name=_class_name, method_name=_method_name)
+        _logger.finest('WLSDPLY-06114', location, class_name=_class_name, method_name=_method_name)
         _logger.exiting(class_name=_class_name, method_name=_method_name)
         return subfolder_result
 
@@ -426,7 +455,7 @@ class Discoverer(object):
         :return: populated dictionary
         """
         _method_name = '_discover_subfolders'
-        _logger.entering(str(location), method_name=_method_name, class_name=_class_name)
+        _logger.entering(location, method_name=_method_name, class_name=_class_name)
         wlst_subfolders = self._find_subfolders(location)
         if wlst_subfolders is not None:
             for wlst_subfolder in wlst_subfolders:
@@ -434,7 +463,7 @@ class Discoverer(object):
                 # will return a None if subfolder not in current wls version
                 if model_subfolder_name is not None:
                     result = self._discover_subfolder(model_subfolder_name, location, result)
-        _logger.finest('WLSDPLY-06114', str(location), class_name=_class_name, method_name=_method_name)
+        _logger.finest('WLSDPLY-06114', location, class_name=_class_name, method_name=_method_name)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
         return result
 
@@ -447,7 +476,7 @@ class Discoverer(object):
         :return: folder result dictionary:
         """
         _method_name = '_discover_single_folder'
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         result = OrderedDict()
         subfolder_path = self._alias_helper.get_wlst_attributes_path(location)
         if self.wlst_cd(subfolder_path, location):
@@ -540,7 +569,7 @@ class Discoverer(object):
         :return: short artificial name for the model
         """
         _method_name = '_get_artificial_type'
-        _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(location, class_name=_class_name, method_name=_method_name)
         mbean_name = None
         subfolder_path = self._alias_helper.get_wlst_attributes_path(location)
         if subfolder_path:
@@ -571,7 +600,7 @@ class Discoverer(object):
                     _logger.fine('WLSDPLY-06122', interface_name, ae.getLocalizedMessage(), class_name=_class_name,
                                  method_name=_method_name)
                 if mbean_name is None:
-                    _logger.fine('WLSDPLY-06125', interface_name, str(location), class_name=_class_name,
+                    _logger.fine('WLSDPLY-06125', interface_name, location, class_name=_class_name,
                                  method_name=_method_name)
                 break
         return mbean_name
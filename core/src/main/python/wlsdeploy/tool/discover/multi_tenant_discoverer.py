@@ -83,7 +83,7 @@ class MultiTenantDiscoverer(Discoverer):
         :return: model name for dictionary:dictionary containing the discovered resource groups
         """
         _method_name = 'get_resource_groups'
-        _logger.entering(str(base_location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(base_location, class_name=_class_name, method_name=_method_name)
         result = OrderedDict()
         model_top_folder_name = model_constants.RESOURCE_GROUP
         location = LocationContext(base_location)
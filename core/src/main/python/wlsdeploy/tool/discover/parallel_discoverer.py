@@ -0,0 +1,137 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import sys
+
+from java.lang import System
+from java.util import ArrayList
+from java.util.concurrent import Callable
+from java.util.concurrent import Executors
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.util import wlst_helper
+
+_class_name = 'ParallelDiscoverer'
+_logger = PlatformLogger(discoverer.get_discover_logger_name())
+
+
+class ParallelDiscoverer(object):
+    """
+    Discover independent sections of the model concurrently.
+
+    Each section is discovered by a worker thread into its own dictionary. If a session factory is provided,
+    every worker opens its own WLST session before discovering its section and binds it to the thread, so the
+    workers never share the WLST current location or connection. Once all of the sections are complete, the
+    partial results are merged into the target dictionaries in the order in which the sections were added,
+    so the resulting model does not depend on the order in which the workers finish.
+    """
+
+    def __init__(self, worker_count, session_factory=None):
+        """
+        :param worker_count: the maximum number of sections to discover at the same time
+        :param session_factory: function that returns a new WLST session with a close() method, or None to
+                                use the WLST instance of the current thread
+        """
+        self._worker_count = worker_count
+        self._session_factory = session_factory
+        self._sections = []
+
+    def add_section(self, section_name, section_dictionary, discover_function):
+        """
+        Add a model section to discover.
+        :param section_name: the name of the section, used for logging
+        :param section_dictionary: the dictionary into which the discovered section is merged
+        :param discover_function: function that discovers the section into the dictionary passed as its argument
+        """
+        self._sections.append(_SectionTask(section_name, section_dictionary, discover_function,
+                                           self._session_factory))
+
+    def get_section_names(self):
+        """
+        Get the names of the sections to discover, in merge order.
+        :return: the list of section names
+        """
+        result = []
+        for section in self._sections:
+            result.append(section.get_name())
+        return result
+
+    def discover(self):
+        """
+        Discover all of the sections and merge the results. If any section fails, the error from the
+        first failed section, in merge order, is raised after all of the workers have finished.
+        """
+        _method_name = 'discover'
+        _logger.entering(self._worker_count, class_name=_class_name, method_name=_method_name)
+
+        if len(self._sections) == 0:
+            _logger.exiting(class_name=_class_name, method_name=_method_name)
+            return
+
+        worker_count = min(max(self._worker_count, 1), len(self._sections))
+        executor = Executors.newFixedThreadPool(worker_count)
+        try:
+            tasks = ArrayList()
+            for section in self._sections:
+                tasks.add(section)
+            executor.invokeAll(tasks)
+        finally:
+            executor.shutdown()
+
+        for section in self._sections:
+            section.raise_error()
+        for section in self._sections:
+            section.merge()
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return
+
+
+class _SectionTask(Callable):
+    """
+    Discover a single model section on a worker thread.
+    """
+
+    def __init__(self, name, section_dictionary, discover_function, session_factory):
+        self._name = name
+        self._section_dictionary = section_dictionary
+        self._discover_function = discover_function
+        self._session_factory = session_factory
+        self._result = OrderedDict()
+        self._error = None
+
+    def get_name(self):
+        return self._name
+
+    def call(self):
+        _method_name = 'call'
+        start_time = System.currentTimeMillis()
+        session = None
+        try:
+            try:
+                if self._session_factory is not None:
+                    session = self._session_factory()
+                    wlst_helper.set_thread_session(session)
+                self._discover_function(self._result)
+            except:
+                self._error = sys.exc_info()
+                _logger.fine('WLSDPLY-06030', self._name, self._error[1], class_name=_class_name,
+                             method_name=_method_name)
+        finally:
+            if session is not None:
+                wlst_helper.clear_thread_session()
+                session.close()
+        _logger.fine('WLSDPLY-06031', self._name, System.currentTimeMillis() - start_time,
+                     class_name=_class_name, method_name=_method_name)
+        return None
+
+    def raise_error(self):
+        if self._error is not None:
+            raise self._error[0], self._error[1], self._error[2]
+
+    def merge(self):
+        for key in self._result:
+            self._section_dictionary[key] = self._result[key]
@@ -476,7 +476,7 @@ class TopologyDiscoverer(Discoverer):
         :return: modified location and name for the model keystore file
         """
         _method_name = '_add_keystore_file_to_archive'
-        _logger.entering(model_name, str(location), class_name=_class_name, method_name=_method_name)
+        _logger.entering(model_name, location, class_name=_class_name, method_name=_method_name)
         server_name = self._get_server_name_from_location(location)
         archive_file = self._model_context.get_archive_file()
         _logger.finer('WLSDPLY-06223', model_value, server_name, class_name=_class_name, method_name=_method_name)
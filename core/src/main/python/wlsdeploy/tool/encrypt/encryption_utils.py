@@ -3,6 +3,7 @@ Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
 from java.lang import String
+from java.util import ArrayList
 
 from oracle.weblogic.deploy.encrypt import EncryptionUtils
 from oracle.weblogic.deploy.json import JsonException
@@ -23,44 +24,23 @@ _logger = PlatformLogger('wlsdeploy.encrypt')
 def encrypt_model_dictionary(passphrase, model_dict, variables=None):
     """
     Encrypt the model dictionary (and referenced variables, if provided) using the specified passphrase.
+    The password fields are collected first and then encrypted together, so that the expensive key derivation
+    for each value is spread across several threads.
     :param passphrase: the passphrase used to encrypt/decrypt the passwords
     :param model_dict: the model dictionary
     :param variables: the variables property object
     :raises EncryptionException if an error occurs
     """
     _initialize_password_field_names()
-    model_changes = 0
-    variable_changes = 0
-
-    if model.get_model_domain_info_key() in model_dict:
-        domain_info_dict = model_dict[model.get_model_domain_info_key()]
-        _model_changes, _variable_changes = \
-            _search_and_replace_passwords(passphrase, model.get_model_domain_info_key(), domain_info_dict, variables)
-        model_changes += _model_changes
-        variable_changes += _variable_changes
-
-    if model.get_model_topology_key() in model_dict:
-        topology_dict = model_dict[model.get_model_topology_key()]
-        _model_changes, _variable_changes = \
-            _search_and_replace_passwords(passphrase, model.get_model_topology_key(), topology_dict, variables)
-        model_changes += _model_changes
-        variable_changes += _variable_changes
-
-    if model.get_model_resources_key() in model_dict:
-        resources_dict = model_dict[model.get_model_resources_key()]
-        _model_changes, _variable_changes = \
-            _search_and_replace_passwords(passphrase, model.get_model_resources_key(), resources_dict, variables)
-        model_changes += _model_changes
-        variable_changes += _variable_changes
-
-    if model.get_model_deployments_key() in model_dict:
-        deployments_dict = model_dict[model.get_model_deployments_key()]
-        _model_changes, _variable_changes = \
-            _search_and_replace_passwords(passphrase, model.get_model_deployments_key(), deployments_dict, variables)
-        model_changes += _model_changes
-        variable_changes += _variable_changes
-
-    return model_changes, variable_changes
+    model_fields = []
+    variable_fields = []
+
+    for section_key in [model.get_model_domain_info_key(), model.get_model_topology_key(),
+                        model.get_model_resources_key(), model.get_model_deployments_key()]:
+        if section_key in model_dict:
+            _search_passwords(section_key, model_dict[section_key], variables, model_fields, variable_fields)
+
+    return _encrypt_fields(passphrase, model_fields, variable_fields, variables)
 
 def encrypt_one_password(passphrase, password):
     """
@@ -104,74 +84,100 @@ def _initialize_password_field_names():
             raise ex
     return
 
-def _search_and_replace_passwords(passphrase, dict_name, model_dict, variables):
+def _search_passwords(dict_name, model_dict, variables, model_fields, variable_fields):
     """
-    Search the model file for password fields and replace the value with its encrypted value.
-    :param passphrase: the encryption passphrase to use
+    Search the model dictionary for password fields that need to be encrypted.
     :param dict_name: the name of the model element represented by the dictionary
     :param model_dict: the model dictionary to search
     :param variables: the variables to use with the model
-    :return: the number of changes to the model dictionary, the number of changes to the variables
+    :param model_fields: the list to which the (folder name, dictionary, field name) of model values are added
+    :param variable_fields: the list to which the (folder name, field name, variable name) of variables are added
     """
-    _method_name = '_search_and_replace_passwords'
+    _method_name = '_search_passwords'
 
-    model_changes = 0
-    variable_changes = 0
     if model_dict is None or len(model_dict) == 0:
-        return model_changes, variable_changes
+        return
 
     for key in model_dict:
         value = model_dict[key]
         if isinstance(value, dict):
-            _model_changes, _variable_changes = _search_and_replace_passwords(passphrase, key, value, variables)
-            model_changes += _model_changes
-            variable_changes += _variable_changes
+            _search_passwords(key, value, variables, model_fields, variable_fields)
         elif type(value) is str and key in _password_field_names:
             variable_names = variable_helper.get_variable_names(value)
             if len(variable_names) == 0:
                 if not EncryptionUtils.isEncryptedString(value):
-                    encrypted_value = EncryptionUtils.encryptString(value, String(passphrase).toCharArray())
-                    model_dict[key] = encrypted_value
-                    _logger.fine('WLSDPLY-04103', dict_name, key, class_name=_class_name, method_name=_method_name)
-                    model_changes += 1
+                    model_fields.append((dict_name, model_dict, key))
                 else:
                     _logger.fine('WLSDPLY-04104', dict_name, key, class_name=_class_name, method_name=_method_name)
             elif len(variable_names) == 1:
-                _variable_changes = _encrypt_variable_value(passphrase, dict_name, key, variable_names[0], variables)
-                variable_changes += _variable_changes
+                _add_variable_field(dict_name, key, variable_names[0], variables, variable_fields)
             else:
                 _logger.warning('WLSDPLY-04105', dict_name, key, len(variable_names), variable_names,
                                 class_name=_class_name, method_name=_method_name)
-    return model_changes, variable_changes
+    return
 
 
-def _encrypt_variable_value(passphrase, dict_name, field_name, var_name, variables):
+def _add_variable_field(dict_name, field_name, var_name, variables, variable_fields):
     """
-    Encrypt the variable value.
-    :param passphrase: the encryption passphrase
+    Add the variable referenced by a password field to the variables to encrypt. A variable referenced
+    by several fields is only encrypted once.
     :param dict_name: the model element name
     :param field_name: the attribute name
     :param var_name: the variable name
     :param variables: the variables
-    :return: the number of variable changes
+    :param variable_fields: the list of (folder name, field name, variable name) of variables to encrypt
     """
-    _method_name = '_encrypt_variable_value'
+    _method_name = '_add_variable_field'
 
-    variable_changes = 0
     if variables is None:
-        return variable_changes
+        return
 
     if var_name in variables:
         var_value = variables[var_name]
-        if len(var_value) > 0:
-            encrypted_value = EncryptionUtils.encryptString(var_value, String(passphrase).toCharArray())
-            variables[var_name] = encrypted_value
-            _logger.fine('WLSDPLY-04106', dict_name, field_name, var_name,
-                         class_name=_class_name, method_name=_method_name)
-            variable_changes = 1
+        if len(var_value) > 0 and not EncryptionUtils.isEncryptedString(var_value):
+            for _dict_name, _field_name, _var_name in variable_fields:
+                if _var_name == var_name:
+                    return
+            variable_fields.append((dict_name, field_name, var_name))
     else:
         ex = exception_helper.create_encryption_exception('WLSDPLY-04107', var_name, field_name, dict_name)
         _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
         raise ex
+    return
+
+
+def _encrypt_fields(passphrase, model_fields, variable_fields, variables):
+    """
+    Encrypt the values of the collected model fields and variables, and replace them with the encrypted values.
+    :param passphrase: the encryption passphrase
+    :param model_fields: the list of (folder name, dictionary, field name) of the model values to encrypt
+    :param variable_fields: the list of (folder name, field name, variable name) of the variables to encrypt
+    :param variables: the variables
+    :return: the number of changes to the model dictionary, the number of changes to the variables
+    """
+    _method_name = '_encrypt_fields'
+
+    clear_texts = ArrayList(len(model_fields) + len(variable_fields))
+    for dict_name, model_dict, key in model_fields:
+        clear_texts.add(model_dict[key])
+    for dict_name, field_name, var_name in variable_fields:
+        clear_texts.add(variables[var_name])
+
+    if clear_texts.isEmpty():
+        return 0, 0
+
+    encrypted_values = EncryptionUtils.encryptStrings(clear_texts, String(passphrase).toCharArray())
+
+    index = 0
+    for dict_name, model_dict, key in model_fields:
+        model_dict[key] = str(encrypted_values.get(index))
+        _logger.fine('WLSDPLY-04103', dict_name, key, class_name=_class_name, method_name=_method_name)
+        index += 1
+
+    for dict_name, field_name, var_name in variable_fields:
+        variables[var_name] = str(encrypted_values.get(index))
+        _logger.fine('WLSDPLY-04106', dict_name, field_name, var_name,
+                     class_name=_class_name, method_name=_method_name)
+        index += 1
 
-    return variable_changes
+    return len(model_fields), len(variable_fields)
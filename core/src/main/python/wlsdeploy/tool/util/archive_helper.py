@@ -5,6 +5,7 @@ The Universal Permissive License (UPL), Version 1.0
 from java.io import File
 from java.lang import IllegalArgumentException
 from java.lang import IllegalStateException
+from java.util import ArrayList
 
 from oracle.weblogic.deploy.util import FileUtils
 from oracle.weblogic.deploy.util import WLSDeployArchive
@@ -160,6 +161,35 @@ class ArchiveHelper(object):
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name, result=result)
         return result
 
+    def extract_files(self, paths):
+        """
+        Extract the specified files and directories from the archive into the Domain Home directory.
+        The entries are extracted in parallel so callers should request everything they need at once.
+        :param paths: the paths into the archive
+        :return: the paths to the extracted files, in the same order as the paths argument
+        :raises: BundleAwareException of the appropriate type: if an error occurs
+        """
+        _method_name = 'extract_files'
+
+        self.__logger.entering(paths, class_name=self.__class_name, method_name=_method_name)
+        path_list = ArrayList()
+        for path in paths:
+            path_list.add(path)
+
+        try:
+            extracted_paths = self.__archive_file.extractFiles(path_list, self.__domain_home)
+        except (IllegalArgumentException, WLSDeployArchiveIOException), e:
+            ex = exception_helper.create_exception(self.__exception_type, "WLSDPLY-19303", paths,
+                                                   self.__archive_file_name, e.getLocalizedMessage(), error=e)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
+
+        result = []
+        for extracted_path in extracted_paths:
+            result.append(extracted_path)
+        self.__logger.exiting(class_name=self.__class_name, method_name=_method_name, result=result)
+        return result
+
     def get_file_hash(self, path):
         """
         Get the Base64-encoded hash value for the file at the specified path within the archive.
@@ -180,6 +210,26 @@ class ArchiveHelper(object):
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name, result=result)
         return result
 
+    def get_file_checksum(self, path):
+        """
+        Get the CRC-32 checksum and size for the file at the specified path within the archive.
+        :param path: the path in the archive
+        :return: the checksum, formatted to match FileUtils.computeChecksum()
+        :raises: BundleAwareException of the appropriate type: if an error occurs
+        """
+        _method_name = 'get_file_checksum'
+
+        self.__logger.entering(path, class_name=self.__class_name, method_name=_method_name)
+        try:
+            result = self.__archive_file.getFileChecksum(path)
+        except (IllegalArgumentException, WLSDeployArchiveIOException), e:
+            ex = exception_helper.create_exception(self.__exception_type, "WLSDPLY-19304", path,
+                                                   self.__archive_file_name, e.getLocalizedMessage(), error=e)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
+        self.__logger.exiting(class_name=self.__class_name, method_name=_method_name, result=result)
+        return result
+
     def extract_domain_library(self, lib_path):
         """
         Extract the specified domain library to the $DOMAIN_HOME/lib directory.
@@ -715,6 +715,7 @@ class AttributeSetter(object):
 
         location = LocationContext(location).append_location(element_type)
         if self.__alias_helper.get_wlst_mbean_type(location) is not None:
+            # the listing is cached by wlst_helper until MBeans are created, deleted or set below its location
             existing_names = self.__get_existing_object_list(location)
             if name in existing_names:
                 location_type, location_name = self.__alias_helper.get_model_type_and_name(location)
@@ -739,7 +740,7 @@ class AttributeSetter(object):
         :return: the domain location
         """
         _method_name = '__get_domain_location'
-        self.__logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
+        self.__logger.entering(location, class_name=self._class_name, method_name=_method_name)
 
         location = LocationContext(location)
         while len(location.get_model_folders()) > 0:
@@ -777,7 +778,7 @@ class AttributeSetter(object):
         """
         _method_name = '__get_existing_object_list'
 
-        self.__logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
+        self.__logger.entering(location, class_name=self._class_name, method_name=_method_name)
         list_path = self.__alias_helper.get_wlst_list_path(location)
         existing_names = self.__wlst_helper.get_existing_object_list(list_path)
         self.__logger.exiting(class_name=self._class_name, method_name=_method_name, result=existing_names)
@@ -797,7 +798,7 @@ class AttributeSetter(object):
         :raises BundleAwareException of the specified type: if the WLDF Action/Notification is not found
         """
         _method_name = '__merge_existing_items'
-        self.__logger.entering(str(items), str(existing_value), class_name=self._class_name, method_name=_method_name)
+        self.__logger.entering(items, existing_value, class_name=self._class_name, method_name=_method_name)
 
         existing_items = TypeUtils.convertToType(List, existing_value)  # type: list of str
         no_existing_items = (existing_items is None) or (len(existing_items) == 0)
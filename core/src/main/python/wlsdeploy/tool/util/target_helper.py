@@ -159,7 +159,7 @@ class TargetHelper(object):
         """
         _method_name = '_get_server_group_targeting_limits'
 
-        self.logger.entering(str(server_group_targeting_limits), str(clusters_map),
+        self.logger.entering(server_group_targeting_limits, clusters_map,
                              class_name=self.__class_name, method_name=_method_name)
         sg_targeting_limits = copy.deepcopy(server_group_targeting_limits)
         for server_group_name, sg_targeting_limit in sg_targeting_limits.iteritems():
@@ -199,7 +199,7 @@ class TargetHelper(object):
         """
         _method_name = '_get_server_to_server_groups_map'
 
-        self.logger.entering(admin_server_name, str(server_names), str(server_groups), str(sg_targeting_limits),
+        self.logger.entering(admin_server_name, server_names, server_groups, sg_targeting_limits,
                              class_name=self.__class_name, method_name=_method_name)
         result = OrderedDict()
         for server_name in server_names:
@@ -226,7 +226,7 @@ class TargetHelper(object):
         """
         _method_name = '__get_server_groups_for_server'
 
-        self.logger.entering(server_name, str(sg_targeting_limits),
+        self.logger.entering(server_name, sg_targeting_limits,
                              class_name=self.__class_name, method_name=_method_name)
         result = None
         for server_group, server_names_list in sg_targeting_limits.iteritems():
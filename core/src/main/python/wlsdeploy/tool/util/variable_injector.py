@@ -72,6 +72,8 @@ _fake_name_marker = 'fakename'
 _fake_name_replacement = re.compile('.' + _fake_name_marker)
 _white_space_replacement = re.compile('\s')
 _split_around_special_names = re.compile('([\w]+\[[\w\.,]+\])|\.')
+# injector regular expressions, compiled once for all of the model locations where they are applied
+_compiled_patterns = dict()
 
 _wlsdeploy_location = os.environ.get('WLSDEPLOY_HOME')
 _class_name = 'variable_injector'
@@ -178,88 +180,115 @@ class VariableInjector(object):
         """
         Iterate through the injector dictionary that was loaded from the file for the model
         injector file keyword.
+
+        The injector keys are compiled into a trie of MBean folder paths, so that the model is traversed
+        once for all of the injectors, rather than once for each injector.
         :param injector_dictionary:
         :return: variable dictionary containing the variable string and model value entries
         """
+        _method_name = 'inject_variables'
         variable_dict = dict()
         if injector_dictionary:
             location = LocationContext()
             domain_token = self.__aliases.get_name_token(location)
             location.add_name_token(domain_token, _fake_name_marker)
-            for injector, injector_values in injector_dictionary.iteritems():
-                entries_dict = self.__inject_variable(location, injector, injector_values)
-                if len(entries_dict) > 0:
-                    variable_dict.update(entries_dict)
+            for section, root_node in self.__build_injector_trie(injector_dictionary):
+                _logger.finer('WLSDPLY-19544', len(root_node.injectors), class_name=_class_name,
+                              method_name=_method_name)
+                self.__traverse_injector_node(root_node, section, location, variable_dict)
 
         return variable_dict
 
-    def __inject_variable(self, location, injector, injector_values):
-        _method_name = '__inject_variable'
-        _logger.entering(injector, class_name=_class_name, method_name=_method_name)
-        variable_dict = dict()
-        start_mbean_list, attribute = _split_injector(injector)
-
-        def _traverse_variables(model_section, mbean_list):
-            if mbean_list:
-                mbean = mbean_list.pop(0)
-                mbean, mbean_name_list = self._find_special_name(mbean)
-                _logger.finer('WLSDPLY-19523', mbean, location.get_folder_path(), class_name=_class_name,
-                              method_name=_method_name)
-                if mbean in model_section:
-                    _logger.finest('WLSDPLY-19514', mbean, class_name=_class_name, method_name=_method_name)
-                    next_model_section = model_section[mbean]
-                    location.append_location(mbean)
-                    name_token = self.__aliases.get_name_token(location)
-                    if not mbean_name_list:
-                        if self.__aliases.supports_multiple_mbean_instances(location):
-                            mbean_name_list = next_model_section
-                        else:
-                            self._check_name_token(location, name_token)
-                    else:
-                        _logger.fine('WLSDPLY-19506', mbean_name_list, attribute, location.get_folder_path(),
-                                     class_name=_class_name, method_name=_method_name)
-                    if mbean_name_list:
-                        for mbean_name in mbean_name_list:
-                            if mbean_name in next_model_section:
-                                continue_mbean_list = copy.copy(mbean_list)
-                                location.add_name_token(name_token, mbean_name)
-                                _traverse_variables(next_model_section[mbean_name], continue_mbean_list)
-                                location.remove_name_token(name_token)
-                    else:
-                        _traverse_variables(next_model_section, mbean_list)
-                    location.pop_location()
-                else:
-                    self._log_mbean_not_found(mbean, injector, location)
-                    return False
+    def __build_injector_trie(self, injector_dictionary):
+        """
+        Compile the injector keys into a trie for each model section.
+        :param injector_dictionary: the injector dictionary
+        :return: list of model section and root trie node pairs, in the order the sections were first used
+        """
+        roots = []
+        root_map = dict()
+        for injector, injector_values in injector_dictionary.iteritems():
+            mbean_list, attribute = _split_injector(injector)
+            section_key = self.__get_injector_section_key(mbean_list)
+            if section_key in root_map:
+                node = root_map[section_key]
             else:
-                self._check_insert_attribute_model(location, model_section, attribute, injector_values)
-                if attribute in model_section:
-                    returned_dict = self._variable_info(model_section, attribute, location, injector_values)
-                    if returned_dict:
-                        variable_dict.update(returned_dict)
+                node = _InjectorNode()
+                root_map[section_key] = node
+                if section_key is None:
+                    roots.append((self.__model, node))
                 else:
-                    _logger.finer('WLSDPLY-19517', attribute, injector, location.get_folder_path(),
-                                  class_name=_class_name, method_name=_method_name)
-            return True
-
-        section = self.__model
-        if start_mbean_list:
+                    roots.append((self.__model[section_key], node))
+
+            node.injectors.append(injector)
+            for segment in mbean_list:
+                child = node.get_child(segment)
+                if child is None:
+                    mbean, mbean_name_list = self._find_special_name(segment)
+                    child = node.add_child(segment, mbean, mbean_name_list)
+                node = child
+                node.injectors.append(injector)
+            node.attributes.append((attribute, injector, injector_values))
+            _compile_injector_patterns(injector_values)
+        return roots
+
+    def __get_injector_section_key(self, mbean_list):
+        if mbean_list:
             # Find out in what section is the mbean top folder so can move to that section in the model
-            top_mbean, __ = self._find_special_name(start_mbean_list[0])
+            top_mbean, __ = self._find_special_name(mbean_list[0])
             for entry in self.__section_keys:
                 if entry in self.__model and top_mbean in self.__model[entry]:
-                    section = self.__model[entry]
-                    break
-        else:
-            # This is a domain attribute
-            section = self.__model[model_sections.get_model_topology_key()]
-        # if it wasn't found, will log appropriately in the called method
-        # This also will allow someone to put the section in the injector string
-        _traverse_variables(section, start_mbean_list)
-
-        _logger.exiting(class_name=_class_name, method_name=_method_name, result=variable_dict)
+                    return entry
+            # if it wasn't found, will log appropriately when the model is traversed
+            # This also will allow someone to put the section in the injector string
+            return None
+        # This is a domain attribute
+        return model_sections.get_model_topology_key()
+
+    def __traverse_injector_node(self, node, model_section, location, variable_dict):
+        _method_name = '__traverse_injector_node'
+        for attribute, injector, injector_values in node.attributes:
+            self._check_insert_attribute_model(location, model_section, attribute, injector_values)
+            if attribute in model_section:
+                returned_dict = self._variable_info(model_section, attribute, location, injector_values)
+                if returned_dict:
+                    variable_dict.update(returned_dict)
+            else:
+                _logger.finer('WLSDPLY-19517', attribute, injector, location.get_folder_path(),
+                              class_name=_class_name, method_name=_method_name)
 
-        return variable_dict
+        for child in node.children:
+            mbean = child.mbean
+            _logger.finer('WLSDPLY-19523', mbean, location.get_folder_path(), class_name=_class_name,
+                          method_name=_method_name)
+            if mbean not in model_section:
+                for injector in child.injectors:
+                    self._log_mbean_not_found(mbean, injector, location)
+                continue
+
+            _logger.finest('WLSDPLY-19514', mbean, class_name=_class_name, method_name=_method_name)
+            next_model_section = model_section[mbean]
+            location.append_location(mbean)
+            name_token = self.__aliases.get_name_token(location)
+            mbean_name_list = child.mbean_name_list
+            if not mbean_name_list:
+                if self.__aliases.supports_multiple_mbean_instances(location):
+                    mbean_name_list = next_model_section
+                else:
+                    self._check_name_token(location, name_token)
+            else:
+                _logger.fine('WLSDPLY-19506', mbean_name_list, child.injectors, location.get_folder_path(),
+                             class_name=_class_name, method_name=_method_name)
+            if mbean_name_list:
+                for mbean_name in mbean_name_list:
+                    if mbean_name in next_model_section:
+                        location.add_name_token(name_token, mbean_name)
+                        self.__traverse_injector_node(child, next_model_section[mbean_name], location,
+                                                      variable_dict)
+                        location.remove_name_token(name_token)
+            else:
+                self.__traverse_injector_node(child, next_model_section, location, variable_dict)
+            location.pop_location()
 
     def __format_variable_name(self, location, attribute):
         _method_name = '__format_variable_name'
@@ -305,7 +334,7 @@ class VariableInjector(object):
             _logger.fine('WLSDPLY-19525', variable_name, attribute_value, attribute, variable_value,
                          class_name=_class_name, method_name=_method_name)
         else:
-            _logger.finer('WLSDPLY-19526', attribute_value, attribute, str(location), class_name=_class_name,
+            _logger.finer('WLSDPLY-19526', attribute_value, attribute, location, class_name=_class_name,
                           method_name=_method_name)
         if variable_value:
             variable_dict[variable_name] = self._check_replace_variable_value(location, attribute, variable_value,
@@ -551,6 +580,34 @@ class VariableInjector(object):
         return value
 
 
+class _InjectorNode(object):
+    """
+    A node in the trie of injector paths. Each child is an MBean folder segment of the injector keys,
+    including the optional list of MBean names, and the attributes are the injectors that end at the node.
+    """
+
+    def __init__(self, segment=None, mbean=None, mbean_name_list=None):
+        self.segment = segment
+        self.mbean = mbean
+        self.mbean_name_list = mbean_name_list
+        self.children = []
+        self.attributes = []
+        # the injector keys that pass through this node, used for logging
+        self.injectors = []
+        self.__child_map = dict()
+
+    def get_child(self, segment):
+        if segment in self.__child_map:
+            return self.__child_map[segment]
+        return None
+
+    def add_child(self, segment, mbean, mbean_name_list):
+        child = _InjectorNode(segment, mbean, mbean_name_list)
+        self.children.append(child)
+        self.__child_map[segment] = child
+        return child
+
+
 def get_default_variable_injector_file_name(variable_injector_file_name=VARIABLE_INJECTOR_FILE_NAME):
     """
     Return the default name and location of the model variable injector json file
@@ -719,12 +776,25 @@ def _replace_segment(regexp, variable_value, attribute_value):
     return replacement_string, replaced_value
 
 
+def _compile_injector_patterns(injector_values):
+    if REGEXP in injector_values:
+        for dictionary in injector_values[REGEXP]:
+            if REGEXP_PATTERN in dictionary:
+                _compile_pattern(dictionary[REGEXP_PATTERN])
+
+
 def _compile_pattern(pattern):
+    if pattern in _compiled_patterns:
+        return _compiled_patterns[pattern]
+
+    compiled = None
     try:
-        return re.compile(pattern)
+        compiled = re.compile(pattern)
     except Exception, e:
         _logger.warning('WLSDPLY-19511', pattern, e, class_name=_class_name, method_name='_compile_pattern')
-    return None
+    # an invalid pattern is cached as None, so that it is only reported once
+    _compiled_patterns[pattern] = compiled
+    return compiled
 
 
 def _already_property(check_string):
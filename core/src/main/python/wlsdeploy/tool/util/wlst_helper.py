@@ -209,6 +209,28 @@ class WlstHelper(object):
             raise ex
         return result
 
+    def get_attributes(self, attribute_names, path=None):
+        """
+        Get the values of the attributes of the MBean at the provided path, or the current location, with a
+        single request to the MBean server. Attributes that could not be read are missing from the result.
+        :param attribute_names: the list of WLST attribute names
+        :param path: the WLST path, by default it uses the current location
+        :return: dictionary of attribute name to value, or None if bulk retrieval is not available
+        :raises: BundleAwareException of the specified type: if an error occurs
+        """
+        _method_name = 'get_attributes'
+
+        try:
+            result = wlst_helper.get_attributes(attribute_names, path=path)
+        except PyWLSTException, pwe:
+            if path is None:
+                path = self.get_pwd()
+            ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-19106', path,
+                                                   pwe.getLocalizedMessage(), error=pwe)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
+        return result
+
     def get_pwd(self):
         """
         Get the current WLST directory path.
@@ -779,7 +801,7 @@ class WlstHelper(object):
         _method_name = 'redeploy_application'
 
         try:
-            result = wlst_helper.redeploy_application(application_name, args, kwargs)
+            result = wlst_helper.redeploy_application(application_name, *args, **kwargs)
         except PyWLSTException, pwe:
             ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-19138', application_name,
                                                    pwe.getLocalizedMessage(), error=pwe)
@@ -799,7 +821,7 @@ class WlstHelper(object):
         _method_name = 'undeploy_application'
 
         try:
-            result = wlst_helper.redeploy_application(application_name, args, kwargs)
+            result = wlst_helper.undeploy_application(application_name, *args, **kwargs)
         except PyWLSTException, pwe:
             ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-19141', application_name,
                                                    pwe.getLocalizedMessage(), error=pwe)
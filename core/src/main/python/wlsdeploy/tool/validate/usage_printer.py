@@ -95,7 +95,7 @@ class UsagePrinter(object):
         """
 
         _method_name = '__print_domain_info_usage'
-        self._logger.finest('1 model_path_tokens={0}', str(model_path_tokens),
+        self._logger.finest('1 model_path_tokens={0}', model_path_tokens,
                             class_name=_class_name, method_name=_method_name)
 
         model_path = validation_utils.format_message('WLSDPLY-05103', '%s:' % model_path_tokens[0])
@@ -183,9 +183,9 @@ class UsagePrinter(object):
         _method_name = '__print_model_section_usage'
 
         self._logger.finest('1 model_path_tokens={0}, control_option={1}',
-                            str(model_path_tokens), self.ControlOptions.from_value(control_option),
+                            model_path_tokens, self.ControlOptions.from_value(control_option),
                             class_name=_class_name, method_name=_method_name)
-        self._logger.finest('1 valid_section_folder_keys={0}', str(valid_section_folder_keys),
+        self._logger.finest('1 valid_section_folder_keys={0}', valid_section_folder_keys,
                             class_name=_class_name, method_name=_method_name)
 
         self.__validate_section_folder_path(model_path_tokens, valid_section_folder_keys)
@@ -233,7 +233,7 @@ class UsagePrinter(object):
 
         valid_subfolder_keys = self._alias_helper.get_model_subfolder_names(validation_location)
         self._logger.finest('3 aliases.get_model_subfolder_names(validation_location) returned: {0}',
-                            str(valid_subfolder_keys),
+                            valid_subfolder_keys,
                             class_name=_class_name, method_name=_method_name)
 
         if not valid_subfolder_keys:
@@ -275,7 +275,7 @@ class UsagePrinter(object):
         _method_name = '__print_attributes_usage'
 
         attr_infos = self._alias_helper.get_model_attribute_names_and_types(validation_location)
-        self._logger.finer('WLSDPLY-05012', str(validation_location), str(attr_infos),
+        self._logger.finer('WLSDPLY-05012', validation_location, attr_infos,
                            class_name=_class_name, method_name=_method_name)
 
         _print_attr_infos(attr_infos, indent_level)
@@ -312,7 +312,7 @@ class UsagePrinter(object):
             del model_path_tokens[model_path_tokens.index('')]
 
         recognized_top_level_keys = model.get_model_top_level_keys()
-        self._logger.finest('recognized_top_level_keys={0}', str(recognized_top_level_keys),
+        self._logger.finest('recognized_top_level_keys={0}', recognized_top_level_keys,
                             class_name=_class_name, method_name=_method_name)
 
         top_level_key = model_path_tokens[0]
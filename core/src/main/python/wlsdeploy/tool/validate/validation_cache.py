@@ -0,0 +1,302 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Content-addressed cache of model validation results.
+
+The results of validating a model depend only on the contents of the model, the variables used to resolve it
+and the name of their file, the entries in the archive, the domain name, and the WLS version, WLST mode and
+tooling version used to validate it.  A fingerprint of everything but the model contents identifies the validation
+context, and the results for each validation area (the root level and each of the top-level model sections) are
+stored under a fingerprint of that area's model subtree.  When all of the areas are found in the cache, validation
+is skipped entirely.  In incremental mode, only the areas whose subtree fingerprint changed are validated again.
+
+The cache mode is taken from the WLSDEPLOY_VALIDATION_CACHE environment variable, which may be set to full,
+incremental or none (the default).  When the cache is enabled, results are cached for the life of the process, and
+are also written to the directory named by the WLSDEPLOY_VALIDATION_CACHE_DIR environment variable, if set, or to
+the lib/validation_cache directory of the WLSDEPLOY_HOME installation.  Only the MAX_CACHE_FILES most recently
+written validation contexts are kept in that directory.
+"""
+import cPickle
+import os
+
+from java.io import File
+from java.lang import Exception as JException
+from java.lang import String
+from java.security import MessageDigest
+from javax.xml.bind import DatatypeConverter
+
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+_class_name = 'validation_cache'
+_logger = PlatformLogger('wlsdeploy.validate')
+
+# Bump this value whenever the structure of the cached results changes
+# so that files written by an older version of the tooling are ignored.
+CACHE_FORMAT_VERSION = 1
+
+CACHE_MODE_ENV_VARIABLE = 'WLSDEPLOY_VALIDATION_CACHE'
+CACHE_DIR_ENV_VARIABLE = 'WLSDEPLOY_VALIDATION_CACHE_DIR'
+
+FULL_CACHE_MODE = 'full'
+INCREMENTAL_CACHE_MODE = 'incremental'
+NO_CACHE_MODE = 'none'
+
+# The number of results kept for each validation area within a validation context
+MAX_RESULTS_PER_AREA = 8
+
+# The number of validation contexts kept in the cache directory
+MAX_CACHE_FILES = 16
+
+_cache_file_name_prefix = 'validation_'
+_cache_file_name_suffix = '.cache'
+
+# Results cached for the life of the process, keyed by context fingerprint
+_memory_cache = {}
+
+
+def get_cache_mode():
+    """
+    Get the validation cache mode.
+    :return: one of FULL_CACHE_MODE, INCREMENTAL_CACHE_MODE or NO_CACHE_MODE
+    """
+    _method_name = 'get_cache_mode'
+
+    cache_mode = os.environ.get(CACHE_MODE_ENV_VARIABLE)
+    if cache_mode is None or len(cache_mode) == 0:
+        return NO_CACHE_MODE
+
+    cache_mode = cache_mode.lower()
+    if cache_mode not in [FULL_CACHE_MODE, INCREMENTAL_CACHE_MODE, NO_CACHE_MODE]:
+        _logger.warning('WLSDPLY-05500', CACHE_MODE_ENV_VARIABLE, cache_mode,
+                        class_name=_class_name, method_name=_method_name)
+        cache_mode = NO_CACHE_MODE
+    return cache_mode
+
+
+def get_cache_directory():
+    """
+    Get the directory used to store the validation results.
+    :return: the directory name, or None if results are only cached in memory
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VARIABLE)
+    if cache_dir is None or len(cache_dir) == 0:
+        wlsdeploy_home = os.environ.get('WLSDEPLOY_HOME')
+        if wlsdeploy_home is not None and len(wlsdeploy_home) > 0:
+            cache_dir = os.path.join(wlsdeploy_home, 'lib', 'validation_cache')
+        else:
+            cache_dir = None
+    return cache_dir
+
+
+def compute_context_fingerprint(wls_version, wlst_mode, validation_mode, model_file_name, variables_file_name,
+                                domain_name, variable_properties, archive_entries):
+    """
+    Compute the fingerprint of the inputs, other than the model itself, that validation depends on.
+    :param wls_version: the WLS version
+    :param wlst_mode: the WLST mode
+    :param validation_mode: the validation mode
+    :param model_file_name: the model file name, which appears in some validation messages
+    :param variables_file_name: the variables file name, which appears in some validation messages
+    :param domain_name: the domain name used to resolve name tokens
+    :param variable_properties: the dictionary of variable values
+    :param archive_entries: the list of archive entry names, or None if there is no archive
+    :return: the fingerprint string
+    """
+    variable_names = variable_properties.keys()
+    variable_names.sort()
+    variable_items = []
+    for variable_name in variable_names:
+        variable_items.append([variable_name, variable_properties[variable_name]])
+
+    return compute_fingerprint([CACHE_FORMAT_VERSION, WebLogicDeployToolingVersion.getFullVersion(),
+                                wls_version, wlst_mode, validation_mode, model_file_name, variables_file_name,
+                                domain_name, variable_items, archive_entries])
+
+
+def compute_fingerprint(value):
+    """
+    Compute the fingerprint of a model value.  Dictionaries are fingerprinted in iteration order, since that
+    is the order in which the validation messages for their contents are recorded.
+    :param value: the model dictionary, list or scalar value
+    :return: the fingerprint string
+    """
+    pieces = []
+    _append_value(pieces, value)
+    digest = MessageDigest.getInstance('MD5')
+    digest.update(String(''.join(pieces)).getBytes('UTF-8'))
+    return DatatypeConverter.printHexBinary(digest.digest())
+
+
+def load(cache_dir, context_fingerprint):
+    """
+    Load the cached results for the validation context.
+    :param cache_dir: the cache directory, or None to only use results cached in memory
+    :param context_fingerprint: the fingerprint of the validation context
+    :return: the cached results, keyed by validation area, which is empty if nothing is cached
+    """
+    _method_name = 'load'
+
+    if context_fingerprint in _memory_cache:
+        return _memory_cache[context_fingerprint]
+
+    results = {}
+    if cache_dir is not None:
+        cache_file = _get_cache_file(cache_dir, context_fingerprint)
+        if cache_file.isFile():
+            try:
+                cache_stream = open(cache_file.getPath(), 'rb')
+                try:
+                    artifact = cPickle.load(cache_stream)
+                finally:
+                    cache_stream.close()
+
+                if type(artifact) is dict and artifact.get('format') == CACHE_FORMAT_VERSION and \
+                        artifact.get('context') == context_fingerprint:
+                    results = artifact['results']
+                    _logger.fine('WLSDPLY-05501', cache_file.getPath(),
+                                 class_name=_class_name, method_name=_method_name)
+                else:
+                    _logger.fine('WLSDPLY-05502', cache_file.getPath(),
+                                 class_name=_class_name, method_name=_method_name)
+            except (IOError, EOFError, cPickle.UnpicklingError, JException), e:
+                _logger.fine('WLSDPLY-05503', cache_file.getPath(), e,
+                             class_name=_class_name, method_name=_method_name)
+
+    _memory_cache[context_fingerprint] = results
+    return results
+
+
+def get_result(results, validation_area, section_fingerprint):
+    """
+    Get the cached result for a validation area.
+    :param results: the cached results returned by load()
+    :param validation_area: the validation area
+    :param section_fingerprint: the fingerprint of the model subtree validated for the area
+    :return: the result dictionary, or None if the area is not cached
+    """
+    if validation_area in results:
+        for fingerprint, result_dict in results[validation_area]:
+            if fingerprint == section_fingerprint:
+                return result_dict
+    return None
+
+
+def add_result(results, validation_area, section_fingerprint, result_dict):
+    """
+    Add the result for a validation area to the cached results, keeping only the most recent results.
+    :param results: the cached results returned by load()
+    :param validation_area: the validation area
+    :param section_fingerprint: the fingerprint of the model subtree validated for the area
+    :param result_dict: the result dictionary
+    """
+    area_results = [(section_fingerprint, result_dict)]
+    if validation_area in results:
+        for fingerprint, cached_dict in results[validation_area]:
+            if fingerprint != section_fingerprint and len(area_results) < MAX_RESULTS_PER_AREA:
+                area_results.append((fingerprint, cached_dict))
+    results[validation_area] = area_results
+    return
+
+
+def store(cache_dir, context_fingerprint, results):
+    """
+    Write the cached results for the validation context.  Failures are logged and otherwise ignored
+    since the cache is only an optimization.
+    :param cache_dir: the cache directory, or None to only cache the results in memory
+    :param context_fingerprint: the fingerprint of the validation context
+    :param results: the cached results returned by load()
+    :return: True if the results were written, False otherwise
+    """
+    _method_name = 'store'
+
+    _memory_cache[context_fingerprint] = results
+    if cache_dir is None:
+        return False
+
+    cache_file = _get_cache_file(cache_dir, context_fingerprint)
+    artifact = {
+        'format': CACHE_FORMAT_VERSION,
+        'context': context_fingerprint,
+        'results': results
+    }
+
+    result = False
+    try:
+        directory = cache_file.getParentFile()
+        if not directory.isDirectory() and not directory.mkdirs():
+            _logger.fine('WLSDPLY-05504', directory.getPath(), class_name=_class_name, method_name=_method_name)
+            return result
+
+        # Write to a temporary file and rename it so that concurrent tool runs never read a partial file.
+        temp_file = File.createTempFile(cache_file.getName(), '.tmp', directory)
+        try:
+            cache_stream = open(temp_file.getPath(), 'wb')
+            try:
+                cPickle.dump(artifact, cache_stream, 1)
+            finally:
+                cache_stream.close()
+
+            if cache_file.exists():
+                cache_file.delete()
+            if temp_file.renameTo(cache_file):
+                result = True
+                _logger.fine('WLSDPLY-05505', cache_file.getPath(), class_name=_class_name, method_name=_method_name)
+        finally:
+            if temp_file.exists():
+                temp_file.delete()
+        _remove_old_cache_files(directory)
+    except (IOError, TypeError, cPickle.PicklingError, JException), e:
+        _logger.fine('WLSDPLY-05506', cache_file.getPath(), e, class_name=_class_name, method_name=_method_name)
+    return result
+
+
+def _remove_old_cache_files(directory):
+    """
+    Remove the least recently written cache files, keeping MAX_CACHE_FILES of them.
+    :param directory: the cache directory
+    """
+    _method_name = '_remove_old_cache_files'
+
+    cache_files = []
+    for cache_file in directory.listFiles():
+        name = cache_file.getName()
+        if cache_file.isFile() and name.startswith(_cache_file_name_prefix) and name.endswith(_cache_file_name_suffix):
+            cache_files.append((cache_file.lastModified(), cache_file))
+
+    if len(cache_files) > MAX_CACHE_FILES:
+        cache_files.sort()
+        for last_modified, cache_file in cache_files[:len(cache_files) - MAX_CACHE_FILES]:
+            if cache_file.delete():
+                _logger.fine('WLSDPLY-05507', cache_file.getPath(), class_name=_class_name, method_name=_method_name)
+    return
+
+
+def _get_cache_file(cache_dir, context_fingerprint):
+    return File(cache_dir, _cache_file_name_prefix + context_fingerprint.lower() + _cache_file_name_suffix)
+
+
+def _append_value(pieces, value):
+    """
+    Append an unambiguous encoding of the value to the list of pieces.  Every piece is prefixed with
+    its type and length so that different structures never produce the same encoding.
+    :param pieces: the list of encoded pieces
+    :param value: the value to encode
+    """
+    if value is None:
+        pieces.append('n;')
+    elif isinstance(value, dict):
+        pieces.append('d%d;' % len(value))
+        for key in value.keys():
+            _append_value(pieces, key)
+            _append_value(pieces, value[key])
+    elif type(value) in [list, tuple]:
+        pieces.append('l%d;' % len(value))
+        for element in value:
+            _append_value(pieces, element)
+    else:
+        text = str(value)
+        pieces.append('%s%d;%s' % (type(value).__name__, len(text), text))
+    return
@@ -0,0 +1,170 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Per-folder-type validation plans.
+
+The alias information the validator needs for a model folder (the valid subfolder and attribute names, the
+attribute types, the path token attributes and the folder type flags) depends only on the folder type, that is
+on the model folders of the location, and not on the names of the folder instances.  A validation plan resolves
+that information once per folder type so that validating a model with many instances of the same folder type
+does not resolve the same alias folder over and over.
+"""
+from wlsdeploy.aliases.location_context import LocationContext
+
+# Name token values are replaced by this marker, followed by the token name and the marker again,
+# when resolving the model folder path template for a location.
+_NAME_MARKER = '\x00'
+
+
+class ValidationPlanCache(object):
+    """
+    The validation plans for the folder types of a model, built on first use.
+    """
+
+    def __init__(self, alias_helper):
+        self._alias_helper = alias_helper
+        self._plans = {}
+        self._path_templates = {}
+        return
+
+    def get_plan(self, location):
+        """
+        Get the validation plan for the folder type of the location.
+        :param location: the location
+        :return: the FolderValidationPlan for the location
+        """
+        folder_path = location.get_folder_path()
+        if folder_path in self._plans:
+            return self._plans[folder_path]
+
+        plan = FolderValidationPlan(self._alias_helper, location)
+        self._plans[folder_path] = plan
+        return plan
+
+    def get_model_folder_path(self, location):
+        """
+        Get the model folder path of the location.  The path is built from a template resolved once
+        for each folder type and set of name tokens, by filling in the names of the location.
+        :param location: the location
+        :return: the model folder path
+        :raises: BundleAwareException of the specified type: if an error occurs
+        """
+        name_tokens = location.get_name_tokens()
+        token_names = name_tokens.keys()
+        token_names.sort()
+        template_key = (location.get_folder_path(), tuple(token_names))
+
+        if template_key in self._path_templates:
+            template_parts = self._path_templates[template_key]
+        else:
+            template_location = LocationContext(location)
+            for token_name in token_names:
+                template_location.add_name_token(token_name, _NAME_MARKER + token_name + _NAME_MARKER)
+            template_parts = self._alias_helper.get_model_folder_path(template_location).split(_NAME_MARKER)
+            self._path_templates[template_key] = template_parts
+
+        # The parts alternate between literal path text and name token names
+        path_parts = []
+        for index in range(len(template_parts)):
+            if index % 2 == 0:
+                path_parts.append(template_parts[index])
+            else:
+                path_parts.append('%s' % name_tokens[template_parts[index]])
+        return ''.join(path_parts)
+
+
+class FolderValidationPlan(object):
+    """
+    The alias information used to validate instances of one folder type.  Each item is resolved
+    the first time it is needed, since some of them are only valid for folders that exist in the
+    WLS version being used.
+    """
+
+    def __init__(self, alias_helper, location):
+        self._alias_helper = alias_helper
+        self._location = LocationContext(location)
+        self._values = {}
+        self._artificial_type_subfolders = {}
+        return
+
+    def get_version_valid_code(self):
+        """
+        Get whether the folder type is valid for the WLS version being used.  The message for a version
+        invalid location includes the instance names so it is not part of the plan.
+        :return: a ValidationCodes value
+        """
+        if 'version_valid_code' not in self._values:
+            code, message = self._alias_helper.is_version_valid_location(self._location)
+            self._values['version_valid_code'] = code
+        return self._values['version_valid_code']
+
+    def get_valid_folder_keys(self):
+        """
+        Get the model subfolder names for the folder type.
+        :return: the list of subfolder names
+        """
+        if 'valid_folder_keys' not in self._values:
+            self._values['valid_folder_keys'] = self._alias_helper.get_model_subfolder_names(self._location)
+        return self._values['valid_folder_keys']
+
+    def get_valid_attr_infos(self):
+        """
+        Get the model attribute names and types for the folder type.
+        :return: the dictionary of attribute types, keyed by attribute name
+        """
+        if 'valid_attr_infos' not in self._values:
+            self._values['valid_attr_infos'] = \
+                self._alias_helper.get_model_attribute_names_and_types(self._location)
+        return self._values['valid_attr_infos']
+
+    def get_path_tokens_attr_keys(self):
+        """
+        Get the names of the attributes of the folder type that use path tokens.
+        :return: the list of attribute names
+        """
+        if 'path_tokens_attr_keys' not in self._values:
+            self._values['path_tokens_attr_keys'] = \
+                self._alias_helper.get_model_uses_path_tokens_attribute_names(self._location)
+        return self._values['path_tokens_attr_keys']
+
+    def get_name_token(self):
+        """
+        Get the name token for the folder type.
+        :return: the name token, or None if the folder type has no name token
+        """
+        if 'name_token' not in self._values:
+            self._values['name_token'] = self._alias_helper.get_name_token(self._location)
+        return self._values['name_token']
+
+    def supports_multiple_mbean_instances(self):
+        """
+        Whether the folder type supports multiple named instances.
+        :return: True if the folder type supports multiple instances, False otherwise
+        """
+        if 'multiple_mbean_instances' not in self._values:
+            self._values['multiple_mbean_instances'] = \
+                self._alias_helper.supports_multiple_mbean_instances(self._location)
+        return self._values['multiple_mbean_instances']
+
+    def requires_artificial_type_subfolder_handling(self):
+        """
+        Whether the folder type requires artificial type subfolder handling.
+        :return: True if the folder type requires artificial type subfolder handling, False otherwise
+        """
+        if 'artificial_type_subfolder_handling' not in self._values:
+            self._values['artificial_type_subfolder_handling'] = \
+                self._alias_helper.requires_artificial_type_subfolder_handling(self._location)
+        return self._values['artificial_type_subfolder_handling']
+
+    def is_artificial_type_subfolder(self, subfolder_name):
+        """
+        Whether the named subfolder of the folder type is an artificial type folder.
+        :param subfolder_name: the model subfolder name
+        :return: True if the subfolder is an artificial type folder, False otherwise
+        """
+        if subfolder_name not in self._artificial_type_subfolders:
+            subfolder_location = LocationContext(self._location).append_location(subfolder_name)
+            self._artificial_type_subfolders[subfolder_name] = \
+                self._alias_helper.is_artificial_type_folder(subfolder_location)
+        return self._artificial_type_subfolders[subfolder_name]
@@ -326,6 +326,21 @@ class ValidationResult(object):
         """
         return self._result['validation_area']
 
+    def get_result_dict(self):
+        """
+        Get the dictionary holding the counts and messages of this result, so that it can be cached.
+        :return: the result dictionary
+        """
+        return self._result
+
+    def set_result_dict(self, result_dict):
+        """
+        Replace the counts and messages of this result with those from a cached result dictionary.
+        :param result_dict: a dictionary returned by get_result_dict()
+        """
+        self._result = result_dict
+        return
+
     def get_errors_count(self):
         """
 
@@ -18,7 +18,9 @@ from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.util.alias_helper import AliasHelper
 from wlsdeploy.tool.util.archive_helper import ArchiveHelper
+from wlsdeploy.tool.validate import validation_cache
 from wlsdeploy.tool.validate import validation_utils
+from wlsdeploy.tool.validate.validation_plan import ValidationPlanCache
 from wlsdeploy.tool.validate.validation_results import ValidationResults, ValidationResult
 from wlsdeploy.tool.validate.usage_printer import UsagePrinter
 from wlsdeploy.util import dictionary_utils
@@ -63,6 +65,8 @@ class Validator(object):
         self._validation_mode = None
         self._validation_results = ValidationResults()
         self._variable_properties = {}
+        # the undefined variable warnings are only recorded in the results when they are cached
+        self._record_variable_warnings = False
         self._wls_helper = WebLogicHelper(self._logger)
 
         if wlst_mode is not None:
@@ -81,6 +85,7 @@ class Validator(object):
         else:
             self._aliases = aliases
         self._alias_helper = AliasHelper(self._aliases, self._logger, ExceptionType.VALIDATE)
+        self._validation_plans = ValidationPlanCache(self._alias_helper)
 
         self._name_tokens_location = LocationContext()
         self._name_tokens_location.add_name_token('DOMAIN', domain_name)
@@ -240,44 +245,141 @@ class Validator(object):
             # not going to validate the structure and only validate things referenced by the model, then no
             # need to load the archive_entries variable because it is not being used.
 
-        validation_result = ValidationResult(_ROOT_LEVEL_VALIDATION_AREA)
-        validation_result = self.__validate_root_level(model_dict,
-                                                       model.get_model_top_level_keys(),
-                                                       validation_result)
-        self._validation_results.set_validation_result(validation_result)
-
-        validation_result = ValidationResult(_DOMAIN_INFO_VALIDATION_AREA)
-        validation_result = self.__validate_domain_info_section(model.get_model_domain_info_key(),
-                                                                model_dict,
-                                                                validation_result)
-        self._validation_results.set_validation_result(validation_result)
-
-        validation_result = ValidationResult(_TOPOLOGY_VALIDATION_AREA)
-        validation_result = self.__validate_model_section(model.get_model_topology_key(),
-                                                          model_dict,
-                                                          self._aliases.get_model_topology_top_level_folder_names(),
-                                                          validation_result)
-        self._validation_results.set_validation_result(validation_result)
-
-        validation_result = ValidationResult(_RESOURCES_VALIDATION_AREA)
-        validation_result = \
-            self.__validate_model_section(model.get_model_resources_key(),
-                                          model_dict,
-                                          self._aliases.get_model_resources_top_level_folder_names(),
-                                          validation_result)
-        self._validation_results.set_validation_result(validation_result)
-
-        validation_result = ValidationResult(_APP_DEPLOYMENTS_VALIDATION_AREA)
-        validation_result = \
-            self.__validate_model_section(model.get_model_deployments_key(),
-                                          model_dict,
-                                          self._aliases.get_model_app_deployments_top_level_folder_names(),
-                                          validation_result)
-        self._validation_results.set_validation_result(validation_result)
+        validation_areas = [_ROOT_LEVEL_VALIDATION_AREA, _DOMAIN_INFO_VALIDATION_AREA, _TOPOLOGY_VALIDATION_AREA,
+                            _RESOURCES_VALIDATION_AREA, _APP_DEPLOYMENTS_VALIDATION_AREA]
+
+        cache_mode = validation_cache.get_cache_mode()
+        if cache_mode == validation_cache.NO_CACHE_MODE:
+            for validation_area in validation_areas:
+                validation_result = self.__validate_area(validation_area, model_dict)
+                self._validation_results.set_validation_result(validation_result)
+        else:
+            self.__validate_areas_with_cache(validation_areas, model_dict, cache_mode)
 
         self._logger.exiting(class_name=_class_name, method_name=_method_name)
         return
 
+    def __validate_areas_with_cache(self, validation_areas, model_dict, cache_mode):
+        """
+        Validate the model areas, reusing the cached results for areas whose part of the model
+        and validation context are unchanged since they were last validated.
+
+        In full cache mode, the cached results are only used if every area is unchanged. In
+        incremental cache mode, only the changed areas are validated.
+
+        :param validation_areas: the list of validation areas
+        :param model_dict: A Python dictionary of the model to be validated
+        :param cache_mode: the validation cache mode
+        :return: Nothing.
+        """
+        _method_name = '__validate_areas_with_cache'
+
+        # record the undefined variable warnings so that they are replayed with the cached results
+        self._record_variable_warnings = True
+
+        archive_entries = None
+        if self._archive_entries is not None:
+            archive_entries = list(self._archive_entries)
+
+        cache_dir = validation_cache.get_cache_directory()
+        context_fingerprint = \
+            validation_cache.compute_context_fingerprint(self._wls_version, self._wlst_mode, self._validation_mode,
+                                                         self._model_file_name,
+                                                         self._model_context.get_variable_file(),
+                                                         self._name_tokens_location.get_name_for_token('DOMAIN'),
+                                                         self._variable_properties, archive_entries)
+        cached_results = validation_cache.load(cache_dir, context_fingerprint)
+
+        section_fingerprints = {}
+        cached_result_dicts = {}
+        for validation_area in validation_areas:
+            section_fingerprint = \
+                validation_cache.compute_fingerprint(self.__get_validation_area_model(validation_area, model_dict))
+            section_fingerprints[validation_area] = section_fingerprint
+            result_dict = validation_cache.get_result(cached_results, validation_area, section_fingerprint)
+            if result_dict is not None:
+                cached_result_dicts[validation_area] = result_dict
+
+        all_cached = len(cached_result_dicts) == len(validation_areas)
+        if all_cached:
+            self._logger.info('WLSDPLY-05037', class_name=_class_name, method_name=_method_name)
+        elif cache_mode != validation_cache.INCREMENTAL_CACHE_MODE:
+            cached_result_dicts = {}
+
+        cache_modified = False
+        for validation_area in validation_areas:
+            if validation_area in cached_result_dicts:
+                if not all_cached:
+                    self._logger.info('WLSDPLY-05038', validation_area,
+                                      class_name=_class_name, method_name=_method_name)
+                validation_result = ValidationResult(validation_area)
+                validation_result.set_result_dict(copy.deepcopy(cached_result_dicts[validation_area]))
+            else:
+                validation_result = self.__validate_area(validation_area, model_dict)
+                validation_cache.add_result(cached_results, validation_area, section_fingerprints[validation_area],
+                                            copy.deepcopy(validation_result.get_result_dict()))
+                cache_modified = True
+            self._validation_results.set_validation_result(validation_result)
+
+        if cache_modified:
+            validation_cache.store(cache_dir, context_fingerprint, cached_results)
+        return
+
+    def __validate_area(self, validation_area, model_dict):
+        """
+        Validate the part of the model covered by a validation area.
+
+        :param validation_area: the validation area
+        :param model_dict: A Python dictionary of the model to be validated
+        :return: the ValidationResult for the area
+        """
+        validation_result = ValidationResult(validation_area)
+        if validation_area == _ROOT_LEVEL_VALIDATION_AREA:
+            validation_result = self.__validate_root_level(model_dict,
+                                                           model.get_model_top_level_keys(),
+                                                           validation_result)
+        elif validation_area == _DOMAIN_INFO_VALIDATION_AREA:
+            validation_result = self.__validate_domain_info_section(model.get_model_domain_info_key(),
+                                                                    model_dict,
+                                                                    validation_result)
+        elif validation_area == _TOPOLOGY_VALIDATION_AREA:
+            validation_result = \
+                self.__validate_model_section(model.get_model_topology_key(),
+                                              model_dict,
+                                              self._aliases.get_model_topology_top_level_folder_names(),
+                                              validation_result)
+        elif validation_area == _RESOURCES_VALIDATION_AREA:
+            validation_result = \
+                self.__validate_model_section(model.get_model_resources_key(),
+                                              model_dict,
+                                              self._aliases.get_model_resources_top_level_folder_names(),
+                                              validation_result)
+        elif validation_area == _APP_DEPLOYMENTS_VALIDATION_AREA:
+            validation_result = \
+                self.__validate_model_section(model.get_model_deployments_key(),
+                                              model_dict,
+                                              self._aliases.get_model_app_deployments_top_level_folder_names(),
+                                              validation_result)
+        return validation_result
+
+    def __get_validation_area_model(self, validation_area, model_dict):
+        """
+        Get the part of the model that the results of a validation area depend on.
+
+        :param validation_area: the validation area
+        :param model_dict: A Python dictionary of the model to be validated
+        :return: the list of root level keys, or the dictionary of a model section
+        """
+        if validation_area == _ROOT_LEVEL_VALIDATION_AREA:
+            return model_dict.keys()
+        elif validation_area == _DOMAIN_INFO_VALIDATION_AREA:
+            return dictionary_utils.get_element(model_dict, model.get_model_domain_info_key())
+        elif validation_area == _TOPOLOGY_VALIDATION_AREA:
+            return dictionary_utils.get_element(model_dict, model.get_model_topology_key())
+        elif validation_area == _RESOURCES_VALIDATION_AREA:
+            return dictionary_utils.get_element(model_dict, model.get_model_resources_key())
+        return dictionary_utils.get_element(model_dict, model.get_model_deployments_key())
+
     def __pre_validation_setup(self, model_dict, archive_file_name):
         """
         Performs pre-validation setup activities. These include things like:
@@ -372,7 +474,7 @@ class Validator(object):
         # Call aliases to get dictionary of the valid attributes for the
         # model_constants.DOMAIN_INFO section.
         valid_attr_infos = self._alias_helper.get_model_domain_info_attribute_names_and_types()
-        self._logger.finer('WLSDPLY-05010', str(valid_attr_infos),
+        self._logger.finer('WLSDPLY-05010', valid_attr_infos,
                            class_name=_class_name, method_name=_method_name)
 
         path_tokens_attr_keys = []
@@ -440,8 +542,9 @@ class Validator(object):
             # section_dict_key is either the name of a folder in the
             # section, or the name of an attribute in the section.
             validation_location = LocationContext()
+            validation_plan = self._validation_plans.get_plan(validation_location)
 
-            model_folder_path = self._alias_helper.get_model_folder_path(validation_location)
+            model_folder_path = self._validation_plans.get_model_folder_path(validation_location)
 
             if '${' in section_dict_key:
                 validation_result = _report_unsupported_variable_usage(section_dict_key,
@@ -451,12 +554,12 @@ class Validator(object):
             self._logger.finer('WLSDPLY-05011', section_dict_key, section_dict_value,
                                class_name=_class_name, method_name=_method_name)
 
-            valid_attr_infos = self._alias_helper.get_model_attribute_names_and_types(validation_location)
-            self._logger.finer('WLSDPLY-05012', str(validation_location), str(valid_attr_infos),
+            valid_attr_infos = validation_plan.get_valid_attr_infos()
+            self._logger.finer('WLSDPLY-05012', validation_location, valid_attr_infos,
                                class_name=_class_name, method_name=_method_name)
 
-            path_tokens_attr_keys = self._alias_helper.get_model_uses_path_tokens_attribute_names(validation_location)
-            self._logger.finer('WLSDPLY-05013', str(validation_location), str(path_tokens_attr_keys),
+            path_tokens_attr_keys = validation_plan.get_path_tokens_attr_keys()
+            self._logger.finer('WLSDPLY-05013', validation_location, path_tokens_attr_keys,
                                class_name=_class_name, method_name=_method_name)
 
             if section_dict_key in valid_attr_infos:
@@ -473,7 +576,7 @@ class Validator(object):
 
                 # Append section_dict_key to location context
                 validation_location.append_location(section_dict_key)
-                self._logger.finest('validation_location = {0}', str(validation_location),
+                self._logger.finest('validation_location = {0}', validation_location,
                                     class_name=_class_name, method_name=_method_name)
 
                 # Call self.__validate_section_folder() passing in section_dict_value
@@ -508,19 +611,22 @@ class Validator(object):
     def __validate_section_folder(self, model_node, validation_location, validation_result):
         _method_name = '__validate_section_folder'
 
-        result, message = self._alias_helper.is_version_valid_location(validation_location)
-        if result == ValidationCodes.VERSION_INVALID:
-            validation_result.add_warning('WLSDPLY-05027', message)
-            return validation_result
-        elif result == ValidationCodes.INVALID:
-            validation_result.add_error('WLSDPLY-05027', message)
-            return validation_result
+        validation_plan = self._validation_plans.get_plan(validation_location)
+        if validation_plan.get_version_valid_code() != ValidationCodes.VALID:
+            # the message names the folder instance, so get it from the aliases
+            result, message = self._alias_helper.is_version_valid_location(validation_location)
+            if result == ValidationCodes.VERSION_INVALID:
+                validation_result.add_warning('WLSDPLY-05027', message)
+                return validation_result
+            elif result == ValidationCodes.INVALID:
+                validation_result.add_error('WLSDPLY-05027', message)
+                return validation_result
 
-        model_folder_path = self._alias_helper.get_model_folder_path(validation_location)
+        model_folder_path = self._validation_plans.get_model_folder_path(validation_location)
         self._logger.finest('1 model_folder_path={0}', model_folder_path,
                             class_name=_class_name, method_name=_method_name)
 
-        if self._alias_helper.supports_multiple_mbean_instances(validation_location):
+        if validation_plan.supports_multiple_mbean_instances():
             self._logger.finer('2 model_node_type={0}',
                                _ModelNodeTypes.from_value(_ModelNodeTypes.NAME_TYPE),
                                class_name=_class_name, method_name=_method_name)
@@ -536,8 +642,8 @@ class Validator(object):
 
                 new_location = LocationContext(validation_location)
 
-                name_token = self._alias_helper.get_name_token(new_location)
-                self._logger.finest('WLSDPLY-05014', str(validation_location), name_token,
+                name_token = validation_plan.get_name_token()
+                self._logger.finest('WLSDPLY-05014', validation_location, name_token,
                                     class_name=_class_name, method_name=_method_name)
 
                 if name_token is not None:
@@ -550,7 +656,7 @@ class Validator(object):
 
                 self.__process_model_node(value_dict, new_location, validation_result)
 
-        elif self._alias_helper.requires_artificial_type_subfolder_handling(validation_location):
+        elif validation_plan.requires_artificial_type_subfolder_handling():
             self._logger.finer('3 model_node_type={0}',
                                _ModelNodeTypes.from_value(_ModelNodeTypes.ARTIFICIAL_TYPE),
                                class_name=_class_name, method_name=_method_name)
@@ -565,7 +671,7 @@ class Validator(object):
 
                 new_location = LocationContext(validation_location)
 
-                name_token = self._alias_helper.get_name_token(new_location)
+                name_token = validation_plan.get_name_token()
                 self._logger.finest('3 name_token={0}', name_token,
                                     class_name=_class_name, method_name=_method_name)
 
@@ -584,7 +690,7 @@ class Validator(object):
                                _ModelNodeTypes.from_value(_ModelNodeTypes.FOLDER_TYPE),
                                class_name=_class_name, method_name=_method_name)
 
-            name_token = self._alias_helper.get_name_token(validation_location)
+            name_token = validation_plan.get_name_token()
             self._logger.finest('4 name_token={0}', name_token,
                                 class_name=_class_name, method_name=_method_name)
 
@@ -608,16 +714,17 @@ class Validator(object):
 
         _method_name = '__process_model_node'
 
-        valid_folder_keys = self._alias_helper.get_model_subfolder_names(validation_location)
-        valid_attr_infos = self._alias_helper.get_model_attribute_names_and_types(validation_location)
-        model_folder_path = self._alias_helper.get_model_folder_path(validation_location)
+        validation_plan = self._validation_plans.get_plan(validation_location)
+        valid_folder_keys = validation_plan.get_valid_folder_keys()
+        valid_attr_infos = validation_plan.get_valid_attr_infos()
+        model_folder_path = self._validation_plans.get_model_folder_path(validation_location)
 
-        self._logger.finest('5 model_node={0}', str(model_node), class_name=_class_name, method_name=_method_name)
+        self._logger.finest('5 model_node={0}', model_node, class_name=_class_name, method_name=_method_name)
         self._logger.finest('5 aliases.get_model_subfolder_names(validation_location) returned: {0}',
-                            str(valid_folder_keys),
+                            valid_folder_keys,
                             class_name=_class_name, method_name=_method_name)
         self._logger.finest('5 aliases.get_model_attribute_names_and_types(validation_location) returned: {0}',
-                            str(valid_attr_infos),
+                            valid_attr_infos,
                             class_name=_class_name, method_name=_method_name)
         self._logger.finest('5 model_folder_path={0}', model_folder_path, class_name=_class_name,
                             method_name=_method_name)
@@ -636,13 +743,13 @@ class Validator(object):
                 self._logger.finer('6 new_location={0}', new_location,
                                    class_name=_class_name, method_name=_method_name)
 
-                if self._alias_helper.is_artificial_type_folder(new_location):
+                if validation_plan.is_artificial_type_subfolder(key):
                     # key is an ARTIFICIAL_TYPE folder
                     self._logger.finest('6 is_artificial_type_folder=True',
                                         class_name=_class_name, method_name=_method_name)
-                    valid_attr_infos = self._alias_helper.get_model_attribute_names_and_types(new_location)
+                    artificial_attr_infos = self._validation_plans.get_plan(new_location).get_valid_attr_infos()
 
-                    validation_result = self.__validate_attributes(value, valid_attr_infos,
+                    validation_result = self.__validate_attributes(value, artificial_attr_infos,
                                                                    new_location, validation_result)
                 else:
                     self.__validate_section_folder(value, new_location, validation_result)
@@ -659,8 +766,7 @@ class Validator(object):
                                                                    validation_result)
 
                 else:
-                    path_tokens_attr_keys = \
-                        self._alias_helper.get_model_uses_path_tokens_attribute_names(validation_location)
+                    path_tokens_attr_keys = validation_plan.get_path_tokens_attr_keys()
 
                     validation_result = self.__validate_attribute(key,
                                                                   value,
@@ -711,14 +817,14 @@ class Validator(object):
                               validation_location, validation_result):
         _method_name = '__validate_attributes'
 
-        self._logger.finest('attributes_dict={0}', str(attributes_dict),
+        self._logger.finest('attributes_dict={0}', attributes_dict,
                             class_name=_class_name, method_name=_method_name)
 
-        path_tokens_attr_keys = self._alias_helper.get_model_uses_path_tokens_attribute_names(validation_location)
-        self._logger.finer('WLSDPLY-05013', str(validation_location), str(path_tokens_attr_keys),
+        path_tokens_attr_keys = self._validation_plans.get_plan(validation_location).get_path_tokens_attr_keys()
+        self._logger.finer('WLSDPLY-05013', validation_location, path_tokens_attr_keys,
                            class_name=_class_name, method_name=_method_name)
 
-        model_folder_path = self._alias_helper.get_model_folder_path(validation_location)
+        model_folder_path = self._validation_plans.get_model_folder_path(validation_location)
 
         for attribute_name, attribute_value in attributes_dict.iteritems():
             validation_result = self.__validate_attribute(attribute_name,
@@ -740,8 +846,8 @@ class Validator(object):
         if expected_data_type == 'password':
             log_value = '<masked>'
 
-        self._logger.entering(attribute_name, log_value, str(valid_attr_infos), str(path_tokens_attr_keys),
-                              model_folder_path, str(validation_location),
+        self._logger.entering(attribute_name, log_value, valid_attr_infos, path_tokens_attr_keys,
+                              model_folder_path, validation_location,
                               class_name=_class_name, method_name=_method_name)
 
         if '${' in attribute_name:
@@ -782,7 +888,7 @@ class Validator(object):
                               validation_location, validation_result):
         _method_name = '__validate_properties'
 
-        self._logger.entering(str(properties_dict), str(validation_location),
+        self._logger.entering(properties_dict, validation_location,
                               class_name=_class_name, method_name=_method_name)
 
         for property_name, property_value in properties_dict.iteritems():
@@ -802,7 +908,7 @@ class Validator(object):
 
         _method_name = '__validate_property'
 
-        self._logger.entering(property_name, property_value, str(valid_prop_infos), model_folder_path,
+        self._logger.entering(property_name, property_value, valid_prop_infos, model_folder_path,
                               class_name=_class_name, method_name=_method_name)
 
         if '${' in property_name:
@@ -851,7 +957,13 @@ class Validator(object):
                     # FIXME(mwooten) - the cla_utils should be fixing all windows paths to use forward slashes already...
                     # assuming that the value is not None
                     variables_file_name = self._model_context.get_variable_file()
-                    if variables_file_name is None:
+                    if self._record_variable_warnings:
+                        if variables_file_name is None:
+                            validation_result.add_warning('WLSDPLY-05021', model_folder_path, property_name)
+                        else:
+                            validation_result.add_warning('WLSDPLY-05022', model_folder_path, property_name,
+                                                          variables_file_name)
+                    elif variables_file_name is None:
                         self._logger.warning('WLSDPLY-05021', model_folder_path, property_name,
                                              class_name=_class_name, method_name=_method_name)
                     else:
@@ -919,7 +1031,7 @@ class Validator(object):
                     validation_result.add_error('WLSDPLY-05025', attribute_name, model_folder_path, path)
         else:
             tokens = validation_utils.extract_path_tokens(path)
-            self._logger.finest('tokens={0}', str(tokens), class_name=_class_name, method_name=_method_name)
+            self._logger.finest('tokens={0}', tokens, class_name=_class_name, method_name=_method_name)
             # TODO(mwooten) - This would be a good place to validate any path token found...
 
             if not self._model_context.has_token_prefix(path):
@@ -933,7 +1045,7 @@ class Validator(object):
         __method_name = '__validate_server_group_targeting_limits'
 
         self._logger.entering(attribute_name, attribute_value, valid_attr_infos, model_folder_path,
-                              str(validation_location), class_name=_class_name, method_name=__method_name)
+                              validation_location, class_name=_class_name, method_name=__method_name)
 
         if attribute_value is not None:
             if not isinstance(attribute_value, dict):
@@ -11,6 +11,10 @@ import oracle.weblogic.deploy.yaml.YamlException as JYamlException
 from wlsdeploy.logging import platform_logger
 from wlsdeploy.exception import exception_helper
 
+# Files larger than this size, in bytes, are parsed in streaming mode, without keeping the whole parse tree
+# in memory while the dictionary is built.
+_streaming_parse_threshold = 1024 * 1024
+
 
 class FileToPython(object):
     """
@@ -35,19 +39,21 @@ class FileToPython(object):
         self.logger.entering(class_name=self._class_name, method_name=_method_name)
         # throws IllegalArgument if not a valid existing file
         model_file = JFileUtils.validateFileName(self.file_name)
+        use_streaming = model_file.length() > _streaming_parse_threshold
         # yaml is the default. For now, if the file extension is not known, then parse the contents as yaml
         if JFileUtils.isJsonFile(model_file):
-            result_dict = self._parse_json()
+            result_dict = self._parse_json(use_streaming)
         else:
-            result_dict = self._parse_yaml()
+            result_dict = self._parse_yaml(use_streaming)
 
         # called method already logged result. don't log it again
         self.logger.exiting(class_name=self._class_name, method_name=_method_name)
         return result_dict
 
-    def _parse_json(self):
+    def _parse_json(self, use_streaming=False):
         """
         Parse the JSON file and convert it into a Python dictionary.
+        :param use_streaming: whether or not to parse the file in streaming mode
         :return: the Python dictionary
         """
         _method_name = '_parse_json'
@@ -56,16 +62,17 @@ class FileToPython(object):
         self.logger.finer('WLSDPLY-03078', 'JSON', self.file_name,
                           class_name=self._class_name, method_name=_method_name)
         try:
-            return JJsonToPython(self.file_name, self.use_ordering).parse()
+            return JJsonToPython(self.file_name, self.use_ordering, use_streaming).parse()
         except JJsonException, je:
             translate_ex = exception_helper.create_translate_exception('WLSDPLY-01710', self.file_name,
                                                                        je.getLocalizedMessage(), error=je)
             self.logger.throwing(translate_ex, class_name=self._class_name, method_name=_method_name)
             raise translate_ex
 
-    def _parse_yaml(self):
+    def _parse_yaml(self, use_streaming=False):
         """
         Parse the Yaml file and convert it into a Python dictionary.
+        :param use_streaming: whether or not to parse the file in streaming mode
         :return: the Python dictionary
         """
         _method_name = '_parse_yaml'
@@ -74,7 +81,7 @@ class FileToPython(object):
         self.logger.finer('WLSDPLY-01711', 'YAML', self.file_name,
                           class_name=self._class_name, method_name=_method_name)
         try:
-            return JYamlToPython(self.file_name, self.use_ordering).parse()
+            return JYamlToPython(self.file_name, self.use_ordering, use_streaming).parse()
         except JYamlException, ye:
             translate_ex = exception_helper.create_translate_exception('WLSDPLY-01710', self.file_name,
                                                                        ye.getLocalizedMessage(), error=ye)
@@ -14,8 +14,6 @@ from java.io import FileReader
 from java.io import IOException
 from java.util import Properties
 
-from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
-
 from wlsdeploy.util import path_utils
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging import platform_logger
@@ -25,6 +23,7 @@ _logger = platform_logger.PlatformLogger('wlsdeploy.variables')
 _variable_pattern = re.compile("\\$\\{[\w.-]+\\}")
 _file_variable_pattern = re.compile("@@FILE:[\w.\\\/:-]+@@")
 _property_pattern = re.compile("@@PROP:[\w.-]+@@")
+_token_pattern = re.compile("@@PROP:([\w.-]+)@@|@@FILE:([\w.\\\/:-]+)@@")
 
 
 def load_variables(file_path):
@@ -132,56 +131,127 @@ def substitute(dictionary, variables):
     :param dictionary: the dictionary in which to substitute variables
     :param variables: a dictionary of variables for substitution
     """
-    _process_node(dictionary, variables)
+    # each @@FILE:...@@ file is only read once per substitution
+    file_values = {}
+    _process_node(dictionary, variables, file_values)
 
 
-def _process_node(nodes, variables):
+def _process_node(nodes, variables, file_values):
     """
     Process variables in the node.
     :param nodes: the dictionary to process
     :param variables: the variables to use
+    :param file_values: the values already read for @@FILE:...@@ tokens, keyed by file path
     """
-    # iterate over copy to avoid concurrent change for add/delete
-    if type(nodes) is OrderedDict:
-        nodes_iterator = OrderedDict(nodes)
-    else:
-        nodes_iterator = dict(nodes)
-    for key in nodes_iterator:
+    # values can be replaced while iterating, but changed keys are collected and
+    # replaced afterwards to avoid concurrent change for add/delete
+    changed_keys = None
+    for key in nodes:
         value = nodes[key]
 
-        # if the key changes with substitution, remove old key and map value to new key
-        new_key = _substitute(key, variables)
-        if new_key is not key:
-            nodes.pop(key)
-            nodes[new_key] = value
-
         if isinstance(value, dict):
-            _process_node(value, variables)
-        elif type(value) is str:
-            nodes[key] = _substitute(value, variables)
+            _process_node(value, variables, file_values)
+        elif type(value) is str and _has_tokens(value):
+            nodes[key] = _substitute(value, variables, file_values)
+
+        if _has_tokens(key):
+            new_key = _substitute(key, variables, file_values)
+            if new_key != key:
+                if changed_keys is None:
+                    changed_keys = []
+                changed_keys.append((key, new_key))
 
+    # if the key changes with substitution, remove old key and map value to new key
+    if changed_keys is not None:
+        for key, new_key in changed_keys:
+            nodes[new_key] = nodes.pop(key)
 
-def _substitute(text, variables):
+
+def _has_tokens(text):
+    """
+    Determine if the text may contain variable placeholders.
+    :param text: the text to check
+    :return: True if the text may contain placeholders, False otherwise
+    """
+    return '@@' in text or '${' in text
+
+
+def _substitute(text, variables, file_values):
     """
     Substitute the variable placeholders with the variable value.
     :param text: the text to process for variable placeholders
     :param variables: the variables to use
+    :param file_values: the values already read for @@FILE:...@@ tokens, keyed by file path
     :return: the replaced text
     """
-    method_name = '_substitute'
-
     if '${' in text:
-        tokens = _variable_pattern.findall(text)
-        if tokens:
-            for token in tokens:
-                key = token[2:-1]
-                # for ${key} variables, leave them in place if not defined.
-                # there are cases where WebLogic allows ${key} values, such as server templates.
-                # ${key} substitution is deprecated, so log if replacement occurs.
-                if key in variables:
-                    value = variables[key]
-                    text = text.replace(token, value)
-                    _logger.info('WLSDPLY-01735', token, key, method_name=method_name, class_name=_class_name)
+        for name in get_variable_names(text):
+            if name in variables:
+                # a ${key} value may form new @@ tokens with the text around it,
+                # so ${key} substitution has to run before the @@ tokens are scanned
+                return _substitute_in_order(text, variables, file_values)
+
+    # skip lookups for text with no @@
+    if '@@' not in text:
+        return text
+
+    def _replace_token(match):
+        return _get_token_value(match, variables, file_values)
+
+    return _token_pattern.sub(_replace_token, text)
+
+
+def _get_token_value(match, variables, file_values):
+    """
+    Get the replacement value for a @@PROP:key@@ or @@FILE:path@@ token matched by the token pattern.
+    :param match: the token match
+    :param variables: the variables to use
+    :param file_values: the values already read for @@FILE:...@@ tokens, keyed by file path
+    :return: the replacement value
+    """
+    method_name = '_get_token_value'
+
+    key = match.group(1)
+    if key is None:
+        return _get_file_value(match.group(2), file_values)
+
+    # for @@PROP:key@@ variables, throw an exception if key is not found.
+    if key not in variables:
+        ex = exception_helper.create_variable_exception('WLSDPLY-01732', key)
+        _logger.throwing(ex, class_name=_class_name, method_name=method_name)
+        raise ex
+
+    # property values may themselves reference @@FILE:path@@ tokens
+    value = variables[key]
+    if '@@FILE:' in value:
+        def _replace_file_token(file_match):
+            return _get_file_value(file_match.group(0)[7:-2], file_values)
+        value = _file_variable_pattern.sub(_replace_file_token, value)
+    return value
+
+
+def _substitute_in_order(text, variables, file_values):
+    """
+    Substitute the ${key}, @@PROP:key@@ and @@FILE:path@@ placeholders in that order, so that
+    the placeholders formed by earlier substitutions are also replaced.
+    :param text: the text to process for variable placeholders
+    :param variables: the variables to use
+    :param file_values: the values already read for @@FILE:...@@ tokens, keyed by file path
+    :return: the replaced text
+    """
+    method_name = '_substitute_in_order'
+
+    tokens = _variable_pattern.findall(text)
+    if tokens:
+        for token in tokens:
+            key = token[2:-1]
+            # for ${key} variables, leave them in place if not defined.
+            # there are cases where WebLogic allows ${key} values, such as server templates.
+            # ${key} substitution is deprecated, so log if replacement occurs.
+            if key in variables:
+                value = variables[key]
+                text = text.replace(token, value)
+                _logger.info('WLSDPLY-01735', token, key, method_name=method_name, class_name=_class_name)
 
     # skip lookups for text with no @@
     if '@@' in text:
@@ -201,12 +271,25 @@ def _substitute(text, variables):
         if tokens:
             for token in tokens:
                 path = token[7:-2]
-                value = _read_value_from_file(path)
+                value = _get_file_value(path, file_values)
                 text = text.replace(token, value)
 
     return text
 
 
+def _get_file_value(file_path, file_values):
+    """
+    Get the value for a @@FILE:path@@ token, reading the file the first time it is referenced.
+    :param file_path: the file from which to read the value
+    :param file_values: the values already read, keyed by file path
+    :return: the text value
+    :raises BundleAwareException if an error occurs while reading the value
+    """
+    if file_path not in file_values:
+        file_values[file_path] = _read_value_from_file(file_path)
+    return file_values[file_path]
+
+
 def _read_value_from_file(file_path):
     """
     Read a single text value from the first line in the specified file.
@@ -81,6 +81,14 @@ class WebLogicHelper(object):
         """
         return self.is_weblogic_version_or_above('12.1.2')
 
+    def is_wlst_ls_with_path_supported(self):
+        """
+        Is the ls(path, returnMap='true') form supported by the WLST interpreter executing this code?
+        Earlier versions of WLST ignore the path argument when a map is requested.
+        :return: True if ls() can list a path other than the current location without changing directories
+        """
+        return self.is_weblogic_version_or_above('12.2.1', use_actual_version=True)
+
     def get_jdbc_url_from_rcu_connect_string(self, rcu_connect_string):
         """
         Get the JDBC URL from the RCU connect string.
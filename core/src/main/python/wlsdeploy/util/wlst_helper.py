@@ -3,16 +3,67 @@ Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
 import com.oracle.cie.domain.script.jython.WLSTException as offlineWLSTException
+import jarray
+from java.lang import Exception as JException
+from java.lang import String
+from java.lang import ThreadLocal
 
 import wlstModule as wlst
 
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util.weblogic_helper import WebLogicHelper
 from oracle.weblogic.deploy.util import PyWLSTException
 
 _logger = PlatformLogger('wlsdeploy.wlst')
 _class_name = 'wlst_helper'
 
+# WLST session bound to the current thread, if any. Worker threads that need their own connection
+# to the domain (see wlsdeploy.util.wlst_session) bind a session here so that all of the functions
+# in this module use it instead of the global WLST instance.
+_thread_session = ThreadLocal()
+
+# Whether ls() can list a path without changing directories when online, determined on first use
+_ls_with_path_supported = None
+
+# Child names listed by get_existing_object_list(), keyed by WLST list path. The lists are kept up to date
+# as MBeans are created and deleted, the listings below a location are discarded when its attributes are set,
+# and all of them are discarded whenever the session changes. Listings are only
+# cached while the current MBean tree is the configuration tree, since runtime MBeans come and go on their own.
+_object_lists = {}
+_object_lists_enabled = True
+
+
+def set_thread_session(session):
+    """
+    Bind the WLST session to the current thread. All subsequent calls from this thread will be directed
+    to the session until clear_thread_session() is called.
+    :param session: the session object that exposes the WLST commands
+    """
+    _thread_session.set(session)
+
+
+def get_thread_session():
+    """
+    Get the WLST session bound to the current thread.
+    :return: the session object, or None if the current thread uses the global WLST instance
+    """
+    return _thread_session.get()
+
+
+def clear_thread_session():
+    """
+    Remove the WLST session bound to the current thread, if any.
+    """
+    _thread_session.remove()
+
+
+def _record_change():
+    """
+    Record a change of the domain, template or edit session, which invalidates all of the cached listings of MBeans.
+    """
+    _object_lists.clear()
+
 
 def cd(path):
     """
@@ -27,7 +78,7 @@ def cd(path):
     _logger.finest('WLSDPLY-00001', path, class_name=_class_name, method_name=_method_name)
 
     try:
-        result = wlst.cd(path)
+        result = _get_wlst().cd(path)
     except (wlst.WLSTException, offlineWLSTException), e:
         raise exception_helper.create_pywlst_exception('WLSDPLY-00002', path, _get_exception_mode(e),
                                                        _format_exception(e), error=e)
@@ -47,7 +98,7 @@ def get(attribute):
     _logger.finest('WLSDPLY-00004', attribute, class_name=_class_name, method_name=_method_name)
 
     try:
-        result = wlst.get(attribute)
+        result = _get_wlst().get(attribute)
     except (wlst.WLSTException, offlineWLSTException), e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00005', attribute, _get_exception_mode(e),
                                                        _format_exception(e), error=e)
@@ -68,12 +119,14 @@ def set(attribute, value):
     _method_name = 'set'
     _logger.finest('WLSDPLY-00007', attribute, value, class_name=_class_name, method_name=_method_name)
     try:
-        wlst.set(attribute, value)
+        _get_wlst().set(attribute, value)
     except (wlst.WLSTException, offlineWLSTException), e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00008', attribute, value,
                                                        _get_exception_mode(e), _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
         raise pwe
+    # setting a reference attribute may create MBeans below the current location
+    _discard_object_lists(_get_current_object_list_key())
     _logger.finest('WLSDPLY-00009', class_name=_class_name, method_name=_method_name)
 
 
@@ -114,6 +167,7 @@ def set_with_cmo(wlst_name, wlst_value, masked=False):
                                                        _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
         raise pwe
+    _discard_object_lists(_get_current_object_list_key())
     _logger.finest('WLSDPLY-00015', wlst_name, value, class_name=_class_name, method_name=_method_name)
     return
 
@@ -133,17 +187,18 @@ def create(name, folder, base_provider_type=None):
 
     try:
         if base_provider_type is None:
-            result = wlst.create(name, folder)
+            result = _get_wlst().create(name, folder)
         else:
-            if not wlst.WLS_ON.isConnected():
+            if not _is_connected():
                 result = wlst.WLS.create(name, folder, base_provider_type)
             else:
-                result = wlst.create(name, folder, base_provider_type)
+                result = _get_wlst().create(name, folder, base_provider_type)
     except (wlst.WLSTException, offlineWLSTException), e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00017', name, folder, base_provider_type,
                                                        _get_exception_mode(e), _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
         raise pwe
+    _update_object_lists(name, folder, True)
     _logger.finest('WLSDPLY-00018', name, folder, base_provider_type, result,
                    class_name=_class_name, method_name=_method_name)
     return result
@@ -160,12 +215,13 @@ def delete(name, folder):
     _logger.finest('WLSDPLY-00019', name, folder, class_name=_class_name, method_name=_method_name)
 
     try:
-        wlst.delete(name, folder)
+        _get_wlst().delete(name, folder)
     except (wlst.WLSTException, offlineWLSTException), e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00020', name, folder, _get_exception_mode(e),
                                                        _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
         raise pwe
+    _update_object_lists(name, folder, False)
     _logger.finest('WLSDPLY-00021', name, folder, class_name=_class_name, method_name=_method_name)
     return
 
@@ -177,8 +233,9 @@ def get_database_defaults():
     """
     _method_name = 'get_database_defaults'
     _logger.entering(class_name=_class_name, method_name=_method_name)
+    _record_change()
     try:
-        wlst.getDatabaseDefaults()
+        _get_wlst().getDatabaseDefaults()
     except offlineWLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00022', e.getLocalizedMessage(), error=e)
         _logger.throwing(pwe, class_name=_class_name, method_name=_method_name)
@@ -196,8 +253,9 @@ def set_server_groups(server, server_groups):
     """
     _method_name = 'set_server_groups'
     _logger.entering(server_groups, server, class_name=_class_name, method_name=_method_name)
+    _record_change()
     try:
-        wlst.setServerGroups(server, server_groups)
+        _get_wlst().setServerGroups(server, server_groups)
     except (wlst.WLSTException, offlineWLSTException), e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00023', server_groups, server,
                                                        _format_exception(e), error=e)
@@ -217,7 +275,7 @@ def set_option(option, value):
     _method_name = 'set_option'
     _logger.entering(option, value, class_name=_class_name, method_name=_method_name)
     try:
-        wlst.setOption(option, value)
+        _get_wlst().setOption(option, value)
     except (wlst.WLSTException, offlineWLSTException), e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00024', option, _get_exception_mode(e),
                                                        _format_exception(e), error=e)
@@ -239,7 +297,7 @@ def lsa(path=None, log_throwing=True):
     """
     _method_name = 'lsa'
     result = _ls(_method_name, 'a', path, log_throwing)
-    if wlst.WLS_ON.isConnected() and result and len(result) > 1:
+    if _is_connected() and result and len(result) > 1:
         make_dict = dict()
         for entry in result.entrySet():
             key = entry.getKey()
@@ -279,7 +337,7 @@ def path_exists(path):
 
     exists = True
     try:
-        wlst.ls(path)
+        _get_wlst().ls(path)
     except (wlst.WLSTException, offlineWLSTException), e:
         _logger.finest('WLSDPLY-00026', path, e.getLocalizedMessage(), class_name=_class_name, method_name=_method_name)
         exists = False
@@ -300,13 +358,23 @@ def _ls(method_name, ls_type, path=None, log_throwing=True):
     _method_name = method_name
     _logger.finest('WLSDPLY-00028', method_name, ls_type, path, class_name=_class_name, method_name=_method_name)
 
-    if path is not None:
+    if path is not None and _is_ls_with_path_supported():
+        current_path = path
+        try:
+            result = _get_wlst().ls(path, returnMap='true', returnType=ls_type)
+        except (wlst.WLSTException, offlineWLSTException), e:
+            pwe = exception_helper.create_pywlst_exception('WLSDPLY-00029', path, ls_type, _get_exception_mode(e),
+                                                           _format_exception(e), error=e)
+            if log_throwing:
+                _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
+            raise pwe
+    elif path is not None:
         # ls(path, returnMap='true') is busted in earlier versions of WLST so go ahead and
         # change directories to the specified path to workaround this
         current_path = get_pwd()
         cd(path)
         try:
-            result = wlst.ls(ls_type, returnMap='true', returnType=ls_type)
+            result = _get_wlst().ls(ls_type, returnMap='true', returnType=ls_type)
         except (wlst.WLSTException, offlineWLSTException), e:
             pwe = exception_helper.create_pywlst_exception('WLSDPLY-00029', path, ls_type, _get_exception_mode(e),
                                                            _format_exception(e), error=e)
@@ -318,7 +386,7 @@ def _ls(method_name, ls_type, path=None, log_throwing=True):
     else:
         current_path = get_pwd()
         try:
-            result = wlst.ls(ls_type, returnMap='true', returnType=ls_type)
+            result = _get_wlst().ls(ls_type, returnMap='true', returnType=ls_type)
         except (wlst.WLSTException, offlineWLSTException), e:
             pwe = exception_helper.create_pywlst_exception('WLSDPLY-00029', current_path, ls_type,
                                                            _get_exception_mode(e), _format_exception(e), error=e)
@@ -371,7 +439,7 @@ def get_pwd():
     _method_name = 'get_pwd'
     _logger.finest('WLSDPLY-00033', class_name=_class_name, method_name=_method_name)
     try:
-        path = wlst.pwd()[1:]
+        path = _get_wlst().pwd()[1:]
     except (wlst.WLSTException, offlineWLSTException), e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00034', _get_exception_mode(e),
                                                        _format_exception(e), error=e)
@@ -397,14 +465,55 @@ def get_cmo():
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
-        wlst.updateCmo()
+        _get_wlst().updateCmo()
     except (wlst.WLSTException, offlineWLSTException), e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00036', get_pwd(), _get_exception_mode(e),
                                                        _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name='get_cmo', error=pwe)
         raise pwe
-    _logger.exiting(class_name=_class_name, method_name=_method_name, result=wlst.cmo)
-    return wlst.cmo
+    _logger.exiting(class_name=_class_name, method_name=_method_name, result=_get_wlst().cmo)
+    return _get_wlst().cmo
+
+
+def get_attributes(attribute_names, path=None):
+    """
+    Return the values of the attributes of the MBean at the provided path, or the current location, using
+    a single MBean server request rather than one WLST get() per attribute. The values are returned as
+    provided by the MBean server, so MBean references are javax.management.ObjectName instances.
+
+    Bulk retrieval is only available in online mode. The MBean server omits attributes that it cannot
+    read from the result, so the caller should fall back to get() for any name missing from the result.
+    :param attribute_names: the list of WLST attribute names
+    :param path: the path of the MBean, or None to use the MBean at the current location
+    :return: dictionary of attribute name to value, or None if bulk retrieval is not available
+    :raises: PyWLSTException: if a WLST error occurs changing to the path
+    """
+    _method_name = 'get_attributes'
+    _logger.entering(attribute_names, path, class_name=_class_name, method_name=_method_name)
+
+    if not _is_connected() or attribute_names is None or len(attribute_names) == 0:
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=None)
+        return None
+
+    if path is None:
+        mbean = _get_wlst().cmo
+    else:
+        mbean = get_mbean_for_wlst_path(path)
+
+    result = None
+    try:
+        object_name = mbean.getObjectName()
+        names = jarray.array(attribute_names, String)
+        attribute_list = _get_wlst().mbs.getAttributes(object_name, names)
+        result = dict()
+        for attribute in attribute_list:
+            result[attribute.getName()] = attribute.getValue()
+    except (AttributeError, wlst.WLSTException, JException), e:
+        _logger.finer('WLSDPLY-00072', path, _format_exception(e), class_name=_class_name,
+                      method_name=_method_name)
+        result = None
+    _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
+    return result
 
 
 def get_mbean_for_wlst_path(path):
@@ -417,9 +526,18 @@ def get_mbean_for_wlst_path(path):
     _method_name = 'get_mbean_for_wlst_path'
     _logger.entering(path, class_name=_class_name, method_name=_method_name)
 
-    current_dir = get_pwd()
-    the_object = cd(path)
-    cd(current_dir)
+    the_object = None
+    if _is_connected():
+        # getMBean() browses to the path without changing the current location
+        try:
+            the_object = _get_wlst().getMBean(path)
+        except wlst.WLSTException, e:
+            _logger.finest('WLSDPLY-00073', path, _format_exception(e), class_name=_class_name,
+                           method_name=_method_name)
+    if the_object is None:
+        current_dir = get_pwd()
+        the_object = cd(path)
+        cd(current_dir)
     _logger.exiting(_class_name, _method_name, the_object)
     return the_object
 
@@ -433,8 +551,9 @@ def read_template(template):
     _method_name = 'read_template'
     _logger.entering(template, class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.readTemplate(template)
+        _get_wlst().readTemplate(template)
     except offlineWLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00037', template, e.getLocalizedMessage(), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -451,8 +570,9 @@ def add_template(template):
     _method_name = 'add_template'
     _logger.entering(template, class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.addTemplate(template)
+        _get_wlst().addTemplate(template)
     except offlineWLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00038', template, e.getLocalizedMessage(), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -468,8 +588,9 @@ def close_template():
     _method_name = 'close_template'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.closeTemplate()
+        _get_wlst().closeTemplate()
     except offlineWLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00039', e.getLocalizedMessage(), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -487,8 +608,9 @@ def select_template(template):
     _method_name = 'select_template'
     _logger.entering(template, class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.selectTemplate(template)
+        _get_wlst().selectTemplate(template)
     except offlineWLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00040', template, e.getLocalizedMessage(), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -504,8 +626,9 @@ def load_templates():
     _method_name = 'load_templates'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.loadTemplates()
+        _get_wlst().loadTemplates()
     except offlineWLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00041', e.getLocalizedMessage(), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -522,8 +645,9 @@ def read_domain(domain_home):
     _method_name = 'read_domain'
     _logger.entering(domain_home, class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.readDomain(domain_home)
+        _get_wlst().readDomain(domain_home)
     except offlineWLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00042', domain_home, e.getLocalizedMessage(), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -542,14 +666,14 @@ def write_domain(domain_home):
     _logger.entering(domain_home, class_name=_class_name, method_name=_method_name)
 
     try:
-        wlst.setOption('OverwriteDomain', 'true')
+        _get_wlst().setOption('OverwriteDomain', 'true')
     except offlineWLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00043', domain_home, e.getLocalizedMessage(), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
         raise pwe
 
     try:
-        wlst.writeDomain(domain_home)
+        _get_wlst().writeDomain(domain_home)
     except offlineWLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00044', domain_home, e.getLocalizedMessage(), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -566,7 +690,7 @@ def update_domain():
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
-        wlst.updateDomain()
+        _get_wlst().updateDomain()
     except offlineWLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00045', e.getLocalizedMessage(), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -582,8 +706,9 @@ def close_domain():
     _method_name = 'close_domain'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.closeDomain()
+        _get_wlst().closeDomain()
     except offlineWLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00046', e.getLocalizedMessage(), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -614,8 +739,9 @@ def connect(username, password, url):
     _method_name = 'connect'
     _logger.entering(username, url, class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.connect(username=username, password=password, url=url)
+        _get_wlst().connect(username=username, password=password, url=url)
     except (wlst.WLSTException, offlineWLSTException), e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00047', username, url, _get_exception_mode(e),
                                                        _format_exception(e), error=e)
@@ -632,8 +758,9 @@ def disconnect():
     _method_name = 'disconnect'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.disconnect()
+        _get_wlst().disconnect()
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00048', _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -649,8 +776,9 @@ def edit():
     _method_name = 'edit'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.edit()
+        _get_wlst().edit()
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00049', _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -666,8 +794,9 @@ def start_edit():
     _method_name = 'start_edit'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.startEdit()
+        _get_wlst().startEdit()
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00050', _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -683,8 +812,9 @@ def stop_edit():
     _method_name = 'stop_edit'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.stopEdit('y')
+        _get_wlst().stopEdit('y')
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00051', _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -700,8 +830,9 @@ def undo():
     _method_name = 'undo'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.undo('true', 'y')
+        _get_wlst().undo('true', 'y')
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00069', _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -718,7 +849,7 @@ def save():
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
-        wlst.save()
+        _get_wlst().save()
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00052', _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -734,8 +865,9 @@ def activate():
     _method_name = 'activate'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        wlst.activate()
+        _get_wlst().activate()
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00053', _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -763,14 +895,21 @@ def get_existing_object_list(wlst_objects_path):
     """
     _method_name = 'get_existing_object_list'
     _logger.finest('WLSDPLY-00054', wlst_objects_path, class_name=_class_name, method_name=_method_name)
-    current_dir = get_pwd()
 
+    cache_key = _get_object_list_key(wlst_objects_path)
+    if cache_key is not None and cache_key in _object_lists:
+        result = list(_object_lists[cache_key])
+        _logger.finest('WLSDPLY-00075', wlst_objects_path, result, class_name=_class_name, method_name=_method_name)
+        return result
+
+    # lsc() leaves the current location unchanged, even if it fails
     try:
         result = lsc(wlst_objects_path, log_throwing=False)
+        if cache_key is not None:
+            _object_lists[cache_key] = list(result)
     except PyWLSTException:
         # if the ls() failed, directory does not exist
         result = []
-    cd(current_dir)
     _logger.finest('WLSDPLY-00055', wlst_objects_path, result, class_name=_class_name, method_name=_method_name)
     return result
 
@@ -788,7 +927,7 @@ def start_application(application_name, *args, **kwargs):
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
     try:
-        result = wlst.startApplication(application_name, *args, **kwargs)
+        result = _get_wlst().startApplication(application_name, *args, **kwargs)
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00056', application_name, args, kwargs,
                                                        _format_exception(e), error=e)
@@ -811,7 +950,7 @@ def stop_application(application_name, *args, **kwargs):
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
     try:
-        result = wlst.stopApplication(application_name, *args, **kwargs)
+        result = _get_wlst().stopApplication(application_name, *args, **kwargs)
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00057', application_name, args, kwargs,
                                                        _format_exception(e), error=e)
@@ -833,8 +972,9 @@ def deploy_application(application_name, *args, **kwargs):
     _method_name = 'deploy_application'
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        result = wlst.deploy(application_name, *args, **kwargs)
+        result = _get_wlst().deploy(application_name, *args, **kwargs)
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00068', application_name, args, kwargs,
                                                        _format_exception(e), error=e)
@@ -856,8 +996,9 @@ def undeploy_application(application_name, *args, **kwargs):
     _method_name = 'undeploy_application'
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        result = wlst.undeploy(application_name, *args, **kwargs)
+        result = _get_wlst().undeploy(application_name, *args, **kwargs)
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00059', application_name, args, kwargs,
                                                        _format_exception(e), error=e)
@@ -879,8 +1020,9 @@ def redeploy_application(application_name, *args, **kwargs):
     _method_name = 'redeploy_application'
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
+    _record_change()
     try:
-        result = wlst.redeploy(application_name, *args, **kwargs)
+        result = _get_wlst().redeploy(application_name, *args, **kwargs)
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00060', application_name, args, kwargs,
                                                        _format_exception(e), error=e)
@@ -900,7 +1042,7 @@ def get_config_manager():
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
-        result = wlst.getConfigManager()
+        result = _get_wlst().getConfigManager()
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00061', _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -975,8 +1117,9 @@ def server_config():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'server_config'
+    _set_object_lists_enabled(True)
     try:
-        wlst.serverConfig()
+        _get_wlst().serverConfig()
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00065', _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -991,8 +1134,9 @@ def domain_runtime():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'domain_runtime'
+    _set_object_lists_enabled(False)
     try:
-        wlst.domainRuntime()
+        _get_wlst().domainRuntime()
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00066', _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -1007,8 +1151,9 @@ def custom():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'custom'
+    _set_object_lists_enabled(False)
     try:
-        wlst.custom()
+        _get_wlst().custom()
     except wlst.WLSTException, e:
         pwe = exception_helper.create_pywlst_exception('WLSDPLY-00067', _format_exception(e), error=e)
         _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
@@ -1017,6 +1162,154 @@ def custom():
     return
 
 
+def _get_object_list_key(wlst_objects_path):
+    """
+    Get the key under which the listing of the path is cached.
+    :param wlst_objects_path: the WLST path
+    :return: the normalized path, or None if listings of the path are not cached
+    """
+    if not _object_lists_enabled or get_thread_session() is not None:
+        return None
+    if wlst_objects_path is None or not wlst_objects_path.startswith('/'):
+        return None
+
+    path = wlst_objects_path
+    while path.find('//') != -1:
+        path = path.replace('//', '/')
+    if len(path) > 1 and path.endswith('/'):
+        path = path[:-1]
+    return path
+
+
+def _set_object_lists_enabled(enabled):
+    """
+    Discard the cached listings and set whether listings are cached, when changing MBean trees.
+    :param enabled: whether listings of the new MBean tree can be cached
+    """
+    global _object_lists_enabled
+
+    _object_lists.clear()
+    _object_lists_enabled = enabled
+
+
+def _update_object_lists(name, folder, created):
+    """
+    Update the cached listings after an MBean of the specified name and type was created or deleted
+    at the current location.  The listing of the MBean type folder is updated in place, and the other
+    listings of the current location and the folders below it are discarded.
+    :param name: the MBean name
+    :param folder: the MBean type
+    :param created: True if the MBean was created, False if it was deleted
+    """
+    _method_name = '_update_object_lists'
+
+    if len(_object_lists) == 0:
+        return
+    parent_path = _get_current_object_list_key()
+    if parent_path is None:
+        _object_lists.clear()
+        return
+
+    # The folder listing MBeans of a type is named after the type offline, and after the plural of the
+    # type online (for example, Servers or Libraries).
+    type_folders = [folder, folder + 's', folder + 'es', folder[:-1] + 'ies']
+    type_paths = []
+    for type_folder in type_folders:
+        type_paths.append(_join_object_list_key(parent_path, type_folder))
+
+    updated_paths = []
+    for path in type_paths:
+        if path in _object_lists:
+            names = _object_lists[path]
+            if created and name not in names:
+                names.append(name)
+            elif not created and name in names:
+                names.remove(name)
+            updated_paths.append(path)
+            _logger.finest('WLSDPLY-00076', path, names, class_name=_class_name, method_name=_method_name)
+
+    # Other MBeans can be created or deleted along with the MBean, such as the migratable target
+    # created online for each server, so the other listings below the current location are discarded.
+    _discard_object_lists(parent_path, updated_paths)
+
+
+def _get_current_object_list_key():
+    """
+    Get the key of the listing of the current location.
+    :return: the key, or None if the listing is not cached or the current location cannot be determined
+    """
+    if len(_object_lists) == 0 or get_thread_session() is not None:
+        return None
+    try:
+        return _get_object_list_key(get_pwd())
+    except PyWLSTException:
+        return None
+
+
+def _join_object_list_key(parent_path, child_name):
+    if parent_path.endswith('/'):
+        return parent_path + child_name
+    return parent_path + '/' + child_name
+
+
+def _discard_object_lists(parent_path, kept_paths=None):
+    """
+    Discard the cached listings of the path and of the folders below it.
+    :param parent_path: the listing key of the path, or None to discard all listings
+    :param kept_paths: the listing keys that should be kept, if any
+    """
+    if len(_object_lists) == 0:
+        return
+    if parent_path is None:
+        _object_lists.clear()
+        return
+
+    prefix = _join_object_list_key(parent_path, '')
+    for path in _object_lists.keys():
+        if (path == parent_path or path.startswith(prefix)) and (kept_paths is None or path not in kept_paths):
+            del _object_lists[path]
+
+
+def _is_ls_with_path_supported():
+    """
+    Determine whether the WLST interpreter supports listing a path without changing directories.
+    The form is only used online, where changing directories means remote calls, since offline
+    the cd-based workaround is cheap and known to work for every WLST version.
+    :return: True if the ls(path, returnMap='true') form can be used
+    """
+    global _ls_with_path_supported
+
+    if not _is_connected():
+        return False
+    if _ls_with_path_supported is None:
+        _ls_with_path_supported = WebLogicHelper(_logger).is_wlst_ls_with_path_supported()
+        _logger.fine('WLSDPLY-00074', _ls_with_path_supported, class_name=_class_name,
+                     method_name='_is_ls_with_path_supported')
+    return _ls_with_path_supported
+
+
+def _get_wlst():
+    """
+    Get the object used to issue WLST commands for the current thread.
+    :return: the session bound to the current thread, or the global WLST instance
+    """
+    session = _thread_session.get()
+    if session is None:
+        return wlst
+    return session
+
+
+def _is_connected():
+    """
+    Determine whether the WLST instance of the current thread is connected to a running server.
+    :return: True if connected, False otherwise
+    """
+    session = _thread_session.get()
+    if session is None:
+        return wlst.WLS_ON.isConnected()
+    return session.is_connected()
+
+
 def _get_exception_mode(e):
     """
     Return a text value dependent on online or offline mode. The wlst exception messages differ between offline
@@ -1059,7 +1352,7 @@ def _cd_back(return_directory):
     """
     if return_directory is not None:
         try:
-            wlst.cd(return_directory)
+            _get_wlst().cd(return_directory)
         except (wlst.WLSTException, offlineWLSTException), ex:
             _logger.warning('WLSDPLY-00068', return_directory, ex.getLocalizedMessage(), error=ex)
 
@@ -1069,7 +1362,7 @@ def _get_wlst_mode():
     Get the text to describe the current WLST mode.
     :return: online, if connected, offline if not
     """
-    if wlst.WLS_ON.isConnected():
+    if _is_connected():
         result = 'online'
     else:
         result = 'offline'
@@ -1081,4 +1374,4 @@ def get_mbi():
     Get the MBeanInfo for the current MBean location.
     :return: javax.management.modelmbean.ModelMBeanInfo instance for the current location
     """
-    return wlst.getMBI()
+    return _get_wlst().getMBI()
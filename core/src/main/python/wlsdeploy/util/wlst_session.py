@@ -0,0 +1,126 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Independent WLST sessions for use by worker threads.
+
+The WLST commands share a single, global current location and connection, so they cannot be used concurrently
+from several threads.  A WlstSession wraps a separate embedded WLST interpreter with its own connection to the
+Admin Server.  The session exposes the WLST commands as attributes so that it can be bound to a worker thread
+with wlst_helper.set_thread_session() and used transparently by the wlst_helper functions.  The commands of the
+embedded interpreter raise that interpreter's own WLSTException class, so the session translates them into the
+WLSTException of the global WLST instance, which is the class that the wlst_helper functions handle.
+"""
+from java.lang import Exception as JException
+from weblogic.management.scripting.utils import WLSTInterpreter
+
+import wlstModule as wlst
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+_logger = PlatformLogger('wlsdeploy.wlst')
+_class_name = 'WlstSession'
+
+_user_variable = '__wlsdeploy_session_user'
+_password_variable = '__wlsdeploy_session_password'
+_url_variable = '__wlsdeploy_session_url'
+
+
+class WlstSession(object):
+    """
+    A WLST interpreter with its own connection to the Admin Server.
+    """
+
+    def __init__(self, username, password, url):
+        """
+        Create the embedded interpreter and connect it to the Admin Server.
+        :param username: the admin user name
+        :param password: the admin password
+        :param url: the admin URL
+        :raises: PyWLSTException: if the session cannot connect
+        """
+        _method_name = '__init__'
+        _logger.entering(username, url, class_name=_class_name, method_name=_method_name)
+
+        self._url = url
+        self._interpreter = None
+        self._session_exception = None
+        try:
+            self._interpreter = WLSTInterpreter()
+            self._interpreter.set(_user_variable, username)
+            self._interpreter.set(_password_variable, password)
+            self._interpreter.set(_url_variable, url)
+            self._session_exception = self._interpreter.get('WLSTException')
+            self._execute('connect(username=%s, password=%s, url=%s)' %
+                          (_user_variable, _password_variable, _url_variable))
+            self._execute('del %s' % _password_variable)
+        except JException, e:
+            self.close()
+            pwe = exception_helper.create_pywlst_exception('WLSDPLY-00070', url, e.getLocalizedMessage(), error=e)
+            _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
+            raise pwe
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+
+    def __getattr__(self, name):
+        """
+        Return the WLST command or variable with the specified name from the embedded interpreter.
+        Commands are wrapped to translate the exceptions of the embedded interpreter.
+        :param name: the name of the WLST command, such as cd or ls
+        :return: the command or variable value
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+        value = self._interpreter.get(name)
+        if value is None:
+            raise AttributeError(name)
+        if self._session_exception is not None and self._session_exception is not wlst.WLSTException and \
+                callable(value):
+            value = _SessionCommand(value, self._session_exception)
+        return value
+
+    def is_connected(self):
+        """
+        Determine whether the session is connected. The session connects when it is created
+        and stays connected until it is closed.
+        :return: True if the session is connected, False otherwise
+        """
+        return self._interpreter is not None
+
+    def close(self):
+        """
+        Disconnect the session from the Admin Server and release the embedded interpreter.
+        Failures are logged since the session is no longer usable either way.
+        """
+        _method_name = 'close'
+
+        if self._interpreter is not None:
+            try:
+                try:
+                    self._execute('disconnect()')
+                except JException, e:
+                    _logger.fine('WLSDPLY-00071', self._url, e.getLocalizedMessage(),
+                                 class_name=_class_name, method_name=_method_name)
+            finally:
+                self._interpreter.cleanup()
+                self._interpreter = None
+
+    def _execute(self, statement):
+        # exec is a reserved word in Jython so the interpreter method must be looked up by name
+        getattr(self._interpreter, 'exec')(statement)
+
+
+class _SessionCommand(object):
+    """
+    A WLST command of an embedded interpreter that raises the WLSTException of the global WLST instance.
+    """
+
+    def __init__(self, command, session_exception):
+        self._command = command
+        self._session_exception = session_exception
+
+    def __call__(self, *args, **kwargs):
+        try:
+            return self._command(*args, **kwargs)
+        except self._session_exception, e:
+            raise wlst.WLSTException(str(e))
@@ -23,14 +23,19 @@ class YamlToPython(object):
     """
     _class_name = 'YamlToPython'
 
-    def __init__(self, file_name, use_ordering=False):
+    def __init__(self, file_name, use_ordering=False, use_streaming=False):
+        """
+        :param file_name: the name of the YAML file
+        :param use_ordering: whether or not to maintain the order of the keys in the dictionaries
+        :param use_streaming: whether or not to build the dictionary while parsing, without keeping the parse tree
+        """
         _method_name = '__init__'
 
         self._file_name = file_name
         self._use_ordering = use_ordering
         self._logger = PlatformLogger('wlsdeploy.yaml')
         try:
-            self._translator = JYamlTranslator(self._file_name, self._use_ordering)
+            self._translator = JYamlTranslator(self._file_name, self._use_ordering, use_streaming)
         except JIllegalArgumentException, iae:
             yaml_ex = \
                 exception_helper.create_yaml_exception('WLSDPLY-18008', file_name, iae.getLocalizedMessage(), error=iae)
@@ -97,11 +102,14 @@ class PythonToYaml(object):
     # 4 spaces
     _indent_unit = '    '
     _requires_quotes_chars_regex = '[:{}\[\],&*#?|<>=!%@`-]'
+    _requires_quotes_chars_pattern = re.compile(_requires_quotes_chars_regex)
 
     def __init__(self, dictionary):
         # Fix error handling for None
         self._dictionary = dictionary
         self._logger = PlatformLogger('wlsdeploy.yaml')
+        # the same attribute names appear over and over in a model, so quote each key once
+        self._quoted_keys = {}
         return
 
     def write_to_yaml_file(self, file_name):
@@ -126,7 +134,8 @@ class PythonToYaml(object):
         writer = None
         try:
             fos = JFileOutputStream(yaml_file, False)
-            writer = JPrintWriter(fos, True)
+            # the print writer buffers the output, so do not flush it after every line
+            writer = JPrintWriter(fos, False)
             self._write_dictionary_to_yaml_file(self._dictionary, writer)
 
         except JFileNotFoundException, fnfe:
@@ -158,11 +167,18 @@ class PythonToYaml(object):
         if dictionary is None:
             return
 
+        quoted_keys = self._quoted_keys
+        child_indent = indent + self._indent_unit
         for key, value in dictionary.iteritems():
-            quoted_key = self._quotify_string(key)
+            if key in quoted_keys:
+                quoted_key = quoted_keys[key]
+            else:
+                quoted_key = self._quotify_string(key)
+                quoted_keys[key] = quoted_key
+
             if isinstance(value, dict):
                 writer.println(indent + quoted_key + ':')
-                self._write_dictionary_to_yaml_file(value, writer, indent + self._indent_unit)
+                self._write_dictionary_to_yaml_file(value, writer, child_indent)
             else:
                 writer.println(indent + quoted_key + ': ' + self._get_value_string(value))
 
@@ -179,13 +195,13 @@ class PythonToYaml(object):
         elif type(value) is int or type(value) is long or type(value) is float:
             result = str(value)
         elif type(value) is list:
-            new_value = '['
-            for element in value:
-                new_value += ' ' + self._get_value_string(element) + ','
-            if len(new_value) > 1:
-                new_value = new_value[:-1]
-            new_value += ' ]'
-            result = str(new_value)
+            if len(value) == 0:
+                result = '[ ]'
+            else:
+                elements = []
+                for element in value:
+                    elements.append(self._get_value_string(element))
+                result = '[ ' + ', '.join(elements) + ' ]'
         else:
             result = self._quotify_string(str(value))
         return result
@@ -215,7 +231,7 @@ class PythonToYaml(object):
         :param text: the input string
         :return: the quoted string, or the original string if no quoting was required
         """
-        if bool(re.search(self._requires_quotes_chars_regex, text)):
+        if self._requires_quotes_chars_pattern.search(text) is not None:
             result = '\'' + _quote_embedded_quotes(text) + '\''
         else:
             result = _quote_embedded_quotes(text)
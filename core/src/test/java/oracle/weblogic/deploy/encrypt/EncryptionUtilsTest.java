@@ -4,6 +4,11 @@
  */
 package oracle.weblogic.deploy.encrypt;
 
+import java.util.ArrayList;
+import java.util.List;
+import javax.crypto.SecretKey;
+import javax.crypto.spec.SecretKeySpec;
+
 import oracle.weblogic.deploy.encrypt.EncryptionUtils;
 import org.junit.Assert;
 import org.junit.Test;
@@ -45,4 +50,74 @@ public class EncryptionUtilsTest {
         result = new String(password);
         Assert.assertEquals("Excepted decrypted password to match", PASSWORD1, result);
     }
+
+    @Test
+    public void encryptStringsTest() throws Exception {
+        List<String> passwords = new ArrayList<>();
+        for (int i = 0; i < 10; i++) {
+            passwords.add(PASSWORD1 + i);
+        }
+        passwords.add("");
+
+        List<String> results = EncryptionUtils.encryptStrings(passwords, PASSPHRASE);
+        Assert.assertEquals("Expected an encrypted password for each password", passwords.size(), results.size());
+        Assert.assertEquals("Expected an empty password to be left as is", "", results.get(passwords.size() - 1));
+        for (int i = 0; i < passwords.size() - 1; i++) {
+            String result = results.get(i);
+            Assert.assertTrue("Excepted encrypted password to start with " + CIPHER_TEXT_PREFIX + " marker",
+                result.startsWith(CIPHER_TEXT_PREFIX));
+
+            // decrypt twice so that the second decryption uses the cached key
+            for (int j = 0; j < 2; j++) {
+                String password = new String(EncryptionUtils.decryptString(result, PASSPHRASE));
+                Assert.assertEquals("Excepted decrypted password to match", passwords.get(i), password);
+            }
+        }
+    }
+
+    @Test(expected = EncryptionException.class)
+    public void decryptWithWrongPassphraseTest() throws Exception {
+        String result = EncryptionUtils.encryptString(PASSWORD1, PASSPHRASE);
+        EncryptionUtils.decryptString(result, "My cat is a siamese".toCharArray());
+    }
+
+    @Test
+    public void encryptStringsOrderTest() throws Exception {
+        List<String> passwords = new ArrayList<>();
+        for (int i = 0; i < 50; i++) {
+            passwords.add(i % 7 == 0 ? "" : PASSWORD1 + i);
+        }
+
+        List<String> results = EncryptionUtils.encryptStrings(passwords, PASSPHRASE);
+        Assert.assertEquals("Expected an encrypted password for each password", passwords.size(), results.size());
+        for (int i = 0; i < passwords.size(); i++) {
+            String result = results.get(i);
+            if (passwords.get(i).isEmpty()) {
+                Assert.assertEquals("Expected an empty password to be left as is", "", result);
+            } else {
+                String password = new String(EncryptionUtils.decryptString(result, PASSPHRASE));
+                Assert.assertEquals("Expected the encrypted password in the same position", passwords.get(i),
+                    password);
+            }
+        }
+    }
+
+    @Test
+    public void keyCacheTest() {
+        SecretKey key1 = new SecretKeySpec(new byte[] { 1 }, "AES");
+        SecretKey key2 = new SecretKeySpec(new byte[] { 2 }, "AES");
+        SecretKey key3 = new SecretKeySpec(new byte[] { 3 }, "AES");
+
+        EncryptionUtils.KeyCache cache = new EncryptionUtils.KeyCache(2);
+        cache.put("key1", key1);
+        cache.put("key2", key2);
+        Assert.assertSame("Expected the cached key", key1, cache.get("key1"));
+
+        // key1 was used more recently, so key2 is evicted
+        cache.put("key3", key3);
+        Assert.assertEquals("Expected the cache to be bounded", 2, cache.size());
+        Assert.assertNull("Expected the least recently used key to be evicted", cache.get("key2"));
+        Assert.assertSame("Expected the recently used key to be kept", key1, cache.get("key1"));
+        Assert.assertSame("Expected the new key to be cached", key3, cache.get("key3"));
+    }
 }
@@ -0,0 +1,86 @@
+/*
+ * Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+ * The Universal Permissive License (UPL), Version 1.0
+ */
+package oracle.weblogic.deploy.json;
+
+import java.io.BufferedWriter;
+import java.io.File;
+import java.io.FileWriter;
+import java.io.IOException;
+
+import org.junit.Assert;
+import org.junit.Test;
+import org.python.core.PyDictionary;
+
+public class JsonTranslatorTest {
+    private static final String[] JSON_FILES = {
+        "src/test/resources/test_jms_mail.json",
+        "src/test/resources/variables-test.json",
+        "src/test/resources/quote-test.json"
+    };
+    private static final int GENERATED_SERVER_COUNT = 100;
+
+    @Test
+    public void testStreamingMatchesParseTree() throws Exception {
+        for (String fileName : JSON_FILES) {
+            String path = new File(fileName).getAbsolutePath();
+            PyDictionary expected = new JsonTranslator(path, true, false).parse();
+            PyDictionary actual = new JsonTranslator(path, true, true).parse();
+            Assert.assertEquals("Streaming result for " + fileName, expected.toString(), actual.toString());
+        }
+    }
+
+    @Test(expected = JsonException.class)
+    public void testStreamingReportsSyntaxErrors() throws Exception {
+        File jsonFile = File.createTempFile("invalid", ".json");
+        jsonFile.deleteOnExit();
+        try (BufferedWriter writer = new BufferedWriter(new FileWriter(jsonFile))) {
+            writer.write("{ \"topology\": { \"Name\": [ \"a\", } }");
+        }
+        new JsonTranslator(jsonFile.getPath(), true, true).parse();
+    }
+
+    @Test
+    public void testStreamingMatchesParseTreeForGeneratedModel() throws Exception {
+        File jsonFile = File.createTempFile("generated", ".json");
+        jsonFile.deleteOnExit();
+        writeSyntheticModel(jsonFile, GENERATED_SERVER_COUNT);
+
+        PyDictionary expected = new JsonTranslator(jsonFile.getPath(), true, false).parse();
+        PyDictionary actual = new JsonTranslator(jsonFile.getPath(), true, true).parse();
+        Assert.assertEquals("Streaming result for the generated model", expected.toString(), actual.toString());
+    }
+
+    private static void writeSyntheticModel(File jsonFile, int serverCount) throws IOException {
+        try (BufferedWriter writer = new BufferedWriter(new FileWriter(jsonFile))) {
+            writer.write("{\n  \"topology\": {\n    \"Name\": \"benchmark\",\n    \"Server\": {\n");
+            for (int i = 0; i < serverCount; i++) {
+                if (i > 0) {
+                    writer.write(",\n");
+                }
+                writer.write("      \"server" + i + "\": {\n");
+                writer.write("        \"ListenAddress\": \"host" + i + ".example.com\",\n");
+                writer.write("        \"ListenPort\": " + (7001 + i) + ",\n");
+                writer.write("        \"Cluster\": \"cluster" + (i % 10) + "\",\n");
+                writer.write("        \"SSL\": { \"Enabled\": true, \"ListenPort\": " + (17001 + i) + " }\n");
+                writer.write("      }");
+            }
+            writer.write("\n    }\n  },\n  \"resources\": {\n    \"JDBCSystemResource\": {\n");
+            for (int i = 0; i < serverCount / 10; i++) {
+                if (i > 0) {
+                    writer.write(",\n");
+                }
+                writer.write("      \"datasource" + i + "\": {\n");
+                writer.write("        \"Target\": [ \"cluster" + (i % 10) + "\", \"AdminServer\" ],\n");
+                writer.write("        \"JdbcResource\": {\n");
+                writer.write("          \"JDBCDriverParams\": { \"URL\": \"jdbc:oracle:thin:@//db" + i
+                    + ".example.com:1521/orcl\" },\n");
+                writer.write("          \"JDBCDataSourceParams\": { \"JNDIName\": [ \"jdbc/datasource" + i
+                    + "\" ] }\n");
+                writer.write("        }\n      }");
+            }
+            writer.write("\n    }\n  }\n}\n");
+        }
+    }
+}
@@ -104,6 +104,45 @@ public class FileUtilsTest {
         Assert.assertEquals(appHash, archiveHash);
     }
 
+    @Test
+    public void testChecksums() throws Exception {
+        File archiveFile = FileUtils.getCanonicalFile(new File(ARCHIVE_FILE_NAME));
+        WLSDeployArchive archive = new WLSDeployArchive(archiveFile.getAbsolutePath());
+        String archiveChecksum = archive.getFileChecksum(APP_PATH);
+
+        File appFile = FileUtils.getCanonicalFile(new File(APP_FILE_NAME));
+        String appChecksum = FileUtils.computeChecksum(appFile.getAbsolutePath());
+
+        Assert.assertEquals(appChecksum, archiveChecksum);
+        Assert.assertTrue(appChecksum.endsWith(":" + appFile.length()));
+    }
+
+    @Test
+    public void testHashCache() throws Exception {
+        File cacheFile = File.createTempFile("file_hashes", ".properties");
+        cacheFile.deleteOnExit();
+        Assert.assertTrue(cacheFile.delete());
+        File hashedFile = File.createTempFile("hashed", ".ear");
+        hashedFile.deleteOnExit();
+        String path = hashedFile.getCanonicalPath();
+        String missingPath = path + ".missing";
+
+        FileHashCache cache = new FileHashCache(cacheFile);
+        Assert.assertNull(cache.get("MD5", path, 10, 20));
+        cache.put("MD5", path, 10, 20, "hash");
+        cache.put("MD5", missingPath, 10, 20, "hash");
+        Assert.assertFalse("expected the cache file to be written by store()", cacheFile.exists());
+        cache.store();
+        Assert.assertTrue(cacheFile.isFile());
+
+        FileHashCache reloaded = new FileHashCache(cacheFile);
+        Assert.assertEquals("hash", reloaded.get("MD5", path, 10, 20));
+        Assert.assertNull(reloaded.get("CRC32", path, 10, 20));
+        Assert.assertNull(reloaded.get("MD5", path, 11, 20));
+        Assert.assertNull(reloaded.get("MD5", path, 10, 21));
+        Assert.assertNull("expected the entry of a missing file to be removed",
+            reloaded.get("MD5", missingPath, 10, 20));
+    }
 
     private void assertMatch(String name, String got, String expected) {
         Assert.assertTrue(MessageFormat.format(FILE_ERR_FORMAT, name, got, expected),
@@ -8,6 +8,8 @@ import java.io.File;
 import java.io.FileInputStream;
 import java.io.FileOutputStream;
 import java.io.IOException;
+import java.util.Arrays;
+import java.util.List;
 
 import org.junit.Assert;
 import org.junit.Before;
@@ -40,6 +42,12 @@ public class WLSDeployArchiveTest {
         '/' + ZIP_FILE_EXISTING_EMPTY_FILE;
     private static final String BINARIES_MODEL_ZIP_TARGET_NAME = WLSDeployZipFileTest.UNIT_TEST_TARGET_DIR +
         '/' + ZIP_FILE_EXISTING_BINARIES_FILE;
+    private static final String ZIP_FILE_EXISTING_APPS_FILE = "SingleAppDomain.zip";
+    private static final String APPS_ZIP_TARGET_NAME = WLSDeployZipFileTest.UNIT_TEST_TARGET_DIR +
+        '/extract-' + ZIP_FILE_EXISTING_APPS_FILE;
+    private static final String EXTRACT_APP_ENTRY_NAME = "wlsdeploy/applications/simpleear.ear";
+    private static final String EXTRACT_SHLIB_DIR_ENTRY_NAME = "wlsdeploy/sharedLibraries/";
+    private static final String EXTRACT_SHLIB_ENTRY_NAME = "wlsdeploy/sharedLibraries/jsf-2.0.war";
 
     @Before
     public void setup() throws Exception {
@@ -123,6 +131,41 @@ public class WLSDeployArchiveTest {
         Assert.assertFalse("Path should not exist", archive.containsFileOrPath(INVALID_DIR_ENTRY_NAME));
     }
 
+    @Test
+    public void testExtractFiles() throws Exception {
+        WLSDeployZipFileTest.copyFile(ZIP_FILE_EXISTING_APPS_FILE, "extract-" + ZIP_FILE_EXISTING_APPS_FILE);
+        WLSDeployArchive archive = new WLSDeployArchive(APPS_ZIP_TARGET_NAME);
+        File extractDir =
+            new File(WLSDeployZipFileTest.UNIT_TEST_TARGET_DIR + File.separator + "extractFiles").getCanonicalFile();
+        extractDir.mkdirs();
+
+        List<String> result =
+            archive.extractFiles(Arrays.asList(EXTRACT_APP_ENTRY_NAME, EXTRACT_SHLIB_DIR_ENTRY_NAME), extractDir);
+        Assert.assertEquals("unexpected number of extracted paths", 2, result.size());
+        File appFile = new File(result.get(0));
+        Assert.assertEquals("unexpected extracted app", new File(extractDir, EXTRACT_APP_ENTRY_NAME), appFile);
+        Assert.assertEquals("unexpected extracted app content",
+            archive.getFileChecksum(EXTRACT_APP_ENTRY_NAME), FileUtils.computeChecksum(appFile));
+        Assert.assertTrue("expected extracted directory", new File(result.get(1)).isDirectory());
+        Assert.assertTrue("expected extracted shared library",
+            new File(extractDir, EXTRACT_SHLIB_ENTRY_NAME).isFile());
+        archive.close();
+    }
+
+    @Test(expected = WLSDeployArchiveIOException.class)
+    public void testExtractFilesMissingEntry() throws Exception {
+        WLSDeployZipFileTest.copyFile(ZIP_FILE_EXISTING_APPS_FILE, "extract-" + ZIP_FILE_EXISTING_APPS_FILE);
+        WLSDeployArchive archive = new WLSDeployArchive(APPS_ZIP_TARGET_NAME);
+        File extractDir =
+            new File(WLSDeployZipFileTest.UNIT_TEST_TARGET_DIR + File.separator + "extractFiles").getCanonicalFile();
+        extractDir.mkdirs();
+        try {
+            archive.extractFiles(Arrays.asList(EXTRACT_APP_ENTRY_NAME, INVALID_APP_ENTRY_NAME), extractDir);
+        } finally {
+            archive.close();
+        }
+    }
+
     @Test
     public void testClearAllBinariesWithEmptyZip() throws Exception {
         WLSDeployZipFileTest.copyFile(ZIP_FILE_EXISTING_BINARIES_FILE);
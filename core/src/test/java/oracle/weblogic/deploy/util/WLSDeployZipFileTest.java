@@ -9,6 +9,7 @@ import java.io.FileInputStream;
 import java.io.FileOutputStream;
 import java.io.IOException;
 import java.io.InputStream;
+import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.Iterator;
 import java.util.List;
@@ -43,6 +44,11 @@ public class WLSDeployZipFileTest {
        "wlsdeploy/applications/get-listen-address-app.war", "wlsdeploy/applications/simpleear.ear" };
 
     private static final String ZIP_FILE_SIMPLE_APPS_MODEL_FILE3 = "sample-apps-archive3.zip";
+    private static final String ZIP_FILE_SIMPLE_APPS_MODEL_FILE4 = "sample-apps-archive4.zip";
+    private static final String[] ZIP_FILE_BATCH_ENTRIES = new String[] {
+        "wlsdeploy/applications/get-listen-address-app.war", "wlsdeploy/applications/simpleear.ear",
+        "wlsdeploy/sharedLibraries/", "wlsdeploy/sharedLibraries/jsf-2.0.war", "model/logging/log.properties",
+        "model/logging/log(1).properties" };
     private static final String LOG_PROPERTIES_SOURCE_LOCATION =
         UNIT_TEST_SOURCE_DIR + File.separator + "log.properties";
 
@@ -77,6 +83,7 @@ public class WLSDeployZipFileTest {
         copyFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE);
         copyFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE, ZIP_FILE_SIMPLE_APPS_MODEL_FILE2);
         copyFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE, ZIP_FILE_SIMPLE_APPS_MODEL_FILE3);
+        copyFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE, ZIP_FILE_SIMPLE_APPS_MODEL_FILE4);
     }
 
     @Test
@@ -89,6 +96,39 @@ public class WLSDeployZipFileTest {
         testEmptyFile(ZIP_FILE_EXISTING_EMPTY_FILE);
     }
 
+    @Test
+    public void testEntryStreamOutlivesOtherCalls() throws Exception {
+        File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_EXISTING_FILE);
+        final WLSDeployZipFile zf = new WLSDeployZipFile(f);
+
+        InputStream stream = zf.getZipEntry(ZIP_FILE_EXISTING_FILE_KEYS[1]);
+        Assert.assertNotNull("Expected a non-null InputStream", stream);
+
+        // another thread reads the archive and closes it while the stream is still open
+        final Exception[] failure = new Exception[1];
+        Thread other = new Thread(new Runnable() {
+            @Override
+            public void run() {
+                try {
+                    for (InputStream entry : zf.getZipEntries().values()) {
+                        entry.close();
+                    }
+                    zf.getZipEntry(ZIP_FILE_EXISTING_FILE_KEYS[1]).close();
+                    zf.close();
+                } catch (Exception e) {
+                    failure[0] = e;
+                }
+            }
+        });
+        other.start();
+        other.join();
+        Assert.assertNull("Unexpected failure reading the archive from another thread", failure[0]);
+
+        long bytesRead = readInputStream(stream);
+        stream.close();
+        Assert.assertEquals("unexpected file size: " + bytesRead, ZIP_FILE_EXISTING_FILE_SIZE, bytesRead);
+    }
+
     @Test
     public void testExistingFile() throws Exception {
         File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_EXISTING_FILE);
@@ -206,6 +246,114 @@ public class WLSDeployZipFileTest {
         zf.close();
     }
 
+    @Test
+    public void testBatchChanges() throws Exception {
+        File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_SIMPLE_APPS_MODEL_FILE4);
+        File original = new File(UNIT_TEST_SOURCE_DIR + File.separator + ZIP_FILE_SIMPLE_APPS_MODEL_FILE);
+        WLSDeployZipFile zf = new WLSDeployZipFile(f);
+        File logPropertiesFile = new File(LOG_PROPERTIES_SOURCE_LOCATION);
+
+        zf.beginBatch();
+        Assert.assertTrue("expected model entries to be removed", zf.removeZipEntries("model/"));
+        for (int i = 0; i < 2; i++) {
+            try (FileInputStream inputStream = new FileInputStream(logPropertiesFile)) {
+                zf.addZipEntry("model/logging/log.properties", inputStream, true);
+            }
+        }
+        Assert.assertEquals("expected batch entries to be listed", Arrays.asList(ZIP_FILE_BATCH_ENTRIES),
+            zf.listZipEntries());
+        Assert.assertEquals("expected zip file to be unchanged before commit", original.length(), f.length());
+        zf.commitBatch();
+        Assert.assertFalse("expected batch to be closed", zf.isBatchOpen());
+
+        WLSDeployZipFile reopened = new WLSDeployZipFile(f);
+        Assert.assertEquals("expected committed entries", Arrays.asList(ZIP_FILE_BATCH_ENTRIES),
+            reopened.listZipEntries());
+        Map<String, InputStream> entries = reopened.getZipEntries();
+        long logSize = readInputStream(entries.get("model/logging/log(1).properties"));
+        Assert.assertEquals("expected log.properties content", logPropertiesFile.length(), logSize);
+        long earSize = readInputStream(entries.get("wlsdeploy/applications/simpleear.ear"));
+        Assert.assertEquals("expected copied entry content", 17856, earSize);
+        reopened.close();
+    }
+
+    @Test
+    public void testBatchRollback() throws Exception {
+        File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_SIMPLE_APPS_MODEL_FILE4);
+        WLSDeployZipFile zf = new WLSDeployZipFile(f);
+        List<String> entries = zf.listZipEntries();
+
+        zf.beginBatch();
+        try (FileInputStream inputStream = new FileInputStream(new File(LOG_PROPERTIES_SOURCE_LOCATION))) {
+            zf.addZipEntry("model/logging/log.properties", inputStream);
+        }
+        zf.removeZipEntry("model/SingleAppDomain.yaml");
+        zf.rollbackBatch();
+        Assert.assertFalse("expected batch to be closed", zf.isBatchOpen());
+        Assert.assertEquals("expected entries to be unchanged", entries, zf.listZipEntries());
+    }
+
+    @Test
+    public void testBatchEntryFailure() throws Exception {
+        File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_SIMPLE_APPS_MODEL_FILE4);
+        WLSDeployZipFile zf = new WLSDeployZipFile(f);
+        List<String> expectedEntries = new ArrayList<>(zf.listZipEntries());
+        File logPropertiesFile = new File(LOG_PROPERTIES_SOURCE_LOCATION);
+
+        zf.beginBatch();
+        try (FileInputStream inputStream = new FileInputStream(logPropertiesFile)) {
+            zf.addZipEntry("model/logging/log.properties", inputStream);
+        }
+        try {
+            zf.addZipEntry("model/logging/broken.properties", new FailingInputStream(100));
+            Assert.fail("expected the failed entry to throw an exception");
+        } catch (WLSDeployArchiveIOException expected) {
+            // only the failed entry is left out of the batch
+        }
+        Assert.assertTrue("expected batch to stay open", zf.isBatchOpen());
+        try (FileInputStream inputStream = new FileInputStream(logPropertiesFile)) {
+            zf.addZipEntry("model/logging/other.properties", inputStream);
+        }
+        zf.commitBatch();
+
+        expectedEntries.add("model/logging/log.properties");
+        expectedEntries.add("model/logging/other.properties");
+        WLSDeployZipFile reopened = new WLSDeployZipFile(f);
+        Assert.assertEquals("expected entries added before and after the failure", expectedEntries,
+            reopened.listZipEntries());
+        Map<String, InputStream> entries = reopened.getZipEntries();
+        long logSize = readInputStream(entries.get("model/logging/log.properties"));
+        Assert.assertEquals("expected log.properties content", logPropertiesFile.length(), logSize);
+        long otherSize = readInputStream(entries.get("model/logging/other.properties"));
+        Assert.assertEquals("expected other.properties content", logPropertiesFile.length(), otherSize);
+        reopened.close();
+    }
+
+    @Test
+    public void testEntryLookups() throws Exception {
+        File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_SIMPLE_APPS_MODEL_FILE4);
+        WLSDeployZipFile zf = new WLSDeployZipFile(f);
+        String appsDir = "wlsdeploy/applications/";
+        String newEntry = appsDir + "logging/log.properties";
+        List<String> appEntries = Arrays.asList(ZIP_FILE_SIMPLE_APPS_MODEL_FILE2_APSS_ENTRIES);
+
+        Assert.assertTrue("expected entry to exist", zf.containsZipEntry(appEntries.get(1)));
+        Assert.assertFalse("expected directory to have no entry", zf.containsZipEntry(appsDir));
+        Assert.assertTrue("expected entries with prefix", zf.containsZipEntries(appsDir));
+        Assert.assertFalse("expected no entries with prefix", zf.containsZipEntries(appsDir + "z"));
+        Assert.assertEquals("expected application entries", appEntries, zf.listZipEntries(appsDir));
+
+        try (FileInputStream inputStream = new FileInputStream(new File(LOG_PROPERTIES_SOURCE_LOCATION))) {
+            Assert.assertTrue("expected entry to be added", zf.addZipEntry(newEntry, inputStream));
+        }
+        Assert.assertTrue("expected added entry to exist", zf.containsZipEntry(newEntry));
+        Assert.assertEquals("expected added entry in prefix list", 3, zf.listZipEntries(appsDir).size());
+
+        Assert.assertTrue("expected entry to be removed", zf.removeZipEntry(newEntry));
+        Assert.assertFalse("expected removed entry to be gone", zf.containsZipEntry(newEntry));
+        Assert.assertEquals("expected application entries", appEntries, zf.listZipEntries(appsDir));
+    }
+
     @Test
     public void testReallyMatches() throws Exception {
         File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_EXISTING_EMPTY_FILE);
@@ -337,4 +485,23 @@ public class WLSDeployZipFileTest {
         System.out.println("copied " + totalBytesRead + " bytes from file " + source.getAbsolutePath() +
             " to " + target.getAbsolutePath());
     }
+
+    // Returns some bytes and then fails, like a file that cannot be read to the end.
+    //
+    private static class FailingInputStream extends InputStream {
+        private int remaining;
+
+        FailingInputStream(int size) {
+            this.remaining = size;
+        }
+
+        @Override
+        public int read() throws IOException {
+            if (remaining <= 0) {
+                throw new IOException("simulated read failure");
+            }
+            remaining--;
+            return 'x';
+        }
+    }
 }
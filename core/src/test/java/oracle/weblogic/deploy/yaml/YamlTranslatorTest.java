@@ -0,0 +1,82 @@
+/*
+ * Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+ * The Universal Permissive License (UPL), Version 1.0
+ */
+package oracle.weblogic.deploy.yaml;
+
+import java.io.BufferedWriter;
+import java.io.File;
+import java.io.FileWriter;
+import java.io.IOException;
+
+import org.junit.Assert;
+import org.junit.Test;
+import org.python.core.PyDictionary;
+
+public class YamlTranslatorTest {
+    private static final String[] YAML_FILES = {
+        "src/test/resources/unit-test.yaml",
+        "src/test/resources/simple-demo-jms-full.yaml",
+        "src/test/resources/variablestest.yaml"
+    };
+    private static final int GENERATED_SERVER_COUNT = 100;
+
+    @Test
+    public void testStreamingMatchesParseTree() throws Exception {
+        for (String fileName : YAML_FILES) {
+            String path = new File(fileName).getAbsolutePath();
+            PyDictionary expected = new YamlTranslator(path, true, false).parse();
+            PyDictionary actual = new YamlTranslator(path, true, true).parse();
+            Assert.assertEquals("Streaming result for " + fileName, expected.toString(), actual.toString());
+        }
+    }
+
+    @Test(expected = YamlException.class)
+    public void testStreamingReportsSyntaxErrors() throws Exception {
+        File yamlFile = File.createTempFile("invalid", ".yaml");
+        yamlFile.deleteOnExit();
+        try (BufferedWriter writer = new BufferedWriter(new FileWriter(yamlFile))) {
+            writer.write("topology:\n    Name: [ a, b ]]\n");
+        }
+        new YamlTranslator(yamlFile.getPath(), true, true).parse();
+    }
+
+    @Test
+    public void testStreamingMatchesParseTreeForGeneratedModel() throws Exception {
+        File yamlFile = File.createTempFile("generated", ".yaml");
+        yamlFile.deleteOnExit();
+        writeSyntheticModel(yamlFile, GENERATED_SERVER_COUNT);
+
+        PyDictionary expected = new YamlTranslator(yamlFile.getPath(), true, false).parse();
+        PyDictionary actual = new YamlTranslator(yamlFile.getPath(), true, true).parse();
+        Assert.assertEquals("Streaming result for the generated model", expected.toString(), actual.toString());
+    }
+
+    private static void writeSyntheticModel(File yamlFile, int serverCount) throws IOException {
+        try (BufferedWriter writer = new BufferedWriter(new FileWriter(yamlFile))) {
+            writer.write("domainInfo:\n    AdminUserName: weblogic\n    AdminPassword: welcome1\n");
+            writer.write("topology:\n    Name: benchmark\n    Server:\n");
+            for (int i = 0; i < serverCount; i++) {
+                writer.write("        server" + i + ":\n");
+                writer.write("            ListenAddress: 'host" + i + ".example.com'\n");
+                writer.write("            ListenPort: " + (7001 + i) + "\n");
+                writer.write("            Cluster: cluster" + (i % 10) + "\n");
+                writer.write("            SSL:\n");
+                writer.write("                Enabled: true\n");
+                writer.write("                ListenPort: " + (17001 + i) + "\n");
+            }
+            writer.write("resources:\n    JDBCSystemResource:\n");
+            for (int i = 0; i < serverCount / 10; i++) {
+                writer.write("        datasource" + i + ":\n");
+                writer.write("            Target: [ cluster" + (i % 10) + ", AdminServer ]\n");
+                writer.write("            JdbcResource:\n");
+                writer.write("                JDBCDriverParams:\n");
+                writer.write("                    URL: 'jdbc:oracle:thin:@//db" + i + ".example.com:1521/orcl'\n");
+                writer.write("                JDBCDataSourceParams:\n");
+                writer.write("                    JNDIName:\n");
+                writer.write("                        - jdbc/datasource" + i + "\n");
+                writer.write("                        - jdbc/alias" + i + "\n");
+            }
+        }
+    }
+}
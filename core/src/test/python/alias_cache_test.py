@@ -0,0 +1,91 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import os
+import unittest
+
+from java.lang import Object
+
+from wlsdeploy.aliases import alias_cache
+from wlsdeploy.aliases.alias_entries import AliasEntries
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+
+
+class AliasCacheTestCase(unittest.TestCase):
+    """
+       1) Unit tests must be a class that extends unittest.TestCase
+       2) Class methods with names starting with 'test' will be executed by the framework (all others skipped)
+    """
+    _execution_dir = '../../unit-tests/alias_cache'
+    _wls_version = '12.2.1.3'
+
+    def setUp(self):
+        if not os.path.exists(self._execution_dir):
+            os.makedirs(self._execution_dir)
+        self.alias_entries = AliasEntries(wls_version=self._wls_version, wlst_mode=WlstModes.ONLINE)
+        self.category_files = self.alias_entries._unit_test_only_get_category_map_files().values()
+
+    def testStoreAndLoad(self):
+        checksum = alias_cache.compute_checksum(self.category_files)
+        self.assertNotEqual(checksum, None)
+
+        location = LocationContext().append_location('Server')
+        expected = self.alias_entries.get_dictionary_for_location(location, False)
+        stored = alias_cache.store(self._execution_dir, self._wls_version, WlstModes.ONLINE, checksum,
+                                   self.alias_entries._category_dict)
+        self.assertEqual(stored, True)
+
+        category_dict = alias_cache.load(self._execution_dir, self._wls_version, WlstModes.ONLINE, checksum)
+        self.assertNotEqual(category_dict, None)
+        self.assertEqual(category_dict['Server'], expected)
+        return
+
+    def testStaleChecksumIsIgnored(self):
+        checksum = alias_cache.compute_checksum(self.category_files)
+        alias_cache.store(self._execution_dir, self._wls_version, WlstModes.OFFLINE, checksum, {})
+        category_dict = alias_cache.load(self._execution_dir, self._wls_version, WlstModes.OFFLINE, 'stale')
+        self.assertEqual(category_dict, None)
+        return
+
+    def testUnpicklableCategoriesAreNotStored(self):
+        store_dir = os.path.join(self._execution_dir, 'unpicklable')
+        stored = alias_cache.store(store_dir, self._wls_version, WlstModes.OFFLINE, 'checksum',
+                                   {'Server': Object()})
+        self.assertEqual(stored, False)
+
+        # the temporary file is removed
+        if os.path.exists(store_dir):
+            self.assertEqual(os.listdir(store_dir), [])
+        return
+
+    def testUnwritableDirectoryStaysLazy(self):
+        # a directory under a regular file can never be created
+        blocking_file = os.path.join(self._execution_dir, 'not_a_directory')
+        output = open(blocking_file, 'w')
+        output.close()
+        unwritable_dir = os.path.join(blocking_file, 'cache')
+        self.assertEqual(alias_cache.is_writable(unwritable_dir), False)
+        self.assertEqual(alias_cache.is_writable(os.path.join(self._execution_dir, 'new_dir')), True)
+
+        saved_dir = os.environ.get(alias_cache.CACHE_DIR_ENV_VARIABLE)
+        os.environ[alias_cache.CACHE_DIR_ENV_VARIABLE] = unwritable_dir
+        try:
+            alias_entries = AliasEntries(wls_version=self._wls_version, wlst_mode=WlstModes.ONLINE)
+        finally:
+            if saved_dir is None:
+                del os.environ[alias_cache.CACHE_DIR_ENV_VARIABLE]
+            else:
+                os.environ[alias_cache.CACHE_DIR_ENV_VARIABLE] = saved_dir
+
+        # no category is compiled until it is used
+        self.assertEqual(len(alias_entries._category_dict), 0)
+        location = LocationContext().append_location('Server')
+        alias_entries.get_dictionary_for_location(location, False)
+        self.assertEqual(alias_entries._category_dict.has_key('Server'), True)
+        self.assertEqual(len(alias_entries._category_dict) < len(self.category_files), True)
+        return
+
+if __name__ == '__main__':
+    unittest.main()
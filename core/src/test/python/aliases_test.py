@@ -1292,5 +1292,52 @@ class AliasesTestCase(unittest.TestCase):
         actual_attr, actual_value = self.aliases.get_wlst_attribute_name_and_value(location, actual_attr, actual_value)
         self.assertEqual(wlst_list, actual_value)
 
+    def testAttributeNamesAreCachedPerFolder(self):
+        aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE, wls_version=self.wls_version)
+        first = LocationContext().append_location(FOLDERS.SERVER)
+        first.add_name_token(aliases.get_name_token(first), 'm1')
+        second = LocationContext().append_location(FOLDERS.SERVER)
+        second.add_name_token(aliases.get_name_token(second), 'm2')
+
+        expected = aliases.get_model_restart_required_attribute_names(first)
+        expected.append('NotAnAttribute')
+        result = aliases.get_model_restart_required_attribute_names(second)
+        self.assertEqual('NotAnAttribute' in result, False)
+
+        self.assertEqual(aliases.get_wlst_attributes_path(first), '/Server/m1')
+        self.assertEqual(aliases.get_wlst_attributes_path(second), '/Server/m2')
+
+        statistics = aliases.get_cache_statistics()
+        self.assertEqual(statistics['attribute_names_misses'], 1)
+        self.assertEqual(statistics['attribute_names_hits'], 1)
+        self.assertEqual(statistics['location_hits'] > 0, True)
+        return
+
+    def testWlstNameEntryIsCopied(self):
+        alias_entries = self.online_aliases._alias_entries
+        location = LocationContext().append_location(FOLDERS.SERVER)
+        location.add_name_token(self.online_aliases.get_name_token(location), 'AdminServer')
+
+        entry = alias_entries.get_alias_attribute_entry_by_wlst_name(location, 'ListenPort')
+        entry['value']['default'] = 'changed'
+        entry = alias_entries.get_alias_attribute_entry_by_wlst_name(location, 'ListenPort')
+        self.assertNotEqual(entry['value']['default'], 'changed')
+        return
+
+    def testIsUnchangedAttributeValue(self):
+        location = LocationContext().append_location(FOLDERS.SERVER)
+        location.add_name_token(self.online_aliases.get_name_token(location), 'AdminServer')
+
+        self.assertEqual(self.online_aliases.is_unchanged_attribute_value(location, 'ListenPort', 7001, '7001'), True)
+        self.assertEqual(self.online_aliases.is_unchanged_attribute_value(location, 'ListenPort', 7002, '7001'), False)
+        self.assertEqual(self.online_aliases.is_unchanged_attribute_value(location, 'ListenAddress', 'host1', 'host1'),
+                         True)
+        self.assertEqual(self.online_aliases.is_unchanged_attribute_value(location, 'ListenAddress', 'host1', None),
+                         False)
+        self.assertEqual(self.online_aliases.is_unchanged_attribute_value(
+            location, 'CustomIdentityKeyStorePassPhraseEncrypted', 'welcome1', 'welcome1'), False)
+        self.assertEqual(self.online_aliases.is_unchanged_attribute_value(location, 'NotAnAttribute', 'x', 'x'), False)
+        return
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,217 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import os
+import unittest
+
+import oracle.weblogic.deploy.util.PyOrderedDict as OrderedDict
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.tool.deploy.applications_deployer import ApplicationsDeployer
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model import Model
+from wlsdeploy.util.model_context import ModelContext
+
+
+class ApplicationsDeployerTestCase(unittest.TestCase):
+    """
+       1) Unit tests must be a class that extends unittest.TestCase
+       2) Class methods with names starting with 'test' will be executed by the framework (all others skipped)
+    """
+    _execution_dir = '../../unit-tests/applications_deployer'
+    wls_version = '12.2.1.3'
+
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+
+    model_context = ModelContext("test", arg_map)
+    aliases = Aliases(model_context=model_context, wlst_mode=WlstModes.ONLINE, wls_version=wls_version)
+
+    def setUp(self):
+        if not os.path.exists(self._execution_dir):
+            os.makedirs(self._execution_dir)
+
+    def testOnlineDeploymentOrdering(self):
+        # lib1 changed and is referenced by app2, app1 changed, and app3 is new
+        model = Model({
+            'appDeployments': {
+                'Library': {
+                    'lib1': {'SourcePath': self._write_file('lib1.war'), 'Target': 'AdminServer'}
+                },
+                'Application': {
+                    'app1': {'SourcePath': self._write_file('app1.ear'), 'Target': 'AdminServer'},
+                    'app3': {'SourcePath': self._write_file('app3.ear'), 'Target': 'AdminServer'}
+                }
+            }
+        })
+        fake_wlst_helper = _FakeWlstHelper({'app1': 100, 'app2': 200, 'app3': 100})
+        deployer = self._create_deployer(model, fake_wlst_helper)
+
+        def build_library_deploy_strategy(location, model_libs, existing_libs, existing_lib_refs,
+                                          stop_app_list, update_library_list):
+            stop_app_list.append('app2')
+            update_library_list.append('lib1')
+
+        def build_app_deploy_strategy(location, model_apps, existing_apps, existing_app_refs,
+                                      stop_and_undeploy_app_list):
+            stop_and_undeploy_app_list.append('app1')
+
+        deployer._ApplicationsDeployer__build_library_deploy_strategy = build_library_deploy_strategy
+        deployer._ApplicationsDeployer__build_app_deploy_strategy = build_app_deploy_strategy
+        deployer._ApplicationsDeployer__online_deploy_apps_and_libs(LocationContext())
+
+        # the apps are stopped and undeployed in descending DeploymentOrder,
+        # and started again in ascending DeploymentOrder once everything is deployed
+        self.assertEqual(fake_wlst_helper.calls, [
+            ('stop', 'app2'), ('stop', 'app1'),
+            ('undeploy', 'app1'), ('undeploy', 'lib1'),
+            ('deploy', 'lib1'), ('deploy', 'app1'), ('deploy', 'app3'),
+            ('redeploy', 'app2'),
+            ('start', 'app1'), ('start', 'app3'), ('start', 'app2')])
+        self.assertEqual(fake_wlst_helper.library_modules, {'app1': 'false', 'lib1': 'true'})
+        return
+
+    def testLibraryReferencesAreListedOnce(self):
+        # lib1 is deployed to both servers, and referenced by app1 and by the web module of app2
+        fake_wlst_helper = _FakeWlstHelper(runtime_lists={
+            '/ServerRuntimes/': ['AdminServer', 'm1'],
+            '/ServerRuntimes/AdminServer/LibraryRuntimes/': ['lib1', 'lib2'],
+            '/ServerRuntimes/AdminServer/LibraryRuntimes/lib1/ReferencingRuntimes/': ['app1', 'app2_web'],
+            '/ServerRuntimes/m1/LibraryRuntimes/': ['lib1'],
+            '/ServerRuntimes/m1/LibraryRuntimes/lib1/ReferencingRuntimes/': ['app1', 'app2_web']
+        }, runtime_attributes={
+            '/ServerRuntimes/AdminServer/LibraryRuntimes/lib1': {'Referenced': 'true'},
+            '/ServerRuntimes/AdminServer/LibraryRuntimes/lib2': {'Referenced': 'false'},
+            '/ServerRuntimes/m1/LibraryRuntimes/lib1': {'Referenced': 'true'},
+            '/ServerRuntimes/AdminServer/LibraryRuntimes/lib1/ReferencingRuntimes/app1':
+                {'Type': 'ApplicationRuntime', 'ApplicationName': 'app1'},
+            '/ServerRuntimes/AdminServer/LibraryRuntimes/lib1/ReferencingRuntimes/app2_web':
+                {'Type': 'WebAppComponentRuntime', 'ApplicationIdentifier': 'app2'},
+            '/ServerRuntimes/m1/LibraryRuntimes/lib1/ReferencingRuntimes/app1':
+                {'Type': 'ApplicationRuntime', 'ApplicationName': 'app1'},
+            '/ServerRuntimes/m1/LibraryRuntimes/lib1/ReferencingRuntimes/app2_web':
+                {'Type': 'WebAppComponentRuntime', 'ApplicationIdentifier': 'app2'}
+        })
+        deployer = self._create_deployer(Model(), fake_wlst_helper)
+
+        references = deployer._ApplicationsDeployer__get_library_runtime_references()
+        self.assertEqual(references.keys(), ['lib1', 'lib2'])
+        self.assertEqual(references['lib1'], ['app1', 'app2'])
+        self.assertEqual(references['lib2'], [])
+
+        # the name attribute that does not match the type is not needed, so no attributes are listed
+        self.assertEqual(fake_wlst_helper.lsa_paths, [])
+        return
+
+    def _create_deployer(self, model, fake_wlst_helper):
+        deployer = ApplicationsDeployer(model, self.model_context, self.aliases, wlst_mode=WlstModes.ONLINE)
+        deployer.wlst_helper = fake_wlst_helper
+
+        # the strategy is computed by each test, from the existing apps and libraries
+        deployer._ApplicationsDeployer__get_existing_apps = lambda base_location: OrderedDict()
+        deployer._ApplicationsDeployer__get_library_references = lambda base_location: OrderedDict()
+        deployer._ApplicationsDeployer__extract_files_from_archive = lambda *args: None
+        deployer._ApplicationsDeployer__get_deployable_library_versioned_name = \
+            lambda source_path, model_name: model_name
+        return deployer
+
+    def _write_file(self, name):
+        file_name = os.path.abspath(os.path.join(self._execution_dir, name))
+        output = open(file_name, 'w')
+        output.write(name)
+        output.close()
+        return file_name
+
+
+class _FakeWlstHelper(object):
+    """
+    Stand-in for the WlstHelper of the deployer, recording the deployment operations in the order they start,
+    and the runtime MBeans that are listed with lsa.  Each operation returns a completed WLST progress object.
+    """
+
+    def __init__(self, deployment_orders=None, runtime_lists=None, runtime_attributes=None):
+        self._deployment_orders = deployment_orders
+        self._runtime_lists = runtime_lists
+        self._runtime_attributes = runtime_attributes
+        self._current_path = '/'
+        self.calls = []
+        self.library_modules = {}
+        self.lsa_paths = []
+
+    def server_config(self):
+        self._current_path = '/'
+
+    def domain_runtime(self):
+        self._current_path = '/'
+
+    def cd(self, path):
+        self._current_path = path
+
+    def get(self, attribute):
+        if attribute == 'DeploymentOrder':
+            return self._deployment_orders[self._current_path.split('/')[-1]]
+        return None
+
+    def get_existing_object_list(self, path):
+        return list(self._runtime_lists[path])
+
+    def get_attributes(self, attribute_names, path):
+        # like the MBean server, leave out the attributes that the MBean does not have
+        result = {}
+        attributes = self._runtime_attributes[path]
+        for attribute_name in attribute_names:
+            if attribute_name in attributes:
+                result[attribute_name] = attributes[attribute_name]
+        return result
+
+    def lsa(self, path):
+        self.lsa_paths.append(path)
+        return dict(self._runtime_attributes[path])
+
+    def stop_application(self, application_name, *args, **kwargs):
+        return self._record('stop', application_name, kwargs)
+
+    def start_application(self, application_name, *args, **kwargs):
+        return self._record('start', application_name, kwargs)
+
+    def undeploy_application(self, application_name, *args, **kwargs):
+        self.library_modules[application_name] = kwargs['libraryModule']
+        return self._record('undeploy', application_name, kwargs)
+
+    def redeploy_application(self, application_name, *args, **kwargs):
+        return self._record('redeploy', application_name, kwargs)
+
+    def deploy_application(self, application_name, *args, **kwargs):
+        return self._record('deploy', application_name, kwargs)
+
+    def _record(self, operation, application_name, kwargs):
+        if kwargs.get('block') != 'false':
+            raise AssertionError(operation + ' of ' + application_name + ' waits for completion')
+        self.calls.append((operation, application_name))
+        return _FakeProgress()
+
+
+class _FakeProgress(object):
+    """
+    A fake WLST progress object for a completed task.
+    """
+
+    def isRunning(self):
+        return False
+
+    def isFailed(self):
+        return False
+
+    def getState(self):
+        return 'completed'
+
+    def getMessage(self):
+        return None
+
+if __name__ == '__main__':
+    unittest.main()
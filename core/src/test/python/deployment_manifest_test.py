@@ -0,0 +1,170 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import os
+import unittest
+
+from java.io import File
+
+from wlsdeploy.tool.deploy import deployer_utils
+from wlsdeploy.tool.deploy.deployment_manifest import DeploymentManifest
+
+
+class DeploymentManifestTestCase(unittest.TestCase):
+    """
+       1) Unit tests must be a class that extends unittest.TestCase
+       2) Class methods with names starting with 'test' will be executed by the framework (all others skipped)
+    """
+    _execution_dir = '../../unit-tests/deployment_manifest'
+
+    def setUp(self):
+        if not os.path.exists(self._execution_dir):
+            os.makedirs(self._execution_dir)
+        manifest_file = File(self._execution_dir, 'deploy_manifest.cache')
+        if manifest_file.exists():
+            manifest_file.delete()
+
+    def testFileHashIsRecorded(self):
+        binary_file = self._write_file('app.ear', 'first version')
+        hasher = _CountingHasher()
+
+        saved_hash_mode = os.environ.get(deployer_utils.HASH_MODE_ENV_VARIABLE)
+        try:
+            if saved_hash_mode is not None:
+                del os.environ[deployer_utils.HASH_MODE_ENV_VARIABLE]
+
+            # files that were not extracted from the archive are recorded once they are hashed
+            manifest = DeploymentManifest(self._execution_dir)
+            first_hash = manifest.get_file_hash(binary_file, hasher.compute)
+            self.assertEqual(manifest.get_file_hash(binary_file, hasher.compute), first_hash)
+            self.assertEqual(hasher.count, 1)
+            self.assertEqual(manifest.store(), True)
+
+            # a new run loads the recorded hash from the manifest file
+            manifest = DeploymentManifest(self._execution_dir)
+            self.assertEqual(manifest.get_file_hash(binary_file, hasher.compute), first_hash)
+            self.assertEqual(hasher.count, 1)
+
+            # the file is hashed again once it changes
+            self._write_file('app.ear', 'the second version')
+            self.assertEqual(manifest.get_file_hash(binary_file, hasher.compute), 'hash-the second version')
+            self.assertEqual(hasher.count, 2)
+        finally:
+            if saved_hash_mode is not None:
+                os.environ[deployer_utils.HASH_MODE_ENV_VARIABLE] = saved_hash_mode
+        return
+
+    def testFileChecksumIsNotRecorded(self):
+        binary_file = self._write_file('app.ear', 'first version')
+        hasher = _CountingHasher()
+
+        saved_hash_mode = os.environ.get(deployer_utils.HASH_MODE_ENV_VARIABLE)
+        try:
+            os.environ[deployer_utils.HASH_MODE_ENV_VARIABLE] = deployer_utils.CHECKSUM_HASH_MODE
+
+            # FileUtils caches the checksums of the files that were not extracted from the archive
+            manifest = DeploymentManifest(self._execution_dir)
+            first_hash = manifest.get_file_hash(binary_file, hasher.compute)
+            self.assertEqual(manifest.get_file_hash(binary_file, hasher.compute), first_hash)
+            self.assertEqual(hasher.count, 2)
+            self.assertEqual(manifest.store(), False)
+        finally:
+            if saved_hash_mode is None:
+                del os.environ[deployer_utils.HASH_MODE_ENV_VARIABLE]
+            else:
+                os.environ[deployer_utils.HASH_MODE_ENV_VARIABLE] = saved_hash_mode
+        return
+
+    def testArchiveEntryHashIsRecorded(self):
+        archive_helper = _FakeArchiveHelper()
+        entry_path = 'wlsdeploy/applications/app.ear'
+        archive_helper.entries[entry_path] = ('1234:10', 'hash1')
+
+        manifest = DeploymentManifest(self._execution_dir)
+        self.assertEqual(manifest.get_archive_file_hash(archive_helper, entry_path), 'hash1')
+        self.assertEqual(manifest.get_archive_file_hash(archive_helper, entry_path), 'hash1')
+        self.assertEqual(archive_helper.hash_count, 1)
+
+        # the extracted copy of the entry is recorded with the hash of the entry
+        extracted_file = self._write_file('extracted.ear', 'extracted')
+        manifest.add_extracted_file(entry_path, extracted_file)
+        hasher = _CountingHasher()
+        self.assertEqual(manifest.get_file_hash(extracted_file, hasher.compute), 'hash1')
+        self.assertEqual(hasher.count, 0)
+        self.assertEqual(manifest.store(), True)
+
+        # a new run loads the recorded hashes from the manifest file
+        manifest = DeploymentManifest(self._execution_dir)
+        self.assertEqual(manifest.get_archive_file_hash(archive_helper, entry_path), 'hash1')
+        self.assertEqual(manifest.get_file_hash(extracted_file, hasher.compute), 'hash1')
+        self.assertEqual(archive_helper.hash_count, 1)
+        self.assertEqual(hasher.count, 0)
+
+        # the extracted copy is hashed once it changes
+        self._write_file('extracted.ear', 'the extracted copy changed')
+        self.assertEqual(manifest.get_file_hash(extracted_file, hasher.compute), 'hash-the extracted copy changed')
+        self.assertEqual(hasher.count, 1)
+        self.assertEqual(manifest.store(), True)
+
+        # the entry is hashed again once its checksum changes
+        archive_helper.entries[entry_path] = ('5678:10', 'hash2')
+        manifest = DeploymentManifest(self._execution_dir)
+        self.assertEqual(manifest.get_archive_file_hash(archive_helper, entry_path), 'hash2')
+        self.assertEqual(archive_helper.hash_count, 2)
+        return
+
+    def testMemoryOnlyManifest(self):
+        archive_helper = _FakeArchiveHelper()
+        entry_path = 'wlsdeploy/sharedLibraries/lib.war'
+        archive_helper.entries[entry_path] = ('1234:7', 'hash1')
+
+        manifest = DeploymentManifest(None)
+        manifest.get_archive_file_hash(archive_helper, entry_path)
+        manifest.get_archive_file_hash(archive_helper, entry_path)
+        self.assertEqual(archive_helper.hash_count, 1)
+        self.assertEqual(manifest.store(), False)
+        return
+
+    def _write_file(self, name, content):
+        file_name = os.path.join(self._execution_dir, name)
+        output = open(file_name, 'w')
+        output.write(content)
+        output.close()
+        return file_name
+
+
+class _CountingHasher(object):
+    """
+    Compute a fake hash of the file content, counting the number of files hashed.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def compute(self, file_name):
+        self.count += 1
+        input_file = open(file_name, 'r')
+        content = input_file.read()
+        input_file.close()
+        return 'hash-' + content
+
+
+class _FakeArchiveHelper(object):
+    """
+    An archive helper with entries of (checksum, hash), counting the number of entries hashed.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.hash_count = 0
+
+    def get_file_checksum(self, path):
+        return self.entries[path][0]
+
+    def get_file_hash(self, path):
+        self.hash_count += 1
+        return self.entries[path][1]
+
+if __name__ == '__main__':
+    unittest.main()
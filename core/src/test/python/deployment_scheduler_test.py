@@ -0,0 +1,144 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import os
+import unittest
+
+from oracle.weblogic.deploy.deploy import DeployException
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.tool.deploy import deployment_scheduler
+from wlsdeploy.tool.deploy.deployment_scheduler import DeploymentScheduler
+
+
+class DeploymentSchedulerTestCase(unittest.TestCase):
+    """
+       1) Unit tests must be a class that extends unittest.TestCase
+       2) Class methods with names starting with 'test' will be executed by the framework (all others skipped)
+    """
+
+    def testDeploymentWaves(self):
+        orders = {'c': '5', 'a': None, 'b': 10, 'd': 5, 'e': None}
+        waves = deployment_scheduler.get_deployment_waves(orders)
+        self.assertEqual(waves, [(5, ['c', 'd']), (10, ['b']), (None, ['a', 'e'])])
+        self.assertEqual(deployment_scheduler.get_deployment_waves({}), [])
+        return
+
+    def testRunWaveConcurrently(self):
+        tracker = _TaskTracker()
+        tasks = []
+        for name in ['a', 'b', 'c', 'd', 'e']:
+            tasks.append((name, tracker.get_start_function(name, 2)))
+
+        scheduler = DeploymentScheduler(max_tasks=3, poll_interval=0)
+        scheduler.run_wave('deploy', 100, tasks)
+        self.assertEqual(tracker.started, ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(tracker.max_running, 3)
+        self.assertEqual(tracker.running, 0)
+        return
+
+    def testRunWaveOneAtATime(self):
+        tracker = _TaskTracker()
+        tasks = []
+        for name in ['a', 'b', 'c']:
+            tasks.append((name, tracker.get_start_function(name, 1)))
+
+        scheduler = DeploymentScheduler(max_tasks=1, poll_interval=0)
+        scheduler.run_wave('start', None, tasks)
+        self.assertEqual(tracker.started, ['a', 'b', 'c'])
+        self.assertEqual(tracker.max_running, 1)
+        return
+
+    def testOneTaskByDefault(self):
+        saved_tasks = os.environ.get(deployment_scheduler.MAX_TASKS_ENV_VARIABLE)
+        try:
+            if saved_tasks is not None:
+                del os.environ[deployment_scheduler.MAX_TASKS_ENV_VARIABLE]
+            self.assertEqual(DeploymentScheduler().get_max_tasks(), 1)
+            os.environ[deployment_scheduler.MAX_TASKS_ENV_VARIABLE] = '3'
+            self.assertEqual(DeploymentScheduler().get_max_tasks(), 3)
+        finally:
+            if saved_tasks is None:
+                del os.environ[deployment_scheduler.MAX_TASKS_ENV_VARIABLE]
+            else:
+                os.environ[deployment_scheduler.MAX_TASKS_ENV_VARIABLE] = saved_tasks
+        return
+
+    def testRunWaveReportsAllFailures(self):
+        tracker = _TaskTracker()
+        tasks = [('a', tracker.get_start_function('a', 1)),
+                 ('b', tracker.get_start_function('b', 2, failed=True)),
+                 ('c', _raise_deploy_exception),
+                 ('d', tracker.get_start_function('d', 1))]
+
+        scheduler = DeploymentScheduler(max_tasks=4, poll_interval=0)
+        try:
+            scheduler.run_wave('deploy', 1, tasks)
+            self.fail('Expected a DeployException')
+        except DeployException, de:
+            message = de.getLocalizedMessage()
+            self.assertNotEqual(message.find('2 of 4'), -1)
+            self.assertNotEqual(message.find('b'), -1)
+            self.assertNotEqual(message.find('c'), -1)
+
+        # the failures do not stop the other tasks of the wave
+        self.assertEqual(tracker.started, ['a', 'b', 'd'])
+        self.assertEqual(tracker.running, 0)
+        return
+
+
+class _TaskTracker(object):
+    """
+    Track the fake WLST tasks started by the scheduler.
+    """
+
+    def __init__(self):
+        self.started = []
+        self.running = 0
+        self.max_running = 0
+
+    def get_start_function(self, name, polls, failed=False):
+        def start_function():
+            self.started.append(name)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            return _FakeProgress(self, polls, failed)
+        return start_function
+
+
+class _FakeProgress(object):
+    """
+    A fake WLST progress object that completes after it is polled a number of times.
+    """
+
+    def __init__(self, tracker, polls, failed):
+        self._tracker = tracker
+        self._polls = polls
+        self._failed = failed
+
+    def isRunning(self):
+        self._polls -= 1
+        if self._polls > 0:
+            return True
+        if self._polls == 0:
+            self._tracker.running -= 1
+        return False
+
+    def isFailed(self):
+        return self._failed
+
+    def getState(self):
+        if self._failed:
+            return 'failed'
+        return 'completed'
+
+    def getMessage(self):
+        return None
+
+
+def _raise_deploy_exception():
+    raise exception_helper.create_deploy_exception('WLSDPLY-09317', 'c', 'SourcePath')
+
+if __name__ == '__main__':
+    unittest.main()
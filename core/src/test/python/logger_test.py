@@ -4,6 +4,8 @@ The Universal Permissive License (UPL), Version 1.0
 """
 import unittest
 
+from java.util.logging import Level as JLevel
+
 import wlsdeploy.exception.exception_helper as exception_helper
 import wlsdeploy.logging.platform_logger as platform_logger
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
@@ -33,5 +35,29 @@ class LoggerTestCase(unittest.TestCase):
         else:
             self.fail('Test must raise DeployException to test logger handling of python exception')
 
+    def testDisabledLevelDoesNotFormatArguments(self):
+        argument = _StrCounter()
+        level = self.logger.get_level()
+        self.logger.set_level(JLevel.INFO)
+        try:
+            self.logger.entering(argument, class_name=self.name,
+                                 method_name='testDisabledLevelDoesNotFormatArguments')
+            self.logger.finest('WLSDPLY-01760', argument, class_name=self.name,
+                               method_name='testDisabledLevelDoesNotFormatArguments')
+            self.logger.exiting(self.name, 'testDisabledLevelDoesNotFormatArguments', argument)
+        finally:
+            self.logger.set_level(level)
+        self.assertEqual(argument.count, 0)
+
+
+class _StrCounter(object):
+    def __init__(self):
+        self.count = 0
+
+    def __str__(self):
+        self.count += 1
+        return 'count=%d' % self.count
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
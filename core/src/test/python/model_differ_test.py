@@ -0,0 +1,148 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import copy
+import unittest
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.wlst_modes import WlstModes
+import wlsdeploy.logging.platform_logger as platform_logger
+from wlsdeploy.tool.deploy.model_differ import ModelDiffer
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class ModelDifferTestCase(unittest.TestCase):
+    """
+       1) Unit tests must be a class that extends unittest.TestCase
+       2) Class methods with names starting with 'test' will be executed by the framework (all others skipped)
+    """
+    wls_version = '12.2.1.3'
+
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+
+    logger = platform_logger.PlatformLogger('wlsdeploy.unittest')
+    model_context = ModelContext("test", arg_map)
+    aliases = Aliases(model_context=model_context, wlst_mode=WlstModes.ONLINE, wls_version=wls_version)
+
+    def setUp(self):
+        self.previous = {
+            'domainInfo': {
+                'AdminUserName': 'weblogic'
+            },
+            'topology': {
+                'AdminServerName': 'AdminServer',
+                'Cluster': {
+                    'mycluster': {
+                        'ClusterMessagingMode': 'unicast'
+                    }
+                },
+                'Server': {
+                    'AdminServer': {
+                        'ListenPort': 7001
+                    },
+                    'm1': {
+                        'ListenPort': 8001,
+                        'Cluster': 'mycluster',
+                        'SSL': {
+                            'Enabled': 'true',
+                            'ListenPort': 8002
+                        }
+                    },
+                    'm2': {
+                        'ListenPort': 9001,
+                        'Cluster': 'mycluster'
+                    }
+                }
+            }
+        }
+
+    def testUnchangedModelIsEmpty(self):
+        current = copy.deepcopy(self.previous)
+        changes = ModelDiffer(current, self.previous, self.aliases, self.logger).get_changed_model()
+        self.assertEqual(len(changes['topology']), 0)
+        self.assertEqual(changes['domainInfo'], current['domainInfo'])
+        return
+
+    def testOnlyChangedAttributesAreKept(self):
+        current = copy.deepcopy(self.previous)
+        current['topology']['Server']['m1']['SSL']['ListenPort'] = 8102
+        current['topology']['Server']['m3'] = {'ListenPort': 10001}
+        del current['topology']['Server']['m2']
+
+        changes = ModelDiffer(current, self.previous, self.aliases, self.logger).get_changed_model()
+        topology = changes['topology']
+        self.assertEqual(list(topology.keys()), ['Server'])
+        servers = topology['Server']
+        server_names = list(servers.keys())
+        server_names.sort()
+        self.assertEqual(server_names, ['m1', 'm3'])
+        self.assertEqual(servers['m1'], {'SSL': {'ListenPort': 8102}})
+        self.assertEqual(servers['m3'], {'ListenPort': 10001})
+        return
+
+    def testVariableValuesAreAlwaysApplied(self):
+        # the previous model is not substituted, so a change of the variable value alone cannot be detected
+        current = copy.deepcopy(self.previous)
+        self.previous['topology']['Server']['m2']['ListenPort'] = '@@PROP:m2.port@@'
+        self.previous['topology']['Cluster']['mycluster']['ClusterMessagingMode'] = '@@FILE:/tmp/mode.txt@@'
+        self.previous['topology']['Server']['@@PROP:m3.name@@'] = {'ListenPort': 10001}
+        current['topology']['Server']['m3'] = {'ListenPort': 10001}
+
+        changes = ModelDiffer(current, self.previous, self.aliases, self.logger).get_changed_model()
+        topology = changes['topology']
+        self.assertEqual(topology['Cluster'], {'mycluster': {'ClusterMessagingMode': 'unicast'}})
+        servers = topology['Server']
+        server_names = list(servers.keys())
+        server_names.sort()
+        self.assertEqual(server_names, ['m2', 'm3'])
+        self.assertEqual(servers['m2'], {'ListenPort': 9001})
+        self.assertEqual(servers['m3'], {'ListenPort': 10001})
+        return
+
+    def testContextAttributesAreKept(self):
+        self.previous['resources'] = {
+            'JDBCSystemResource': {
+                'ds1': {
+                    'Target': 'mycluster',
+                    'JdbcResource': {'JDBCConnectionPoolParams': {'MaxCapacity': 10}}
+                },
+                'ds2': {
+                    'Target': 'mycluster',
+                    'JdbcResource': {'JDBCConnectionPoolParams': {'MaxCapacity': 10}}
+                }
+            },
+            'JMSSystemResource': {
+                'jms1': {
+                    'Target': 'mycluster',
+                    'JmsResource': {
+                        'Queue': {
+                            'q1': {'SubDeploymentName': 'sub1', 'JNDIName': 'jms/q1'}
+                        }
+                    }
+                }
+            }
+        }
+        current = copy.deepcopy(self.previous)
+        current['resources']['JDBCSystemResource']['ds1']['JdbcResource']['JDBCConnectionPoolParams'] = \
+            {'MaxCapacity': 20}
+        current['resources']['JMSSystemResource']['jms1']['JmsResource']['Queue']['q1']['JNDIName'] = 'jms/queue1'
+
+        changes = ModelDiffer(current, self.previous, self.aliases, self.logger).get_changed_model()
+        resources = changes['resources']
+        self.assertEqual(list(resources['JDBCSystemResource'].keys()), ['ds1'])
+        self.assertEqual(resources['JDBCSystemResource']['ds1'], {
+            'Target': 'mycluster',
+            'JdbcResource': {'JDBCConnectionPoolParams': {'MaxCapacity': 20}}
+        })
+        jms1 = resources['JMSSystemResource']['jms1']
+        self.assertEqual(jms1['Target'], 'mycluster')
+        self.assertEqual(jms1['JmsResource']['Queue']['q1'], {'SubDeploymentName': 'sub1', 'JNDIName': 'jms/queue1'})
+        return
+
+if __name__ == '__main__':
+    unittest.main()
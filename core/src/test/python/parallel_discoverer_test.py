@@ -0,0 +1,127 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from java.lang import Thread
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.tool.discover.parallel_discoverer import ParallelDiscoverer
+from wlsdeploy.util import wlst_helper
+from wlsdeploy.util.wlst_session import _SessionCommand
+
+
+class ParallelDiscovererTestCase(unittest.TestCase):
+    """
+    The WLST layer is replaced by a local session object so that the sections can be discovered
+    without a running Admin Server.
+    """
+
+    def setUp(self):
+        self.sessions = []
+
+    def testSectionsAreMergedInOrder(self):
+        first = OrderedDict()
+        second = OrderedDict()
+        discoverer = ParallelDiscoverer(3, self._open_session)
+        # the first section finishes last, so the merge order cannot depend on completion order
+        discoverer.add_section('first', first, _section_function(['Server', 'Cluster'], 300))
+        discoverer.add_section('second', second, _section_function(['JDBCSystemResource'], 10))
+        discoverer.add_section('third', second, _section_function(['JMSServer', 'FileStore'], 100))
+        discoverer.discover()
+
+        self.assertEqual(first.keys(), ['Server', 'Cluster'])
+        self.assertEqual(second.keys(), ['JDBCSystemResource', 'JMSServer', 'FileStore'])
+        self.assertEqual(first['Server']['session'] is not second['JMSServer']['session'], True)
+        self.assertEqual(len(self.sessions), 3)
+        for session in self.sessions:
+            self.assertEqual(session.closed, True)
+        self.assertEqual(wlst_helper.get_thread_session(), None)
+        return
+
+    def testSectionErrorIsRaised(self):
+        topology = OrderedDict()
+        discoverer = ParallelDiscoverer(2, self._open_session)
+        discoverer.add_section('topology', topology, _section_function(['Server'], 10))
+        discoverer.add_section('resources', OrderedDict(), _failing_section)
+        self.assertRaises(ValueError, discoverer.discover)
+        self.assertEqual(len(topology), 0)
+        for session in self.sessions:
+            self.assertEqual(session.closed, True)
+        return
+
+    def testSessionExceptionsAreTranslated(self):
+        folders = OrderedDict()
+        discoverer = ParallelDiscoverer(1, _MissingFolderSession)
+        discoverer.add_section('topology', folders, _list_missing_folder)
+        discoverer.discover()
+        # the missing folder is reported as empty rather than killing the worker
+        self.assertEqual(folders['Missing'], [])
+        return
+
+    def _open_session(self):
+        session = _LocalSession()
+        self.sessions.append(session)
+        return session
+
+
+class _LocalSession(object):
+    """
+    Stand-in for a WLST session connected to the Admin Server.
+    """
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _SessionWLSTException(Exception):
+    """
+    Stand-in for the WLSTException class of an embedded WLST interpreter.
+    """
+    pass
+
+
+class _MissingFolderSession(_LocalSession):
+    """
+    Stand-in for a WLST session whose commands fail the way they do for a folder that does not exist.
+    """
+    def __init__(self):
+        _LocalSession.__init__(self)
+        self.cd = _SessionCommand(_raise_session_exception, _SessionWLSTException)
+        self.ls = _SessionCommand(_raise_session_exception, _SessionWLSTException)
+        self.pwd = _SessionCommand(_get_root_path, _SessionWLSTException)
+
+    def is_connected(self):
+        return True
+
+
+def _raise_session_exception(*args, **kwargs):
+    raise _SessionWLSTException('No such folder')
+
+
+def _get_root_path(*args, **kwargs):
+    return 'serverConfig:/'
+
+
+def _list_missing_folder(dictionary):
+    dictionary['Missing'] = wlst_helper.get_existing_object_list('/Missing/')
+
+
+def _section_function(folder_names, delay):
+    def discover_section(dictionary):
+        Thread.sleep(delay)
+        for folder_name in folder_names:
+            dictionary[folder_name] = {'session': wlst_helper.get_thread_session()}
+    return discover_section
+
+
+def _failing_section(dictionary):
+    raise ValueError('failed')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,11 @@ The Universal Permissive License (UPL), Version 1.0
 import javaos as os
 import unittest
 
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.json.json_translator import PythonToJson
 from wlsdeploy.util.model_translator import FileToPython, PythonToFile
+from wlsdeploy.yaml.yaml_translator import PythonToYaml
 
 class TranslatorTestCase(unittest.TestCase):
     _execution_dir = '../../unit-tests/'
@@ -17,6 +21,9 @@ class TranslatorTestCase(unittest.TestCase):
     _target_json_file = os.path.join(_execution_dir, 'quote-test.json')
     _target_yaml_file = os.path.join(_execution_dir, 'quote-test.yaml')
 
+    _expected_json_file = os.path.join(_resources_dir, 'writer-test-expected.json')
+    _expected_yaml_file = os.path.join(_resources_dir, 'writer-test-expected.yaml')
+
     def setUp(self):
         self.name = 'TranslatorTestCase'
         if not os.path.exists(self._execution_dir):
@@ -90,3 +97,80 @@ class TranslatorTestCase(unittest.TestCase):
         self.assertEqual(quotedValue, 'test "legal" yaml')
         quotedValue = newPythonDict['baz']
         self.assertEqual(quotedValue, 'test \'legal\' yaml')
+
+    def testYamlOutputMatchesExpected(self):
+        model = _get_sample_model(2)
+        new_file = os.path.join(self._execution_dir, 'writer-test.yaml')
+
+        PythonToYaml(model).write_to_yaml_file(new_file)
+        self.assertEqual(_read_file(new_file), _read_file(self._expected_yaml_file))
+
+        new_model = FileToPython(new_file, use_ordering=True).parse()
+        self.assertEqual(new_model['resources']['JDBCSystemResource']['ds-1']['Target'], 'cluster-1,AdminServer')
+        self.assertEqual(len(new_model['topology']['Server']['server-1']['ServerStart']['ClassPath']), 3)
+
+    def testJsonOutputMatchesExpected(self):
+        model = _get_sample_model(2, False)
+        new_file = os.path.join(self._execution_dir, 'writer-test.json')
+
+        PythonToJson(model).write_to_json_file(new_file)
+        self.assertEqual(_read_file(new_file), _read_file(self._expected_json_file))
+
+        new_model = FileToPython(new_file, use_ordering=True).parse()
+        self.assertEqual(new_model['topology']['Server']['server-1']['ListenPort'], 7002)
+
+
+def _get_sample_model(server_count, include_lists=True):
+    """
+    Build a model with the kinds of values the writers handle: nested folders, lists, quotes,
+    YAML special characters, numbers and booleans.  The JSON writer does not write lists.
+    The expected output for two servers is in the writer-test-expected files.
+    """
+    servers = OrderedDict()
+    datasources = OrderedDict()
+    for i in range(server_count):
+        server = OrderedDict()
+        server['ListenAddress'] = 'host%d.example.com' % i
+        server['ListenPort'] = 7001 + i
+        server['Cluster'] = 'cluster-%d' % (i % 4)
+        server['Notes'] = 'it\'s "quoted": yes'
+        server['ServerStart'] = OrderedDict()
+        server['ServerStart']['Arguments'] = '-Xmx1024m -Dweblogic.Stdout=@@PROP:stdout@@'
+        if include_lists:
+            server['ServerStart']['ClassPath'] = ['a.jar', 'b.jar', []]
+        server['SSL'] = OrderedDict()
+        server['SSL']['Enabled'] = 'true'
+        servers['server-%d' % i] = server
+
+        datasource = OrderedDict()
+        datasource['Target'] = 'cluster-%d,AdminServer' % (i % 4)
+        datasource['JdbcResource'] = OrderedDict()
+        datasource['JdbcResource']['JDBCDriverParams'] = OrderedDict()
+        datasource['JdbcResource']['JDBCDriverParams']['URL'] = 'jdbc:oracle:thin:@//db%d:1521/orcl' % i
+        datasource['JdbcResource']['JDBCDriverParams']['PasswordEncrypted'] = '@@PROP:ds.password@@'
+        datasources['ds-%d' % i] = datasource
+
+    topology = OrderedDict()
+    topology['Name'] = 'base_domain'
+    topology['Server'] = servers
+    resources = OrderedDict()
+    resources['JDBCSystemResource'] = datasources
+
+    model = OrderedDict()
+    model['topology'] = topology
+    model['resources'] = resources
+    return model
+
+
+def _read_file(file_name):
+    """
+    Read the file, with the line separators of the platform replaced by new lines.
+    """
+    model_file = open(file_name, 'r')
+    try:
+        return model_file.read().replace('\r\n', '\n')
+    finally:
+        model_file.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import os
+import unittest
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.tool.validate import validation_cache
+from wlsdeploy.tool.validate.validation_results import ValidationResult
+
+
+class ValidationCacheTestCase(unittest.TestCase):
+    """
+       1) Unit tests must be a class that extends unittest.TestCase
+       2) Class methods with names starting with 'test' will be executed by the framework (all others skipped)
+    """
+    _execution_dir = '../../unit-tests/validation_cache'
+    _wls_version = '12.2.1.3'
+
+    def setUp(self):
+        if not os.path.exists(self._execution_dir):
+            os.makedirs(self._execution_dir)
+
+    def testModelFingerprint(self):
+        topology = OrderedDict()
+        topology['Name'] = 'base_domain'
+        topology['Server'] = {'AdminServer': {'ListenPort': 7001}}
+        fingerprint = validation_cache.compute_fingerprint(topology)
+
+        same_topology = OrderedDict()
+        same_topology['Name'] = 'base_domain'
+        same_topology['Server'] = {'AdminServer': {'ListenPort': 7001}}
+        self.assertEqual(validation_cache.compute_fingerprint(same_topology), fingerprint)
+
+        same_topology['Server']['AdminServer']['ListenPort'] = '7001'
+        self.assertNotEqual(validation_cache.compute_fingerprint(same_topology), fingerprint)
+        self.assertNotEqual(validation_cache.compute_fingerprint(['a', 'b']),
+                            validation_cache.compute_fingerprint(['ab']))
+        return
+
+    def testStoreAndLoad(self):
+        context_fingerprint = \
+            validation_cache.compute_context_fingerprint(self._wls_version, WlstModes.OFFLINE, 'TOOL', 'model.yaml',
+                                                         'vars.properties', 'base_domain', {'port': '7001'},
+                                                         ['wlsdeploy/apps/a.ear'])
+        other_fingerprint = \
+            validation_cache.compute_context_fingerprint(self._wls_version, WlstModes.ONLINE, 'TOOL', 'model.yaml',
+                                                         'vars.properties', 'base_domain', {'port': '7001'},
+                                                         ['wlsdeploy/apps/a.ear'])
+        self.assertNotEqual(context_fingerprint, other_fingerprint)
+
+        # the variables file name appears in the undefined variable warnings
+        other_fingerprint = \
+            validation_cache.compute_context_fingerprint(self._wls_version, WlstModes.OFFLINE, 'TOOL', 'model.yaml',
+                                                         'other.properties', 'base_domain', {'port': '7001'},
+                                                         ['wlsdeploy/apps/a.ear'])
+        self.assertNotEqual(context_fingerprint, other_fingerprint)
+
+        validation_result = ValidationResult('topology Section')
+        validation_result.add_error('WLSDPLY-05029', 'Foo', 'topology:/', ['Name'])
+        results = {}
+        validation_cache.add_result(results, 'topology Section', 'ABCD', validation_result.get_result_dict())
+        stored = validation_cache.store(self._execution_dir, context_fingerprint, results)
+        self.assertEqual(stored, True)
+
+        # load from the file rather than the results cached in memory
+        del validation_cache._memory_cache[context_fingerprint]
+        loaded = validation_cache.load(self._execution_dir, context_fingerprint)
+        self.assertEqual(validation_cache.get_result(loaded, 'topology Section', 'EFGH'), None)
+        result_dict = validation_cache.get_result(loaded, 'topology Section', 'ABCD')
+        self.assertNotEqual(result_dict, None)
+
+        cached_result = ValidationResult('topology Section')
+        cached_result.set_result_dict(result_dict)
+        self.assertEqual(cached_result.get_errors_count(), 1)
+        self.assertEqual(cached_result.get_errors_messages()[0]['resource_id'], 'WLSDPLY-05029')
+        return
+
+    def testResultsPerAreaAreBounded(self):
+        results = {}
+        for i in range(validation_cache.MAX_RESULTS_PER_AREA + 2):
+            validation_cache.add_result(results, 'resources Section', str(i), {'index': i})
+        self.assertEqual(len(results['resources Section']), validation_cache.MAX_RESULTS_PER_AREA)
+        self.assertEqual(validation_cache.get_result(results, 'resources Section', '0'), None)
+        last = str(validation_cache.MAX_RESULTS_PER_AREA + 1)
+        self.assertEqual(validation_cache.get_result(results, 'resources Section', last)['index'],
+                         validation_cache.MAX_RESULTS_PER_AREA + 1)
+        return
+
+    def testCacheIsDisabledByDefault(self):
+        saved_mode = os.environ.get(validation_cache.CACHE_MODE_ENV_VARIABLE)
+        try:
+            if saved_mode is not None:
+                del os.environ[validation_cache.CACHE_MODE_ENV_VARIABLE]
+            self.assertEqual(validation_cache.get_cache_mode(), validation_cache.NO_CACHE_MODE)
+            os.environ[validation_cache.CACHE_MODE_ENV_VARIABLE] = 'Incremental'
+            self.assertEqual(validation_cache.get_cache_mode(), validation_cache.INCREMENTAL_CACHE_MODE)
+        finally:
+            if saved_mode is None:
+                del os.environ[validation_cache.CACHE_MODE_ENV_VARIABLE]
+            else:
+                os.environ[validation_cache.CACHE_MODE_ENV_VARIABLE] = saved_mode
+        return
+
+    def testCacheFilesAreBounded(self):
+        cache_dir = os.path.join(self._execution_dir, 'bounded')
+        if os.path.exists(cache_dir):
+            for name in os.listdir(cache_dir):
+                os.remove(os.path.join(cache_dir, name))
+
+        for i in range(validation_cache.MAX_CACHE_FILES + 2):
+            context_fingerprint = \
+                validation_cache.compute_context_fingerprint(self._wls_version, WlstModes.OFFLINE, 'TOOL',
+                                                             'model.yaml', None, 'domain%d' % i, {}, None)
+            self.assertEqual(validation_cache.store(cache_dir, context_fingerprint, {}), True)
+        self.assertEqual(len(os.listdir(cache_dir)), validation_cache.MAX_CACHE_FILES)
+        return
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,11 @@ from wlsdeploy.util.model_context import ModelContext
 import validate
 from wlsdeploy.tool.validate.validator import Validator
 from wlsdeploy.tool.validate import validation_utils
+from wlsdeploy.tool.validate.validation_plan import ValidationPlanCache
+from wlsdeploy.tool.util.alias_helper import AliasHelper
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.exception.expection_types import ExceptionType
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.aliases import alias_constants
 
@@ -232,5 +237,34 @@ class ValidationTestCase(unittest.TestCase):
 
         self.assertNotEqual(return_code, Validator.ReturnCode.STOP)
 
+    def testValidationPlanModelFolderPath(self):
+        mw_home = os.environ['MW_HOME']
+        model_context = ModelContext('ValidationTestCase', {'-oracle_home': mw_home})
+        aliases = Aliases(model_context, wlst_mode=WlstModes.OFFLINE)
+        alias_helper = AliasHelper(aliases, self._logger, ExceptionType.VALIDATE)
+        validation_plans = ValidationPlanCache(alias_helper)
+
+        locations = []
+        server_location = LocationContext().append_location('Server')
+        locations.append(LocationContext(server_location))
+        server_location.add_name_token('DOMAIN', 'base_domain')
+        for server_name in ['AdminServer', 'managed1']:
+            location = LocationContext(server_location)
+            location.add_name_token(alias_helper.get_name_token(location), server_name)
+            locations.append(location)
+            ssl_location = LocationContext(location).append_location('SSL')
+            ssl_location.add_name_token(alias_helper.get_name_token(ssl_location), server_name)
+            locations.append(ssl_location)
+
+        for location in locations:
+            self.assertEqual(validation_plans.get_model_folder_path(location),
+                             alias_helper.get_model_folder_path(location))
+
+        plan = validation_plans.get_plan(locations[1])
+        self.assertEqual(validation_plans.get_plan(locations[3]), plan)
+        self.assertEqual(plan.get_valid_attr_infos(),
+                         alias_helper.get_model_attribute_names_and_types(locations[3]))
+
+
 if __name__ == '__main__':
     unittest.main()
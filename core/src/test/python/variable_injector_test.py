@@ -207,6 +207,23 @@ class VariableFileHelperTest(unittest.TestCase):
         actual = self._helper.inject_variables(replacement_dict)
         self._compare_to_expected_dictionary(expected, actual)
 
+    def testWithSharedAndNamedPaths(self):
+        expected = dict()
+        expected['Server.AdminServer.ListenPort'] = '9001'
+        expected['Server.m1.ListenPort'] = '9003'
+        expected['Server.m2.ListenPort'] = '9005'
+        expected['Server.m1.SSL.Enabled'] = 'True'
+        expected['Server.m1.SSL.ListenPort'] = '9004'
+        expected['Server.m2.SSL.ListenPort'] = '9006'
+        expected['Machine.machine1.NodeManager.ListenAddress'] = '127.0.0.1'
+        replacement_dict = dict()
+        replacement_dict['Server.ListenPort'] = dict()
+        replacement_dict['Server[m1].SSL.Enabled'] = dict()
+        replacement_dict['Server[MANAGED_SERVERS].SSL.ListenPort'] = dict()
+        replacement_dict['Machine.NodeManager.ListenAddress'] = dict()
+        actual = self._helper.inject_variables(replacement_dict)
+        self._compare_to_expected_dictionary(expected, actual)
+
     def testWithManagedServerKeyword(self):
         expected = dict()
         expected['Server.m1.SSL.Enabled'] = 'True'
@@ -79,6 +79,18 @@ class VariablesTestCase(unittest.TestCase):
         variables.substitute(model, {'variable_dir': self._resources_dir})
         self.assertEqual(model['domainInfo']['AdminUserName'], 'file-variable-value')
 
+    def testPropertyWithFileVariable(self):
+        path = self._resources_dir + '/' + self._file_variable_name
+        model = {'domainInfo': {'AdminUserName': '@@PROP:user@@', 'AdminPassword': '@@PROP:user@@'}}
+        variables.substitute(model, {'user': '@@FILE:' + path + '@@'})
+        self.assertEqual(model['domainInfo']['AdminUserName'], 'file-variable-value')
+        self.assertEqual(model['domainInfo']['AdminPassword'], 'file-variable-value')
+
+    def testSubstituteKeyAndValue(self):
+        model = {'topology': {'@@PROP:server@@': '@@PROP:port@@', 's2': 'x-@@PROP:port@@-@@PROP:server@@'}}
+        variables.substitute(model, {'server': 's1', 'port': '7001'})
+        self.assertEqual(model['topology'], {'s1': '7001', 's2': 'x-7001-s1'})
+
     def testFileVariableNotFound(self):
         try:
             path = self._resources_dir + '/no-file.txt'
@@ -90,6 +102,42 @@ class VariablesTestCase(unittest.TestCase):
         else:
             self.fail('Test must raise VariableException when variable file is not found')
 
+    def testSubstituteTokensInOnePass(self):
+        path = self._resources_dir + '/' + self._file_variable_name
+        variable_map = {'host': 'host1', 'port': '7001', 'secret': '@@FILE:' + path + '@@'}
+        model = {'topology': {
+            'Notes': '@@PROP:host@@:@@PROP:port@@ @@FILE:' + path + '@@ @@PROP:port@@',
+            'Password': '@@PROP:secret@@',
+            'Plain': 'no placeholders'
+        }}
+        variables.substitute(model, variable_map)
+        self.assertEqual(model['topology']['Notes'], 'host1:7001 file-variable-value 7001')
+        self.assertEqual(model['topology']['Password'], 'file-variable-value')
+        self.assertEqual(model['topology']['Plain'], 'no placeholders')
+
+    def testFileVariableIsReadOnce(self):
+        path = self._resources_dir + '/' + self._file_variable_name
+        read_paths = []
+        read_value_from_file = variables._read_value_from_file
+
+        def _counting_read(file_path):
+            read_paths.append(file_path)
+            return read_value_from_file(file_path)
+
+        variables._read_value_from_file = _counting_read
+        try:
+            model = {'domainInfo': {
+                'AdminUserName': '@@FILE:' + path + '@@',
+                'AdminPassword': '@@PROP:password@@'
+            }}
+            variables.substitute(model, {'password': '@@FILE:' + path + '@@'})
+        finally:
+            variables._read_value_from_file = read_value_from_file
+
+        self.assertEqual(model['domainInfo']['AdminUserName'], 'file-variable-value')
+        self.assertEqual(model['domainInfo']['AdminPassword'], 'file-variable-value')
+        self.assertEqual(read_paths, [path])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,263 @@
+"""
+Copyright (c) 2018, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.util.attribute_setter import AttributeSetter
+from wlsdeploy.util import wlst_helper
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class WlstHelperTestCase(unittest.TestCase):
+    """
+    The WLST module used by wlst_helper is replaced by a fake WLST holding a tree of folders,
+    so that the calls made for each operation can be checked without a domain.
+    """
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+
+    model_context = ModelContext('test', arg_map)
+    aliases = Aliases(model_context=model_context, wlst_mode=WlstModes.ONLINE, wls_version='12.2.1.3')
+
+    def setUp(self):
+        self._saved_wlst = wlst_helper.wlst
+        self._saved_ls_with_path_supported = wlst_helper._ls_with_path_supported
+        wlst_helper._set_object_lists_enabled(True)
+
+    def tearDown(self):
+        wlst_helper.wlst = self._saved_wlst
+        wlst_helper._ls_with_path_supported = self._saved_ls_with_path_supported
+        wlst_helper._set_object_lists_enabled(True)
+
+    def testListPathOnline(self):
+        fake_wlst = self._use_fake_wlst(True)
+        wlst_helper._ls_with_path_supported = True
+        self.assertEqual(wlst_helper.lsc('/Servers'), ['AdminServer'])
+        self.assertEqual(fake_wlst.calls, [('ls', '/Servers')])
+        return
+
+    def testListPathOnlineWithoutSupport(self):
+        fake_wlst = self._use_fake_wlst(True)
+        wlst_helper._ls_with_path_supported = False
+        self.assertEqual(wlst_helper.lsc('/Servers'), ['AdminServer'])
+        self.assertEqual(fake_wlst.calls, [('cd', '/Servers'), ('ls', 'c'), ('cd', '/')])
+        return
+
+    def testListPathOffline(self):
+        # the version check does not matter offline, where the cd-based listing is always used
+        fake_wlst = self._use_fake_wlst(False)
+        wlst_helper._ls_with_path_supported = True
+        self.assertEqual(wlst_helper.lsc('/Servers'), ['AdminServer'])
+        self.assertEqual(fake_wlst.calls, [('cd', '/Servers'), ('ls', 'c'), ('cd', '/')])
+        return
+
+    def testCreateUpdatesTypeListing(self):
+        fake_wlst = self._use_fake_wlst(True)
+        self._list_all()
+
+        wlst_helper.cd('/')
+        wlst_helper.create('m1', 'Server')
+        fake_wlst.calls = []
+        self.assertEqual(wlst_helper.get_existing_object_list('/Servers'), ['AdminServer', 'm1'])
+        self.assertEqual(fake_wlst.calls, [])
+
+        # the migratable target created along with the server online is listed again
+        self.assertEqual(wlst_helper.get_existing_object_list('/MigratableTargets'), ['m1 (migratable)'])
+        self.assertEqual(wlst_helper.get_existing_object_list('/Clusters'), [])
+        self.assertEqual(fake_wlst.calls, [('ls', '/MigratableTargets'), ('ls', '/Clusters')])
+        return
+
+    def testCreateUpdatesPluralTypeListing(self):
+        fake_wlst = self._use_fake_wlst(True)
+        self._list_all()
+
+        wlst_helper.cd('/')
+        wlst_helper.create('jsf', 'Library')
+        fake_wlst.calls = []
+        self.assertEqual(wlst_helper.get_existing_object_list('/Libraries'), ['jsf'])
+        self.assertEqual(fake_wlst.calls, [])
+        return
+
+    def testDeleteUpdatesTypeListing(self):
+        fake_wlst = self._use_fake_wlst(True)
+        self._list_all()
+
+        wlst_helper.cd('/')
+        wlst_helper.delete('AdminServer', 'Server')
+        fake_wlst.calls = []
+        self.assertEqual(wlst_helper.get_existing_object_list('/Servers'), [])
+        self.assertEqual(fake_wlst.calls, [])
+
+        # the listings of the deleted MBean are discarded
+        self.assertEqual(wlst_helper.get_existing_object_list('/Servers/AdminServer'), [])
+        self.assertEqual(fake_wlst.calls, [('ls', '/Servers/AdminServer')])
+        return
+
+    def testCreateBelowLocationKeepsOtherListings(self):
+        fake_wlst = self._use_fake_wlst(True)
+        self._list_all()
+
+        wlst_helper.cd('/Servers/AdminServer')
+        wlst_helper.create('AdminServer', 'Log')
+        fake_wlst.calls = []
+        self.assertEqual(wlst_helper.get_existing_object_list('/Servers'), ['AdminServer'])
+        self.assertEqual(wlst_helper.get_existing_object_list('/Clusters'), [])
+        self.assertEqual(fake_wlst.calls, [])
+        return
+
+    def testSetDiscardsListingsBelowLocation(self):
+        fake_wlst = self._use_fake_wlst(True)
+        self._list_all()
+
+        wlst_helper.cd('/Servers/AdminServer')
+        wlst_helper.set('ListenPort', 7001)
+        fake_wlst.calls = []
+        self.assertEqual(wlst_helper.get_existing_object_list('/Servers'), ['AdminServer'])
+        self.assertEqual(wlst_helper.get_existing_object_list('/Clusters'), [])
+        self.assertEqual(fake_wlst.calls, [])
+
+        self.assertEqual(wlst_helper.get_existing_object_list('/Servers/AdminServer'), ['Log', 'SSL'])
+        self.assertEqual(fake_wlst.calls, [('ls', '/Servers/AdminServer')])
+        return
+
+    def testTargetCreatedWithServerIsFound(self):
+        fake_wlst = self._use_fake_wlst(True)
+        self._list_all()
+        attribute_setter = AttributeSetter(self.aliases, PlatformLogger('wlsdeploy.deploy'), ExceptionType.DEPLOY,
+                                           wlst_mode=WlstModes.ONLINE)
+
+        wlst_helper.cd('/')
+        wlst_helper.create('m1', 'Server')
+        fake_wlst.calls = []
+
+        # the migratable target created along with the server online is found by the attribute setter
+        mbean = attribute_setter._AttributeSetter__find_target('m1 (migratable)', LocationContext())
+        self.assertEqual(mbean.path, '/MigratableTargets/m1 (migratable)')
+        self.assertEqual(fake_wlst.calls.count(('ls', '/Servers')), 0)
+        self.assertEqual(fake_wlst.calls.count(('ls', '/MigratableTargets')), 1)
+        return
+
+    def _use_fake_wlst(self, connected):
+        fake_wlst = _FakeWlst(connected, {
+            '/': ['Servers', 'Clusters', 'Libraries', 'MigratableTargets'],
+            '/Servers': ['AdminServer'],
+            '/Servers/AdminServer': ['Log', 'SSL'],
+            '/Servers/AdminServer/Logs': [],
+            '/Clusters': [],
+            '/Libraries': [],
+            '/MigratableTargets': []
+        })
+        wlst_helper.wlst = fake_wlst
+        wlst_helper._ls_with_path_supported = True
+        return fake_wlst
+
+    def _list_all(self):
+        for path in ['/Servers', '/Servers/AdminServer', '/Clusters', '/Libraries', '/MigratableTargets']:
+            wlst_helper.get_existing_object_list(path)
+
+
+class _FakeWLSTException(Exception):
+    """
+    Stand-in for the WLSTException class of WLST.
+    """
+    pass
+
+
+class _FakeConnection(object):
+    def __init__(self, connected):
+        self._connected = connected
+
+    def isConnected(self):
+        return self._connected
+
+
+class _FakeMBean(object):
+    def __init__(self, path):
+        self.path = path
+
+
+class _FakeWlst(object):
+    """
+    Stand-in for the WLST module, recording the cd, ls, create, delete, set and getMBean calls.
+    """
+    WLSTException = _FakeWLSTException
+
+    def __init__(self, connected, tree):
+        self.WLS_ON = _FakeConnection(connected)
+        self.tree = tree
+        self.current = '/'
+        self.calls = []
+
+    def cd(self, path):
+        self.calls.append(('cd', path))
+        self.current = self._get_existing_path(path)
+
+    def pwd(self):
+        if self.current == '/':
+            return '/base_domain'
+        return '/base_domain' + self.current
+
+    def ls(self, *args, **kwargs):
+        self.calls.append(('ls', args[0]))
+        if args[0] in ['a', 'c']:
+            path = self.current
+        else:
+            path = self._get_existing_path(args[0])
+        return list(self.tree[path])
+
+    def create(self, name, folder, *args):
+        self.calls.append(('create', name, folder))
+        self._add(self.current, folder, name)
+        if folder == 'Server' and self.WLS_ON.isConnected():
+            self._add('/', 'MigratableTarget', name + ' (migratable)')
+
+    def delete(self, name, folder):
+        self.calls.append(('delete', name, folder))
+        type_path = self._get_type_path(self.current, folder)
+        self.tree[type_path].remove(name)
+        del self.tree[self._join(type_path, name)]
+
+    def set(self, attribute, value):
+        self.calls.append(('set', attribute, value))
+
+    def getMBean(self, path):
+        self.calls.append(('getMBean', path))
+        if path in self.tree:
+            return _FakeMBean(path)
+        return None
+
+    def _add(self, parent, folder, name):
+        type_path = self._get_type_path(parent, folder)
+        self.tree[type_path].append(name)
+        self.tree[self._join(type_path, name)] = []
+
+    def _get_type_path(self, parent, folder):
+        if folder.endswith('y'):
+            return self._join(parent, folder[:-1] + 'ies')
+        return self._join(parent, folder + 's')
+
+    def _get_existing_path(self, path):
+        if not path.startswith('/'):
+            path = self._join(self.current, path)
+        if len(path) > 1 and path.endswith('/'):
+            path = path[:-1]
+        if path not in self.tree:
+            raise _FakeWLSTException('No such path ' + path)
+        return path
+
+    def _join(self, parent, child):
+        if parent == '/':
+            return '/' + child
+        return parent + '/' + child
+
+if __name__ == '__main__':
+    unittest.main()